@@ -0,0 +1 @@
+"""Benchmark module for KIS Trading System - engine/storage performance measurement"""
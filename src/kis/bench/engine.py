@@ -0,0 +1,359 @@
+"""Engine benchmark CLI (python -m kis.bench.engine)"""
+
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Dict, Any, Callable, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import sessionmaker
+
+from kis.bench.synthetic import DEFAULT_SIZES, generate_snapshot, parse_size
+from kis.engine.columnar import create_proposal_columnar
+from kis.engine.proposal import create_proposal
+from kis.engine.provenance import resolve_build_sha
+from kis.engine.run import (
+    PHASE0_CONFIG,
+    save_snapshot,
+    save_proposal,
+    log_proposal_created,
+)
+from kis.storage.factory import create_storage_engine
+from kis.storage.init_db import init_database
+
+
+DEFAULT_OUTPUT_FILE = "bench_engine.json"
+
+# baseline 대비 median이 이 비율 이상 느려지면 regression
+DEFAULT_REGRESSION_THRESHOLD = 0.2
+
+RESULT_FORMAT_VERSION = 1
+
+ENGINES = {
+    'create_proposal': create_proposal,
+    'columnar': create_proposal_columnar,
+}
+
+
+def measure_latency(fn: Callable[[], Any], repeat: int, warmup: int = 1) -> Dict[str, float]:
+    """
+    Measure wall-clock latency of fn.
+
+    Args:
+        fn: Zero-argument callable
+        repeat: Number of timed runs
+        warmup: Number of untimed runs before measuring
+
+    Returns:
+        Dict with runs, min_ms, median_ms, mean_ms, max_ms
+    """
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+
+    return {
+        'runs': repeat,
+        'min_ms': min(samples),
+        'median_ms': statistics.median(samples),
+        'mean_ms': statistics.fmean(samples),
+        'max_ms': max(samples),
+    }
+
+
+def measure_memory_peak(fn: Callable[[], Any]) -> int:
+    """
+    Measure peak Python heap allocation of one fn call (tracemalloc).
+
+    Args:
+        fn: Zero-argument callable
+
+    Returns:
+        Peak allocated bytes during the call
+    """
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def measure_persist(
+    snapshot_data: Dict[str, Any],
+    config: Dict[str, Any],
+    repeat: int,
+    database_url: Optional[str] = None
+) -> Dict[str, float]:
+    """
+    Measure end-to-end run.main-style persistence against SQLite.
+
+    Each run saves a snapshot, creates a proposal, saves it and logs the
+    proposal_created event. Runs use distinct snapshot sources so content
+    hash deduplication does not skip the snapshot insert.
+
+    Args:
+        snapshot_data: Snapshot data dict
+        config: Configuration dict
+        repeat: Number of timed runs
+        database_url: Optional database URL (default: temporary SQLite file)
+
+    Returns:
+        Latency stats dict (see measure_latency)
+    """
+    with contextlib.ExitStack() as stack:
+        if database_url is None:
+            temp_dir = stack.enter_context(tempfile.TemporaryDirectory())
+            database_url = f"sqlite:///{os.path.join(temp_dir, 'bench.db')}"
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            init_database(database_url)
+
+        engine = create_storage_engine(database_url)
+        stack.callback(engine.dispose)
+        session = sessionmaker(bind=engine)()
+        stack.callback(session.close)
+
+        run_index = iter(range(repeat + 1))
+
+        def persist_once():
+            data = dict(snapshot_data, source=f"{snapshot_data['source']}-{next(run_index)}")
+            snapshot_id = save_snapshot(session, data)
+            proposal_data = create_proposal(data, config)
+            proposal_id = save_proposal(session, proposal_data, snapshot_id, config)
+            log_proposal_created(
+                session,
+                proposal_id,
+                snapshot_id,
+                proposal_data['correlation_id'],
+                proposal_data['constraints_check']['passed']
+            )
+
+        return measure_latency(persist_once, repeat)
+
+
+def run_case(
+    size: int,
+    kr_ratio: float,
+    config: Dict[str, Any],
+    repeat: int,
+    seed: int = 0,
+    persist: bool = True
+) -> Dict[str, Any]:
+    """
+    Run all measurements for one universe size / market mix.
+
+    Args:
+        size: Number of symbols
+        kr_ratio: Fraction of KR symbols
+        config: Configuration dict
+        repeat: Number of timed runs per measurement
+        seed: Random seed for the synthetic universe
+        persist: Whether to measure SQLite persistence
+
+    Returns:
+        Case result dict
+    """
+    snapshot_data = generate_snapshot(size, kr_ratio=kr_ratio, seed=seed, source=f"bench-{size}")
+
+    case = {'size': size, 'kr_ratio': kr_ratio, 'seed': seed, 'latency': {}, 'memory_peak_bytes': {}}
+    for name, engine_fn in ENGINES.items():
+        run = functools.partial(engine_fn, snapshot_data, config)
+        case['latency'][name] = measure_latency(run, repeat)
+        case['memory_peak_bytes'][name] = measure_memory_peak(run)
+
+    if persist:
+        case['latency']['persist'] = measure_persist(snapshot_data, config, repeat)
+
+    return case
+
+
+def run_benchmarks(
+    sizes: List[int],
+    kr_ratios: List[float],
+    repeat: int,
+    seed: int = 0,
+    config: Optional[Dict[str, Any]] = None,
+    persist: bool = True
+) -> Dict[str, Any]:
+    """
+    Run the benchmark matrix (sizes x market mixes).
+
+    Args:
+        sizes: Universe sizes
+        kr_ratios: KR fractions
+        repeat: Number of timed runs per measurement
+        seed: Random seed
+        config: Configuration dict (default: PHASE0_CONFIG)
+        persist: Whether to measure SQLite persistence
+
+    Returns:
+        Result dict with 'meta' and 'cases'
+    """
+    config = config or PHASE0_CONFIG
+    cases = []
+    for size in sizes:
+        for kr_ratio in kr_ratios:
+            case = run_case(size, kr_ratio, config, repeat, seed=seed, persist=persist)
+            cases.append(case)
+            print(format_case(case))
+
+    return {
+        'meta': {
+            'format_version': RESULT_FORMAT_VERSION,
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'git_commit_sha': resolve_build_sha(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'config': config,
+        },
+        'cases': cases,
+    }
+
+
+def format_case(case: Dict[str, Any]) -> str:
+    """Format one case result as a summary line"""
+    parts = [f"size={case['size']:>7} kr={case['kr_ratio']:.2f}"]
+    for name, stats in case['latency'].items():
+        parts.append(f"{name}={stats['median_ms']:.3f}ms")
+    for name, peak in case['memory_peak_bytes'].items():
+        parts.append(f"{name}_peak={peak / 1024 / 1024:.1f}MiB")
+    return "  ".join(parts)
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD
+) -> List[str]:
+    """
+    Compare median latencies with a baseline result file.
+
+    Cases are matched by (size, kr_ratio); cases or metrics missing on
+    either side are ignored.
+
+    Args:
+        baseline: Baseline result dict
+        current: Current result dict
+        threshold: Allowed relative slowdown (0.2 = 20%)
+
+    Returns:
+        List of regression descriptions (empty if none)
+    """
+    baseline_cases = {(c['size'], c['kr_ratio']): c for c in baseline.get('cases', [])}
+    regressions = []
+    for case in current.get('cases', []):
+        base_case = baseline_cases.get((case['size'], case['kr_ratio']))
+        if base_case is None:
+            continue
+        for name, stats in case['latency'].items():
+            base_stats = base_case['latency'].get(name)
+            if base_stats is None or base_stats['median_ms'] <= 0:
+                continue
+            ratio = stats['median_ms'] / base_stats['median_ms']
+            if ratio > 1 + threshold:
+                regressions.append(
+                    f"{name} size={case['size']} kr={case['kr_ratio']:.2f}: "
+                    f"{base_stats['median_ms']:.3f}ms -> {stats['median_ms']:.3f}ms (x{ratio:.2f})"
+                )
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse CLI arguments"""
+    parser = argparse.ArgumentParser(
+        prog="python -m kis.bench.engine",
+        description="Benchmark proposal generation on synthetic universes"
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(f"{size // 1000}k" for size in DEFAULT_SIZES),
+        help="Comma-separated universe sizes (default: 1k,10k,100k)"
+    )
+    parser.add_argument(
+        "--kr-ratio",
+        action="append",
+        type=float,
+        dest="kr_ratios",
+        default=[],
+        help="Fraction of KR symbols (repeatable, default: 0.4)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per measurement (default: 5)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--config", default=None, help="Config JSON file (default: Phase 0 config)")
+    parser.add_argument("--no-persist", action="store_true", help="Skip SQLite persistence measurement")
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_OUTPUT_FILE,
+        help=f"Result JSON file (default: {DEFAULT_OUTPUT_FILE})"
+    )
+    parser.add_argument("--baseline", default=None, help="Baseline result JSON file to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="Allowed relative median slowdown vs baseline (default: 0.2)"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point"""
+    args = parse_args(argv)
+
+    try:
+        sizes = [parse_size(size) for size in args.sizes.split(",") if size.strip()]
+        config = PHASE0_CONFIG
+        if args.config:
+            with open(args.config, 'r', encoding='utf-8') as f:
+                config = json.load(f)
+        results = run_benchmarks(
+            sizes,
+            args.kr_ratios or [0.4],
+            args.repeat,
+            seed=args.seed,
+            config=config,
+            persist=not args.no_persist
+        )
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(baseline, results, args.threshold)
+        if regressions:
+            print(f"Regressions vs {args.baseline}:")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"No regressions vs {args.baseline} (threshold {args.threshold:.0%})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
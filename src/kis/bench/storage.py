@@ -0,0 +1,264 @@
+"""Payload encoding benchmark CLI (python -m kis.bench.storage)"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+
+from sqlalchemy import Column, Integer, MetaData, Table, insert, select
+
+from kis.bench.engine import measure_latency
+from kis.bench.synthetic import generate_snapshot, parse_size
+from kis.engine.provenance import resolve_build_sha
+from kis.engine.run import build_snapshot
+from kis.storage.encoding import (
+    ENCODING_JSON,
+    ENCODINGS,
+    EncodedJSON,
+    available_encodings,
+    decode_payload,
+    encode_payload,
+)
+from kis.storage.factory import create_storage_engine
+
+
+DEFAULT_OUTPUT_FILE = "bench_storage.json"
+
+DEFAULT_SIZES = (1_000, 10_000)
+
+# 한 case에서 저장/로드하는 row 수
+DEFAULT_ROWS = 20
+
+RESULT_FORMAT_VERSION = 1
+
+
+def measure_encoding(
+    payload: Dict[str, Any],
+    encoding: str,
+    rows: int,
+    repeat: int,
+    database_url: str
+) -> Dict[str, Any]:
+    """
+    Measure stored size, write time and load (select + decode) time of one encoding.
+
+    Args:
+        payload: Snapshot payload dict
+        encoding: Payload encoding
+        rows: Rows written and loaded per run
+        repeat: Number of timed runs
+        database_url: SQLite database URL (one file per encoding)
+
+    Returns:
+        Dict with encoded_bytes, db_file_bytes and write/load/decode latency stats
+    """
+    metadata = MetaData()
+    table = Table(
+        "bench_payloads",
+        metadata,
+        Column("id", Integer, primary_key=True),
+        Column("payload_json", EncodedJSON(encoding=encoding), nullable=False),
+    )
+    engine = create_storage_engine(database_url)
+    try:
+        metadata.create_all(engine)
+        encoded = encode_payload(payload, encoding)
+
+        def write_rows():
+            with engine.begin() as conn:
+                conn.execute(table.delete())
+                conn.execute(insert(table), [{'payload_json': payload} for _ in range(rows)])
+
+        def load_rows():
+            with engine.connect() as conn:
+                loaded = conn.execute(select(table.c.payload_json)).scalars().all()
+            assert len(loaded) == rows
+
+        write = measure_latency(write_rows, repeat)
+        load = measure_latency(load_rows, repeat)
+        decode = measure_latency(lambda: decode_payload(encoded), repeat)
+
+        # WAL 내용을 본 파일로 옮긴 뒤 크기 측정
+        with engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+            conn.exec_driver_sql("VACUUM")
+    finally:
+        engine.dispose()
+
+    stored = encoded.encode('utf-8') if isinstance(encoded, str) else encoded
+    return {
+        'encoded_bytes': len(stored),
+        'db_file_bytes': os.path.getsize(database_url[len("sqlite:///"):]),
+        'latency': {'write': write, 'load': load, 'decode': decode},
+    }
+
+
+def run_case(
+    size: int,
+    encodings: List[str],
+    rows: int,
+    repeat: int,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Run all encodings for one synthetic snapshot size.
+
+    Encodings whose optional package is not installed are reported as skipped.
+
+    Args:
+        size: Number of symbols in the snapshot payload
+        encodings: Encodings to measure
+        rows: Rows written and loaded per run
+        repeat: Number of timed runs per measurement
+        seed: Random seed for the synthetic universe
+
+    Returns:
+        Case result dict (results per encoding, ratios vs json)
+    """
+    # snapshots.payload_json에 저장되는 형태 그대로 (asof는 ISO 문자열)
+    payload = build_snapshot(generate_snapshot(size, seed=seed, source=f"bench-{size}")).payload_json
+    available = available_encodings()
+
+    case = {'size': size, 'rows': rows, 'seed': seed, 'results': {}, 'skipped': [], 'vs_json': {}}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for encoding in encodings:
+            if not available[encoding]:
+                case['skipped'].append(encoding)
+                continue
+            database_url = f"sqlite:///{os.path.join(temp_dir, f'{encoding}.db')}"
+            case['results'][encoding] = measure_encoding(payload, encoding, rows, repeat, database_url)
+
+    baseline = case['results'].get(ENCODING_JSON)
+    if baseline is not None:
+        for encoding, result in case['results'].items():
+            if encoding == ENCODING_JSON:
+                continue
+            case['vs_json'][encoding] = {
+                'size_ratio': result['encoded_bytes'] / baseline['encoded_bytes'],
+                'write_speedup': baseline['latency']['write']['median_ms'] / result['latency']['write']['median_ms'],
+                'load_speedup': baseline['latency']['load']['median_ms'] / result['latency']['load']['median_ms'],
+            }
+    return case
+
+
+def run_benchmarks(
+    sizes: List[int],
+    encodings: List[str],
+    rows: int,
+    repeat: int,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Run the benchmark matrix (snapshot sizes x encodings).
+
+    Args:
+        sizes: Snapshot universe sizes
+        encodings: Encodings to measure
+        rows: Rows written and loaded per run
+        repeat: Number of timed runs per measurement
+        seed: Random seed
+
+    Returns:
+        Result dict with 'meta' and 'cases'
+    """
+    cases = []
+    for size in sizes:
+        case = run_case(size, encodings, rows, repeat, seed=seed)
+        cases.append(case)
+        print(format_case(case))
+
+    return {
+        'meta': {
+            'format_version': RESULT_FORMAT_VERSION,
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'git_commit_sha': resolve_build_sha(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': repeat,
+            'rows': rows,
+            'available_encodings': available_encodings(),
+        },
+        'cases': cases,
+    }
+
+
+def format_case(case: Dict[str, Any]) -> str:
+    """Format one case result as summary lines"""
+    lines = [f"size={case['size']:>7} rows={case['rows']}"]
+    for encoding, result in case['results'].items():
+        line = (
+            f"  {encoding:<8} {result['encoded_bytes']:>10,} B  "
+            f"write={result['latency']['write']['median_ms']:.3f}ms  "
+            f"load={result['latency']['load']['median_ms']:.3f}ms"
+        )
+        ratios = case['vs_json'].get(encoding)
+        if ratios:
+            line += f"  size={ratios['size_ratio']:.1%} of json  load x{ratios['load_speedup']:.2f}"
+        lines.append(line)
+    for encoding in case['skipped']:
+        lines.append(f"  {encoding:<8} skipped (optional package not installed)")
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse CLI arguments"""
+    parser = argparse.ArgumentParser(
+        prog="python -m kis.bench.storage",
+        description="Benchmark payload_json encodings (size, write and load time)"
+    )
+    parser.add_argument(
+        "--sizes",
+        default=",".join(f"{size // 1000}k" for size in DEFAULT_SIZES),
+        help="Comma-separated snapshot universe sizes (default: 1k,10k)"
+    )
+    parser.add_argument(
+        "--encoding",
+        action="append",
+        dest="encodings",
+        choices=ENCODINGS,
+        default=[],
+        help="Encoding to measure (repeatable, default: all)"
+    )
+    parser.add_argument(
+        "--rows",
+        type=int,
+        default=DEFAULT_ROWS,
+        help=f"Rows written and loaded per run (default: {DEFAULT_ROWS})"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per measurement (default: 5)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument(
+        "--output",
+        default=DEFAULT_OUTPUT_FILE,
+        help=f"Result JSON file (default: {DEFAULT_OUTPUT_FILE})"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point"""
+    args = parse_args(argv)
+
+    try:
+        sizes = [parse_size(size) for size in args.sizes.split(",") if size.strip()]
+        encodings = args.encodings or list(ENCODINGS)
+        # 비교 기준인 json은 항상 포함
+        if ENCODING_JSON not in encodings:
+            encodings.insert(0, ENCODING_JSON)
+        results = run_benchmarks(sizes, encodings, max(1, args.rows), args.repeat, seed=args.seed)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    print(f"Results written to: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""Synthetic universe generator for benchmarks"""
+
+import random
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+
+
+# 벤치마크 기본 규모
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+_SIZE_SUFFIXES = {'k': 1_000, 'm': 1_000_000}
+
+
+def parse_size(value: str) -> int:
+    """
+    Parse a universe size such as "1k", "10k", "100k", "1m" or "2500".
+
+    Args:
+        value: Size string
+
+    Returns:
+        Number of symbols
+
+    Raises:
+        ValueError: If the size is not a positive integer
+    """
+    text = value.strip().lower()
+    multiplier = 1
+    if text and text[-1] in _SIZE_SUFFIXES:
+        multiplier = _SIZE_SUFFIXES[text[-1]]
+        text = text[:-1]
+    try:
+        size = int(float(text) * multiplier)
+    except ValueError:
+        raise ValueError(f"Invalid size: {value}")
+    if size <= 0:
+        raise ValueError(f"Invalid size: {value}")
+    return size
+
+
+def generate_universe(
+    size: int,
+    kr_ratio: float = 0.4,
+    seed: int = 0,
+    missing_score_ratio: float = 0.0,
+    tie_ratio: float = 0.0
+) -> List[Dict[str, Any]]:
+    """
+    Generate a deterministic synthetic universe.
+
+    Args:
+        size: Number of symbols
+        kr_ratio: Fraction of KR symbols (rest are US)
+        seed: Random seed
+        missing_score_ratio: Fraction of symbols without a score
+        tie_ratio: Fraction of symbols drawn from a small integer score range (ties)
+
+    Returns:
+        Universe list of {symbol, market, score} dicts
+
+    Raises:
+        ValueError: If a ratio is outside [0, 1]
+    """
+    for name, ratio in (('kr_ratio', kr_ratio), ('missing_score_ratio', missing_score_ratio), ('tie_ratio', tie_ratio)):
+        if not 0.0 <= ratio <= 1.0:
+            raise ValueError(f"{name} must be within [0, 1]: {ratio}")
+
+    rng = random.Random(seed)
+    kr_count = round(size * kr_ratio)
+
+    universe = []
+    for i in range(size):
+        if i < kr_count:
+            symbol, market = f"{i:06d}.KS", "KR"
+        else:
+            symbol, market = f"US{i:07d}", "US"
+
+        roll = rng.random()
+        if roll < missing_score_ratio:
+            score = None
+        elif roll < missing_score_ratio + tie_ratio:
+            score = rng.randint(90, 100)
+        else:
+            score = round(rng.uniform(0.0, 100.0), 4)
+        universe.append({"symbol": symbol, "market": market, "score": score})
+
+    # market이 섞인 실제 snapshot 순서를 흉내냄
+    rng.shuffle(universe)
+    return universe
+
+
+def generate_snapshot(
+    size: int,
+    kr_ratio: float = 0.4,
+    seed: int = 0,
+    source: str = "synthetic",
+    asof: Optional[datetime] = None,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    Generate snapshot data in the load_sample_snapshot format.
+
+    Args:
+        size: Number of symbols
+        kr_ratio: Fraction of KR symbols
+        seed: Random seed
+        source: Snapshot source label
+        asof: Snapshot timestamp (default: now, UTC)
+        **kwargs: Passed to generate_universe (missing_score_ratio, tie_ratio)
+
+    Returns:
+        Snapshot data dict with 'asof', 'source', 'universe'
+    """
+    return {
+        'asof': asof or datetime.now(timezone.utc),
+        'source': source,
+        'universe': generate_universe(size, kr_ratio=kr_ratio, seed=seed, **kwargs)
+    }
@@ -0,0 +1,250 @@
+"""Constraint-driven weight allocation (score-proportional water-filling)"""
+
+import math
+from typing import Dict, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+MARKETS = ('KR', 'US')
+
+# 부동소수점 허용오차
+WEIGHT_TOLERANCE = 1e-9
+
+# Phase 0 기본값 (config에 값이 없을 때 사용)
+DEFAULT_MAX_POSITIONS = 20
+DEFAULT_MAX_WEIGHT_PER_POSITION = 0.08
+DEFAULT_TARGET_WEIGHTS = {'KR': 0.4, 'US': 0.6}
+
+WEIGHTING_SCORE = "score"
+WEIGHTING_EQUAL = "equal"
+
+
+def min_positions_for(target_weight: float, max_weight: float) -> int:
+    """
+    Minimum number of positions that can hold target_weight under the per-position cap.
+
+    Args:
+        target_weight: Market target weight (e.g. 0.4)
+        max_weight: Per-position weight cap (e.g. 0.08)
+
+    Returns:
+        ceil(target_weight / max_weight), ignoring float noise
+    """
+    return max(1, math.ceil(target_weight / max_weight - WEIGHT_TOLERANCE))
+
+
+class AllocationSpec:
+    """
+    Allocation constraints resolved from a config dict.
+
+    Config keys (all optional, Phase 0 defaults otherwise):
+    - max_positions, max_weight_per_position
+    - kr_target_weight, us_target_weight
+    - kr_positions, us_positions: positions per market
+      (default: minimum feasible count, ceil(target / cap))
+    - weighting: "score" (score-proportional, default) or "equal"
+    """
+
+    def __init__(
+        self,
+        max_positions: int,
+        max_weight: float,
+        target_weights: Dict[str, float],
+        positions: Dict[str, int],
+        weighting: str = WEIGHTING_SCORE
+    ):
+        self.max_positions = max_positions
+        self.max_weight = max_weight
+        self.target_weights = target_weights
+        self.positions = positions
+        self.weighting = weighting
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> "AllocationSpec":
+        """
+        Build spec from config dict.
+
+        Args:
+            config: Configuration dict (e.g. PHASE0_CONFIG)
+
+        Returns:
+            Validated AllocationSpec
+
+        Raises:
+            ValueError: If the constraints are infeasible or invalid
+        """
+        config = config or {}
+        max_weight = float(config.get('max_weight_per_position', DEFAULT_MAX_WEIGHT_PER_POSITION))
+        target_weights = {
+            market: float(config.get(f'{market.lower()}_target_weight', DEFAULT_TARGET_WEIGHTS[market]))
+            for market in MARKETS
+        }
+        positions = {
+            market: int(config.get(
+                f'{market.lower()}_positions',
+                min_positions_for(target_weights[market], max_weight)
+            ))
+            for market in MARKETS
+        }
+        spec = cls(
+            max_positions=int(config.get('max_positions', DEFAULT_MAX_POSITIONS)),
+            max_weight=max_weight,
+            target_weights=target_weights,
+            positions=positions,
+            weighting=config.get('weighting', WEIGHTING_SCORE)
+        )
+        spec.validate()
+        return spec
+
+    def validate(self) -> None:
+        """
+        Check that the constraints can be satisfied.
+
+        Raises:
+            ValueError: If the constraints are infeasible or invalid
+        """
+        if self.weighting not in (WEIGHTING_SCORE, WEIGHTING_EQUAL):
+            raise ValueError(f"Unknown weighting: {self.weighting}")
+        if self.max_weight <= 0:
+            raise ValueError(f"max_weight_per_position must be positive: {self.max_weight}")
+        if abs(sum(self.target_weights.values()) - 1.0) >= WEIGHT_TOLERANCE:
+            raise ValueError(f"Market target weights must sum to 1.0: {self.target_weights}")
+        for market in MARKETS:
+            if self.positions[market] * self.max_weight < self.target_weights[market] - WEIGHT_TOLERANCE:
+                raise ValueError(
+                    f"Infeasible {market} allocation: {self.positions[market]} positions x "
+                    f"{self.max_weight:.0%} cap < {self.target_weights[market]:.0%} target"
+                )
+        if sum(self.positions.values()) > self.max_positions:
+            raise ValueError(
+                f"Too many positions: {sum(self.positions.values())} > max_positions {self.max_positions}"
+            )
+
+
+def water_fill(raw: np.ndarray, target: float, cap: float) -> np.ndarray:
+    """
+    Allocate target proportionally to raw weights with a per-position cap.
+
+    Weight excess above the cap is redistributed to uncapped positions
+    in proportion to their raw weights (water-filling). Vectorized:
+    O(n log n) for the sort, O(n) otherwise.
+
+    Args:
+        raw: Positive raw weights (e.g. scores)
+        target: Total weight to allocate
+        cap: Per-position weight cap
+
+    Returns:
+        Weights (same order as raw), each <= cap, summing to target
+
+    Raises:
+        ValueError: If len(raw) * cap < target
+    """
+    n = len(raw)
+    if n == 0 or n * cap < target - WEIGHT_TOLERANCE:
+        raise ValueError(f"Infeasible allocation: {n} positions x {cap} cap < {target} target")
+
+    order = np.argsort(-raw, kind='stable')
+    sorted_raw = raw[order]
+
+    # k개를 cap으로 고정했을 때 나머지의 비례 계수: (target - k*cap) / sum(raw[k:])
+    tail_sums = np.cumsum(sorted_raw[::-1])[::-1]
+    capped_counts = np.arange(n)
+    scale = (target - capped_counts * cap) / tail_sums
+    # 비례 배분된 첫 종목이 cap 이하가 되는 최소 k
+    fits = sorted_raw * scale <= cap + WEIGHT_TOLERANCE
+    k = int(np.argmax(fits))
+
+    sorted_weights = np.empty(n)
+    sorted_weights[:k] = cap
+    sorted_weights[k:] = sorted_raw[k:] * scale[k]
+    np.minimum(sorted_weights, cap, out=sorted_weights)
+
+    weights = np.empty(n)
+    weights[order] = sorted_weights
+    return weights
+
+
+def market_weights(scores: Sequence[Optional[float]], target: float, spec: AllocationSpec) -> np.ndarray:
+    """
+    Weights for the selected stocks of one market.
+
+    Score weighting needs strictly positive scores; if any selected stock has
+    no score (None/NaN) or a non-positive score, the market falls back to
+    equal weights.
+
+    Args:
+        scores: Scores of selected stocks in ranking order
+        target: Market target weight
+        spec: Allocation spec
+
+    Returns:
+        Weight array
+    """
+    raw = np.array([np.nan if s is None else s for s in scores], dtype=np.float64)
+    if spec.weighting == WEIGHTING_EQUAL or not (np.all(np.isfinite(raw)) and np.all(raw > 0)):
+        raw = np.ones(len(raw))
+    return water_fill(raw, target, spec.max_weight)
+
+
+def check_constraints(weights: Dict[str, np.ndarray], spec: AllocationSpec) -> Dict[str, Any]:
+    """
+    Validate allocated weights against the spec.
+
+    Args:
+        weights: Market code -> weight array
+        spec: Allocation spec
+
+    Returns:
+        constraints_check dict (proposal payload format)
+    """
+    all_weights = np.concatenate([weights[market] for market in MARKETS])
+    total_positions = int(len(all_weights))
+    total_weight = float(all_weights.sum())
+    market_sums = {market: float(weights[market].sum()) for market in MARKETS}
+    max_weight = float(all_weights.max()) if total_positions else 0.0
+
+    passed = bool(
+        total_positions <= spec.max_positions and
+        max_weight <= spec.max_weight and
+        all(
+            abs(market_sums[market] - spec.target_weights[market]) < WEIGHT_TOLERANCE
+            for market in MARKETS
+        ) and
+        abs(total_weight - 1.0) < WEIGHT_TOLERANCE
+    )
+
+    return {
+        'max_positions': spec.max_positions,
+        'max_weight': spec.max_weight,
+        'kr_weight': spec.target_weights['KR'],
+        'us_weight': spec.target_weights['US'],
+        'passed': passed,
+        'actual_positions': total_positions,
+        'actual_max_weight': max_weight,
+        'actual_kr_weight': market_sums['KR'],
+        'actual_us_weight': market_sums['US'],
+        'actual_total_weight': total_weight
+    }
+
+
+def solve(
+    selected_scores: Dict[str, Sequence[Optional[float]]],
+    spec: AllocationSpec
+) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    Allocate weights to selected stocks and check constraints.
+
+    Args:
+        selected_scores: Market code -> scores of selected stocks (ranking order)
+        spec: Allocation spec
+
+    Returns:
+        (market code -> weight array, constraints_check dict)
+    """
+    weights = {
+        market: market_weights(selected_scores[market], spec.target_weights[market], spec)
+        for market in MARKETS
+    }
+    return weights, check_constraints(weights, spec)
@@ -0,0 +1,165 @@
+"""Columnar (NumPy) proposal generation for large universes"""
+
+import uuid
+from typing import Dict, Any, List, Union
+
+import numpy as np
+
+from kis.engine.allocator import AllocationSpec, solve
+from kis.engine.proposal import validate_market_counts
+
+
+class UniverseColumns:
+    """
+    Column-oriented view of a snapshot universe.
+
+    symbol/market/score are held as parallel NumPy arrays so that market
+    partitioning, top-k selection and constraint checks run as array operations.
+    The view is built once per snapshot and can be reused across configs.
+    """
+
+    def __init__(self, symbols: np.ndarray, markets: np.ndarray, scores: np.ndarray):
+        """
+        Initialize columns.
+
+        Args:
+            symbols: Symbol array (str)
+            markets: Market array (str)
+            scores: Score array (float, NaN if score is missing)
+        """
+        self.symbols = symbols
+        self.markets = markets
+        self.scores = scores
+        # 오름차순 정렬 키: -score, score 없음 → 0 (create_proposal의 stock_sort_key와 동일)
+        self.sort_keys = np.where(np.isnan(scores), 0.0, -scores)
+
+    @classmethod
+    def from_universe(cls, universe: List[Dict[str, Any]]) -> "UniverseColumns":
+        """
+        Build columns from a universe list of {symbol, market, score} dicts.
+
+        Args:
+            universe: Universe list from snapshot data
+
+        Returns:
+            UniverseColumns instance
+        """
+        n = len(universe)
+        symbols = np.array([s.get('symbol', '') for s in universe], dtype=str)
+        markets = np.array([s.get('market', '') for s in universe], dtype=str)
+        scores = np.fromiter(
+            (np.nan if s.get('score') is None else s['score'] for s in universe),
+            dtype=np.float64,
+            count=n
+        )
+        return cls(symbols, markets, scores)
+
+    @classmethod
+    def from_snapshot(cls, universe_snapshot: Dict[str, Any]) -> "UniverseColumns":
+        """
+        Build columns from snapshot data containing 'universe' list.
+
+        Args:
+            universe_snapshot: Snapshot data dict
+
+        Returns:
+            UniverseColumns instance
+        """
+        return cls.from_universe(universe_snapshot.get('universe', []))
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def market_indices(self, market: str) -> np.ndarray:
+        """
+        Get row indices for a market.
+
+        Args:
+            market: Market code ('KR' or 'US')
+
+        Returns:
+            Integer index array
+        """
+        return np.flatnonzero(self.markets == market)
+
+    def top_k(self, indices: np.ndarray, k: int) -> np.ndarray:
+        """
+        Select top-k rows by (score desc, symbol asc) without a full sort.
+
+        np.partition finds the k-th sort key in O(n); only rows at or above that
+        key (k rows plus ties) are ordered with lexsort.
+
+        Args:
+            indices: Candidate row indices
+            k: Number of rows to select
+
+        Returns:
+            Selected row indices in ranking order
+        """
+        if k <= 0 or len(indices) == 0:
+            return indices[:0]
+
+        keys = self.sort_keys[indices]
+        if len(indices) > k:
+            kth_key = np.partition(keys, k - 1)[k - 1]
+            mask = keys <= kth_key
+            indices = indices[mask]
+            keys = keys[mask]
+
+        order = np.lexsort((self.symbols[indices], keys))
+        return indices[order[:k]]
+
+
+def create_proposal_columnar(
+    universe: Union[Dict[str, Any], UniverseColumns],
+    config: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    """
+    Create a proposal using the columnar engine.
+
+    Same selection, allocation solver and payload shape as
+    kis.engine.proposal.create_proposal, intended for 10k+ symbol universes.
+
+    Args:
+        universe: Snapshot data containing 'universe' list, or prebuilt UniverseColumns
+        config: Optional configuration dict (see create_proposal)
+
+    Returns:
+        Proposal payload dict with positions, constraints_check, correlation_id
+
+    Raises:
+        ValueError: If universe has insufficient stocks or the config is infeasible
+    """
+    spec = AllocationSpec.from_config(config)
+
+    columns = universe if isinstance(universe, UniverseColumns) else UniverseColumns.from_snapshot(universe)
+
+    # 1. market별 분리
+    indices = {market: columns.market_indices(market) for market in ('KR', 'US')}
+
+    # 2. 최소 수량 확인
+    validate_market_counts(len(indices['KR']), len(indices['US']), spec)
+
+    # 3. market별 top-k 선택
+    selected = {
+        market: columns.top_k(market_indices, spec.positions[market])
+        for market, market_indices in indices.items()
+    }
+
+    # 4. 가중치 배분 및 제약 검증 (create_proposal과 동일 solver)
+    weights, constraints_check = solve(
+        {market: columns.scores[rows] for market, rows in selected.items()},
+        spec
+    )
+
+    # 5. positions 생성 (JSON 직렬화를 위해 Python 타입으로 변환)
+    positions = []
+    for market in ('KR', 'US'):
+        for symbol, weight in zip(columns.symbols[selected[market]].tolist(), weights[market].tolist()):
+            positions.append({'symbol': symbol, 'market': market, 'weight': weight})
+
+    return {
+        'positions': positions,
+        'constraints_check': constraints_check,
+        'correlation_id': str(uuid.uuid4())
+    }
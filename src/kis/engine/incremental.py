@@ -0,0 +1,295 @@
+"""Incremental proposal recomputation on universe deltas"""
+
+import bisect
+import heapq
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from kis.engine.allocator import AllocationSpec
+from kis.engine.proposal import (
+    create_proposal,
+    stock_sort_key,
+    validate_market_counts,
+)
+
+
+class MarketBook:
+    """
+    Scores of one market plus its current top-k (create_proposal ordering).
+
+    Updates that keep the top-k well defined (a stock entering the top-k,
+    a top-k stock improving, any change outside the top-k) cost O(log k)
+    plus a list insert. Only removing or worsening a top-k stock forces a
+    rebuild, which is O(n log k) and deferred until top() is called.
+    """
+
+    def __init__(self, k: int):
+        """
+        Initialize book.
+
+        Args:
+            k: Number of stocks in the top-k
+        """
+        self.k = k
+        self.stocks: Dict[str, Dict[str, Any]] = {}
+        self._top: List[Tuple[Tuple[float, str], str]] = []
+        self._top_symbols = set()
+        self._dirty = False
+
+    def __len__(self) -> int:
+        return len(self.stocks)
+
+    def load(self, stocks: Iterable[Dict[str, Any]]) -> None:
+        """
+        Replace all stocks and rebuild the top-k.
+
+        Args:
+            stocks: Universe entries of this market
+        """
+        self.stocks = {stock['symbol']: stock for stock in stocks}
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        best = heapq.nsmallest(self.k, self.stocks.values(), key=stock_sort_key)
+        self._top = [(stock_sort_key(stock), stock['symbol']) for stock in best]
+        self._top_symbols = {symbol for _, symbol in self._top}
+        self._dirty = False
+
+    def _remove_from_top(self, symbol: str) -> Tuple[float, str]:
+        for i, (key, top_symbol) in enumerate(self._top):
+            if top_symbol == symbol:
+                del self._top[i]
+                self._top_symbols.discard(symbol)
+                return key
+        raise KeyError(symbol)
+
+    def upsert(self, stock: Dict[str, Any]) -> None:
+        """
+        Add or rescore a stock.
+
+        Args:
+            stock: Universe entry dict
+        """
+        symbol = stock['symbol']
+        self.stocks[symbol] = stock
+        if self._dirty:
+            return
+
+        new_key = stock_sort_key(stock)
+        if symbol in self._top_symbols:
+            old_key = self._remove_from_top(symbol)
+            if new_key > old_key:
+                # top-k 밖의 종목이 추월했을 수 있음
+                self._dirty = True
+                return
+            bisect.insort(self._top, (new_key, symbol))
+            self._top_symbols.add(symbol)
+        elif len(self._top) < self.k or new_key < self._top[-1][0]:
+            bisect.insort(self._top, (new_key, symbol))
+            self._top_symbols.add(symbol)
+            if len(self._top) > self.k:
+                _, dropped = self._top.pop()
+                self._top_symbols.discard(dropped)
+
+    def remove(self, symbol: str) -> None:
+        """
+        Remove a stock.
+
+        Args:
+            symbol: Stock symbol
+
+        Raises:
+            KeyError: If the symbol is not in this market
+        """
+        del self.stocks[symbol]
+        if not self._dirty and symbol in self._top_symbols:
+            self._remove_from_top(symbol)
+            self._dirty = True
+
+    def top(self) -> List[Dict[str, Any]]:
+        """
+        Get top-k stocks in ranking order.
+
+        Returns:
+            List of universe entry dicts (best first)
+        """
+        if self._dirty:
+            self._rebuild()
+        return [self.stocks[symbol] for _, symbol in self._top]
+
+
+def diff_positions(
+    previous: List[Dict[str, Any]],
+    current: List[Dict[str, Any]]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Diff two position lists by symbol.
+
+    Args:
+        previous: Positions of the last proposal
+        current: Positions of the new proposal
+
+    Returns:
+        Dict with 'added', 'removed' (position dicts) and 'changed'
+        ({symbol, market, old_weight, new_weight})
+    """
+    previous_by_symbol = {p['symbol']: p for p in previous}
+    current_by_symbol = {p['symbol']: p for p in current}
+
+    added = [p for p in current if p['symbol'] not in previous_by_symbol]
+    removed = [p for p in previous if p['symbol'] not in current_by_symbol]
+    changed = [
+        {
+            'symbol': p['symbol'],
+            'market': p['market'],
+            'old_weight': previous_by_symbol[p['symbol']]['weight'],
+            'new_weight': p['weight']
+        }
+        for p in current
+        if p['symbol'] in previous_by_symbol
+        and previous_by_symbol[p['symbol']]['weight'] != p['weight']
+    ]
+
+    return {'added': added, 'removed': removed, 'changed': changed}
+
+
+class IncrementalProposalEngine:
+    """
+    Keeps per-market top-k state between snapshots so score ticks can be
+    applied as deltas instead of re-sorting the whole universe.
+    """
+
+    def __init__(self, config: Dict[str, Any] = None):
+        """
+        Initialize engine.
+
+        Args:
+            config: Optional configuration dict passed to create_proposal
+        """
+        self.config = config
+        self.spec = AllocationSpec.from_config(config)
+        self.books = {
+            market: MarketBook(k) for market, k in self.spec.positions.items()
+        }
+        self._market_of: Dict[str, str] = {}
+        self.last_proposal: Optional[Dict[str, Any]] = None
+
+    def load_snapshot(self, universe_snapshot: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Load a full snapshot and create the baseline proposal.
+
+        Args:
+            universe_snapshot: Snapshot data containing 'universe' list
+
+        Returns:
+            Dict with 'proposal' and 'diff' (diff against the previous proposal, if any)
+
+        Raises:
+            ValueError: If universe has insufficient stocks
+        """
+        by_market = {market: [] for market in self.books}
+        self._market_of = {}
+        for stock in universe_snapshot.get('universe', []):
+            market = stock.get('market')
+            if market in by_market:
+                by_market[market].append(stock)
+                self._market_of[stock['symbol']] = market
+        for market, book in self.books.items():
+            book.load(by_market[market])
+
+        return self._emit()
+
+    def apply_delta(
+        self,
+        added: Optional[List[Dict[str, Any]]] = None,
+        removed: Optional[List[str]] = None,
+        rescored: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Apply a universe delta and emit the new proposal.
+
+        Args:
+            added: New universe entries ({symbol, market, score})
+            removed: Symbols removed from the universe
+            rescored: Mapping of symbol -> new score (None clears the score)
+
+        Returns:
+            Dict with 'proposal' and 'diff' against the last proposal
+
+        Raises:
+            ValueError: If a removed/rescored symbol is unknown or universe becomes insufficient
+        """
+        if self.last_proposal is None:
+            raise ValueError("No baseline proposal: call load_snapshot first")
+
+        # 전체 delta를 먼저 검증: 거부된 delta가 books에 일부만 반영되지 않도록
+        self._validate_delta(added or [], removed or [], rescored or {})
+
+        for symbol in removed or []:
+            market = self._market_of.pop(symbol, None)
+            if market is None:
+                raise ValueError(f"Unknown symbol in delta: {symbol}")
+            self.books[market].remove(symbol)
+
+        for stock in added or []:
+            market = stock.get('market')
+            if market not in self.books:
+                continue
+            previous_market = self._market_of.get(stock['symbol'])
+            if previous_market is not None and previous_market != market:
+                self.books[previous_market].remove(stock['symbol'])
+            self._market_of[stock['symbol']] = market
+            self.books[market].upsert(stock)
+
+        for symbol, score in (rescored or {}).items():
+            market = self._market_of.get(symbol)
+            if market is None:
+                raise ValueError(f"Unknown symbol in delta: {symbol}")
+            book = self.books[market]
+            book.upsert(dict(book.stocks[symbol], score=score))
+
+        return self._emit()
+
+    def _validate_delta(
+        self,
+        added: List[Dict[str, Any]],
+        removed: List[str],
+        rescored: Dict[str, Any]
+    ) -> None:
+        """Check symbols and resulting market counts of a delta without changing any state"""
+        # symbol -> 적용 후 market (None = 삭제), 변경되는 symbol만 기록
+        pending: Dict[str, Optional[str]] = {}
+
+        def market_of(symbol: str) -> Optional[str]:
+            return pending[symbol] if symbol in pending else self._market_of.get(symbol)
+
+        for symbol in removed:
+            if market_of(symbol) is None:
+                raise ValueError(f"Unknown symbol in delta: {symbol}")
+            pending[symbol] = None
+        for stock in added:
+            if stock.get('market') in self.books:
+                pending[stock['symbol']] = stock['market']
+        for symbol in rescored:
+            if market_of(symbol) is None:
+                raise ValueError(f"Unknown symbol in delta: {symbol}")
+
+        counts = {market: len(book) for market, book in self.books.items()}
+        for symbol, market in pending.items():
+            previous_market = self._market_of.get(symbol)
+            if previous_market is not None:
+                counts[previous_market] -= 1
+            if market is not None:
+                counts[market] += 1
+        validate_market_counts(counts['KR'], counts['US'], self.spec)
+
+    def _emit(self) -> Dict[str, Any]:
+        validate_market_counts(len(self.books['KR']), len(self.books['US']), self.spec)
+
+        reduced_universe = self.books['KR'].top() + self.books['US'].top()
+        proposal = create_proposal({'universe': reduced_universe}, self.config)
+
+        previous_positions = self.last_proposal['positions'] if self.last_proposal else []
+        diff = diff_positions(previous_positions, proposal['positions'])
+        self.last_proposal = proposal
+
+        return {'proposal': proposal, 'diff': diff}
@@ -0,0 +1,282 @@
+"""Process-pool parallel proposal generation for multi-snapshot sweeps"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+
+from sqlalchemy.orm import sessionmaker
+
+from kis.storage.factory import create_storage_engine
+from kis.storage.models import Snapshot
+from kis.engine.sample_data import load_snapshot_file
+from kis.engine.proposal import create_proposal
+from kis.engine.run import save_snapshot, save_proposal, log_proposal_created
+
+
+# Worker process별 DB engine 캐시 (database_url -> engine)
+_worker_engines: Dict[str, Any] = {}
+
+
+def propose_all(snapshot_data: Dict[str, Any], configs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Run every config against one parsed snapshot.
+
+    Args:
+        snapshot_data: Snapshot data dict with 'universe'
+        configs: Configuration dicts
+
+    Returns:
+        List of {config_index, proposal} or {config_index, error} (config order)
+    """
+    outcomes = []
+    for config_index, config in enumerate(configs):
+        try:
+            outcomes.append({"config_index": config_index, "proposal": create_proposal(snapshot_data, config)})
+        except ValueError as e:
+            outcomes.append({"config_index": config_index, "error": str(e)})
+    return outcomes
+
+
+def propose_from_file(file_path: str, configs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Worker task: load snapshot file once and create a proposal per config.
+
+    Args:
+        file_path: Snapshot file path (JSON or NDJSON)
+        configs: Configuration dicts of the sweep
+
+    Returns:
+        Result dict with source, snapshot (None if loading failed), outcomes
+        and error (if loading failed)
+    """
+    try:
+        snapshot_data = load_snapshot_file(file_path)
+    except (FileNotFoundError, ValueError) as e:
+        return {"source": file_path, "snapshot": None, "outcomes": [], "error": str(e)}
+    return {
+        "source": file_path,
+        "snapshot": snapshot_data,
+        "outcomes": propose_all(snapshot_data, configs)
+    }
+
+
+def propose_from_snapshot_id(
+    database_url: str,
+    snapshot_id: int,
+    configs: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Worker task: load stored snapshot by ID once and create a proposal per config.
+
+    Args:
+        database_url: Database URL (each worker opens its own engine)
+        snapshot_id: Snapshot ID in snapshots table
+        configs: Configuration dicts of the sweep
+
+    Returns:
+        Result dict with source, snapshot_id, outcomes and error (if loading failed)
+    """
+    try:
+        snapshot_data = load_stored_snapshot(database_url, snapshot_id)
+    except ValueError as e:
+        return {"source": f"snapshot:{snapshot_id}", "snapshot_id": snapshot_id, "outcomes": [], "error": str(e)}
+    return {
+        "source": f"snapshot:{snapshot_id}",
+        "snapshot_id": snapshot_id,
+        "outcomes": propose_all(snapshot_data, configs)
+    }
+
+
+def load_stored_snapshot(database_url: str, snapshot_id: int) -> Dict[str, Any]:
+    """
+    Load stored snapshot payload by ID (worker-side, engine cached per process).
+
+    Args:
+        database_url: Database URL
+        snapshot_id: Snapshot ID in snapshots table
+
+    Returns:
+        Snapshot payload dict
+
+    Raises:
+        ValueError: If snapshot does not exist
+    """
+    engine = _worker_engines.get(database_url)
+    if engine is None:
+        engine = create_storage_engine(database_url)
+        _worker_engines[database_url] = engine
+
+    session = sessionmaker(bind=engine)()
+    try:
+        # payload_json은 deferred 컬럼이므로 직접 조회 (추가 round trip 없음)
+        row = session.query(Snapshot.payload_json).filter_by(snapshot_id=snapshot_id).first()
+        if row is None:
+            raise ValueError(f"Snapshot {snapshot_id} not found")
+        return row.payload_json
+    finally:
+        session.close()
+
+
+def iter_results(tasks: List[Tuple], workers: int) -> Iterator[Dict[str, Any]]:
+    """Run tasks inline (workers <= 1) or on a process pool, yielding results as they complete"""
+    if workers <= 1:
+        for func, *args in tasks:
+            yield func(*args)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(func, *args) for func, *args in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_parallel(
+    session,
+    configs: List[Dict[str, Any]],
+    workers: int,
+    snapshot_files: Optional[List[str]] = None,
+    snapshot_ids: Optional[List[int]] = None,
+    database_url: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fan out create_proposal over snapshot files or stored snapshot IDs.
+
+    One task per source: the worker parses the snapshot once and runs every
+    config against it. Results stream back to this process, which is the
+    single writer persisting the snapshot (file mode, once per file),
+    proposals and proposal_created events as each result arrives.
+
+    A source that fails to load or a config that fails on a snapshot is
+    reported as an error result; the rest of the sweep continues.
+
+    Args:
+        session: SQLAlchemy session used by the writer
+        configs: Configuration dicts (every source is run with every config)
+        workers: Number of worker processes (<= 1 runs inline)
+        snapshot_files: Snapshot JSON file paths
+        snapshot_ids: Snapshot IDs from snapshots table (requires database_url)
+        database_url: Database URL for workers loading stored snapshots
+
+    Returns:
+        List of result dicts (completion order): source, config_index, snapshot_id,
+        proposal and proposal_id, or error if the proposal could not be created
+    """
+    tasks = [(propose_from_file, file_path, configs) for file_path in snapshot_files or []]
+    tasks += [(propose_from_snapshot_id, database_url, snapshot_id, configs) for snapshot_id in snapshot_ids or []]
+
+    results = []
+    for task_result in iter_results(tasks, workers):
+        source = task_result["source"]
+        if "error" in task_result:
+            # snapshot 로드 실패: 해당 source의 모든 config를 오류로 기록
+            results.extend(
+                {"source": source, "config_index": config_index, "error": task_result["error"]}
+                for config_index in range(len(configs))
+            )
+            continue
+
+        snapshot_id = task_result.get("snapshot_id")
+        for outcome in task_result["outcomes"]:
+            result = {"source": source, **outcome}
+            if "error" in outcome:
+                results.append(result)
+                continue
+            if snapshot_id is None:
+                # 파일 snapshot은 source당 1회만 저장
+                snapshot_id = save_snapshot(session, task_result["snapshot"])
+
+            proposal_data = outcome["proposal"]
+            result["snapshot_id"] = snapshot_id
+            result["proposal_id"] = save_proposal(
+                session, proposal_data, snapshot_id, configs[outcome["config_index"]]
+            )
+            log_proposal_created(
+                session,
+                result["proposal_id"],
+                snapshot_id,
+                proposal_data["correlation_id"],
+                proposal_data["constraints_check"]["passed"]
+            )
+            results.append(result)
+
+    return results
+
+
+def parse_snapshot_ids(spec: str) -> List[int]:
+    """
+    Parse snapshot ID spec such as "1-30" or "3,5,8-10".
+
+    Args:
+        spec: Comma separated IDs and inclusive ranges
+
+    Returns:
+        Sorted list of unique snapshot IDs
+
+    Raises:
+        ValueError: If the spec is malformed
+    """
+    ids = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            ids.update(range(int(start), int(end) + 1))
+        else:
+            ids.add(int(part))
+    if not ids:
+        raise ValueError(f"Invalid snapshot ID spec: {spec!r}")
+    return sorted(ids)
+
+
+def run_sweep(
+    session,
+    configs: List[Dict[str, Any]],
+    workers: int,
+    snapshot_files: Optional[List[str]] = None,
+    snapshot_ids: Optional[List[int]] = None,
+    database_url: Optional[str] = None
+) -> int:
+    """
+    Run parallel sweep and print throughput.
+
+    Args:
+        session: SQLAlchemy session used by the writer
+        configs: Configuration dicts
+        workers: Number of worker processes
+        snapshot_files: Snapshot JSON file paths
+        snapshot_ids: Snapshot IDs from snapshots table
+        database_url: Database URL for workers
+
+    Returns:
+        Exit code (1 if any proposal failed)
+    """
+    started = time.perf_counter()
+    results = run_parallel(
+        session,
+        configs,
+        workers,
+        snapshot_files=snapshot_files,
+        snapshot_ids=snapshot_ids,
+        database_url=database_url
+    )
+    elapsed = time.perf_counter() - started
+
+    failed = [r for r in results if "error" in r]
+    created = [r for r in results if "error" not in r]
+    passed = sum(1 for r in created if r["proposal"]["constraints_check"]["passed"])
+    throughput = len(created) / elapsed if elapsed > 0 else float("inf")
+
+    for result in failed:
+        print(f"Error: {result['source']} (config {result['config_index']}): {result['error']}")
+
+    print("\n" + "="*50)
+    print(f"Parallel proposal generation completed ({workers} workers)")
+    print("="*50)
+    print(f"Proposals: {len(created)} (constraints passed: {passed}, failed: {len(failed)})")
+    print(f"Elapsed: {elapsed:.3f}s")
+    print(f"Throughput: {throughput:.1f} proposals/sec")
+    print("="*50)
+
+    return 1 if failed else 0
@@ -1,33 +1,117 @@
 """Proposal generation logic for Engine module"""
 
 import uuid
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+from kis.engine.allocator import (
+    AllocationSpec,
+    DEFAULT_MAX_POSITIONS,
+    DEFAULT_MAX_WEIGHT_PER_POSITION,
+    DEFAULT_TARGET_WEIGHTS,
+    min_positions_for,
+    solve,
+)
 
 
 # Phase 0 고정 파라미터
-MAX_POSITIONS = 20
-MAX_WEIGHT_PER_POSITION = 0.08
-KR_TARGET_WEIGHT = 0.4
-US_TARGET_WEIGHT = 0.6
+MAX_POSITIONS = DEFAULT_MAX_POSITIONS
+MAX_WEIGHT_PER_POSITION = DEFAULT_MAX_WEIGHT_PER_POSITION
+KR_TARGET_WEIGHT = DEFAULT_TARGET_WEIGHTS['KR']
+US_TARGET_WEIGHT = DEFAULT_TARGET_WEIGHTS['US']
+
+# 기본 선택 수량 (제약 만족을 위한 최소값: ceil(목표비중 / 종목당 상한) → KR 5, US 8)
+MIN_KR_POSITIONS = min_positions_for(KR_TARGET_WEIGHT, MAX_WEIGHT_PER_POSITION)
+MIN_US_POSITIONS = min_positions_for(US_TARGET_WEIGHT, MAX_WEIGHT_PER_POSITION)
+
+
+def stock_sort_key(stock: Dict[str, Any]) -> Tuple[float, str]:
+    """
+    Ranking key for a universe entry: score descending, then symbol.
+    
+    Stocks without a score rank as score 0.
+    
+    Args:
+        stock: Universe entry dict
+        
+    Returns:
+        Ascending sort key tuple
+    """
+    score = stock.get('score')
+    if score is not None:
+        return (-score, stock.get('symbol', ''))
+    return (0, stock.get('symbol', ''))
+
 
-# 기본 선택 수량 (제약 만족을 위한 최소값)
-MIN_KR_POSITIONS = 5
-MIN_US_POSITIONS = 8
+def validate_market_counts(kr_count: int, us_count: int, spec: Optional[AllocationSpec] = None) -> None:
+    """
+    Validate that the universe has enough stocks per market.
+    
+    Args:
+        kr_count: Number of KR stocks in the universe
+        us_count: Number of US stocks in the universe
+        spec: Allocation spec (default: Phase 0 parameters)
+        
+    Raises:
+        ValueError: If universe has insufficient stocks (default: KR < 5 or US < 8)
+    """
+    if spec is None:
+        spec = AllocationSpec.from_config()
+    
+    for market, count in (('KR', kr_count), ('US', us_count)):
+        required = spec.positions[market]
+        if count < required:
+            raise ValueError(
+                f"Insufficient {market} stocks: {count} < {required}. "
+                f"Need at least {required} {market} stocks to satisfy "
+                f"{spec.target_weights[market]:.0%} allocation with {spec.max_weight:.0%} cap."
+            )
+
+
+def build_positions(
+    selected: Dict[str, List[Dict[str, Any]]],
+    spec: AllocationSpec
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Allocate weights to selected stocks and build positions.
+    
+    Args:
+        selected: Market code -> selected universe entries in ranking order
+        spec: Allocation spec
+        
+    Returns:
+        (positions list, constraints_check dict)
+    """
+    weights, constraints_check = solve(
+        {market: [stock.get('score') for stock in stocks] for market, stocks in selected.items()},
+        spec
+    )
+    
+    positions = []
+    for market in ('KR', 'US'):
+        for stock, weight in zip(selected[market], weights[market].tolist()):
+            positions.append({
+                'symbol': stock['symbol'],
+                'market': market,
+                'weight': weight
+            })
+    
+    return positions, constraints_check
 
 
 def create_proposal(universe_snapshot: Dict[str, Any], config: Dict[str, Any] = None) -> Dict[str, Any]:
     """
     Create a proposal from universe snapshot data.
     
-    Phase 0 알고리즘:
-    - KR 5개, US 8개 선택 (총 13개)
-    - KR: 40%를 5개로 동일가중 분배 (각 8%)
-    - US: 60%를 8개로 동일가중 분배 (각 7.5%)
-    - 제약: 최대 20종목, 종목당 최대 8%, KR/US 40/60
+    알고리즘 (kis.engine.allocator):
+    - market별 score 상위 N개 선택 (기본 KR 5개, US 8개 = ceil(목표비중 / 종목당 상한))
+    - market 목표비중을 score 비례로 분배, 종목당 상한 초과분은 나머지 종목에 재분배 (water-filling)
+    - score가 없거나 0 이하인 종목이 선택된 market은 동일가중
+    - 제약: 최대 20종목, 종목당 최대 8%, KR/US 40/60 (config 값이 있으면 config 우선)
     
     Args:
         universe_snapshot: Snapshot data containing 'universe' list
-        config: Optional configuration dict (for future use)
+        config: Optional configuration dict (max_positions, max_weight_per_position,
+                kr_target_weight, us_target_weight, kr_positions, us_positions, weighting)
         
     Returns:
         Proposal payload dict with:
@@ -36,10 +120,10 @@ def create_proposal(universe_snapshot: Dict[str, Any], config: Dict[str, Any] =
         - correlation_id: UUID4 string
         
     Raises:
-        ValueError: If universe has insufficient stocks (KR < 5 or US < 8)
+        ValueError: If universe has insufficient stocks (default: KR < 5 or US < 8)
+            or the config constraints are infeasible
     """
-    if config is None:
-        config = {}
+    spec = AllocationSpec.from_config(config)
     
     universe = universe_snapshot.get('universe', [])
     
@@ -48,84 +132,22 @@ def create_proposal(universe_snapshot: Dict[str, Any], config: Dict[str, Any] =
     us_stocks = [s for s in universe if s.get('market') == 'US']
     
     # 2. 에러 처리: 최소 수량 확인
-    if len(kr_stocks) < MIN_KR_POSITIONS:
-        raise ValueError(
-            f"Insufficient KR stocks: {len(kr_stocks)} < {MIN_KR_POSITIONS}. "
-            f"Need at least {MIN_KR_POSITIONS} KR stocks to satisfy 40% allocation with 8% cap."
-        )
-    if len(us_stocks) < MIN_US_POSITIONS:
-        raise ValueError(
-            f"Insufficient US stocks: {len(us_stocks)} < {MIN_US_POSITIONS}. "
-            f"Need at least {MIN_US_POSITIONS} US stocks to satisfy 60% allocation with 8% cap."
-        )
+    validate_market_counts(len(kr_stocks), len(us_stocks), spec)
     
     # 3. 각 market별로 score 내림차순 정렬 (없으면 symbol 정렬)
-    def sort_key(stock):
-        score = stock.get('score')
-        if score is not None:
-            return (-score, stock.get('symbol', ''))
-        return (0, stock.get('symbol', ''))
-    
-    kr_sorted = sorted(kr_stocks, key=sort_key)
-    us_sorted = sorted(us_stocks, key=sort_key)
+    kr_sorted = sorted(kr_stocks, key=stock_sort_key)
+    us_sorted = sorted(us_stocks, key=stock_sort_key)
     
-    # 4. 기본 선택: KR 5개, US 8개
-    selected_kr = kr_sorted[:MIN_KR_POSITIONS]
-    selected_us = us_sorted[:MIN_US_POSITIONS]
-    
-    # 5. 가중치 계산
-    # KR: 40%를 5개로 동일가중 분배 → 각 8% (0.08)
-    kr_weight_per_stock = KR_TARGET_WEIGHT / MIN_KR_POSITIONS
-    
-    # US: 60%를 8개로 동일가중 분배 → 각 7.5% (0.075)
-    us_weight_per_stock = US_TARGET_WEIGHT / MIN_US_POSITIONS
-    
-    # 6. positions 생성
-    positions = []
-    
-    for stock in selected_kr:
-        positions.append({
-            'symbol': stock['symbol'],
-            'market': 'KR',
-            'weight': kr_weight_per_stock
-        })
-    
-    for stock in selected_us:
-        positions.append({
-            'symbol': stock['symbol'],
-            'market': 'US',
-            'weight': us_weight_per_stock
-        })
-    
-    # 7. 제약 검증
-    total_positions = len(positions)
-    total_weight = sum(p['weight'] for p in positions)
-    kr_weight_sum = sum(p['weight'] for p in positions if p['market'] == 'KR')
-    us_weight_sum = sum(p['weight'] for p in positions if p['market'] == 'US')
-    max_weight = max(p['weight'] for p in positions)
-    
-    constraints_passed = (
-        total_positions <= MAX_POSITIONS and
-        max_weight <= MAX_WEIGHT_PER_POSITION and
-        abs(kr_weight_sum - KR_TARGET_WEIGHT) < 1e-9 and
-        abs(us_weight_sum - US_TARGET_WEIGHT) < 1e-9 and
-        abs(total_weight - 1.0) < 1e-9
-    )
-    
-    constraints_check = {
-        'max_positions': MAX_POSITIONS,
-        'max_weight': MAX_WEIGHT_PER_POSITION,
-        'kr_weight': KR_TARGET_WEIGHT,
-        'us_weight': US_TARGET_WEIGHT,
-        'passed': constraints_passed,
-        'actual_positions': total_positions,
-        'actual_max_weight': max_weight,
-        'actual_kr_weight': kr_weight_sum,
-        'actual_us_weight': us_weight_sum,
-        'actual_total_weight': total_weight
+    # 4. 선택 (기본 KR 5개, US 8개)
+    selected = {
+        'KR': kr_sorted[:spec.positions['KR']],
+        'US': us_sorted[:spec.positions['US']]
     }
     
-    # 8. correlation_id 생성
+    # 5. 가중치 배분 및 제약 검증 (동일 solver)
+    positions, constraints_check = build_positions(selected, spec)
+    
+    # 6. correlation_id 생성
     correlation_id = str(uuid.uuid4())
     
     return {
@@ -133,4 +155,3 @@ def create_proposal(universe_snapshot: Dict[str, Any], config: Dict[str, Any] =
         'constraints_check': constraints_check,
         'correlation_id': correlation_id
     }
-
@@ -0,0 +1,168 @@
+"""Proposal provenance (build SHA, config hash, schema version) resolved once per process"""
+
+import hashlib
+import json
+import os
+import subprocess
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from kis.storage.models import SchemaVersion
+
+
+REPO_ROOT = Path(__file__).parent.parent.parent.parent
+
+# 배포 시 빌드 SHA를 기록하는 파일 (git이 없는 배포 환경용)
+BUILD_VERSION_FILE = REPO_ROOT / "BUILD_VERSION"
+
+# git_commit_sha 컬럼 길이
+GIT_COMMIT_SHA_MAX_LENGTH = 40
+
+
+def get_git_commit_sha() -> str:
+    """
+    Get current git commit SHA.
+
+    Returns:
+        Git commit SHA string, or "unknown" if git command fails
+    """
+    try:
+        result = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=REPO_ROOT
+        )
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return "unknown"
+
+
+def get_config_hash(config: Dict[str, Any]) -> str:
+    """
+    Calculate SHA256 hash of sorted JSON config.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        SHA256 hash as hex string (64 characters)
+    """
+    # Sort keys for deterministic hash
+    sorted_config = json.dumps(config, sort_keys=True)
+    return hashlib.sha256(sorted_config.encode('utf-8')).hexdigest()
+
+
+def get_schema_version(session) -> str:
+    """
+    Get latest schema version from database.
+
+    Args:
+        session: SQLAlchemy session
+
+    Returns:
+        Schema version string (e.g., "0.1.0")
+    """
+    schema_version = session.query(SchemaVersion).order_by(
+        SchemaVersion.applied_at.desc()
+    ).first()
+
+    if schema_version:
+        return schema_version.schema_version
+    else:
+        # Fallback to default if no version found
+        return "0.1.0"
+
+
+def resolve_build_sha() -> str:
+    """
+    Resolve build SHA without forking when possible.
+
+    Order: BUILD_VERSION env var, BUILD_VERSION file, `git rev-parse HEAD`.
+
+    Returns:
+        Build SHA string (max 40 chars), or "unknown"
+    """
+    build_version = os.getenv("BUILD_VERSION", "").strip()
+    if not build_version and BUILD_VERSION_FILE.exists():
+        build_version = BUILD_VERSION_FILE.read_text(encoding='utf-8').strip()
+    if not build_version:
+        build_version = get_git_commit_sha()
+    return build_version[:GIT_COMMIT_SHA_MAX_LENGTH]
+
+
+class ProvenanceContext:
+    """
+    Provenance values reused for every proposal created in the process.
+
+    - git_commit_sha: resolved once (env/file, falling back to git once)
+    - config_hash: hashed from canonical JSON on every call (cheap, never stale)
+    - schema_version: memoized per database URL
+    """
+
+    def __init__(self, git_commit_sha: Optional[str] = None):
+        """
+        Initialize context.
+
+        Args:
+            git_commit_sha: Optional fixed build SHA (resolved lazily if None)
+        """
+        self._git_commit_sha = git_commit_sha
+        self._schema_versions: Dict[str, str] = {}
+
+    @property
+    def git_commit_sha(self) -> str:
+        """Build SHA (resolved on first access)"""
+        if self._git_commit_sha is None:
+            self._git_commit_sha = resolve_build_sha()
+        return self._git_commit_sha
+
+    def config_hash(self, config: Dict[str, Any]) -> str:
+        """
+        Get config hash.
+
+        Not memoized: hashing the canonical JSON of a small config costs
+        about as much as comparing a cached copy, and a mutated dict can
+        never return a stale hash.
+
+        Args:
+            config: Configuration dictionary
+
+        Returns:
+            SHA256 hash as hex string
+        """
+        return get_config_hash(config)
+
+    def schema_version(self, session) -> str:
+        """
+        Get schema version, memoized per database URL.
+
+        Args:
+            session: SQLAlchemy session
+
+        Returns:
+            Schema version string
+        """
+        key = str(session.get_bind().url)
+        version = self._schema_versions.get(key)
+        if version is None:
+            version = get_schema_version(session)
+            self._schema_versions[key] = version
+        return version
+
+    def reset(self) -> None:
+        """Forget all resolved values (e.g. after a schema migration)"""
+        self._git_commit_sha = None
+        self._schema_versions.clear()
+
+
+_provenance: Optional[ProvenanceContext] = None
+
+
+def get_provenance() -> ProvenanceContext:
+    """Get or create the process-wide provenance context"""
+    global _provenance
+    if _provenance is None:
+        _provenance = ProvenanceContext()
+    return _provenance
@@ -0,0 +1,345 @@
+"""Deterministic proposal replay from stored snapshots (python -m kis.engine.replay)"""
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, Any, List, Optional, Tuple
+
+from sqlalchemy.orm import sessionmaker
+
+from kis.storage.factory import create_storage_engine
+from kis.storage.init_db import DATABASE_URL
+from kis.storage.models import Proposal
+from kis.engine.allocator import WEIGHTING_EQUAL
+from kis.engine.columnar import create_proposal_columnar
+from kis.engine.parallel import iter_results, load_stored_snapshot, parse_snapshot_ids
+from kis.engine.proposal import create_proposal
+from kis.engine.provenance import get_config_hash
+from kis.engine.run import PHASE0_CONFIG, load_config_file
+
+
+# position weight 비교 허용오차
+DEFAULT_WEIGHT_TOLERANCE = 1e-9
+
+# worker task당 snapshot 수 (프로세스 간 전송 횟수 감소)
+DEFAULT_CHUNK_SIZE = 16
+
+STATUS_MATCH = "match"
+STATUS_MISMATCH = "mismatch"
+STATUS_ERROR = "error"
+STATUS_UNRESOLVED_CONFIG = "unresolved_config"
+
+# weighting이 config에 포함되기 전의 PHASE0_CONFIG: 이 config_hash로 저장된
+# (schema 0.3.0 이전, config_json 없는) proposal은 균등 가중으로 생성됨
+LEGACY_PHASE0_CONFIG = {key: value for key, value in PHASE0_CONFIG.items() if key != "weighting"}
+
+ENGINES = {
+    'proposal': create_proposal,
+    'columnar': create_proposal_columnar,
+}
+
+
+def build_config_registry(configs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Index known configs by config_hash (for proposals stored without config_json).
+
+    Args:
+        configs: Candidate configuration dicts
+
+    Returns:
+        Dict of config_hash -> config
+    """
+    return {get_config_hash(config): config for config in configs}
+
+
+def compare_positions(
+    stored: List[Dict[str, Any]],
+    replayed: List[Dict[str, Any]],
+    tolerance: float = DEFAULT_WEIGHT_TOLERANCE
+) -> List[str]:
+    """
+    Compare two position lists position by position.
+
+    Args:
+        stored: Positions from the stored proposal payload
+        replayed: Positions from the regenerated proposal
+        tolerance: Absolute weight tolerance
+
+    Returns:
+        List of mismatch descriptions (empty if equal)
+    """
+    mismatches = []
+    if len(stored) != len(replayed):
+        mismatches.append(f"position count {len(stored)} != {len(replayed)}")
+
+    for index, (old, new) in enumerate(zip(stored, replayed)):
+        if (old['symbol'], old['market']) != (new['symbol'], new['market']):
+            mismatches.append(
+                f"#{index}: {old['market']}:{old['symbol']} != {new['market']}:{new['symbol']}"
+            )
+        elif abs(old['weight'] - new['weight']) > tolerance:
+            mismatches.append(f"#{index} {old['symbol']}: weight {old['weight']!r} != {new['weight']!r}")
+
+    return mismatches
+
+
+def replay_snapshots(
+    database_url: str,
+    batch: List[Tuple[int, List[Dict[str, Any]]]],
+    engine_name: str = 'proposal',
+    tolerance: float = DEFAULT_WEIGHT_TOLERANCE
+) -> List[Dict[str, Any]]:
+    """
+    Worker task: regenerate and verify proposals for a batch of snapshots.
+
+    Each snapshot is loaded once and replayed for all of its proposals.
+
+    Args:
+        database_url: Database URL (each worker opens its own engine)
+        batch: List of (snapshot_id, jobs); job = {proposal_id, config, positions}
+        engine_name: Engine used for regeneration (see ENGINES)
+        tolerance: Absolute weight tolerance
+
+    Returns:
+        List of result dicts {proposal_id, snapshot_id, status, mismatches|error}
+    """
+    engine_fn = ENGINES[engine_name]
+    results = []
+    for snapshot_id, jobs in batch:
+        try:
+            payload = load_stored_snapshot(database_url, snapshot_id)
+        except ValueError as e:
+            results.extend(
+                {'proposal_id': job['proposal_id'], 'snapshot_id': snapshot_id, 'status': STATUS_ERROR, 'error': str(e)}
+                for job in jobs
+            )
+            continue
+
+        for job in jobs:
+            result = {'proposal_id': job['proposal_id'], 'snapshot_id': snapshot_id}
+            try:
+                replayed = engine_fn(payload, job['config'])
+            except ValueError as e:
+                result.update(status=STATUS_ERROR, error=str(e))
+            else:
+                mismatches = compare_positions(job['positions'], replayed['positions'], tolerance)
+                result.update(status=STATUS_MISMATCH if mismatches else STATUS_MATCH, mismatches=mismatches)
+            results.append(result)
+
+    return results
+
+
+def load_replay_jobs(
+    session,
+    snapshot_ids: Optional[List[int]] = None,
+    registry: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Tuple[Dict[int, List[Dict[str, Any]]], List[Dict[str, Any]]]:
+    """
+    Load stored proposals to replay, grouped by snapshot.
+
+    The config is taken from proposals.config_json; older rows without it
+    are resolved through the config_hash registry.
+
+    Args:
+        session: SQLAlchemy session
+        snapshot_ids: Snapshot IDs to replay (None = all)
+        registry: config_hash -> config for rows without config_json
+
+    Returns:
+        (snapshot_id -> jobs, results for proposals whose config could not be resolved)
+    """
+    registry = registry or {}
+    query = session.query(
+        Proposal.proposal_id,
+        Proposal.universe_snapshot_id,
+        Proposal.config_hash,
+        Proposal.config_json,
+        Proposal.payload_json
+    ).filter(Proposal.universe_snapshot_id.isnot(None))
+
+    wanted = None
+    if snapshot_ids is not None:
+        wanted = set(snapshot_ids)
+        query = query.filter(Proposal.universe_snapshot_id.between(min(wanted), max(wanted)))
+
+    jobs_by_snapshot: Dict[int, List[Dict[str, Any]]] = {}
+    unresolved = []
+    for proposal_id, snapshot_id, config_hash, config_json, payload in query.order_by(Proposal.proposal_id):
+        if wanted is not None and snapshot_id not in wanted:
+            continue
+        config = config_json if config_json is not None else registry.get(config_hash)
+        if config is None:
+            unresolved.append({
+                'proposal_id': proposal_id,
+                'snapshot_id': snapshot_id,
+                'status': STATUS_UNRESOLVED_CONFIG,
+                'error': f"No config stored or registered for config_hash {config_hash}"
+            })
+            continue
+        jobs_by_snapshot.setdefault(snapshot_id, []).append({
+            'proposal_id': proposal_id,
+            'config': config,
+            'positions': payload['positions']
+        })
+
+    return jobs_by_snapshot, unresolved
+
+
+def run_replay(
+    database_url: str,
+    snapshot_ids: Optional[List[int]] = None,
+    configs: Optional[List[Dict[str, Any]]] = None,
+    workers: int = 1,
+    engine_name: str = 'proposal',
+    tolerance: float = DEFAULT_WEIGHT_TOLERANCE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Dict[str, Any]:
+    """
+    Replay stored proposals and verify position-level equality.
+
+    Args:
+        database_url: Database URL
+        snapshot_ids: Snapshot IDs to replay (None = all)
+        configs: Known configs for rows without config_json (PHASE0_CONFIG and the
+            legacy equal-weight PHASE0 hash are always included)
+        workers: Number of worker processes (<= 1 runs inline)
+        engine_name: Engine used for regeneration (see ENGINES)
+        tolerance: Absolute weight tolerance
+        chunk_size: Snapshots per worker task
+
+    Returns:
+        Summary dict with counts per status and per-proposal results (proposal_id order)
+
+    Raises:
+        ValueError: If engine_name is unknown
+    """
+    if engine_name not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine_name}")
+
+    registry = build_config_registry([PHASE0_CONFIG] + list(configs or []))
+    registry.setdefault(
+        get_config_hash(LEGACY_PHASE0_CONFIG),
+        dict(LEGACY_PHASE0_CONFIG, weighting=WEIGHTING_EQUAL)
+    )
+
+    engine = create_storage_engine(database_url)
+    session = sessionmaker(bind=engine)()
+    try:
+        jobs_by_snapshot, results = load_replay_jobs(session, snapshot_ids, registry)
+    finally:
+        session.close()
+        engine.dispose()
+
+    items = sorted(jobs_by_snapshot.items())
+    tasks = [
+        (replay_snapshots, database_url, items[i:i + chunk_size], engine_name, tolerance)
+        for i in range(0, len(items), chunk_size)
+    ]
+    for batch_results in iter_results(tasks, workers):
+        results.extend(batch_results)
+
+    results.sort(key=lambda r: r['proposal_id'])
+    counts = {status: 0 for status in (STATUS_MATCH, STATUS_MISMATCH, STATUS_ERROR, STATUS_UNRESOLVED_CONFIG)}
+    for result in results:
+        counts[result['status']] += 1
+
+    return {
+        'total': len(results),
+        'snapshots': len(items),
+        'counts': counts,
+        'results': results
+    }
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse CLI arguments"""
+    parser = argparse.ArgumentParser(
+        prog="python -m kis.engine.replay",
+        description="Regenerate stored proposals from their snapshots and verify the positions"
+    )
+    parser.add_argument(
+        "--snapshot-ids",
+        default=None,
+        help="Snapshots to replay (e.g. '1-30' or '3,5,8-10', default: all)"
+    )
+    parser.add_argument(
+        "--config",
+        action="append",
+        dest="config_files",
+        default=[],
+        help="Config JSON file for proposals stored without config_json (repeatable)"
+    )
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes (default: 1)")
+    parser.add_argument(
+        "--engine",
+        choices=sorted(ENGINES),
+        default='proposal',
+        help="Engine used for regeneration (default: proposal)"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_WEIGHT_TOLERANCE,
+        help="Absolute weight tolerance (default: 1e-9)"
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Snapshots per worker task (default: 16)"
+    )
+    parser.add_argument("--report", default=None, help="Write per-proposal results to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point"""
+    args = parse_args(argv)
+
+    try:
+        snapshot_ids = parse_snapshot_ids(args.snapshot_ids) if args.snapshot_ids else None
+        configs = [load_config_file(path) for path in args.config_files]
+        database_url = os.getenv("DATABASE_URL", DATABASE_URL)
+
+        started = time.perf_counter()
+        summary = run_replay(
+            database_url,
+            snapshot_ids=snapshot_ids,
+            configs=configs,
+            workers=args.workers,
+            engine_name=args.engine,
+            tolerance=args.tolerance,
+            chunk_size=max(1, args.chunk_size)
+        )
+        elapsed = time.perf_counter() - started
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+
+    for result in summary['results']:
+        if result['status'] == STATUS_MATCH:
+            continue
+        detail = result.get('error') or "; ".join(result['mismatches'][:3])
+        print(f"Proposal {result['proposal_id']} (snapshot {result['snapshot_id']}): {result['status']} - {detail}")
+
+    counts = summary['counts']
+    throughput = summary['total'] / elapsed if elapsed > 0 else float("inf")
+    print("\n" + "="*50)
+    print(f"Replay completed ({args.workers} workers, engine: {args.engine})")
+    print("="*50)
+    print(f"Proposals: {summary['total']} from {summary['snapshots']} snapshots")
+    print(f"Matched: {counts[STATUS_MATCH]}, mismatched: {counts[STATUS_MISMATCH]}, "
+          f"errors: {counts[STATUS_ERROR]}, unresolved config: {counts[STATUS_UNRESOLVED_CONFIG]}")
+    print(f"Elapsed: {elapsed:.3f}s ({throughput:.1f} proposals/sec)")
+    print("="*50)
+
+    return 0 if counts[STATUS_MATCH] == summary['total'] else 1
+
+
+if __name__ == "__main__":
+    exit(main())
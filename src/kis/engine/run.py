@@ -1,98 +1,70 @@
 """CLI entry point for Engine module - snapshot creation and proposal generation"""
 
+import argparse
 import json
 import os
-import subprocess
-import hashlib
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker
 
+from kis.storage.factory import create_storage_engine
 from kis.storage.init_db import init_database, DATABASE_URL
-from kis.storage.models import Snapshot, Proposal, EventLog, SchemaVersion, ProposalStatus
-from kis.engine.sample_data import load_sample_snapshot
+from kis.storage.models import Snapshot, Proposal, EventLog, ProposalStatus
+from kis.storage.proposal_positions import build_positions
+from kis.storage.snapshot_constituents import build_constituents
+from kis.storage.snapshot_content import get_snapshot_content_hash
+from kis.engine.sample_data import load_sample_snapshot, load_snapshot_file
 from kis.engine.proposal import create_proposal
+from kis.engine.columnar import UniverseColumns, create_proposal_columnar
+from kis.engine.provenance import (
+    get_git_commit_sha,
+    get_config_hash,
+    get_schema_version,
+    get_provenance,
+)
 
 
+SAMPLE_SNAPSHOT_FILE = Path(__file__).parent.parent.parent.parent / "data" / "sample_snapshot.json"
+
 # Phase 0 고정 파라미터 (config_hash 계산용)
 PHASE0_CONFIG = {
     "max_positions": 20,
     "max_weight_per_position": 0.08,
     "kr_target_weight": 0.4,
     "us_target_weight": 0.6,
+    "weighting": "score",
     "phase": 0
 }
 
 
-def get_git_commit_sha() -> str:
+def get_snapshot_id_by_hash(session, content_hash: str) -> Optional[int]:
     """
-    Get current git commit SHA.
-    
-    Returns:
-        Git commit SHA string, or "unknown" if git command fails
-    """
-    try:
-        result = subprocess.run(
-            ['git', 'rev-parse', 'HEAD'],
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=Path(__file__).parent.parent.parent.parent
-        )
-        return result.stdout.strip()
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return "unknown"
-
-
-def get_config_hash(config: Dict[str, Any]) -> str:
-    """
-    Calculate SHA256 hash of sorted JSON config.
-    
-    Args:
-        config: Configuration dictionary
-        
-    Returns:
-        SHA256 hash as hex string (64 characters)
-    """
-    # Sort keys for deterministic hash
-    sorted_config = json.dumps(config, sort_keys=True)
-    return hashlib.sha256(sorted_config.encode('utf-8')).hexdigest()
-
-
-def get_schema_version(session) -> str:
-    """
-    Get latest schema version from database.
+    Find existing snapshot with the same content hash.
     
     Args:
         session: SQLAlchemy session
+        content_hash: Snapshot content hash
         
     Returns:
-        Schema version string (e.g., "0.1.0")
+        snapshot_id or None if not found
     """
-    schema_version = session.query(SchemaVersion).order_by(
-        SchemaVersion.applied_at.desc()
-    ).first()
-    
-    if schema_version:
-        return schema_version.schema_version
-    else:
-        # Fallback to default if no version found
-        return "0.1.0"
+    row = session.query(Snapshot.snapshot_id).filter_by(content_hash=content_hash).first()
+    return row[0] if row else None
 
 
-def save_snapshot(session, snapshot_data: Dict[str, Any]) -> int:
+def build_snapshot(snapshot_data: Dict[str, Any]) -> Snapshot:
     """
-    Save snapshot to database.
+    Build (unsaved) Snapshot row from snapshot data.
     
     Args:
-        session: SQLAlchemy session
         snapshot_data: Snapshot data dict with 'asof', 'source', 'universe'
         
     Returns:
-        snapshot_id
+        Snapshot object (not added to session)
     """
     # Ensure asof is timezone-aware UTC
     asof = snapshot_data['asof']
@@ -111,14 +83,47 @@ def save_snapshot(session, snapshot_data: Dict[str, Any]) -> int:
     if isinstance(payload_data['asof'], datetime):
         payload_data['asof'] = payload_data['asof'].isoformat()
     
-    snapshot = Snapshot(
+    return Snapshot(
         asof=asof,
         source=snapshot_data['source'],
-        payload_json=payload_data
+        payload_json=payload_data,
+        content_hash=get_snapshot_content_hash(payload_data)
     )
+
+
+def save_snapshot(session, snapshot_data: Dict[str, Any]) -> int:
+    """
+    Save snapshot to database (with its snapshot_constituents rows).
+    
+    If a snapshot with byte-identical content already exists, no row is
+    inserted and the existing snapshot_id is returned.
+    
+    Args:
+        session: SQLAlchemy session
+        snapshot_data: Snapshot data dict with 'asof', 'source', 'universe'
+        
+    Returns:
+        snapshot_id
+    """
+    snapshot = build_snapshot(snapshot_data)
+    
+    existing_id = get_snapshot_id_by_hash(session, snapshot.content_hash)
+    if existing_id is not None:
+        return existing_id
     
     session.add(snapshot)
-    session.commit()
+    try:
+        session.flush()
+        # symbol별 이력 조회용 정규화 universe (snapshot과 같은 transaction)
+        session.add_all(build_constituents(snapshot))
+        session.commit()
+    except IntegrityError:
+        # 동시 실행으로 같은 content가 먼저 저장된 경우
+        session.rollback()
+        existing_id = get_snapshot_id_by_hash(session, snapshot.content_hash)
+        if existing_id is None:
+            raise
+        return existing_id
     session.refresh(snapshot)
     
     return snapshot.snapshot_id
@@ -131,7 +136,7 @@ def save_proposal(
     config: Dict[str, Any]
 ) -> int:
     """
-    Save proposal to database.
+    Save proposal to database (with its proposal_positions rows).
     
     Args:
         session: SQLAlchemy session
@@ -142,13 +147,15 @@ def save_proposal(
     Returns:
         proposal_id
     """
-    config_hash = get_config_hash(config)
-    git_commit_sha = get_git_commit_sha()
-    schema_version = get_schema_version(session)
+    provenance = get_provenance()
+    config_hash = provenance.config_hash(config)
+    git_commit_sha = provenance.git_commit_sha
+    schema_version = provenance.schema_version(session)
     
     proposal = Proposal(
         universe_snapshot_id=snapshot_id,
         config_hash=config_hash,
+        config_json=config,
         git_commit_sha=git_commit_sha,
         schema_version=schema_version,
         payload_json=proposal_data,
@@ -156,6 +163,9 @@ def save_proposal(
     )
     
     session.add(proposal)
+    session.flush()
+    # 노출(exposure) 조회용 정규화 positions (proposal과 같은 transaction)
+    session.add_all(build_positions(proposal.proposal_id, proposal_data))
     session.commit()
     session.refresh(proposal)
     
@@ -195,11 +205,254 @@ def log_proposal_created(
     session.commit()
 
 
-def main():
+def create_proposals_batch(
+    snapshots: List[Dict[str, Any]],
+    configs: List[Dict[str, Any]],
+    session=None
+) -> List[Dict[str, Any]]:
+    """
+    Create proposals for every (snapshot, config) pair in one pass.
+    
+    Each snapshot universe is parsed into columns once and reused for every config.
+    If a session is given, snapshots, proposals and proposal_created events are
+    persisted with bulk inserts in a single transaction.
+    
+    Args:
+        snapshots: List of snapshot data dicts with 'asof', 'source', 'universe'
+        configs: List of configuration dicts
+        session: Optional SQLAlchemy session for persistence
+        
+    Returns:
+        List of result dicts (snapshot order, then config order) with
+        snapshot_index, config_index, proposal and, when persisted,
+        snapshot_id and proposal_id
+        
+    Raises:
+        ValueError: If any snapshot has insufficient stocks
+    """
+    results = []
+    for snapshot_index, snapshot_data in enumerate(snapshots):
+        columns = UniverseColumns.from_snapshot(snapshot_data)
+        for config_index, config in enumerate(configs):
+            results.append({
+                "snapshot_index": snapshot_index,
+                "config_index": config_index,
+                "proposal": create_proposal_columnar(columns, config)
+            })
+    
+    if session is not None:
+        save_proposals_batch(session, snapshots, configs, results)
+    
+    return results
+
+
+def save_proposals_batch(
+    session,
+    snapshots: List[Dict[str, Any]],
+    configs: List[Dict[str, Any]],
+    results: List[Dict[str, Any]]
+) -> None:
+    """
+    Persist batch results in a single transaction.
+    
+    Sets snapshot_id and proposal_id on each result dict.
+    
+    Args:
+        session: SQLAlchemy session
+        snapshots: Snapshot data dicts referenced by result snapshot_index
+        configs: Configuration dicts referenced by result config_index
+        results: Results from create_proposals_batch
+    """
+    provenance = get_provenance()
+    config_hashes = [provenance.config_hash(config) for config in configs]
+    git_commit_sha = provenance.git_commit_sha
+    
+    try:
+        schema_version = provenance.schema_version(session)
+        
+        # 1. Snapshots (content hash로 중복 제거 후 bulk insert, flush로 ID 할당)
+        snapshot_rows = [build_snapshot(snapshot_data) for snapshot_data in snapshots]
+        hashes = {row.content_hash for row in snapshot_rows}
+        snapshot_ids = dict(
+            session.query(Snapshot.content_hash, Snapshot.snapshot_id)
+            .filter(Snapshot.content_hash.in_(hashes))
+            .all()
+        )
+        new_rows = {}
+        for row in snapshot_rows:
+            if row.content_hash not in snapshot_ids and row.content_hash not in new_rows:
+                new_rows[row.content_hash] = row
+        session.add_all(new_rows.values())
+        session.flush()
+        for row in new_rows.values():
+            session.add_all(build_constituents(row))
+        snapshot_ids.update((content_hash, row.snapshot_id) for content_hash, row in new_rows.items())
+        
+        # 2. Proposals
+        proposal_rows = []
+        for result in results:
+            result["snapshot_id"] = snapshot_ids[snapshot_rows[result["snapshot_index"]].content_hash]
+            proposal_rows.append(Proposal(
+                universe_snapshot_id=result["snapshot_id"],
+                config_hash=config_hashes[result["config_index"]],
+                config_json=configs[result["config_index"]],
+                git_commit_sha=git_commit_sha,
+                schema_version=schema_version,
+                payload_json=result["proposal"],
+                status=ProposalStatus.PENDING
+            ))
+        session.add_all(proposal_rows)
+        session.flush()
+        for result, proposal_row in zip(results, proposal_rows):
+            session.add_all(build_positions(proposal_row.proposal_id, result["proposal"]))
+        
+        # 3. proposal_created events
+        now = datetime.now(timezone.utc)
+        events = []
+        for result, proposal_row in zip(results, proposal_rows):
+            result["proposal_id"] = proposal_row.proposal_id
+            events.append(EventLog(
+                timestamp=now,
+                event_type="proposal_created",
+                correlation_id=result["proposal"]["correlation_id"],
+                actor="engine",
+                payload_json={
+                    "proposal_id": result["proposal_id"],
+                    "snapshot_id": result["snapshot_id"],
+                    "constraints_passed": result["proposal"]["constraints_check"]["passed"]
+                }
+            ))
+        session.add_all(events)
+        
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+
+def load_config_file(file_path: str) -> Dict[str, Any]:
+    """
+    Load configuration dict from JSON file.
+    
+    Args:
+        file_path: Path to JSON config file
+        
+    Returns:
+        Configuration dict
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def run_batch(session, snapshot_files: List[str], configs: List[Dict[str, Any]]) -> int:
+    """
+    Run batch proposal generation and print throughput.
+    
+    Args:
+        session: SQLAlchemy session
+        snapshot_files: Snapshot JSON file paths
+        configs: Configuration dicts
+        
+    Returns:
+        Exit code
+    """
+    snapshots = [load_snapshot_file(path) for path in snapshot_files]
+    print(f"Loaded {len(snapshots)} snapshots, {len(configs)} configs")
+    
+    started = time.perf_counter()
+    results = create_proposals_batch(snapshots, configs, session=session)
+    elapsed = time.perf_counter() - started
+    
+    passed = sum(1 for r in results if r["proposal"]["constraints_check"]["passed"])
+    throughput = len(results) / elapsed if elapsed > 0 else float("inf")
+    
+    print("\n" + "="*50)
+    print("Batch proposal generation completed successfully!")
+    print("="*50)
+    print(f"Proposals: {len(results)} (constraints passed: {passed})")
+    print(f"Elapsed: {elapsed:.3f}s")
+    print(f"Throughput: {throughput:.1f} proposals/sec")
+    print("="*50)
+    
+    return 0
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse CLI arguments"""
+    parser = argparse.ArgumentParser(
+        prog="python -m kis.engine.run",
+        description="Create snapshot(s) and proposal(s) and store them in the database"
+    )
+    parser.add_argument(
+        "snapshot_files",
+        nargs="*",
+        help="Snapshot files, JSON or NDJSON (default: data/sample_snapshot.json)"
+    )
+    parser.add_argument(
+        "--config",
+        action="append",
+        dest="config_files",
+        default=[],
+        help="Config JSON file (repeatable, default: Phase 0 config)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes for parallel proposal generation"
+    )
+    parser.add_argument(
+        "--snapshot-ids",
+        default=None,
+        help="Regenerate proposals from stored snapshots (e.g. '1-30' or '3,5,8-10')"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None):
     """Main CLI entry point"""
+    args = parse_args(argv)
+    
+    if args.snapshot_files or args.config_files or args.workers or args.snapshot_ids:
+        try:
+            configs = [load_config_file(path) for path in args.config_files] or [PHASE0_CONFIG]
+            snapshot_ids = None
+            if args.snapshot_ids:
+                from kis.engine.parallel import parse_snapshot_ids
+                snapshot_ids = parse_snapshot_ids(args.snapshot_ids)
+            snapshot_files = args.snapshot_files
+            if not snapshot_files and snapshot_ids is None:
+                snapshot_files = [str(SAMPLE_SNAPSHOT_FILE)]
+            
+            database_url = os.getenv("DATABASE_URL", DATABASE_URL)
+            print(f"Initializing database: {database_url}")
+            init_database(database_url)
+            
+            engine = create_storage_engine(database_url)
+            Session = sessionmaker(bind=engine)
+            session = Session()
+            try:
+                if args.workers or snapshot_ids is not None:
+                    # Local import: kis.engine.parallel depends on this module
+                    from kis.engine.parallel import run_sweep
+                    return run_sweep(
+                        session,
+                        configs,
+                        args.workers or 1,
+                        snapshot_files=snapshot_files,
+                        snapshot_ids=snapshot_ids,
+                        database_url=database_url
+                    )
+                return run_batch(session, snapshot_files, configs)
+            finally:
+                session.close()
+        except (FileNotFoundError, ValueError) as e:
+            print(f"Error: {e}")
+            return 1
+    
     try:
         # 1. 샘플 데이터 로드
-        sample_file = Path(__file__).parent.parent.parent.parent / "data" / "sample_snapshot.json"
+        sample_file = SAMPLE_SNAPSHOT_FILE
         if not sample_file.exists():
             print(f"Error: Sample snapshot file not found: {sample_file}")
             return 1
@@ -214,7 +467,7 @@ def main():
         init_database(database_url)
         
         # 3. DB 세션 생성
-        engine = create_engine(database_url, echo=False)
+        engine = create_storage_engine(database_url)
         Session = sessionmaker(bind=engine)
         session = Session()
         
@@ -3,7 +3,36 @@
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Optional, Tuple
+
+
+# 스트리밍 로더 기본 읽기 단위 (문자 수)
+STREAM_CHUNK_SIZE = 1 << 16
+
+# NDJSON 스냅샷 확장자: 첫 줄은 {"asof", "source"} 헤더, 이후 줄마다 universe 항목 1개
+NDJSON_SUFFIXES = ('.ndjson', '.jsonl')
+
+
+def parse_asof(asof_str: str) -> datetime:
+    """
+    Parse ISO 8601 asof string (e.g. "2025-12-18T00:00:00Z") to datetime.
+
+    Args:
+        asof_str: asof string
+
+    Returns:
+        Parsed datetime
+
+    Raises:
+        ValueError: If the format is invalid
+    """
+    try:
+        value = asof_str
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+    except (ValueError, AttributeError) as e:
+        raise ValueError(f"Invalid asof format: {asof_str}") from e
 
 
 def load_sample_snapshot(file_path: str) -> Dict[str, Any]:
@@ -37,13 +66,225 @@ def load_sample_snapshot(file_path: str) -> Dict[str, Any]:
     
     # Parse asof to UTC datetime
     # ISO 8601 format: "2025-12-18T00:00:00Z"
-    try:
-        asof_str = data['asof']
-        if asof_str.endswith('Z'):
-            asof_str = asof_str[:-1] + '+00:00'
-        data['asof'] = datetime.fromisoformat(asof_str)
-    except (ValueError, AttributeError) as e:
-        raise ValueError(f"Invalid asof format: {data['asof']}") from e
+    data['asof'] = parse_asof(data['asof'])
     
     return data
 
+
+class _JSONObjectReader:
+    """
+    Incremental reader for a top-level JSON object.
+
+    Scalar fields are decoded whole; the 'universe' array is decoded one
+    element at a time so memory stays bounded by the read chunk size and
+    the largest single entry.
+    """
+
+    def __init__(self, f, chunk_size: int = STREAM_CHUNK_SIZE):
+        self._f = f
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def _read_more(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._f.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        # 소비한 앞부분은 버림
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skip whitespace and return next character ('' at EOF)"""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._read_more():
+                return ''
+
+    def _expect(self, chars: str) -> str:
+        ch = self._peek()
+        if not ch or ch not in chars:
+            raise ValueError(f"Invalid snapshot JSON: expected one of {chars!r}, got {ch!r}")
+        self._pos += 1
+        return ch
+
+    def _decode_value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as e:
+                if self._read_more():
+                    continue
+                raise ValueError(f"Invalid snapshot JSON: {e}") from e
+            # 숫자 등이 chunk 경계에서 잘렸을 수 있으므로 다음 chunk 확인
+            if end == len(self._buf) and self._read_more():
+                continue
+            self._pos = end
+            return value
+
+    def iter_fields(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield (key, value) for top-level fields and ('universe[]', entry) per universe entry.
+
+        Raises:
+            ValueError: If the JSON is invalid
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._decode_value()
+            if not isinstance(key, str):
+                raise ValueError("Invalid snapshot JSON: object key must be a string")
+            self._expect(':')
+            if key == 'universe':
+                self._expect('[')
+                if self._peek() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        yield 'universe[]', self._decode_value()
+                        if self._expect(',]') == ']':
+                            break
+                yield 'universe', None
+            else:
+                yield key, self._decode_value()
+            if self._expect(',}') == '}':
+                return
+
+
+class SnapshotStream:
+    """
+    Streaming view of a snapshot file.
+
+    asof/source are validated when the stream is opened; universe entries are
+    read lazily by iter_universe() and never held in memory as a full list.
+    """
+
+    def __init__(self, file_path: str, asof: datetime, source: str, is_ndjson: bool,
+                 chunk_size: int = STREAM_CHUNK_SIZE):
+        self.file_path = file_path
+        self.asof = asof
+        self.source = source
+        self.is_ndjson = is_ndjson
+        self.chunk_size = chunk_size
+
+    def iter_universe(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield universe entries as they are read from the file.
+
+        Raises:
+            ValueError: If the file is invalid or has no 'universe' field
+        """
+        with open(self.file_path, 'r', encoding='utf-8') as f:
+            if self.is_ndjson:
+                f.readline()  # header
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        yield json.loads(line)
+                return
+
+            found_universe = False
+            for key, value in _JSONObjectReader(f, self.chunk_size).iter_fields():
+                if key == 'universe[]':
+                    yield value
+                elif key == 'universe':
+                    found_universe = True
+            if not found_universe:
+                raise ValueError("Missing required field: 'universe'")
+
+
+def open_snapshot_stream(file_path: str, chunk_size: int = STREAM_CHUNK_SIZE) -> SnapshotStream:
+    """
+    Open snapshot file (JSON or NDJSON) for streaming.
+
+    JSON files are scanned incrementally for 'asof'/'source'; if they come after
+    'universe', the universe entries are skipped (not kept) during the scan.
+    NDJSON files must start with a {"asof", "source"} header line.
+
+    Args:
+        file_path: Path to the snapshot file
+        chunk_size: Read chunk size in characters
+
+    Returns:
+        SnapshotStream with validated asof/source
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file is invalid or missing required fields
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"Sample snapshot file not found: {file_path}")
+
+    is_ndjson = path.suffix.lower() in NDJSON_SUFFIXES
+    header: Dict[str, Optional[Any]] = {}
+
+    with open(path, 'r', encoding='utf-8') as f:
+        if is_ndjson:
+            try:
+                header = json.loads(f.readline() or '{}')
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid NDJSON header: {e}") from e
+            if not isinstance(header, dict):
+                raise ValueError("Invalid NDJSON header: expected an object")
+        else:
+            for key, value in _JSONObjectReader(f, chunk_size).iter_fields():
+                if key in ('asof', 'source'):
+                    header[key] = value
+                if 'asof' in header and 'source' in header:
+                    break
+
+    if 'asof' not in header:
+        raise ValueError("Missing required field: 'asof'")
+    if 'source' not in header:
+        raise ValueError("Missing required field: 'source'")
+
+    return SnapshotStream(
+        str(path),
+        parse_asof(header['asof']),
+        header['source'],
+        is_ndjson,
+        chunk_size
+    )
+
+
+def load_snapshot_file(file_path: str) -> Dict[str, Any]:
+    """
+    Load a snapshot file (JSON or NDJSON) into a snapshot data dict.
+
+    JSON files go through load_sample_snapshot; NDJSON files are read with
+    the streaming reader. The universe is materialized in both cases since
+    the caller persists the full snapshot.
+
+    Args:
+        file_path: Path to the snapshot file
+
+    Returns:
+        Dictionary with parsed asof datetime, source and universe
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file is invalid or missing required fields
+    """
+    if Path(file_path).suffix.lower() not in NDJSON_SUFFIXES:
+        return load_sample_snapshot(file_path)
+
+    stream = open_snapshot_stream(file_path)
+    return {
+        'asof': stream.asof,
+        'source': stream.source,
+        'universe': list(stream.iter_universe())
+    }
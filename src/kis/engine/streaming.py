@@ -0,0 +1,123 @@
+"""
+Bounded-memory proposal generation over streamed universes.
+
+This is a library entry point for callers that only need the proposal.
+The kis.engine.run / parallel CLIs persist the full snapshot (payload_json
+and snapshot_constituents), so they read files with load_snapshot_file,
+which materializes the universe, instead of the top-k path here.
+"""
+
+import heapq
+from typing import Dict, Any, Iterable, List, Union
+
+from kis.engine.allocator import AllocationSpec
+from kis.engine.proposal import create_proposal, stock_sort_key
+from kis.engine.sample_data import SnapshotStream
+
+
+class _HeapEntry:
+    """Heap entry ordered so that the worst-ranked stock is at the heap root"""
+
+    __slots__ = ('key', 'stock')
+
+    def __init__(self, key, stock: Dict[str, Any]):
+        self.key = key
+        self.stock = stock
+
+    def __lt__(self, other: "_HeapEntry") -> bool:
+        return self.key > other.key
+
+
+class TopK:
+    """
+    Keep the k best-ranked stocks (create_proposal ordering) seen so far.
+
+    Memory is O(k) regardless of how many stocks are pushed.
+    """
+
+    def __init__(self, k: int):
+        """
+        Initialize selector.
+
+        Args:
+            k: Number of stocks to keep
+        """
+        self.k = k
+        self.seen = 0
+        self._heap: List[_HeapEntry] = []
+
+    def push(self, stock: Dict[str, Any]) -> None:
+        """
+        Offer a stock to the selector.
+
+        Args:
+            stock: Universe entry dict
+        """
+        self.seen += 1
+        if self.k <= 0:
+            return
+        entry = _HeapEntry(stock_sort_key(stock), stock)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry.key < self._heap[0].key:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[Dict[str, Any]]:
+        """
+        Get kept stocks in ranking order.
+
+        Returns:
+            List of universe entry dicts (best first)
+        """
+        return [entry.stock for entry in sorted(self._heap, key=lambda e: e.key)]
+
+
+def select_top_k_by_market(
+    entries: Iterable[Dict[str, Any]],
+    k_by_market: Dict[str, int]
+) -> Dict[str, TopK]:
+    """
+    Single pass over universe entries keeping top-k per market.
+
+    Args:
+        entries: Universe entries (e.g. SnapshotStream.iter_universe())
+        k_by_market: Number of stocks to keep per market code
+
+    Returns:
+        Dict of market code -> TopK selector (markets not in k_by_market are ignored)
+    """
+    selectors = {market: TopK(k) for market, k in k_by_market.items()}
+    for stock in entries:
+        selector = selectors.get(stock.get('market'))
+        if selector is not None:
+            selector.push(stock)
+    return selectors
+
+
+def create_proposal_streaming(
+    snapshot: Union[SnapshotStream, Iterable[Dict[str, Any]]],
+    config: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    """
+    Create a proposal from a streamed universe with bounded memory.
+
+    Only the top-k stocks per market are retained while reading, then the
+    regular create_proposal runs on that reduced universe, which yields the
+    same positions as running it on the full universe.
+
+    Args:
+        snapshot: SnapshotStream or iterable of universe entries
+        config: Optional configuration dict (see create_proposal)
+
+    Returns:
+        Proposal payload dict with positions, constraints_check, correlation_id
+
+    Raises:
+        ValueError: If universe has insufficient stocks or the config is infeasible
+    """
+    entries = snapshot.iter_universe() if isinstance(snapshot, SnapshotStream) else snapshot
+    spec = AllocationSpec.from_config(config)
+    selectors = select_top_k_by_market(entries, spec.positions)
+
+    reduced_universe = selectors['KR'].items() + selectors['US'].items()
+    return create_proposal({'universe': reduced_universe}, config)
@@ -1,16 +1,26 @@
 """FastAPI application for Execution Server"""
 
+import asyncio
 import hashlib
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, NoReturn, Optional
 from fastapi import FastAPI, Depends, HTTPException, status, Header
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel
 
-from kis.storage.session import get_db_session
-from kis.storage.models import ProposalStatus
-from kis.execution.config import get_jwt_secret
+from kis.storage.async_session import get_async_db_session, dispose_async_engine
+from kis.storage.session import get_engine, get_session_factory
+from kis.storage.models import OrderStatus, ProposalStatus
+from kis.execution.config import (
+    DEFAULT_MARKET_CONCURRENCY,
+    get_jwt_secret,
+    get_event_sink_config,
+    get_kill_switch_config,
+    get_kis_client_config,
+    get_market_concurrency
+)
 from kis.execution.auth import (
     create_token,
     verify_token,
@@ -19,23 +29,111 @@ from kis.execution.auth import (
     InvalidTokenSignatureError,
     TokenExpiredError
 )
-from kis.execution.broker import BrokerClient, SpyBrokerClient
-from kis.execution.repository import (
+from kis.execution.broker import BrokerClient, BrokerRejectedError, SpyBrokerClient
+from kis.execution.async_repository import (
     get_kill_switch_status,
     get_approval_by_jti,
-    mark_token_used,
+    claim_approval_token,
     create_order,
+    create_orders,
     log_event,
     get_proposal_by_id
 )
 from kis.storage.models import KillSwitchStatus
+from kis.storage.event_sink import EventSink
+from kis.execution.kill_switch import KillSwitchService
+from kis.execution.kis_client import KISBrokerClient
 
 
-app = FastAPI(title="KIS Trading System Execution Server", version="0.1.0")
-
 # Broker client instance (can be replaced in tests)
 broker_client: BrokerClient = SpyBrokerClient()
 
+# Batched event writer for rejection events (None: commit each event synchronously)
+event_sink: Optional[EventSink] = None
+
+# In-memory kill switch status (None: query system_state on every order)
+kill_switch_service: Optional[KillSwitchService] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Start background services if configured: KIS mock-trading broker
+    client (KIS_APP_KEY, otherwise the spy broker), batched event writer
+    (EXECUTION_EVENT_SINK / EXECUTION_EVENT_WAL_DIR) and kill switch cache
+    (EXECUTION_KILL_SWITCH_CACHE, opt-in)
+    """
+    global broker_client, event_sink, kill_switch_service
+    original_broker = broker_client
+    kis_config = get_kis_client_config()
+    if kis_config is not None:
+        broker_client = KISBrokerClient(**kis_config)
+    sink_config = get_event_sink_config()
+    if sink_config is not None and event_sink is None:
+        event_sink = EventSink(get_session_factory(), **sink_config)
+    kill_switch_config = get_kill_switch_config()
+    if kill_switch_config is not None and kill_switch_service is None:
+        kill_switch_service = KillSwitchService(get_engine(), **kill_switch_config)
+    try:
+        yield
+    finally:
+        if kill_switch_service is not None:
+            kill_switch_service.close()
+            kill_switch_service = None
+        if event_sink is not None:
+            event_sink.close()
+            event_sink = None
+        if broker_client is not original_broker:
+            await broker_client.aclose()
+            broker_client = original_broker
+        await dispose_async_engine()
+
+
+app = FastAPI(title="KIS Trading System Execution Server", version="0.1.0", lifespan=lifespan)
+
+
+async def log_rejection(db: AsyncSession, event_type: str, correlation_id: str, payload: dict) -> None:
+    """
+    Record a rejection event before an HTTPException is raised.
+    
+    With event_sink configured the event is buffered and written in a batch
+    (durable once emit returns if the sink has a WAL; the WAL fsync then runs
+    in a worker thread so it doesn't block the event loop); otherwise it is
+    committed immediately.
+    
+    Args:
+        db: Database session
+        event_type: Event type
+        correlation_id: Correlation ID
+        payload: Event payload dictionary
+    """
+    if event_sink is not None:
+        if event_sink.wal_dir is not None:
+            await asyncio.to_thread(event_sink.emit, event_type, correlation_id, "execution_server", payload)
+        else:
+            event_sink.emit(event_type, correlation_id, "execution_server", payload)
+        return
+    await log_event(db, event_type, correlation_id, payload)
+    await db.commit()
+
+
+async def current_kill_switch_status(db: AsyncSession) -> KillSwitchStatus:
+    """
+    Get the kill switch status for an order request.
+    
+    With kill_switch_service running the status is read from memory (ACTIVE
+    if the cache is stale or lost sync); otherwise system_state is queried.
+    
+    Args:
+        db: Database session
+        
+    Returns:
+        Kill switch status
+    """
+    if kill_switch_service is not None:
+        return kill_switch_service.get_status()
+    return await get_kill_switch_status(db)
+
 
 class IssueTokenRequest(BaseModel):
     """Request body for /issue_token"""
@@ -63,10 +161,32 @@ class PlaceOrderResponse(BaseModel):
     status: str
 
 
+class PlaceOrdersRequest(BaseModel):
+    """Request body for /place_orders (required: one intent with a quantity per proposal position)"""
+    order_intents: Optional[List[Dict[str, Any]]] = None
+
+
+class OrderLegResult(BaseModel):
+    """Result of one /place_orders leg"""
+    index: int
+    symbol: str
+    market: str
+    order_id: int
+    status: str
+    broker_order_id: Optional[str] = None
+    error: Optional[str] = None
+
+
+class PlaceOrdersResponse(BaseModel):
+    """Response for /place_orders"""
+    proposal_id: int
+    legs: List[OrderLegResult]
+
+
 @app.post("/issue_token", response_model=IssueTokenResponse)
 async def issue_token(
     request: IssueTokenRequest,
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """
     Issue JWT token for approved proposal.
@@ -85,7 +205,7 @@ async def issue_token(
         HTTPException: 404 if proposal not found, 400 if proposal not pending
     """
     # Get proposal
-    proposal = get_proposal_by_id(db, request.proposal_id)
+    proposal = await get_proposal_by_id(db, request.proposal_id)
     if proposal is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -126,9 +246,9 @@ async def issue_token(
     )
 
 
-def get_bearer_token(
+async def get_bearer_token(
     authorization: Optional[str] = Header(None),
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ) -> str:
     """
     Extract Bearer token from Authorization header.
@@ -145,26 +265,24 @@ def get_bearer_token(
     """
     if not authorization:
         # Log event before raising exception
-        log_event(
+        await log_rejection(
             db,
             "order_rejected",
             "unknown",
             {"reason": "Authorization header is required"}
         )
-        db.commit()  # Commit event before raising exception
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authorization header is required"
         )
     
     if not authorization.startswith("Bearer "):
-        log_event(
+        await log_rejection(
             db,
             "order_rejected",
             "unknown",
             {"reason": "Authorization header must start with 'Bearer '"}
         )
-        db.commit()  # Commit event before raising exception
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Authorization header must start with 'Bearer '"
@@ -172,13 +290,12 @@ def get_bearer_token(
     
     token = authorization[7:]  # Remove "Bearer " prefix
     if not token:
-        log_event(
+        await log_rejection(
             db,
             "order_rejected",
             "unknown",
             {"reason": "Token is required"}
         )
-        db.commit()  # Commit event before raising exception
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token is required"
@@ -187,37 +304,86 @@ def get_bearer_token(
     return token
 
 
-@app.post("/place_order", response_model=PlaceOrderResponse)
-async def place_order(
-    request: PlaceOrderRequest,
-    token: str = Depends(get_bearer_token),
-    db: Session = Depends(get_db_session)
-):
+async def reject_unclaimed_token(
+    db: AsyncSession,
+    token_jti: str,
+    token_hash: str,
+    correlation_id: str,
+    now: datetime
+) -> NoReturn:
     """
-    Place order with broker (after approval token verification).
+    Record and raise the rejection for a token whose claim matched no row.
+    
+    Only runs on the rejection path: the approval is re-read to report why
+    the claim failed (not found, hash mismatch, expired or already used).
+    
+    Args:
+        db: Database session
+        token_jti: Token JTI
+        token_hash: Hash of the presented token
+        correlation_id: Correlation ID
+        now: Claim time used by the failed claim
+        
+    Raises:
+        HTTPException: 403 in every case
+    """
+    approval = await get_approval_by_jti(db, token_jti)
+    expires_at = approval.token_expires_at if approval is not None else None
+    if expires_at is not None and expires_at.tzinfo is None:
+        # SQLite는 timezone 없이 저장 (UTC)
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    if approval is None:
+        reason, detail, extra = "Approval record not found", "Approval record not found", {}
+    elif approval.token_hash != token_hash:
+        reason, detail, extra = "Token hash mismatch", "Token hash mismatch", {}
+    elif approval.token_used_at is not None:
+        reason, detail = "Token already used", "Token already used (one-time use only)"
+        extra = {"token_used_at": approval.token_used_at.isoformat()}
+    elif expires_at is not None and expires_at <= now:
+        reason, detail, extra = "Token expired (from DB)", "Token expired", {}
+    else:
+        reason, detail, extra = "Approval claim failed", "Approval token could not be claimed", {}
+    
+    await log_rejection(
+        db,
+        "order_rejected",
+        correlation_id,
+        {
+            "reason": reason,
+            "token_jti": token_jti,
+            **extra
+        }
+    )
+    raise HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail=detail
+    )
+    # Broker call count remains 0
+
+
+async def verify_order_request(token: str, db: AsyncSession) -> Dict[str, Any]:
+    """
+    Run the order checks that precede the approval claim.
     
-    Processing order (server-enforced):
     1. Kill switch check (if active -> 403 + broker calls == 0)
-    2. JWT signature verification (if fails -> 401/403 + broker calls == 0)
-    3. Token expiration check (if expired -> 403 + broker calls == 0)
-    4. Approval record verification (token_hash, token_used_at, token_expires_at)
-    5. On success: mark token used, log event, call broker, create order
+    2. JWT signature / expiration verification (if fails -> 401/403 + broker calls == 0)
+    
+    Every rejection is recorded with log_rejection before raising.
     
     Args:
-        request: Order request
-        token: Bearer token from Authorization header
+        token: Bearer token
         db: Database session
         
     Returns:
-        Order response with order_id and status
+        Verified claims dict with token_jti, proposal_id, correlation_id
         
     Raises:
-        HTTPException: 403 if kill switch active, 401/403 if token invalid, 403 if token expired/used
+        HTTPException: 403 if kill switch active, 401/403 if token invalid or expired
     """
     # 1. Kill switch check (MUST be first - before any broker call)
-    kill_switch_status = get_kill_switch_status(db)
+    kill_switch_status = await current_kill_switch_status(db)
     if kill_switch_status == KillSwitchStatus.ACTIVE:
-        log_event(
+        await log_rejection(
             db,
             "order_blocked_killswitch",
             "unknown",  # correlation_id not available yet
@@ -226,7 +392,6 @@ async def place_order(
                 "kill_switch_status": kill_switch_status.value
             }
         )
-        db.commit()  # Commit event before raising exception
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Order blocked: Kill switch is active"
@@ -238,20 +403,12 @@ async def place_order(
         secret = get_jwt_secret()
         payload = verify_token(token, secret)
     except InvalidTokenSignatureError as e:
-        # Try to decode token without verification to get claims (but don't trust them)
-        correlation_id = "unknown"
-        proposal_id = None
-        token_jti = None
-        try:
-            import jwt as jwt_lib
-            unverified = jwt_lib.decode(token, options={"verify_signature": False})
-            correlation_id = unverified.get("correlation_id", "unknown")
-            proposal_id = unverified.get("proposal_id")
-            token_jti = unverified.get("jti")
-        except Exception:
-            pass
+        # Unverified claims decoded by verify_token (for logging only, don't trust them)
+        correlation_id = e.claims.get("correlation_id", "unknown")
+        proposal_id = e.claims.get("proposal_id")
+        token_jti = e.claims.get("jti")
         
-        log_event(
+        await log_rejection(
             db,
             "order_rejected_auth",
             correlation_id,
@@ -263,27 +420,18 @@ async def place_order(
                 "error": str(e)
             }
         )
-        db.commit()  # Commit event before raising exception
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Invalid token signature: {str(e)}"
         )
         # Broker call count remains 0
     except TokenExpiredError as e:
-        # Expired token has valid signature, so we can decode claims
-        correlation_id = "unknown"
-        proposal_id = None
-        token_jti = None
-        try:
-            import jwt as jwt_lib
-            unverified = jwt_lib.decode(token, options={"verify_signature": False, "verify_exp": False})
-            correlation_id = unverified.get("correlation_id", "unknown")
-            proposal_id = unverified.get("proposal_id")
-            token_jti = unverified.get("jti")
-        except Exception:
-            pass
+        # Expired token has valid signature; claims come from verify_token
+        correlation_id = e.claims.get("correlation_id", "unknown")
+        proposal_id = e.claims.get("proposal_id")
+        token_jti = e.claims.get("jti")
         
-        log_event(
+        await log_rejection(
             db,
             "order_rejected_expired",
             correlation_id,
@@ -295,27 +443,18 @@ async def place_order(
                 "error": str(e)
             }
         )
-        db.commit()  # Commit event before raising exception
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=f"Token expired: {str(e)}"
         )
         # Broker call count remains 0
     except TokenVerificationError as e:
-        # Try to decode token to get claims (but don't trust them)
-        correlation_id = "unknown"
-        proposal_id = None
-        token_jti = None
-        try:
-            import jwt as jwt_lib
-            unverified = jwt_lib.decode(token, options={"verify_signature": False})
-            correlation_id = unverified.get("correlation_id", "unknown")
-            proposal_id = unverified.get("proposal_id")
-            token_jti = unverified.get("jti")
-        except Exception:
-            pass
+        # Unverified claims decoded by verify_token (for logging only, don't trust them)
+        correlation_id = e.claims.get("correlation_id", "unknown")
+        proposal_id = e.claims.get("proposal_id")
+        token_jti = e.claims.get("jti")
         
-        log_event(
+        await log_rejection(
             db,
             "order_rejected_auth",
             correlation_id,
@@ -327,7 +466,6 @@ async def place_order(
                 "error": str(e)
             }
         )
-        db.commit()  # Commit event before raising exception
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=f"Token verification failed: {str(e)}"
@@ -341,7 +479,7 @@ async def place_order(
     proposal_payload_hash = payload.get("proposal_payload_hash")
     
     if not token_jti or not proposal_id:
-        log_event(
+        await log_rejection(
             db,
             "order_rejected",
             correlation_id,
@@ -351,119 +489,172 @@ async def place_order(
                 "proposal_id": proposal_id
             }
         )
-        db.commit()  # Commit event before raising exception
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token missing required claims"
         )
         # Broker call count remains 0
     
-    # 3. Get approval record
-    approval = get_approval_by_jti(db, token_jti)
-    if approval is None:
-        log_event(
-            db,
-            "order_rejected",
-            correlation_id,
-            {
-                "reason": "Approval record not found",
-                "token_jti": token_jti
-            }
-        )
-        db.commit()  # Commit event before raising exception
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Approval record not found"
-        )
-        # Broker call count remains 0
+    return {
+        "token_jti": token_jti,
+        "proposal_id": proposal_id,
+        "correlation_id": correlation_id
+    }
+
+
+async def claim_order_token(
+    db: AsyncSession,
+    token: str,
+    token_jti: str,
+    correlation_id: str,
+    event_type: str,
+    event_payload: Dict[str, Any]
+) -> int:
+    """
+    Claim the approval token and commit it with the order request event.
     
-    # 4. Verify token hash
-    token_hash = calculate_token_hash(token)
-    if approval.token_hash != token_hash:
-        log_event(
-            db,
-            "order_rejected",
-            correlation_id,
-            {
-                "reason": "Token hash mismatch",
-                "token_jti": token_jti
-            }
-        )
-        db.commit()  # Commit event before raising exception
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Token hash mismatch"
-        )
-        # Broker call count remains 0
+    One conditional UPDATE ... RETURNING validates token_hash, token_used_at
+    and token_expires_at and consumes the token, so only one of concurrent
+    requests with the same token wins. The event is committed in the claim
+    transaction, before any broker call, so the token stays consumed even if
+    the process dies mid-order.
     
-    # 5. Check token expiration (from DB)
+    Args:
+        db: Database session
+        token: Bearer token
+        token_jti: Verified token JTI
+        correlation_id: Correlation ID
+        event_type: Request event type (e.g. order_requested)
+        event_payload: Request event payload (approval_id is added)
+        
+    Returns:
+        Claimed approval ID
+        
+    Raises:
+        HTTPException: 403 if the approval is missing, mismatched, expired or already used
+    """
+    token_hash = calculate_token_hash(token)
     now = datetime.now(timezone.utc)
-    if approval.token_expires_at:
-        # Ensure both are timezone-aware
-        expires_at = approval.token_expires_at
-        if expires_at.tzinfo is None:
-            expires_at = expires_at.replace(tzinfo=timezone.utc)
-        if expires_at < now:
-            log_event(
-                db,
-                "order_rejected",
-                correlation_id,
-                {
-                    "reason": "Token expired (from DB)",
-                    "token_jti": token_jti
-                }
-            )
-            db.commit()  # Commit event before raising exception
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Token expired"
-            )
-            # Broker call count remains 0
+    claimed = await claim_approval_token(db, token_jti, token_hash, now)
+    if claimed is None:
+        await reject_unclaimed_token(db, token_jti, token_hash, correlation_id, now)
+    approval_id, _ = claimed
+    
+    await log_event(db, event_type, correlation_id, {**event_payload, "approval_id": approval_id})
+    await db.commit()
+    return approval_id
+
+
+@app.get("/metrics/kill_switch")
+async def kill_switch_metrics() -> Dict[str, Any]:
+    """
+    Report kill switch cache state and staleness for monitoring.
+    
+    Returns:
+        KillSwitchService.metrics() (with enabled=True), or {"enabled": False}
+        when orders query system_state directly
+    """
+    if kill_switch_service is None:
+        return {"enabled": False}
+    return {"enabled": True, **kill_switch_service.metrics()}
+
+
+@app.post("/place_order", response_model=PlaceOrderResponse)
+async def place_order(
+    request: PlaceOrderRequest,
+    token: str = Depends(get_bearer_token),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """
+    Place order with broker (after approval token verification).
+    
+    Processing order (server-enforced):
+    1. Kill switch check (if active -> 403 + broker calls == 0)
+    2. JWT signature verification (if fails -> 401/403 + broker calls == 0)
+    3. Token expiration check (if expired -> 403 + broker calls == 0)
+    4. Order intent validation by the broker client (if invalid -> 400, token not consumed)
+    5. Approval claim: one conditional UPDATE verifies token_hash, token_used_at and
+       token_expires_at and marks the token used (concurrent reuse -> only one succeeds)
+    6. On success: log event (committed with the claim), call broker, create order.
+       If the broker call fails the order is stored as rejected with the error.
+    
+    Args:
+        request: Order request
+        token: Bearer token from Authorization header
+        db: Database session
+        
+    Returns:
+        Order response with order_id and status
+        
+    Raises:
+        HTTPException: 403 if kill switch active, 401/403 if token invalid, 403 if token expired/used,
+            400 if the order intent is invalid, 422 if the broker rejected the order,
+            502 if the broker is unavailable
+    """
+    # 1-3. Kill switch check, JWT signature/expiration verification
+    claims = await verify_order_request(token, db)
+    token_jti = claims["token_jti"]
+    proposal_id = claims["proposal_id"]
+    correlation_id = claims["correlation_id"]
     
-    # 6. Check if token already used (1-time use)
-    if approval.token_used_at is not None:
-        log_event(
+    # 4. Order intent validation before the claim: 잘못된 주문으로 토큰이 소모되지 않도록
+    try:
+        broker_client.validate_order(request.order_intent)
+    except ValueError as e:
+        await log_rejection(
             db,
             "order_rejected",
             correlation_id,
             {
-                "reason": "Token already used",
+                "reason": "Invalid order intent",
                 "token_jti": token_jti,
-                "token_used_at": approval.token_used_at.isoformat()
+                "error": str(e)
             }
         )
-        db.commit()  # Commit event before raising exception
         raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Token already used (one-time use only)"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid order intent: {str(e)}"
         )
-        # Broker call count remains 0
     
-    # 7. All checks passed - proceed with order
-    # Mark token as used (1-time use)
-    mark_token_used(db, approval.approval_id)
-    
-    # Log order request
-    log_event(
-        db,
-        "order_requested",
-        correlation_id,
-        {
-            "proposal_id": proposal_id,
-            "approval_id": approval.approval_id,
-            "token_jti": token_jti
-        }
-    )
+    # 5-6. Claim approval (one-time use) and log the order request
+    approval_id = await claim_order_token(db, token, token_jti, correlation_id, "order_requested", {
+        "proposal_id": proposal_id,
+        "token_jti": token_jti
+    })
     
     # Call broker (this is where broker_client.place_order is called)
-    broker_response = await broker_client.place_order(request.order_intent)
+    try:
+        broker_response = await broker_client.place_order(request.order_intent)
+    except Exception as e:
+        # 토큰은 이미 소모됨: 실패한 주문도 rejected로 기록 (event와 함께 commit)
+        error = f"{type(e).__name__}: {e}"
+        await log_event(db, "order_rejected", correlation_id, {
+            "reason": "Broker error",
+            "proposal_id": proposal_id,
+            "approval_id": approval_id,
+            "token_jti": token_jti,
+            "error": error
+        })
+        order = await create_order(
+            db,
+            correlation_id=correlation_id,
+            proposal_id=proposal_id,
+            approval_id=approval_id,
+            order_data={**request.order_intent, "error": error},
+            status=OrderStatus.REJECTED
+        )
+        # 422 상수 이름은 Starlette 버전마다 달라(UNPROCESSABLE_ENTITY/CONTENT) 숫자로 지정
+        raise HTTPException(
+            status_code=422 if isinstance(e, BrokerRejectedError) else status.HTTP_502_BAD_GATEWAY,
+            detail=f"Order {order.order_id} failed at broker: {error}"
+        )
     
     # Create order record
-    order = create_order(
+    order = await create_order(
         db,
         correlation_id=correlation_id,
         proposal_id=proposal_id,
-        approval_id=approval.approval_id,
+        approval_id=approval_id,
         order_data={
             **request.order_intent,
             "broker_response": broker_response
@@ -475,3 +666,182 @@ async def place_order(
         status=order.status.value
     )
 
+
+
+def build_basket_intents(proposal_payload: Dict[str, Any], order_intents: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Validate the order intents of a proposal basket.
+    
+    Proposals carry target weights, not share quantities, so the caller must
+    send one intent per proposal position with a positive integer quantity
+    (the token is single-use, so a partial basket is rejected rather than
+    spending it on a subset). A missing market is taken from the proposal
+    position.
+    
+    Args:
+        proposal_payload: Proposal payload_json with 'positions'
+        order_intents: Order intents from the request, or None
+        
+    Returns:
+        Order intents, each with symbol and market
+        
+    Raises:
+        ValueError: If intents are missing, an intent is not part of the proposal,
+            duplicates a symbol, disagrees with the position's market or has no
+            positive integer quantity, or a proposal position has no intent
+    """
+    markets = {
+        position['symbol']: position['market']
+        for position in proposal_payload.get('positions') or []
+    }
+    if not markets:
+        raise ValueError("Proposal has no positions")
+    if not order_intents:
+        raise ValueError("order_intents is required: one intent with a quantity per proposal position")
+    
+    intents = []
+    seen = set()
+    for index, intent in enumerate(order_intents):
+        symbol = intent.get("symbol")
+        if symbol not in markets:
+            raise ValueError(f"Order intent {index}: symbol {symbol!r} is not in the proposal")
+        if symbol in seen:
+            raise ValueError(f"Order intent {index}: duplicate symbol {symbol!r}")
+        seen.add(symbol)
+        market = intent.get("market") or markets[symbol]
+        if market != markets[symbol]:
+            raise ValueError(
+                f"Order intent {index} ({symbol}): market {market!r} does not match "
+                f"proposal market {markets[symbol]!r}"
+            )
+        quantity = intent.get("quantity")
+        if isinstance(quantity, bool) or not isinstance(quantity, int) or quantity <= 0:
+            # broker 호출 전에 거부해야 토큰이 소모되지 않음
+            raise ValueError(f"Order intent {index} ({symbol}): quantity must be a positive integer")
+        intents.append({**intent, "market": market})
+    
+    missing = [symbol for symbol in markets if symbol not in seen]
+    if missing:
+        raise ValueError(f"Missing order intents for proposal positions: {', '.join(missing)}")
+    return intents
+
+
+@app.post("/place_orders", response_model=PlaceOrdersResponse)
+async def place_orders(
+    request: PlaceOrdersRequest,
+    token: str = Depends(get_bearer_token),
+    db: AsyncSession = Depends(get_async_db_session)
+):
+    """
+    Place all orders of an approved proposal with one approval token.
+    
+    The token is verified and claimed once for the whole basket (same checks
+    as /place_order; a reused token is rejected before any broker call).
+    Legs are then sent to the broker concurrently, at most
+    EXECUTION_MARKET_CONCURRENCY calls per market at a time, and every leg
+    is stored with one bulk insert: accepted legs as pending orders, legs
+    the broker failed as rejected orders.
+    
+    Args:
+        request: Basket request (order_intents covering every proposal position)
+        token: Bearer token from Authorization header
+        db: Database session
+        
+    Returns:
+        Per-leg results (order_id, status, broker_order_id or error)
+        
+    Raises:
+        HTTPException: 403 if kill switch active, 401/403 if token invalid/expired/used,
+            400 if the basket is invalid, 404 if the proposal does not exist
+    """
+    # 1-3. Kill switch check, JWT signature/expiration verification
+    claims = await verify_order_request(token, db)
+    token_jti = claims["token_jti"]
+    proposal_id = claims["proposal_id"]
+    correlation_id = claims["correlation_id"]
+    
+    # Basket validation before the claim: 잘못된 요청으로 토큰이 소모되지 않도록
+    proposal = await get_proposal_by_id(db, proposal_id)
+    if proposal is None:
+        await log_rejection(
+            db,
+            "order_rejected",
+            correlation_id,
+            {
+                "reason": "Proposal not found",
+                "proposal_id": proposal_id,
+                "token_jti": token_jti
+            }
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Proposal {proposal_id} not found"
+        )
+    try:
+        intents = build_basket_intents(proposal.payload_json, request.order_intents)
+        for index, intent in enumerate(intents):
+            try:
+                broker_client.validate_order(intent)
+            except ValueError as e:
+                raise ValueError(f"Order intent {index} ({intent['symbol']}): {e}") from e
+        market_limits = get_market_concurrency()
+    except ValueError as e:
+        await log_rejection(
+            db,
+            "order_rejected",
+            correlation_id,
+            {
+                "reason": "Invalid order basket",
+                "token_jti": token_jti,
+                "error": str(e)
+            }
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid order basket: {str(e)}"
+        )
+    
+    # 4-5. Claim approval once for the whole basket and log the request
+    approval_id = await claim_order_token(db, token, token_jti, correlation_id, "orders_requested", {
+        "proposal_id": proposal_id,
+        "token_jti": token_jti,
+        "legs": len(intents)
+    })
+    
+    # Submit legs concurrently (per-market semaphore)
+    semaphores = {
+        market: asyncio.Semaphore(market_limits.get(market, DEFAULT_MARKET_CONCURRENCY))
+        for market in {intent["market"] for intent in intents}
+    }
+    
+    async def submit(intent: Dict[str, Any]):
+        async with semaphores[intent["market"]]:
+            try:
+                return await broker_client.place_order(intent), None
+            except Exception as e:
+                # 한 leg의 broker 오류가 나머지 leg를 중단시키지 않음
+                return None, f"{type(e).__name__}: {e}"
+    
+    outcomes = await asyncio.gather(*(submit(intent) for intent in intents))
+    
+    # Persist every leg with one bulk insert
+    orders = []
+    for intent, (broker_response, error) in zip(intents, outcomes):
+        if error is None:
+            orders.append(({**intent, "broker_response": broker_response}, OrderStatus.PENDING))
+        else:
+            orders.append(({**intent, "error": error}, OrderStatus.REJECTED))
+    order_ids = await create_orders(db, correlation_id, proposal_id, approval_id, orders)
+    
+    legs = []
+    for index, (intent, (broker_response, error), order_id) in enumerate(zip(intents, outcomes, order_ids)):
+        legs.append(OrderLegResult(
+            index=index,
+            symbol=intent["symbol"],
+            market=intent["market"],
+            order_id=order_id,
+            status=(OrderStatus.PENDING if error is None else OrderStatus.REJECTED).value,
+            broker_order_id=(broker_response or {}).get("broker_order_id"),
+            error=error
+        ))
+    return PlaceOrdersResponse(proposal_id=proposal_id, legs=legs)
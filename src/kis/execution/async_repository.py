@@ -0,0 +1,177 @@
+"""Async (AsyncSession) repository for Execution Server database operations"""
+
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from kis.storage.models import (
+    SystemState,
+    Approval,
+    Order,
+    Proposal,
+    KillSwitchStatus,
+    OrderStatus
+)
+from kis.execution.repository import build_order, build_order_row, build_event, build_claim_statement
+
+
+async def get_kill_switch_status(session: AsyncSession) -> KillSwitchStatus:
+    """
+    Get latest kill switch status from system_state.
+
+    Args:
+        session: Async database session
+
+    Returns:
+        Kill switch status (default: ACTIVE if no record exists)
+    """
+    latest_status = await session.scalar(
+        select(SystemState.kill_switch_status)
+        .order_by(SystemState.timestamp.desc())
+        .limit(1)
+    )
+
+    if latest_status is not None:
+        return latest_status
+    else:
+        # Conservative default: ACTIVE if no record exists
+        return KillSwitchStatus.ACTIVE
+
+
+async def get_approval_by_jti(session: AsyncSession, token_jti: str) -> Optional[Approval]:
+    """
+    Get approval record by token JTI.
+
+    Args:
+        session: Async database session
+        token_jti: Token JTI (JWT ID)
+
+    Returns:
+        Approval object or None if not found
+    """
+    return await session.scalar(select(Approval).where(Approval.token_jti == token_jti).limit(1))
+
+
+async def claim_approval_token(
+    session: AsyncSession,
+    token_jti: str,
+    token_hash: str,
+    now: Optional[datetime] = None
+) -> Optional[tuple]:
+    """
+    Atomically validate and consume a one-time approval token (not committed).
+
+    Args:
+        session: Async database session
+        token_jti: Token JTI (JWT ID)
+        token_hash: SHA-256 hash of the presented token
+        now: Claim time (default: now, UTC)
+
+    Returns:
+        (approval_id, proposal_id) if claimed, None if the token is unknown,
+        mismatched, expired or already used
+    """
+    result = await session.execute(
+        build_claim_statement(token_jti, token_hash, now or datetime.now(timezone.utc))
+    )
+    row = result.first()
+    return tuple(row) if row is not None else None
+
+
+async def create_order(
+    session: AsyncSession,
+    correlation_id: str,
+    proposal_id: int,
+    approval_id: int,
+    order_data: dict,
+    status: OrderStatus = OrderStatus.PENDING
+) -> Order:
+    """
+    Create order record in database.
+
+    Args:
+        session: Async database session
+        correlation_id: Correlation ID
+        proposal_id: Proposal ID
+        approval_id: Approval ID
+        order_data: Order data dictionary
+        status: Order status
+
+    Returns:
+        Created Order object
+    """
+    order = build_order(correlation_id, proposal_id, approval_id, order_data, status)
+
+    session.add(order)
+    await session.commit()
+    await session.refresh(order)
+
+    return order
+
+
+async def create_orders(
+    session: AsyncSession,
+    correlation_id: str,
+    proposal_id: int,
+    approval_id: int,
+    orders: List[Tuple[dict, OrderStatus]]
+) -> List[int]:
+    """
+    Create several order records with one bulk INSERT ... RETURNING and commit.
+
+    Args:
+        session: Async database session
+        correlation_id: Correlation ID
+        proposal_id: Proposal ID
+        approval_id: Approval ID
+        orders: (order data, status) per order
+
+    Returns:
+        Created order IDs in input order
+    """
+    rows = [
+        build_order_row(correlation_id, proposal_id, approval_id, order_data, status)
+        for order_data, status in orders
+    ]
+    result = await session.execute(
+        insert(Order).returning(Order.order_id, sort_by_parameter_order=True),
+        rows
+    )
+    order_ids = list(result.scalars())
+    await session.commit()
+    return order_ids
+
+
+async def log_event(
+    session: AsyncSession,
+    event_type: str,
+    correlation_id: str,
+    payload: dict
+) -> None:
+    """
+    Log event to event_log.
+
+    Args:
+        session: Async database session
+        event_type: Event type
+        correlation_id: Correlation ID
+        payload: Event payload dictionary
+    """
+    session.add(build_event(event_type, correlation_id, payload))
+    await session.flush()  # Flush to ensure event is in session (hash chain assigned)
+    # Note: commit will be done by caller or separately to ensure persistence
+
+
+async def get_proposal_by_id(session: AsyncSession, proposal_id: int) -> Optional[Proposal]:
+    """
+    Get proposal by ID.
+
+    Args:
+        session: Async database session
+        proposal_id: Proposal ID
+
+    Returns:
+        Proposal object or None if not found
+    """
+    return await session.get(Proposal, proposal_id)
@@ -1,15 +1,29 @@
 """JWT authentication and token verification for Execution Server"""
 
 import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 import jwt
-from jwt.exceptions import InvalidTokenError, ExpiredSignatureError, DecodeError
+from jwt.exceptions import InvalidTokenError, DecodeError
+
+from kis.execution.config import get_token_cache_size
 
 
 class TokenVerificationError(Exception):
-    """Base exception for token verification errors"""
-    pass
+    """
+    Base exception for token verification errors.
+    
+    claims holds the unverified token claims (empty if the token could not
+    be decoded) so callers can log correlation_id/jti without decoding again.
+    They must not be trusted.
+    """
+    
+    def __init__(self, message: str, claims: Optional[Dict[str, Any]] = None):
+        super().__init__(message)
+        self.claims = claims or {}
 
 
 class InvalidTokenSignatureError(TokenVerificationError):
@@ -22,13 +36,146 @@ class TokenExpiredError(TokenVerificationError):
     pass
 
 
-def verify_token(token: str, secret: str) -> Dict[str, Any]:
+class TokenCache:
+    """
+    Bounded LRU cache of token verification results.
+    
+    Keyed by (token hash, secret fingerprint), so rotating the secret never
+    serves results verified with the old one. Verified claims expire at the
+    token's exp; failures that cannot change for the same token and secret
+    (expired, bad signature/malformed) are kept until evicted.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize cache.
+        
+        Args:
+            max_entries: Maximum cached tokens (0 disables caching)
+        """
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        # key -> (expires_at, claims, (error type, message) or None)
+        self._entries: "OrderedDict[Tuple[str, str], tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(token: str, secret: str) -> Tuple[str, str]:
+        """Build the cache key (token hash, secret fingerprint)"""
+        return calculate_token_hash(token), hashlib.sha256(secret.encode('utf-8')).hexdigest()
+    
+    def get(self, key: Tuple[str, str]) -> Optional[Tuple[Dict[str, Any], Optional[TokenVerificationError]]]:
+        """
+        Look up a verification result.
+        
+        Args:
+            key: Cache key from make_key()
+            
+        Returns:
+            (claims, error) where error is None for verified claims or a new
+            TokenVerificationError to raise, or None on miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, claims, failure = entry
+                # PyJWT와 동일하게 now >= exp 이면 만료
+                if expires_at is not None and time.time() >= expires_at:
+                    del self._entries[key]
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        if failure is None:
+            return dict(claims), None
+        # 예외 객체는 traceback을 붙잡지 않도록 (type, message)로만 보관하고 매번 새로 생성
+        error_type, message = failure
+        return dict(claims), error_type(message, dict(claims))
+    
+    def put(
+        self,
+        key: Tuple[str, str],
+        claims: Dict[str, Any],
+        error: Optional[TokenVerificationError] = None,
+        expires_at: Optional[float] = None
+    ) -> None:
+        """
+        Store a verification result, evicting the least recently used entry when full.
+        
+        Args:
+            key: Cache key from make_key()
+            claims: Verified claims, or unverified claims for a failure
+            error: Verification error (None for verified claims)
+            expires_at: Unix time after which the entry is dropped (None: until evicted)
+        """
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            failure = (type(error), str(error)) if error is not None else None
+            self._entries[key] = (expires_at, dict(claims), failure)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Process-wide cache used by verify_token (EXECUTION_TOKEN_CACHE_SIZE, 0 disables)
+token_cache = TokenCache(max_entries=get_token_cache_size())
+
+
+# 토큰 서명 알고리즘 (create_token과 동일)
+TOKEN_ALGORITHM = "HS256"
+
+
+def _verify_claims(claims: Dict[str, Any]) -> None:
+    """
+    Check time-based registered claims of an already decoded payload.
+    
+    Args:
+        claims: Token payload
+        
+    Raises:
+        TokenExpiredError: If exp has passed
+        TokenVerificationError: If exp/nbf/iat is malformed or not yet valid
+    """
+    now = time.time()
+    for name in ("exp", "nbf", "iat"):
+        value = claims.get(name)
+        if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            raise TokenVerificationError(f"Invalid token: {name} claim must be a number", claims)
+    if claims.get("exp") is not None and claims["exp"] <= now:
+        raise TokenExpiredError("Token has expired: Signature has expired", claims)
+    if claims.get("nbf") is not None and claims["nbf"] > now:
+        raise TokenVerificationError("Invalid token: The token is not yet valid (nbf)", claims)
+    if claims.get("iat") is not None and claims["iat"] > now:
+        raise TokenVerificationError("Invalid token: The token is not yet valid (iat)", claims)
+
+
+def verify_token(token: str, secret: str, use_cache: bool = True) -> Dict[str, Any]:
     """
     Verify and decode JWT token.
     
+    The token is decoded once; the signature and exp are then checked
+    against that result. Results are cached per token and secret (see
+    TokenCache), so a token retried by a client is HMAC-verified and decoded
+    only once. On failure the raised error carries the unverified claims for
+    logging.
+    
     Args:
         token: JWT token string
         secret: JWT secret for verification
+        use_cache: Use the process-wide token_cache
         
     Returns:
         Decoded token payload (claims)
@@ -38,21 +185,46 @@ def verify_token(token: str, secret: str) -> Dict[str, Any]:
         TokenExpiredError: If token has expired
         TokenVerificationError: For other verification errors
     """
+    key = TokenCache.make_key(token, secret) if use_cache else None
+    if key is not None:
+        cached = token_cache.get(key)
+        if cached is not None:
+            claims, error = cached
+            if error is not None:
+                raise error
+            return claims
+    
     try:
-        # Decode and verify token
-        payload = jwt.decode(
-            token,
-            secret,
-            algorithms=["HS256"],
-            options={"verify_signature": True, "verify_exp": True}
-        )
-        return payload
-    except ExpiredSignatureError as e:
-        raise TokenExpiredError(f"Token has expired: {str(e)}") from e
+        # 서명 검증 전 1회만 decode하고, 이후 검증은 이 결과를 사용
+        decoded = jwt.decode_complete(token, options={"verify_signature": False, "verify_exp": False})
     except DecodeError as e:
-        raise InvalidTokenSignatureError(f"Token signature is invalid: {str(e)}") from e
+        error = InvalidTokenSignatureError(f"Token signature is invalid: {str(e)}")
+        if key is not None:
+            token_cache.put(key, {}, error=error)
+        raise error from e
     except InvalidTokenError as e:
         raise TokenVerificationError(f"Invalid token: {str(e)}") from e
+    
+    claims = decoded["payload"]
+    try:
+        if decoded["header"].get("alg") != TOKEN_ALGORITHM:
+            raise InvalidTokenSignatureError("Token signature is invalid: The specified alg value is not allowed", claims)
+        algorithm = jwt.get_algorithm_by_name(TOKEN_ALGORITHM)
+        signing_input = token.rsplit(".", 1)[0].encode("utf-8")
+        if not algorithm.verify(signing_input, algorithm.prepare_key(secret), decoded["signature"]):
+            raise InvalidTokenSignatureError("Token signature is invalid: Signature verification failed", claims)
+        _verify_claims(claims)
+    except (InvalidTokenSignatureError, TokenExpiredError) as error:
+        # 같은 토큰/secret이면 결과가 바뀌지 않으므로 캐시
+        if key is not None:
+            token_cache.put(key, error.claims, error=error)
+        raise
+    # nbf/iat 등 시간에 따라 결과가 바뀔 수 있는 오류(TokenVerificationError)는 캐시하지 않음
+    
+    # exp가 없는 토큰은 만료 시점을 알 수 없으므로 캐시하지 않음
+    if key is not None and isinstance(claims.get("exp"), (int, float)):
+        token_cache.put(key, claims, expires_at=float(claims["exp"]))
+    return claims
 
 
 def decode_token(token: str, secret: str) -> Dict[str, Any]:
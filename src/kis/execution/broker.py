@@ -1,7 +1,25 @@
 """Broker client interface and Spy implementation for testing"""
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+
+class BrokerError(Exception):
+    """Base exception for broker client errors"""
+    pass
+
+
+class BrokerRejectedError(BrokerError):
+    """Broker answered but rejected the request (rt_cd != '0')"""
+
+    def __init__(self, message: str, msg_cd: Optional[str] = None):
+        super().__init__(message)
+        self.msg_cd = msg_cd
+
+
+class BrokerUnavailableError(BrokerError):
+    """Broker unreachable: retries exhausted or circuit breaker open"""
+    pass
 
 
 class BrokerClient(ABC):
@@ -19,6 +37,25 @@ class BrokerClient(ABC):
             Broker response dictionary
         """
         pass
+    
+    def validate_order(self, order_data: Dict[str, Any]) -> None:
+        """
+        Check that an order can be submitted, without calling the broker.
+        
+        Called before the approval token is claimed so that malformed
+        orders don't consume it; accepts everything by default.
+        
+        Args:
+            order_data: Order data dictionary
+            
+        Raises:
+            ValueError: If the order is incomplete or unsupported
+        """
+        pass
+    
+    async def aclose(self) -> None:
+        """Release client resources (e.g. pooled connections); no-op by default"""
+        pass
 
 
 class SpyBrokerClient(BrokerClient):
@@ -1,6 +1,11 @@
 """Configuration for Execution Server"""
 
 import os
+from typing import Dict, Any, Optional
+
+
+# /place_orders 시장별 동시 broker 호출 수 기본값
+DEFAULT_MARKET_CONCURRENCY = 4
 
 
 def get_jwt_secret() -> str:
@@ -21,3 +26,119 @@ def get_jwt_secret() -> str:
         )
     return secret
 
+
+def get_token_cache_size() -> int:
+    """
+    Get the verified-token cache size (EXECUTION_TOKEN_CACHE_SIZE, default: 1024, 0 disables).
+    
+    Returns:
+        Maximum number of cached tokens
+    """
+    return max(0, int(os.getenv("EXECUTION_TOKEN_CACHE_SIZE", "1024")))
+
+
+def get_event_sink_config() -> Optional[Dict[str, Any]]:
+    """
+    Get batched event writer settings from environment variables.
+    
+    - EXECUTION_EVENT_SINK: "1"/"true" to enable batching (default: disabled)
+    - EXECUTION_EVENT_WAL_DIR: durable WAL directory (optional)
+    - EXECUTION_EVENT_BATCH_SIZE / EXECUTION_EVENT_FLUSH_INTERVAL: flush thresholds
+    
+    Returns:
+        Keyword arguments for EventSink (without session_factory), or None if disabled
+    """
+    enabled = os.getenv("EXECUTION_EVENT_SINK", "").strip().lower() in ("1", "true", "yes")
+    wal_dir = os.getenv("EXECUTION_EVENT_WAL_DIR") or None
+    if not enabled and wal_dir is None:
+        return None
+    
+    config: Dict[str, Any] = {"wal_dir": wal_dir}
+    if os.getenv("EXECUTION_EVENT_BATCH_SIZE"):
+        config["batch_size"] = int(os.getenv("EXECUTION_EVENT_BATCH_SIZE"))
+    if os.getenv("EXECUTION_EVENT_FLUSH_INTERVAL"):
+        config["flush_interval"] = float(os.getenv("EXECUTION_EVENT_FLUSH_INTERVAL"))
+    return config
+
+
+def get_kill_switch_config() -> Optional[Dict[str, Any]]:
+    """
+    Get in-process kill switch cache settings from environment variables.
+    
+    - EXECUTION_KILL_SWITCH_CACHE: "1"/"true" to enable the cache and watcher (default: disabled, read system_state on every order)
+    - EXECUTION_KILL_SWITCH_POLL_INTERVAL: seconds between change checks
+    - EXECUTION_KILL_SWITCH_MAX_STALENESS: seconds without a successful check before failing closed
+    - EXECUTION_KILL_SWITCH_REFRESH_INTERVAL: seconds between unconditional reloads
+    
+    Returns:
+        Keyword arguments for KillSwitchService (without engine), or None if disabled
+    """
+    enabled = os.getenv("EXECUTION_KILL_SWITCH_CACHE", "").strip().lower() in ("1", "true", "yes")
+    if not enabled:
+        return None
+    
+    config: Dict[str, Any] = {}
+    if os.getenv("EXECUTION_KILL_SWITCH_POLL_INTERVAL"):
+        config["poll_interval"] = float(os.getenv("EXECUTION_KILL_SWITCH_POLL_INTERVAL"))
+    if os.getenv("EXECUTION_KILL_SWITCH_MAX_STALENESS"):
+        config["max_staleness"] = float(os.getenv("EXECUTION_KILL_SWITCH_MAX_STALENESS"))
+    if os.getenv("EXECUTION_KILL_SWITCH_REFRESH_INTERVAL"):
+        config["refresh_interval"] = float(os.getenv("EXECUTION_KILL_SWITCH_REFRESH_INTERVAL"))
+    return config
+
+
+def get_market_concurrency() -> Dict[str, int]:
+    """
+    Get per-market broker concurrency limits for /place_orders.
+    
+    EXECUTION_MARKET_CONCURRENCY: comma-separated MARKET=N pairs (e.g. "KR=4,US=8");
+    markets not listed use DEFAULT_MARKET_CONCURRENCY.
+    
+    Returns:
+        Dict of market -> maximum concurrent broker calls
+        
+    Raises:
+        ValueError: If the setting is malformed
+    """
+    limits: Dict[str, int] = {}
+    for item in os.getenv("EXECUTION_MARKET_CONCURRENCY", "").split(","):
+        if not item.strip():
+            continue
+        market, _, value = item.partition("=")
+        if not market.strip() or not value.strip().isdigit() or int(value) < 1:
+            raise ValueError(f"Invalid EXECUTION_MARKET_CONCURRENCY entry: {item!r} (expected MARKET=N)")
+        limits[market.strip().upper()] = int(value)
+    return limits
+
+
+def get_kis_client_config() -> Optional[Dict[str, Any]]:
+    """
+    Get KIS mock-trading broker client settings from environment variables.
+    
+    - KIS_APP_KEY / KIS_APP_SECRET / KIS_ACCOUNT_NO: credentials (client disabled if KIS_APP_KEY is unset)
+    - KIS_BASE_URL: API base URL (default: mock-trading domain; real-trading domain is rejected)
+    - KIS_RATE_LIMIT: requests per second
+    - KIS_MAX_CONNECTIONS: connection pool size
+    
+    Returns:
+        Keyword arguments for KISBrokerClient, or None if not configured
+        
+    Raises:
+        ValueError: If KIS_APP_KEY is set without KIS_APP_SECRET or KIS_ACCOUNT_NO
+    """
+    app_key = os.getenv("KIS_APP_KEY")
+    if not app_key:
+        return None
+    app_secret = os.getenv("KIS_APP_SECRET")
+    account = os.getenv("KIS_ACCOUNT_NO")
+    if not app_secret or not account:
+        raise ValueError("KIS_APP_SECRET and KIS_ACCOUNT_NO are required when KIS_APP_KEY is set")
+    
+    config: Dict[str, Any] = {"app_key": app_key, "app_secret": app_secret, "account": account}
+    if os.getenv("KIS_BASE_URL"):
+        config["base_url"] = os.getenv("KIS_BASE_URL")
+    if os.getenv("KIS_RATE_LIMIT"):
+        config["rate_limit"] = float(os.getenv("KIS_RATE_LIMIT"))
+    if os.getenv("KIS_MAX_CONNECTIONS"):
+        config["max_connections"] = int(os.getenv("KIS_MAX_CONNECTIONS"))
+    return config
@@ -0,0 +1,259 @@
+"""In-process kill switch state cache with a change watcher (fail closed)"""
+
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from sqlalchemy.orm import sessionmaker
+
+from kis.execution.repository import get_kill_switch_status
+from kis.storage.models import KillSwitchStatus
+
+
+DEFAULT_POLL_INTERVAL = 0.05  # seconds
+DEFAULT_MAX_STALENESS = 1.0  # seconds
+DEFAULT_REFRESH_INTERVAL = 30.0  # seconds
+
+# watcher 연결 실패 후 재연결 대기 상한
+MAX_RECONNECT_BACKOFF = 5.0  # seconds
+
+WATCHER_SQLITE = "sqlite_data_version"
+WATCHER_POLLING = "polling"
+
+
+class _SqliteDataVersionWatcher:
+    """
+    Detects commits by any connection or process via PRAGMA data_version.
+
+    data_version changes whenever another connection commits to the
+    database file, so the latest system_state row is reloaded only after a
+    write instead of on every poll.
+    """
+
+    name = WATCHER_SQLITE
+
+    def __init__(self, engine):
+        self._conn = engine.connect()
+        self._version = None
+
+    def changed(self) -> bool:
+        version = self._conn.exec_driver_sql("PRAGMA data_version").scalar()
+        # 읽기 전용 연결이 열린 transaction을 붙잡지 않도록 매번 종료
+        self._conn.rollback()
+        changed = version != self._version
+        self._version = version
+        return changed
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class _PollingWatcher:
+    """Fallback for backends without a cheap change counter: reload on every poll"""
+
+    name = WATCHER_POLLING
+
+    def __init__(self, engine):
+        pass
+
+    def changed(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+
+class KillSwitchService:
+    """
+    Keeps the current kill switch status in memory for the order hot path.
+
+    A background thread watches system_state for changes every
+    poll_interval seconds (SQLite: PRAGMA data_version; other backends:
+    re-read the latest row) and reloads the status when it changed, plus a
+    full reload every refresh_interval seconds. Each successful check marks
+    the cached value as synced.
+
+    get_status() never touches the database. It fails closed and returns
+    ACTIVE when the service is not running, the watcher lost its connection,
+    or the last successful check is older than max_staleness seconds.
+    """
+
+    def __init__(
+        self,
+        engine,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_staleness: float = DEFAULT_MAX_STALENESS,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        autostart: bool = True
+    ):
+        """
+        Initialize service.
+
+        Args:
+            engine: SQLAlchemy (sync) engine
+            poll_interval: Seconds between change checks
+            max_staleness: Seconds after the last successful check before failing closed
+            refresh_interval: Seconds between unconditional reloads
+            autostart: Load the current status and start the watcher thread
+        """
+        self.engine = engine
+        self.poll_interval = poll_interval
+        self.max_staleness = max_staleness
+        self.refresh_interval = refresh_interval
+        self.session_factory = sessionmaker(bind=engine)
+        self.watcher_name = (
+            WATCHER_SQLITE if engine.dialect.name == "sqlite" else WATCHER_POLLING
+        )
+
+        self._status: KillSwitchStatus = KillSwitchStatus.ACTIVE
+        self._synced = False
+        self._last_sync: Optional[float] = None  # time.monotonic()
+        self._last_reload: Optional[float] = None
+        self._reloads = 0
+        self._errors = 0
+        self._last_error: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        if autostart:
+            self.start()
+
+    # -- public API --------------------------------------------------------
+
+    def start(self) -> None:
+        """Load the current status and start the watcher thread (idempotent)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        try:
+            self.reload()
+        except Exception as e:
+            # 첫 로드 실패: fail closed 상태로 시작하고 watcher가 재시도
+            self._mark_error(e)
+        self._thread = threading.Thread(target=self._run, name="kill-switch-watcher", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop the watcher thread; get_status() returns ACTIVE afterwards"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=max(1.0, self.poll_interval * 10))
+            self._thread = None
+        with self._lock:
+            self._synced = False
+
+    def reload(self) -> KillSwitchStatus:
+        """
+        Read the latest status from system_state and mark the cache synced.
+
+        Returns:
+            Latest kill switch status
+        """
+        session = self.session_factory()
+        try:
+            status = get_kill_switch_status(session)
+        finally:
+            session.close()
+        now = time.monotonic()
+        with self._lock:
+            self._status = status
+            self._synced = True
+            self._last_sync = now
+            self._last_reload = now
+            self._reloads += 1
+        return status
+
+    def staleness(self) -> Optional[float]:
+        """Seconds since the last successful check (None if never synced)"""
+        last_sync = self._last_sync
+        if last_sync is None:
+            return None
+        return time.monotonic() - last_sync
+
+    def is_fresh(self) -> bool:
+        """Whether the cached status is synced and within max_staleness"""
+        staleness = self.staleness()
+        return self._synced and staleness is not None and staleness <= self.max_staleness
+
+    def get_status(self) -> KillSwitchStatus:
+        """
+        Get the kill switch status from memory (no database access).
+
+        Returns:
+            Cached status, or ACTIVE if the cache is not fresh (fail closed)
+        """
+        if not self.is_fresh():
+            return KillSwitchStatus.ACTIVE
+        return self._status
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Get cache metrics for monitoring.
+
+        Returns:
+            Dict with status, cached_status, synced, fail_closed, staleness_seconds,
+            max_staleness_seconds, watcher, reloads, errors, last_error
+        """
+        staleness = self.staleness()
+        fresh = self.is_fresh()
+        return {
+            'status': self.get_status().value,
+            'cached_status': self._status.value,
+            'synced': self._synced,
+            'fail_closed': not fresh,
+            'staleness_seconds': staleness,
+            'max_staleness_seconds': self.max_staleness,
+            'poll_interval_seconds': self.poll_interval,
+            'watcher': self.watcher_name,
+            'reloads': self._reloads,
+            'errors': self._errors,
+            'last_error': self._last_error,
+        }
+
+    # -- watcher thread ----------------------------------------------------
+
+    def _mark_error(self, error: Exception) -> None:
+        with self._lock:
+            self._synced = False
+            self._errors += 1
+            self._last_error = f"{type(error).__name__}: {error}"
+
+    def _create_watcher(self):
+        if self.watcher_name == WATCHER_SQLITE:
+            return _SqliteDataVersionWatcher(self.engine)
+        return _PollingWatcher(self.engine)
+
+    def _check(self, watcher) -> None:
+        """Reload if the watcher saw a change or the refresh interval passed, else mark synced"""
+        now = time.monotonic()
+        refresh_due = self._last_reload is None or now - self._last_reload >= self.refresh_interval
+        if watcher.changed() or refresh_due or not self._synced:
+            self.reload()
+            return
+        with self._lock:
+            self._last_sync = now
+
+    def _run(self) -> None:
+        backoff = self.poll_interval
+        while not self._stop.is_set():
+            watcher = None
+            try:
+                watcher = self._create_watcher()
+                # 연결 직후 첫 data_version은 항상 변경으로 보고 reload
+                while not self._stop.is_set():
+                    self._check(watcher)
+                    backoff = self.poll_interval
+                    self._stop.wait(self.poll_interval)
+            except Exception as e:
+                # 동기화 상실: get_status()는 즉시 ACTIVE (fail closed), 재연결 시도
+                self._mark_error(e)
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, MAX_RECONNECT_BACKOFF)
+            finally:
+                if watcher is not None:
+                    try:
+                        watcher.close()
+                    except Exception:
+                        pass
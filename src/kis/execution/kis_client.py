@@ -0,0 +1,500 @@
+"""Async KIS (한국투자증권) mock-trading broker client: pooled HTTP, rate limiting, retries, circuit breaker"""
+
+import asyncio
+import importlib.util
+import random
+import time
+from typing import Dict, Any, Optional, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from kis.execution.broker import (
+    BrokerClient,
+    BrokerError,
+    BrokerRejectedError,
+    BrokerUnavailableError,
+)
+
+
+# Phase 0: 모의투자 도메인만 허용 (실전 도메인 openapi.koreainvestment.com:9443 호출 금지)
+KIS_MOCK_BASE_URL = "https://openapivts.koreainvestment.com:29443"
+KIS_MOCK_HOST = "openapivts.koreainvestment.com"
+# 테스트용 local stand-in 서버
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+# 모의투자 REST 호출 한도 (초당 건수)
+DEFAULT_RATE_LIMIT = 2.0
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_TIMEOUT = 5.0  # seconds
+
+DEFAULT_MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.2  # seconds
+RETRY_MAX_DELAY = 2.0  # seconds
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30.0  # seconds
+
+# 초당 거래건수 초과: 게이트웨이에서 거부되어 주문이 처리되지 않으므로 주문도 재시도 가능
+RATE_LIMIT_MSG_CODE = "EGW00201"
+
+TOKEN_PATH = "/oauth2/tokenP"
+DOMESTIC_ORDER_PATH = "/uapi/domestic-stock/v1/trading/order-cash"
+OVERSEAS_ORDER_PATH = "/uapi/overseas-stock/v1/trading/order"
+
+# 모의투자 tr_id (side -> tr_id)
+DOMESTIC_TR_IDS = {"buy": "VTTC0802U", "sell": "VTTC0801U"}
+OVERSEAS_TR_IDS = {"buy": "VTTT1002U", "sell": "VTTT1001U"}
+
+# access token 만료 전 갱신 여유
+TOKEN_REFRESH_MARGIN = 60.0  # seconds
+
+
+def http2_available() -> bool:
+    """Whether the optional h2 package (httpx HTTP/2 support) is installed"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def validate_base_url(base_url: str) -> str:
+    """
+    Check that a base URL points to the KIS mock-trading domain (or a local stand-in).
+
+    Args:
+        base_url: Broker API base URL
+
+    Returns:
+        Base URL without trailing slash
+
+    Raises:
+        ValueError: If the host is neither the mock domain nor local
+    """
+    host = urlsplit(base_url).hostname or ""
+    if host != KIS_MOCK_HOST and host not in LOCAL_HOSTS:
+        raise ValueError(
+            f"Broker base URL must be the KIS mock-trading domain ({KIS_MOCK_BASE_URL}) "
+            f"or a local server in Phase 0, got: {base_url}"
+        )
+    return base_url.rstrip("/")
+
+
+def parse_account(account: str) -> Tuple[str, str]:
+    """
+    Split a KIS account number into (CANO, ACNT_PRDT_CD).
+
+    Args:
+        account: Account number, '12345678-01' or '1234567801'
+
+    Returns:
+        (8-digit account, 2-digit product code)
+
+    Raises:
+        ValueError: If the format is invalid
+    """
+    digits = account.replace("-", "").strip()
+    if len(digits) != 10 or not digits.isdigit():
+        raise ValueError(f"Invalid KIS account number: {account!r} (expected 12345678-01)")
+    return digits[:8], digits[8:]
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+
+    Refills rate tokens per second up to capacity; acquire() waits until a
+    token is available. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize bucket.
+
+        Args:
+            rate: Tokens per second
+            capacity: Maximum burst (default: rate, at least 1)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait for and take one token"""
+        # lock을 잡은 채 대기해 도착 순서대로 토큰 배분
+        async with self._lock:
+            while True:
+                self._refill(time.monotonic())
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    closed -> open after failure_threshold consecutive failures; open rejects
+    calls for reset_timeout seconds, then half_open lets one trial call
+    through (success closes, failure re-opens).
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT
+    ):
+        """
+        Initialize breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds the circuit stays open before a trial call
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+
+    def allow(self) -> bool:
+        """Whether a call may proceed now (reserves the half-open trial call)"""
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                return False
+            self._trial_in_flight = True
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit and reset the failure count"""
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def release(self) -> None:
+        """Release a reserved half-open trial without recording an outcome"""
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count a failure; open the circuit at the threshold or after a failed trial"""
+        self.failures += 1
+        self._trial_in_flight = False
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+
+class _RetryableError(Exception):
+    """Internal: attempt failed in a way that may be retried"""
+
+    def __init__(self, message: str, request_sent: bool, rate_limited: bool = False):
+        super().__init__(message)
+        self.request_sent = request_sent
+        self.rate_limited = rate_limited
+
+
+class KISBrokerClient(BrokerClient):
+    """
+    Broker client for the KIS mock-trading REST API.
+
+    One pooled httpx.AsyncClient (keep-alive; HTTP/2 when the h2 package
+    is installed) is shared by all calls. Every request waits for the
+    token bucket, so concurrent orders never exceed the per-second limit.
+
+    Retries use full-jitter exponential backoff. Idempotent calls (token
+    issuance) retry on any transport error, timeout or 5xx. Orders retry
+    only when the request provably was not processed (connection could not
+    be established, or the gateway rate-limit rejection), so an order is
+    never submitted twice. Transport failures and 5xx responses count
+    towards the circuit breaker (gateway rate-limit rejections do not); while it is open calls fail fast with
+    BrokerUnavailableError.
+    """
+
+    def __init__(
+        self,
+        app_key: str,
+        app_secret: str,
+        account: str,
+        base_url: str = KIS_MOCK_BASE_URL,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Initialize client.
+
+        Args:
+            app_key: KIS app key
+            app_secret: KIS app secret
+            account: Account number ('12345678-01')
+            base_url: API base URL (mock domain or local stand-in only)
+            rate_limit: Requests per second
+            max_connections: Connection pool size
+            timeout: Per-request timeout in seconds
+            max_retries: Retries after the first attempt
+            failure_threshold: Consecutive failures that open the circuit breaker
+            reset_timeout: Seconds before a trial call once the circuit is open
+            transport: Optional httpx transport (e.g. httpx.MockTransport in tests)
+
+        Raises:
+            ValueError: If base_url is not allowed or the account number is invalid
+        """
+        self.base_url = validate_base_url(base_url)
+        self.app_key = app_key
+        self.app_secret = app_secret
+        self.cano, self.account_product_code = parse_account(account)
+        self.max_retries = max_retries
+        self.rate_limiter = TokenBucket(rate_limit)
+        self.circuit_breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.http2 = transport is None and http2_available()
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=self.http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            timeout=httpx.Timeout(timeout),
+            transport=transport
+        )
+
+        self._access_token: Optional[str] = None
+        self._token_expires_at = 0.0  # time.monotonic()
+        self._token_lock = asyncio.Lock()
+
+        self.stats = {"requests": 0, "retries": 0, "rejected": 0, "circuit_open": 0}
+
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        await self._client.aclose()
+
+    # -- HTTP --------------------------------------------------------------
+
+    async def _send_once(self, method: str, path: str, headers: Dict[str, str], body: Dict[str, Any]) -> Dict[str, Any]:
+        await self.rate_limiter.acquire()
+        self.stats["requests"] += 1
+        try:
+            response = await self._client.request(method, path, headers=headers, json=body)
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+            # 연결 자체가 안 됨: 요청이 전송되지 않음
+            raise _RetryableError(f"{type(e).__name__}: {e}", request_sent=False) from e
+        except httpx.TransportError as e:
+            raise _RetryableError(f"{type(e).__name__}: {e}", request_sent=True) from e
+
+        try:
+            data = response.json()
+        except ValueError:
+            data = {}
+        if data.get("msg_cd") == RATE_LIMIT_MSG_CODE:
+            raise _RetryableError(f"Rate limited by broker: {data.get('msg1')}", request_sent=False, rate_limited=True)
+        if response.status_code >= 500:
+            raise _RetryableError(f"Broker HTTP {response.status_code}", request_sent=True)
+        if response.status_code >= 400:
+            raise BrokerRejectedError(
+                f"Broker HTTP {response.status_code}: {data.get('msg1') or data.get('error_description') or response.text}",
+                data.get("msg_cd") or data.get("error_code")
+            )
+        return data
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        headers: Dict[str, str],
+        body: Dict[str, Any],
+        idempotent: bool
+    ) -> Dict[str, Any]:
+        """
+        Send a request with rate limiting, jittered retries and the circuit breaker.
+
+        Raises:
+            BrokerUnavailableError: If the circuit is open or retries are exhausted
+            BrokerRejectedError: If the broker answered with a 4xx
+        """
+        attempt = 0
+        while True:
+            if not self.circuit_breaker.allow():
+                self.stats["circuit_open"] += 1
+                raise BrokerUnavailableError("Broker circuit breaker is open")
+            try:
+                data = await self._send_once(method, path, headers, body)
+            except _RetryableError as e:
+                if e.rate_limited:
+                    # gateway throttling은 broker 장애가 아님: trial 예약만 해제
+                    self.circuit_breaker.release()
+                else:
+                    self.circuit_breaker.record_failure()
+                retryable = idempotent or not e.request_sent
+                if not retryable or attempt >= self.max_retries:
+                    raise BrokerUnavailableError(f"Broker request failed after {attempt + 1} attempt(s): {e}") from e
+                # full jitter exponential backoff
+                delay = random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** attempt)))
+                attempt += 1
+                self.stats["retries"] += 1
+                await asyncio.sleep(delay)
+                continue
+            except BrokerRejectedError:
+                # broker가 응답함: 연결 상태는 정상
+                self.circuit_breaker.record_success()
+                raise
+            except BaseException:
+                # 취소 등 결과를 알 수 없는 종료: half-open trial이 영구히 잠기지 않도록 해제
+                self.circuit_breaker.release()
+                raise
+            self.circuit_breaker.record_success()
+            return data
+
+    # -- access token ------------------------------------------------------
+
+    async def get_access_token(self) -> str:
+        """
+        Get a cached access token, issuing a new one near expiry.
+
+        KIS limits token issuance (about once per minute), so concurrent
+        callers share one issuance.
+
+        Returns:
+            Access token
+        """
+        async with self._token_lock:
+            if self._access_token and time.monotonic() < self._token_expires_at - TOKEN_REFRESH_MARGIN:
+                return self._access_token
+            data = await self._request(
+                "POST",
+                TOKEN_PATH,
+                {"content-type": "application/json"},
+                {"grant_type": "client_credentials", "appkey": self.app_key, "appsecret": self.app_secret},
+                idempotent=True
+            )
+            if "access_token" not in data:
+                raise BrokerRejectedError(f"Token response without access_token: {data}")
+            self._access_token = data["access_token"]
+            self._token_expires_at = time.monotonic() + float(data.get("expires_in", 86400))
+            return self._access_token
+
+    # -- orders ------------------------------------------------------------
+
+    def build_order_request(self, order_data: Dict[str, Any]) -> Tuple[str, str, Dict[str, Any]]:
+        """
+        Map an order intent to a KIS order request.
+
+        Order intent keys: symbol, quantity, market (KR/US, default KR),
+        side (buy/sell, default buy), price (limit price; KR without price
+        is a market order, US requires a price), exchange (US, default NASD).
+
+        Args:
+            order_data: Order intent
+
+        Returns:
+            (path, tr_id, body)
+
+        Raises:
+            ValueError: If the intent is incomplete or unsupported
+        """
+        symbol = order_data.get("symbol")
+        quantity = order_data.get("quantity")
+        if not symbol or isinstance(quantity, bool) or not isinstance(quantity, int) or quantity <= 0:
+            raise ValueError(f"Order intent needs symbol and positive integer quantity: {order_data}")
+        side = order_data.get("side", "buy")
+        if side not in DOMESTIC_TR_IDS:
+            raise ValueError(f"Unknown order side: {side!r} (expected buy/sell)")
+        market = (order_data.get("market") or "KR").upper()
+        price = order_data.get("price")
+        account = {"CANO": self.cano, "ACNT_PRDT_CD": self.account_product_code}
+
+        if market == "KR":
+            # '005930.KS' -> '005930'
+            body = {
+                **account,
+                "PDNO": str(symbol).split(".")[0],
+                "ORD_DVSN": "00" if price is not None else "01",
+                "ORD_QTY": str(quantity),
+                "ORD_UNPR": str(int(price)) if price is not None else "0",
+            }
+            return DOMESTIC_ORDER_PATH, DOMESTIC_TR_IDS[side], body
+        if market == "US":
+            if price is None:
+                raise ValueError(f"US orders need a limit price: {order_data}")
+            body = {
+                **account,
+                "OVRS_EXCG_CD": order_data.get("exchange", "NASD"),
+                "PDNO": str(symbol),
+                "ORD_QTY": str(quantity),
+                "OVRS_ORD_UNPR": f"{float(price):.2f}",
+                "ORD_SVR_DVSN_CD": "0",
+                "ORD_DVSN": "00",
+            }
+            return OVERSEAS_ORDER_PATH, OVERSEAS_TR_IDS[side], body
+        raise ValueError(f"Unsupported market: {market!r} (expected KR/US)")
+
+    def validate_order(self, order_data: Dict[str, Any]) -> None:
+        """
+        Check that an order intent maps to a KIS order request.
+
+        Args:
+            order_data: Order intent (see build_order_request)
+
+        Raises:
+            ValueError: If the intent is incomplete or unsupported
+        """
+        self.build_order_request(order_data)
+
+    async def place_order(self, order_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Submit an order to the KIS mock-trading API.
+
+        Args:
+            order_data: Order intent (see build_order_request)
+
+        Returns:
+            Broker response dict (broker_order_id, status, message, order_time)
+
+        Raises:
+            ValueError: If the order intent is invalid
+            BrokerRejectedError: If the broker rejected the order
+            BrokerUnavailableError: If the broker is unreachable or the circuit is open
+        """
+        path, tr_id, body = self.build_order_request(order_data)
+        access_token = await self.get_access_token()
+        headers = {
+            "content-type": "application/json; charset=utf-8",
+            "authorization": f"Bearer {access_token}",
+            "appkey": self.app_key,
+            "appsecret": self.app_secret,
+            "tr_id": tr_id,
+            "custtype": "P",
+        }
+        data = await self._request("POST", path, headers, body, idempotent=False)
+        if data.get("rt_cd") != "0":
+            self.stats["rejected"] += 1
+            raise BrokerRejectedError(
+                f"Order rejected: [{data.get('msg_cd')}] {data.get('msg1')}",
+                data.get("msg_cd")
+            )
+        output = data.get("output") or {}
+        return {
+            "broker_order_id": output.get("ODNO"),
+            "status": "pending",
+            "message": data.get("msg1"),
+            "order_time": output.get("ORD_TMD"),
+        }
@@ -2,6 +2,7 @@
 
 from datetime import datetime, timezone
 from typing import Optional
+from sqlalchemy import or_, update
 from sqlalchemy.orm import Session
 
 from kis.storage.models import (
@@ -15,6 +16,82 @@ from kis.storage.models import (
 )
 
 
+def build_order_row(
+    correlation_id: str,
+    proposal_id: int,
+    approval_id: int,
+    order_data: dict,
+    status: OrderStatus = OrderStatus.PENDING
+) -> dict:
+    """
+    Build orders column values (for ORM objects and bulk inserts).
+    
+    Args:
+        correlation_id: Correlation ID
+        proposal_id: Proposal ID
+        approval_id: Approval ID
+        order_data: Order data dictionary
+        status: Order status
+        
+    Returns:
+        Column value dict
+    """
+    return {
+        "correlation_id": correlation_id,
+        "proposal_id": proposal_id,
+        "status": status,
+        "payload_json": {
+            "proposal_id": proposal_id,
+            "approval_id": approval_id,
+            **order_data
+        }
+    }
+
+
+def build_order(
+    correlation_id: str,
+    proposal_id: int,
+    approval_id: int,
+    order_data: dict,
+    status: OrderStatus = OrderStatus.PENDING
+) -> Order:
+    """
+    Build an Order (shared by the sync and async repositories).
+    
+    Args:
+        correlation_id: Correlation ID
+        proposal_id: Proposal ID
+        approval_id: Approval ID
+        order_data: Order data dictionary
+        status: Order status
+        
+    Returns:
+        New (unsaved) Order object
+    """
+    return Order(**build_order_row(correlation_id, proposal_id, approval_id, order_data, status))
+
+
+def build_event(event_type: str, correlation_id: str, payload: dict) -> EventLog:
+    """
+    Build an execution_server EventLog (shared by the sync and async repositories).
+    
+    Args:
+        event_type: Event type
+        correlation_id: Correlation ID
+        payload: Event payload dictionary
+        
+    Returns:
+        New (unsaved) EventLog object
+    """
+    return EventLog(
+        timestamp=datetime.now(timezone.utc),
+        event_type=event_type,
+        correlation_id=correlation_id,
+        actor="execution_server",
+        payload_json=payload
+    )
+
+
 def get_kill_switch_status(session: Session) -> KillSwitchStatus:
     """
     Get latest kill switch status from system_state.
@@ -50,18 +127,58 @@ def get_approval_by_jti(session: Session, token_jti: str) -> Optional[Approval]:
     return session.query(Approval).filter_by(token_jti=token_jti).first()
 
 
-def mark_token_used(session: Session, approval_id: int) -> None:
+def build_claim_statement(token_jti: str, token_hash: str, now: datetime):
+    """
+    Build the conditional approval claim (shared by the sync and async repositories).
+    
+    One UPDATE validates the token (jti, hash, unused, not expired) and
+    consumes it: a row is returned only for the single request that wins.
+    
+    Args:
+        token_jti: Token JTI (JWT ID)
+        token_hash: SHA-256 hash of the presented token
+        now: Claim time (UTC), stored as token_used_at
+        
+    Returns:
+        UPDATE ... RETURNING approval_id, proposal_id statement
+    """
+    return (
+        update(Approval)
+        .where(
+            Approval.token_jti == token_jti,
+            Approval.token_hash == token_hash,
+            Approval.token_used_at.is_(None),
+            or_(Approval.token_expires_at.is_(None), Approval.token_expires_at > now)
+        )
+        .values(token_used_at=now)
+        .returning(Approval.approval_id, Approval.proposal_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def claim_approval_token(
+    session: Session,
+    token_jti: str,
+    token_hash: str,
+    now: Optional[datetime] = None
+) -> Optional[tuple]:
     """
-    Mark token as used by setting token_used_at.
+    Atomically validate and consume a one-time approval token (not committed).
     
     Args:
         session: Database session
-        approval_id: Approval ID
+        token_jti: Token JTI (JWT ID)
+        token_hash: SHA-256 hash of the presented token
+        now: Claim time (default: now, UTC)
+        
+    Returns:
+        (approval_id, proposal_id) if claimed, None if the token is unknown,
+        mismatched, expired or already used
     """
-    approval = session.query(Approval).filter_by(approval_id=approval_id).first()
-    if approval:
-        approval.token_used_at = datetime.now(timezone.utc)
-        session.commit()
+    row = session.execute(
+        build_claim_statement(token_jti, token_hash, now or datetime.now(timezone.utc))
+    ).first()
+    return tuple(row) if row is not None else None
 
 
 def create_order(
@@ -69,7 +186,8 @@ def create_order(
     correlation_id: str,
     proposal_id: int,
     approval_id: int,
-    order_data: dict
+    order_data: dict,
+    status: OrderStatus = OrderStatus.PENDING
 ) -> Order:
     """
     Create order record in database.
@@ -80,19 +198,12 @@ def create_order(
         proposal_id: Proposal ID
         approval_id: Approval ID
         order_data: Order data dictionary
+        status: Order status
         
     Returns:
         Created Order object
     """
-    order = Order(
-        correlation_id=correlation_id,
-        status=OrderStatus.PENDING,
-        payload_json={
-            "proposal_id": proposal_id,
-            "approval_id": approval_id,
-            **order_data
-        }
-    )
+    order = build_order(correlation_id, proposal_id, approval_id, order_data, status)
     
     session.add(order)
     session.commit()
@@ -116,13 +227,7 @@ def log_event(
         correlation_id: Correlation ID
         payload: Event payload dictionary
     """
-    event = EventLog(
-        timestamp=datetime.now(timezone.utc),
-        event_type=event_type,
-        correlation_id=correlation_id,
-        actor="execution_server",
-        payload_json=payload
-    )
+    event = build_event(event_type, correlation_id, payload)
     
     session.add(event)
     session.flush()  # Flush to ensure event is in session
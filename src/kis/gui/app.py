@@ -3,9 +3,9 @@
 from datetime import datetime
 from typing import Optional, List
 from fastapi import FastAPI, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from kis.storage.session import get_db_session
+from kis.storage.async_session import get_async_db_session
 from kis.storage.models import ProposalStatus
 from kis.gui.schemas import (
     ProposalResponse,
@@ -14,7 +14,7 @@ from kis.gui.schemas import (
     RejectRequest,
     RejectResponse
 )
-from kis.gui.repository import ProposalRepository
+from kis.gui.repository import AsyncProposalRepository
 from kis.gui.token_client import TokenClient
 
 
@@ -24,7 +24,7 @@ app = FastAPI(title="KIS Trading System GUI", version="0.1.0")
 @app.get("/proposals", response_model=List[ProposalResponse])
 async def get_proposals(
     status: Optional[str] = "pending",
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """
     Get proposals by status.
@@ -37,15 +37,15 @@ async def get_proposals(
     Returns:
         List of proposals
     """
-    repo = ProposalRepository(db)
-    proposals = repo.get_proposals(status)
+    repo = AsyncProposalRepository(db)
+    proposals = await repo.get_proposals(status)
     return proposals
 
 
 @app.get("/proposals/{proposal_id}", response_model=ProposalResponse)
 async def get_proposal(
     proposal_id: int,
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """
     Get proposal by ID.
@@ -60,8 +60,8 @@ async def get_proposal(
     Raises:
         HTTPException: 404 if proposal not found
     """
-    repo = ProposalRepository(db)
-    proposal = repo.get_proposal_by_id(proposal_id)
+    repo = AsyncProposalRepository(db)
+    proposal = await repo.get_proposal_by_id(proposal_id)
     
     if proposal is None:
         raise HTTPException(
@@ -76,7 +76,7 @@ async def get_proposal(
 async def approve_proposal(
     proposal_id: int,
     request: ApproveRequest,
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """
     Approve proposal and request token issuance.
@@ -92,10 +92,10 @@ async def approve_proposal(
     Raises:
         HTTPException: 404 if proposal not found, 409 if not pending
     """
-    repo = ProposalRepository(db)
+    repo = AsyncProposalRepository(db)
     
     # Get proposal
-    proposal = repo.get_proposal_by_id(proposal_id)
+    proposal = await repo.get_proposal_by_id(proposal_id)
     if proposal is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -157,7 +157,7 @@ async def approve_proposal(
         token_expires_at = token_expires_at_str
     
     # Approve proposal (stores token_hash only, not token 원문)
-    approval = repo.approve_proposal(
+    approval = await repo.approve_proposal(
         proposal_id=proposal_id,
         approved_by=request.approved_by,
         token=token_result['token'],
@@ -166,7 +166,7 @@ async def approve_proposal(
     )
     
     # Log approval event
-    repo.log_approval_event(
+    await repo.log_approval_event(
         event_type="approval_granted",
         correlation_id=correlation_id,
         proposal_id=proposal_id,
@@ -190,7 +190,7 @@ async def approve_proposal(
 async def reject_proposal(
     proposal_id: int,
     request: RejectRequest,
-    db: Session = Depends(get_db_session)
+    db: AsyncSession = Depends(get_async_db_session)
 ):
     """
     Reject proposal.
@@ -206,10 +206,10 @@ async def reject_proposal(
     Raises:
         HTTPException: 404 if proposal not found, 409 if not pending
     """
-    repo = ProposalRepository(db)
+    repo = AsyncProposalRepository(db)
     
     # Get proposal
-    proposal = repo.get_proposal_by_id(proposal_id)
+    proposal = await repo.get_proposal_by_id(proposal_id)
     if proposal is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -224,7 +224,7 @@ async def reject_proposal(
         )
     
     # Reject proposal
-    approval = repo.reject_proposal(
+    approval = await repo.reject_proposal(
         proposal_id=proposal_id,
         rejected_by=request.rejected_by,
         rejection_reason=request.rejection_reason
@@ -232,7 +232,7 @@ async def reject_proposal(
     
     # Log rejection event
     correlation_id = proposal.payload_json.get('correlation_id', '')
-    repo.log_approval_event(
+    await repo.log_approval_event(
         event_type="approval_rejected",
         correlation_id=correlation_id,
         proposal_id=proposal_id,
@@ -3,11 +3,98 @@
 import hashlib
 from datetime import datetime, timezone
 from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from kis.storage.models import Proposal, Approval, EventLog, ProposalStatus, ApprovalStatus
 
 
+def _proposal_status_filter(status: Optional[str]):
+    """
+    Build the status filter for proposal listing.
+    
+    Args:
+        status: Proposal status (None defaults to 'pending', '' means no filter)
+    
+    Returns:
+        (filter clause or None, valid flag)
+    """
+    if status is None:
+        status = "pending"
+    if not status:
+        return None, True
+    try:
+        return Proposal.status == ProposalStatus(status), True
+    except ValueError:
+        return None, False
+
+
+def _check_pending(proposal: Optional[Proposal], proposal_id: int) -> None:
+    if proposal is None:
+        raise ValueError(f"Proposal {proposal_id} not found")
+    if proposal.status != ProposalStatus.PENDING:
+        raise ValueError(f"Proposal {proposal_id} is not in pending status (current: {proposal.status})")
+
+
+def _build_approval(proposal_id: int, approved_by: str, token: str, token_jti: str, token_expires_at: datetime) -> Approval:
+    return Approval(
+        proposal_id=proposal_id,
+        status=ApprovalStatus.APPROVED,
+        approved_by=approved_by,
+        approved_at=datetime.now(timezone.utc),
+        token_hash=hashlib.sha256(token.encode('utf-8')).hexdigest(),
+        token_jti=token_jti,
+        token_expires_at=token_expires_at,
+        token_used_at=None,
+        rejection_reason=None
+    )
+
+
+def _build_rejection(proposal_id: int, rejection_reason: str) -> Approval:
+    return Approval(
+        proposal_id=proposal_id,
+        status=ApprovalStatus.REJECTED,
+        approved_by=None,
+        approved_at=None,
+        token_hash=None,
+        token_jti=None,
+        token_expires_at=None,
+        token_used_at=None,
+        rejection_reason=rejection_reason
+    )
+
+
+def _build_approval_event(
+    event_type: str,
+    correlation_id: str,
+    proposal_id: int,
+    approval_id: int,
+    approved_by: Optional[str] = None,
+    rejected_by: Optional[str] = None,
+    token_hash: Optional[str] = None
+) -> EventLog:
+    payload = {
+        "proposal_id": proposal_id,
+        "approval_id": approval_id
+    }
+    
+    if approved_by:
+        payload["approved_by"] = approved_by
+    if rejected_by:
+        payload["rejected_by"] = rejected_by
+    if token_hash:
+        payload["token_hash"] = token_hash
+    
+    return EventLog(
+        timestamp=datetime.now(timezone.utc),
+        event_type=event_type,
+        correlation_id=correlation_id,
+        actor="gui",
+        payload_json=payload
+    )
+
+
 class ProposalRepository:
     """Repository for Proposal and Approval operations"""
     
@@ -31,18 +118,14 @@ class ProposalRepository:
         Returns:
             List of Proposal objects
         """
-        if status is None:
-            status = "pending"
+        status_filter, valid = _proposal_status_filter(status)
+        if not valid:
+            # Invalid status, return empty list
+            return []
         
         query = self.session.query(Proposal)
-        
-        if status:
-            try:
-                status_enum = ProposalStatus(status)
-                query = query.filter(Proposal.status == status_enum)
-            except ValueError:
-                # Invalid status, return empty list
-                return []
+        if status_filter is not None:
+            query = query.filter(status_filter)
         
         return query.all()
     
@@ -84,27 +167,10 @@ class ProposalRepository:
         """
         # Get proposal
         proposal = self.get_proposal_by_id(proposal_id)
-        if proposal is None:
-            raise ValueError(f"Proposal {proposal_id} not found")
-        
-        if proposal.status != ProposalStatus.PENDING:
-            raise ValueError(f"Proposal {proposal_id} is not in pending status (current: {proposal.status})")
-        
-        # Calculate token hash
-        token_hash = hashlib.sha256(token.encode('utf-8')).hexdigest()
-        
-        # Create approval record
-        approval = Approval(
-            proposal_id=proposal_id,
-            status=ApprovalStatus.APPROVED,
-            approved_by=approved_by,
-            approved_at=datetime.now(timezone.utc),
-            token_hash=token_hash,
-            token_jti=token_jti,
-            token_expires_at=token_expires_at,
-            token_used_at=None,
-            rejection_reason=None
-        )
+        _check_pending(proposal, proposal_id)
+        
+        # Create approval record (token_hash only)
+        approval = _build_approval(proposal_id, approved_by, token, token_jti, token_expires_at)
         
         self.session.add(approval)
         
@@ -138,24 +204,10 @@ class ProposalRepository:
         """
         # Get proposal
         proposal = self.get_proposal_by_id(proposal_id)
-        if proposal is None:
-            raise ValueError(f"Proposal {proposal_id} not found")
-        
-        if proposal.status != ProposalStatus.PENDING:
-            raise ValueError(f"Proposal {proposal_id} is not in pending status (current: {proposal.status})")
+        _check_pending(proposal, proposal_id)
         
         # Create approval record (no token for rejected)
-        approval = Approval(
-            proposal_id=proposal_id,
-            status=ApprovalStatus.REJECTED,
-            approved_by=None,
-            approved_at=None,
-            token_hash=None,
-            token_jti=None,
-            token_expires_at=None,
-            token_used_at=None,
-            rejection_reason=rejection_reason
-        )
+        approval = _build_rejection(proposal_id, rejection_reason)
         
         self.session.add(approval)
         
@@ -189,26 +241,152 @@ class ProposalRepository:
             rejected_by: Rejector name (for approval_rejected)
             token_hash: Token hash (for approval_granted)
         """
-        payload = {
-            "proposal_id": proposal_id,
-            "approval_id": approval_id
-        }
-        
-        if approved_by:
-            payload["approved_by"] = approved_by
-        if rejected_by:
-            payload["rejected_by"] = rejected_by
-        if token_hash:
-            payload["token_hash"] = token_hash
-        
-        event = EventLog(
-            timestamp=datetime.now(timezone.utc),
-            event_type=event_type,
-            correlation_id=correlation_id,
-            actor="gui",
-            payload_json=payload
+        event = _build_approval_event(
+            event_type, correlation_id, proposal_id, approval_id, approved_by, rejected_by, token_hash
         )
         
         self.session.add(event)
         self.session.commit()
 
+
+class AsyncProposalRepository:
+    """Async (AsyncSession) counterpart of ProposalRepository for the FastAPI app"""
+    
+    def __init__(self, session: AsyncSession):
+        """
+        Initialize repository with async database session.
+        
+        Args:
+            session: SQLAlchemy AsyncSession
+        """
+        self.session = session
+    
+    async def get_proposals(self, status: Optional[str] = None) -> List[Proposal]:
+        """
+        Get proposals by status.
+        
+        Args:
+            status: Proposal status filter (pending, approved, rejected, executed)
+                   If None, defaults to 'pending'
+        
+        Returns:
+            List of Proposal objects
+        """
+        status_filter, valid = _proposal_status_filter(status)
+        if not valid:
+            # Invalid status, return empty list
+            return []
+        
+        query = select(Proposal)
+        if status_filter is not None:
+            query = query.where(status_filter)
+        
+        return list((await self.session.scalars(query)).all())
+    
+    async def get_proposal_by_id(self, proposal_id: int) -> Optional[Proposal]:
+        """
+        Get proposal by ID.
+        
+        Args:
+            proposal_id: Proposal ID
+        
+        Returns:
+            Proposal object or None if not found
+        """
+        return await self.session.get(Proposal, proposal_id)
+    
+    async def approve_proposal(
+        self,
+        proposal_id: int,
+        approved_by: str,
+        token: str,
+        token_jti: str,
+        token_expires_at: datetime
+    ) -> Approval:
+        """
+        Approve proposal and create approval record.
+        
+        Args:
+            proposal_id: Proposal ID
+            approved_by: Approver name
+            token: Token string (원문, hash 계산용)
+            token_jti: Token JTI
+            token_expires_at: Token expiration time
+        
+        Returns:
+            Created Approval object
+        
+        Raises:
+            ValueError: If proposal is not in pending status
+        """
+        proposal = await self.get_proposal_by_id(proposal_id)
+        _check_pending(proposal, proposal_id)
+        
+        approval = _build_approval(proposal_id, approved_by, token, token_jti, token_expires_at)
+        self.session.add(approval)
+        proposal.status = ProposalStatus.APPROVED
+        
+        await self.session.commit()
+        await self.session.refresh(approval)
+        
+        return approval
+    
+    async def reject_proposal(
+        self,
+        proposal_id: int,
+        rejected_by: str,
+        rejection_reason: str
+    ) -> Approval:
+        """
+        Reject proposal and create approval record.
+        
+        Args:
+            proposal_id: Proposal ID
+            rejected_by: Rejector name
+            rejection_reason: Rejection reason
+        
+        Returns:
+            Created Approval object
+        
+        Raises:
+            ValueError: If proposal is not in pending status
+        """
+        proposal = await self.get_proposal_by_id(proposal_id)
+        _check_pending(proposal, proposal_id)
+        
+        approval = _build_rejection(proposal_id, rejection_reason)
+        self.session.add(approval)
+        proposal.status = ProposalStatus.REJECTED
+        
+        await self.session.commit()
+        await self.session.refresh(approval)
+        
+        return approval
+    
+    async def log_approval_event(
+        self,
+        event_type: str,
+        correlation_id: str,
+        proposal_id: int,
+        approval_id: int,
+        approved_by: Optional[str] = None,
+        rejected_by: Optional[str] = None,
+        token_hash: Optional[str] = None
+    ) -> None:
+        """
+        Log approval event to event_log.
+        
+        Args:
+            event_type: Event type (approval_granted or approval_rejected)
+            correlation_id: Correlation ID from proposal
+            proposal_id: Proposal ID
+            approval_id: Approval ID
+            approved_by: Approver name (for approval_granted)
+            rejected_by: Rejector name (for approval_rejected)
+            token_hash: Token hash (for approval_granted)
+        """
+        self.session.add(_build_approval_event(
+            event_type, correlation_id, proposal_id, approval_id, approved_by, rejected_by, token_hash
+        ))
+        await self.session.commit()
+
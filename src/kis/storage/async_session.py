@@ -0,0 +1,121 @@
+"""Async database session utilities for FastAPI (aiosqlite / asyncpg)"""
+
+import os
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from kis.storage.factory import get_engine_options, install_sqlite_pragmas
+from kis.storage.init_db import DATABASE_URL
+
+
+# backend -> async driver
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+# Global async engine and session factory
+_async_engine: Optional[AsyncEngine] = None
+_AsyncSessionLocal: Optional[async_sessionmaker] = None
+
+
+def to_async_url(database_url: str) -> str:
+    """
+    Convert a database URL to its async driver (sqlite -> aiosqlite, postgresql -> asyncpg).
+
+    URLs that already name an async driver are returned unchanged.
+
+    Args:
+        database_url: Database URL
+
+    Returns:
+        Database URL with async driver
+
+    Raises:
+        ValueError: If the backend has no supported async driver
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend: {backend}")
+    if url.get_driver_name() in ASYNC_DRIVERS.values():
+        return database_url
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+def create_async_storage_engine(database_url: str, **kwargs) -> AsyncEngine:
+    """
+    Create an async SQLAlchemy engine with the storage tuning profile.
+
+    Same pool settings and SQLite pragmas as create_storage_engine().
+
+    Args:
+        database_url: Database URL (sync or async driver)
+        **kwargs: Extra create_async_engine arguments (override the profile)
+
+    Returns:
+        Async SQLAlchemy engine
+    """
+    options = get_engine_options(database_url)
+    options.update(kwargs)
+    options.setdefault("echo", False)
+    engine = create_async_engine(to_async_url(database_url), **options)
+    install_sqlite_pragmas(engine.sync_engine, database_url)
+    return engine
+
+
+def create_async_session_factory(engine: AsyncEngine) -> async_sessionmaker:
+    """
+    Create an AsyncSession factory.
+
+    expire_on_commit=False: 응답 직렬화 시 commit 이후 속성 접근이 lazy load(I/O)를 일으키지 않도록 함
+
+    Args:
+        engine: Async engine
+
+    Returns:
+        async_sessionmaker bound to the engine
+    """
+    return async_sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get or create async database engine"""
+    global _async_engine
+    if _async_engine is None:
+        database_url = os.getenv("DATABASE_URL", DATABASE_URL)
+        _async_engine = create_async_storage_engine(database_url)
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Get or create async session factory"""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = create_async_session_factory(get_async_engine())
+    return _AsyncSessionLocal
+
+
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    FastAPI dependency for async database session.
+
+    Usage:
+        @app.get("/items")
+        async def read_items(db: AsyncSession = Depends(get_async_db_session)):
+            ...
+    """
+    AsyncSessionLocal = get_async_session_factory()
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+async def dispose_async_engine() -> None:
+    """Dispose the global async engine (application shutdown)"""
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _AsyncSessionLocal = None
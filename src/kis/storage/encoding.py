@@ -0,0 +1,218 @@
+"""Compact payload encodings for JSON columns (EncodedJSON TypeDecorator)"""
+
+import json
+import os
+import zlib
+from typing import Any, Dict, Optional
+
+from sqlalchemy import JSON, LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+try:
+    import msgpack
+except ImportError:  # optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+
+ENCODING_JSON = "json"
+ENCODING_ZLIB = "zlib"
+ENCODING_MSGPACK = "msgpack"
+ENCODING_ZSTD = "zstd"
+
+ENCODINGS = (ENCODING_JSON, ENCODING_ZLIB, ENCODING_MSGPACK, ENCODING_ZSTD)
+
+# binary 값 앞 4바이트 (NUL로 시작하므로 JSON text와 구분됨)
+MAGIC = {
+    ENCODING_ZLIB: b"\x00KZ1",
+    ENCODING_MSGPACK: b"\x00KM1",
+    ENCODING_ZSTD: b"\x00KS1",
+}
+MAGIC_LENGTH = 4
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# 전체 기본값 / 컬럼별 override 환경변수 (예: KIS_PAYLOAD_ENCODING_SNAPSHOTS=zstd)
+ENCODING_ENV = "KIS_PAYLOAD_ENCODING"
+
+
+def available_encodings() -> Dict[str, bool]:
+    """Get which encodings can be used in this environment (msgpack/zstd are optional)"""
+    return {
+        ENCODING_JSON: True,
+        ENCODING_ZLIB: True,
+        ENCODING_MSGPACK: msgpack is not None,
+        ENCODING_ZSTD: zstandard is not None,
+    }
+
+
+def check_encoding(encoding: str) -> str:
+    """
+    Validate an encoding name.
+
+    Args:
+        encoding: Encoding name
+
+    Returns:
+        The encoding name
+
+    Raises:
+        ValueError: If the encoding is unknown or its optional package is missing
+    """
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Unknown payload encoding: {encoding} (expected one of {', '.join(ENCODINGS)})")
+    if not available_encodings()[encoding]:
+        package = "msgpack" if encoding == ENCODING_MSGPACK else "zstandard"
+        raise ValueError(f"Payload encoding '{encoding}' requires the '{package}' package")
+    return encoding
+
+
+def resolve_encoding(setting: Optional[str] = None, default: str = ENCODING_JSON) -> str:
+    """
+    Resolve the write encoding of a column from the environment.
+
+    KIS_PAYLOAD_ENCODING_<SETTING> overrides KIS_PAYLOAD_ENCODING, which overrides default.
+
+    Args:
+        setting: Column setting name (e.g. 'snapshots')
+        default: Encoding used when no environment variable is set
+
+    Returns:
+        Encoding name
+    """
+    value = None
+    if setting:
+        value = os.getenv(f"{ENCODING_ENV}_{setting.upper()}")
+    value = value or os.getenv(ENCODING_ENV) or default
+    return check_encoding(value.strip().lower())
+
+
+def encode_payload(value: Any, encoding: str) -> Any:
+    """
+    Encode a JSON-compatible value.
+
+    Args:
+        value: JSON-compatible value
+        encoding: Encoding name
+
+    Returns:
+        JSON text (json) or magic-prefixed bytes (zlib, msgpack, zstd)
+    """
+    if encoding == ENCODING_JSON:
+        return json.dumps(value)
+    if encoding == ENCODING_MSGPACK:
+        return MAGIC[ENCODING_MSGPACK] + msgpack.packb(value, use_bin_type=True)
+
+    text = json.dumps(value, separators=(',', ':')).encode('utf-8')
+    if encoding == ENCODING_ZLIB:
+        return MAGIC[ENCODING_ZLIB] + zlib.compress(text, ZLIB_LEVEL)
+    return MAGIC[ENCODING_ZSTD] + zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(text)
+
+
+def detect_encoding(raw: Any) -> Optional[str]:
+    """
+    Detect the encoding of a stored value.
+
+    Args:
+        raw: Value as returned by the driver
+
+    Returns:
+        Encoding name (None for NULL)
+    """
+    if raw is None:
+        return None
+    if isinstance(raw, memoryview):
+        raw = raw.tobytes()
+    if isinstance(raw, bytes):
+        prefix = raw[:MAGIC_LENGTH]
+        for encoding, magic in MAGIC.items():
+            if prefix == magic:
+                return encoding
+    return ENCODING_JSON
+
+
+def decode_payload(raw: Any) -> Any:
+    """
+    Decode a stored value in any supported encoding (legacy JSON text included).
+
+    Args:
+        raw: Value as returned by the driver (str, bytes, memoryview or already-parsed JSON)
+
+    Returns:
+        Decoded JSON-compatible value
+
+    Raises:
+        ValueError: If the value needs an optional package that is not installed
+    """
+    if raw is None or isinstance(raw, (dict, list)):
+        return raw
+    if isinstance(raw, memoryview):
+        raw = raw.tobytes()
+    if isinstance(raw, str):
+        return json.loads(raw)
+
+    encoding = detect_encoding(raw)
+    if encoding == ENCODING_JSON:
+        return json.loads(raw.decode('utf-8'))
+    body = raw[MAGIC_LENGTH:]
+    if encoding == ENCODING_ZLIB:
+        return json.loads(zlib.decompress(body))
+    check_encoding(encoding)
+    if encoding == ENCODING_MSGPACK:
+        return msgpack.unpackb(body, raw=False)
+    return json.loads(zstandard.ZstdDecompressor().decompress(body))
+
+
+class EncodedJSON(TypeDecorator):
+    """
+    JSON column stored as text JSON or a compact binary encoding.
+
+    Reads decode every encoding transparently (by magic prefix), so rows
+    written before a column switched encoding, or before re-encoding, stay
+    readable. Writes use the column's encoding, fixed at construction:
+    explicitly, or from KIS_PAYLOAD_ENCODING[_<SETTING>] (default: json).
+
+    DDL is JSON for the json encoding and a binary type otherwise (only
+    matters for new tables; SQLite accepts either value in an existing
+    column, Postgres needs the migration in kis.storage.reencode).
+    """
+
+    impl = JSON
+    cache_ok = True
+
+    def __init__(self, encoding: Optional[str] = None, setting: Optional[str] = None):
+        """
+        Initialize column type.
+
+        Args:
+            encoding: Write encoding (None = resolve from the environment)
+            setting: Column setting name for KIS_PAYLOAD_ENCODING_<SETTING>
+        """
+        super().__init__()
+        self.encoding = check_encoding(encoding) if encoding else resolve_encoding(setting)
+        self.setting = setting
+
+    def load_dialect_impl(self, dialect):
+        if self.encoding == ENCODING_JSON:
+            return dialect.type_descriptor(JSON())
+        return dialect.type_descriptor(LargeBinary())
+
+    def bind_processor(self, dialect):
+        encoding = self.encoding
+
+        def process(value):
+            if value is None:
+                return None
+            return encode_payload(value, encoding)
+        return process
+
+    def result_processor(self, dialect, coltype):
+        return decode_payload
+
+    def copy(self, **kw):
+        return EncodedJSON(encoding=self.encoding, setting=self.setting)
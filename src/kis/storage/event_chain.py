@@ -0,0 +1,463 @@
+"""Hash chain for append-only event_log (assignment on append, incremental verification)"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from sqlalchemy import column, event, func, insert, inspect, select, table, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from kis.storage.factory import create_storage_engine
+from kis.storage.models import EventChainHead, EventLog, EventLogCheckpoint, EventLogPartition
+
+
+# 체인 시작 전 prev_hash
+GENESIS_HASH = "0" * 64
+
+CHAIN_ID = 1
+
+# 검증 시 한 번에 읽는 event 수
+DEFAULT_VERIFY_BATCH_SIZE = 10_000
+
+
+def normalize_timestamp(timestamp: datetime) -> str:
+    """
+    Canonical UTC ISO timestamp (naive values are treated as UTC, as SQLite returns them).
+
+    Args:
+        timestamp: Event timestamp
+
+    Returns:
+        ISO 8601 string in UTC with microseconds
+    """
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc).isoformat(timespec='microseconds')
+
+
+def compute_event_hash(
+    prev_hash: str,
+    timestamp: datetime,
+    event_type: str,
+    correlation_id: str,
+    actor: str,
+    payload: Dict[str, Any]
+) -> str:
+    """
+    Calculate chained SHA256 hash of an event.
+
+    hash = sha256(prev_hash + canonical JSON of the event fields)
+
+    Args:
+        prev_hash: Hash of the previous event (GENESIS_HASH for the first)
+        timestamp: Event timestamp
+        event_type: Event type
+        correlation_id: Correlation ID
+        actor: Actor
+        payload: Event payload dict
+
+    Returns:
+        SHA256 hash as hex string (64 characters)
+    """
+    canonical = json.dumps(
+        {
+            'timestamp': normalize_timestamp(timestamp),
+            'event_type': event_type,
+            'correlation_id': correlation_id,
+            'actor': actor,
+            'payload': payload
+        },
+        sort_keys=True,
+        separators=(',', ':')
+    )
+    return hashlib.sha256((prev_hash + canonical).encode('utf-8')).hexdigest()
+
+
+# event_log 파티션 상태 (EventLogPartition.status)
+PARTITION_CLOSED = "closed"      # rollover table에 이동됨 (SQLite)
+PARTITION_ATTACHED = "attached"  # native partition으로 event_log에 포함됨 (Postgres)
+PARTITION_ARCHIVED = "archived"  # archive 파일로만 존재 (endpoint만 DB에 남음)
+
+
+def event_log_table(table_name: str):
+    """
+    Lightweight table construct with the event_log columns (for rollover partitions).
+
+    Args:
+        table_name: event_log or a partition table name
+
+    Returns:
+        sqlalchemy TableClause
+    """
+    if table_name == EventLog.__tablename__:
+        return EventLog.__table__
+    return table(table_name, *[column(c.name, c.type) for c in EventLog.__table__.columns])
+
+
+def _last_chained_hash(connection) -> str:
+    row = connection.execute(
+        select(EventLog.hash)
+        .where(EventLog.hash.isnot(None))
+        .order_by(EventLog.event_id.desc())
+        .limit(1)
+    ).first()
+    if row:
+        return row[0]
+    # hot table이 비어 있으면 마지막 파티션의 끝 hash
+    last_hash = connection.execute(
+        select(EventLogPartition.last_hash)
+        .where(EventLogPartition.last_hash.isnot(None))
+        .order_by(EventLogPartition.last_event_id.desc())
+        .limit(1)
+    ).scalar()
+    return last_hash or GENESIS_HASH
+
+
+def _last_event_id(connection) -> int:
+    """Highest event_id in event_log or any registered partition (0 if none)"""
+    hot = connection.execute(select(func.max(EventLog.event_id))).scalar()
+    partitioned = connection.execute(select(func.max(EventLogPartition.last_event_id))).scalar()
+    return max(hot or 0, partitioned or 0)
+
+
+def ensure_chain_head(connection) -> None:
+    """
+    Create the chain head row if missing (head = last chained event or genesis).
+
+    Args:
+        connection: SQLAlchemy connection (inside a transaction)
+    """
+    exists = connection.execute(
+        select(EventChainHead.chain_id).where(EventChainHead.chain_id == CHAIN_ID)
+    ).first()
+    if exists is None:
+        connection.execute(insert(EventChainHead).values(
+            chain_id=CHAIN_ID,
+            head_hash=_last_chained_hash(connection),
+            head_event_id=_last_event_id(connection),
+            updated_at=datetime.now(timezone.utc)
+        ))
+
+
+def lock_chain_head(connection) -> Tuple[str, int]:
+    """
+    Lock the chain head for this transaction and return the head hash and event_id.
+
+    The UPDATE takes the database write lock (SQLite) or the row lock
+    (Postgres) before the head is read, so concurrent appenders from other
+    processes are serialized instead of forking the chain.
+
+    The head event_id is the event_id sequence: it keeps increasing after
+    events are moved out of event_log into partitions. Rows inserted
+    without going through the chain (raw SQL) are accounted for by also
+    taking the current max(event_id).
+
+    Args:
+        connection: SQLAlchemy connection (inside a transaction)
+
+    Returns:
+        (current head hash, last assigned event_id)
+    """
+    locked = connection.execute(
+        update(EventChainHead)
+        .where(EventChainHead.chain_id == CHAIN_ID)
+        .values(updated_at=datetime.now(timezone.utc))
+    ).rowcount
+    if not locked:
+        ensure_chain_head(connection)
+    head_hash, head_event_id = connection.execute(
+        select(EventChainHead.head_hash, EventChainHead.head_event_id).where(EventChainHead.chain_id == CHAIN_ID)
+    ).one()
+    if head_event_id is None:
+        # head_event_id 컬럼 추가 이전에 생성된 head
+        return head_hash, _last_event_id(connection)
+    hot = connection.execute(select(func.max(EventLog.event_id))).scalar()
+    return head_hash, max(head_event_id, hot or 0)
+
+
+def assign_event_hashes(session: Session, events: List[EventLog]) -> None:
+    """
+    Set event_id/prev_hash/hash on new events in insert order and advance the chain head.
+
+    Args:
+        session: SQLAlchemy session about to flush the events
+        events: New EventLog objects (insert order)
+    """
+    connection = session.connection()
+    head, last_event_id = lock_chain_head(connection)
+    for event_log in events:
+        if event_log.event_id is None:
+            last_event_id += 1
+            event_log.event_id = last_event_id
+        else:
+            last_event_id = max(last_event_id, event_log.event_id)
+        if event_log.timestamp is None:
+            event_log.timestamp = datetime.now(timezone.utc)
+        event_log.prev_hash = head
+        event_log.hash = compute_event_hash(
+            head,
+            event_log.timestamp,
+            event_log.event_type,
+            event_log.correlation_id,
+            event_log.actor,
+            event_log.payload_json
+        )
+        head = event_log.hash
+
+    connection.execute(
+        update(EventChainHead)
+        .where(EventChainHead.chain_id == CHAIN_ID)
+        .values(head_hash=head, head_event_id=last_event_id)
+    )
+
+
+@event.listens_for(Session, "before_flush")
+def _chain_new_events(session, flush_context, instances):
+    """Chain every EventLog appended through an ORM session"""
+    events = [obj for obj in session.new if isinstance(obj, EventLog) and obj.hash is None]
+    if not events:
+        return
+    events.sort(key=lambda obj: inspect(obj).insert_order)
+    with session.no_autoflush:
+        assign_event_hashes(session, events)
+
+
+def get_latest_checkpoint(session) -> Optional[EventLogCheckpoint]:
+    """
+    Get latest verified checkpoint.
+
+    Args:
+        session: SQLAlchemy session
+
+    Returns:
+        EventLogCheckpoint or None if the chain was never verified
+    """
+    return session.query(EventLogCheckpoint).order_by(EventLogCheckpoint.event_id.desc()).first()
+
+
+def _iter_chain_rows(session, after_event_id: int, batch_size: int) -> Iterator[Tuple[str, Any]]:
+    """
+    Yield the chain in event_id order across partitions and event_log.
+
+    Yields ('event', row) for stored events and ('archived', EventLogPartition)
+    for partitions that only exist as archive files.
+    """
+    columns = [
+        'event_id', 'timestamp', 'event_type', 'correlation_id', 'actor', 'payload_json', 'prev_hash', 'hash'
+    ]
+
+    def read_range(source, after: int, upto: Optional[int]):
+        id_column = source.c.event_id
+        while True:
+            query = select(*[source.c[name] for name in columns]).where(id_column > after)
+            if upto is not None:
+                query = query.where(id_column <= upto)
+            rows = session.execute(query.order_by(id_column).limit(batch_size)).all()
+            if not rows:
+                return
+            for row in rows:
+                yield row
+            after = rows[-1][0]
+
+    partitions = session.query(EventLogPartition).filter(
+        EventLogPartition.last_event_id > after_event_id
+    ).order_by(EventLogPartition.first_event_id).all()
+    for partition in partitions:
+        if partition.status == PARTITION_ATTACHED:
+            # native partition (Postgres): event_log 조회에 포함됨
+            for row in read_range(EventLog.__table__, after_event_id, partition.last_event_id):
+                yield 'event', row
+        else:
+            # 파티션 앞 구간 중 event_log에 남아 있는 이벤트
+            for row in read_range(EventLog.__table__, after_event_id, partition.first_event_id - 1):
+                yield 'event', row
+            if partition.status == PARTITION_ARCHIVED:
+                yield 'archived', partition
+            else:
+                for row in read_range(event_log_table(partition.table_name), after_event_id, partition.last_event_id):
+                    yield 'event', row
+        after_event_id = max(after_event_id, partition.last_event_id)
+
+    for row in read_range(EventLog.__table__, after_event_id, None):
+        yield 'event', row
+
+
+def verify_chain(
+    session,
+    full: bool = False,
+    batch_size: int = DEFAULT_VERIFY_BATCH_SIZE,
+    save_checkpoint: bool = True
+) -> Dict[str, Any]:
+    """
+    Verify the event_log hash chain from the latest checkpoint (or from the start).
+
+    Events are read in event_id order with keyset pagination, across closed
+    partitions and event_log. Archived partitions are checked by their
+    registered endpoints (first prev_hash must continue the chain); their
+    events are verified against the archive file by verify_archive().
+    Events written before hashing existed (hash NULL, before the first
+    chained event) are counted as unchained. On success a new checkpoint is
+    stored at the last verified event; a broken chain never advances the
+    checkpoint.
+
+    Args:
+        session: SQLAlchemy session
+        full: Ignore checkpoints and verify the whole table
+        batch_size: Events read per query
+        save_checkpoint: Store a checkpoint after successful verification
+
+    Returns:
+        Result dict with ok, verified, unchained, archived, start_event_id,
+        head_event_id, head_hash and, when broken, broken_event_id and reason
+    """
+    checkpoint = None if full else get_latest_checkpoint(session)
+    last_event_id = checkpoint.event_id if checkpoint else 0
+    expected_prev = checkpoint.hash if checkpoint else None
+
+    result = {
+        'ok': True,
+        'verified': 0,
+        'unchained': 0,
+        'archived': 0,
+        'start_event_id': last_event_id,
+        'head_event_id': last_event_id,
+        'head_hash': expected_prev,
+    }
+
+    for kind, item in _iter_chain_rows(session, last_event_id, batch_size):
+        if kind == 'archived':
+            partition = item
+            # checkpoint가 파티션 중간이면 시작점 연결은 이전 검증에서 확인됨
+            if partition.first_event_id > last_event_id and partition.first_prev_hash is not None:
+                expected = expected_prev or GENESIS_HASH
+                if partition.first_prev_hash != expected:
+                    result.update(
+                        ok=False,
+                        broken_event_id=partition.first_event_id,
+                        reason=f"archived partition {partition.period} starts at prev_hash "
+                               f"{partition.first_prev_hash} != previous hash {expected}"
+                    )
+                    return result
+            if partition.last_hash is not None:
+                expected_prev = partition.last_hash
+                result['head_hash'] = expected_prev
+                result['head_event_id'] = partition.last_event_id
+            last_event_id = partition.last_event_id
+            result['archived'] += partition.event_count
+            continue
+
+        event_id, timestamp, event_type, correlation_id, actor, payload, prev_hash, event_hash = item
+        last_event_id = event_id
+        if expected_prev is None:
+            if event_hash is None:
+                # 해시 체인 도입 이전 이벤트
+                result['unchained'] += 1
+                continue
+            expected_prev = GENESIS_HASH
+
+        reason = None
+        if event_hash is None:
+            reason = "missing hash"
+        elif prev_hash != expected_prev:
+            reason = f"prev_hash {prev_hash} != previous hash {expected_prev}"
+        else:
+            computed = compute_event_hash(prev_hash, timestamp, event_type, correlation_id, actor, payload)
+            if computed != event_hash:
+                reason = f"hash mismatch (stored {event_hash}, computed {computed})"
+
+        if reason is not None:
+            result.update(ok=False, broken_event_id=event_id, reason=reason)
+            return result
+
+        expected_prev = event_hash
+        result['verified'] += 1
+        result['head_event_id'] = event_id
+        result['head_hash'] = event_hash
+
+    if (
+        save_checkpoint
+        and result['head_hash'] is not None
+        and result['head_event_id'] > result['start_event_id']
+    ):
+        session.add(EventLogCheckpoint(
+            event_id=result['head_event_id'],
+            hash=result['head_hash'],
+            events_verified=result['verified'],
+            created_at=datetime.now(timezone.utc)
+        ))
+        session.commit()
+
+    return result
+
+
+def format_result(result: Dict[str, Any]) -> str:
+    """Format verification result as a summary line"""
+    if not result['ok']:
+        return f"BROKEN at event {result['broken_event_id']}: {result['reason']}"
+    return (
+        f"OK: verified {result['verified']} events "
+        f"({result['start_event_id']} -> {result['head_event_id']}), unchained {result['unchained']}, "
+        f"archived {result['archived']}"
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse CLI arguments"""
+    parser = argparse.ArgumentParser(
+        prog="python -m kis.storage.event_chain",
+        description="Verify the event_log hash chain incrementally from the latest checkpoint"
+    )
+    parser.add_argument("--full", action="store_true", help="Verify the whole table, ignoring checkpoints")
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=None,
+        help="Keep verifying new events every N seconds (runs until interrupted or the chain breaks)"
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_VERIFY_BATCH_SIZE,
+        help=f"Events read per query (default: {DEFAULT_VERIFY_BATCH_SIZE})"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point"""
+    # Local import: kis.storage.init_db imports this module
+    from kis.storage.init_db import DATABASE_URL
+
+    args = parse_args(argv)
+    database_url = os.getenv("DATABASE_URL", DATABASE_URL)
+    engine = create_storage_engine(database_url)
+    Session = sessionmaker(bind=engine)
+
+    full = args.full
+    try:
+        while True:
+            session = Session()
+            try:
+                started = time.perf_counter()
+                result = verify_chain(session, full=full, batch_size=args.batch_size)
+                elapsed = time.perf_counter() - started
+            finally:
+                session.close()
+
+            print(f"{format_result(result)} in {elapsed:.3f}s")
+            if not result['ok']:
+                return 1
+            if args.interval is None:
+                return 0
+            full = False
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    exit(main())
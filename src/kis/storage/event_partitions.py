@@ -0,0 +1,681 @@
+"""Monthly event_log partitions with archive tiering (python -m kis.storage.event_partitions)"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+from sqlalchemy import Column, MetaData, Table, delete, func, insert, select, text
+from sqlalchemy.orm import sessionmaker
+
+from kis.storage.event_chain import (
+    GENESIS_HASH,
+    PARTITION_ARCHIVED,
+    PARTITION_ATTACHED,
+    PARTITION_CLOSED,
+    compute_event_hash,
+    event_log_table,
+    lock_chain_head,
+    normalize_timestamp,
+)
+from kis.storage.factory import create_storage_engine
+from kis.storage.init_db import DATABASE_URL, append_only_trigger_statements
+from kis.storage.models import EventLog, EventLogPartition
+
+
+ARCHIVE_SUFFIX = ".ndjson.gz"
+MANIFEST_SUFFIX = ".manifest.json"
+ARCHIVE_FORMAT = "ndjson+gzip"
+
+# archive 대상에서 제외하는 최근 파티션 수 (현재 월 제외)
+DEFAULT_KEEP_MONTHS = 3
+
+PARTITION_NAME_PATTERN = re.compile(r"^event_log_(\d{4})(\d{2})$")
+
+EVENT_COLUMNS = (
+    'event_id', 'timestamp', 'event_type', 'correlation_id', 'actor', 'payload_json', 'prev_hash', 'hash'
+)
+
+
+def period_of(timestamp: datetime) -> str:
+    """
+    Get the partition period of a timestamp (naive values are treated as UTC).
+
+    Args:
+        timestamp: Event timestamp
+
+    Returns:
+        Period string YYYY-MM
+    """
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc)
+    return f"{timestamp.year:04d}-{timestamp.month:02d}"
+
+
+def period_bounds(period: str) -> Tuple[datetime, datetime]:
+    """
+    Get the UTC [start, end) range of a period.
+
+    Args:
+        period: Period string YYYY-MM
+
+    Returns:
+        (start, end) timezone-aware datetimes
+
+    Raises:
+        ValueError: If period is not YYYY-MM
+    """
+    match = re.fullmatch(r"(\d{4})-(\d{2})", period)
+    if match is None or not 1 <= int(match.group(2)) <= 12:
+        raise ValueError(f"Invalid period (expected YYYY-MM): {period}")
+    year, month = int(match.group(1)), int(match.group(2))
+    start = datetime(year, month, 1, tzinfo=timezone.utc)
+    end = datetime(year + month // 12, month % 12 + 1, 1, tzinfo=timezone.utc)
+    return start, end
+
+
+def next_period(period: str) -> str:
+    """Get the period following period (YYYY-MM)"""
+    return period_of(period_bounds(period)[1])
+
+
+def previous_period(period: str) -> str:
+    """Get the period preceding period (YYYY-MM)"""
+    return period_of(period_bounds(period)[0] - timedelta(days=1))
+
+
+def partition_table_name(period: str) -> str:
+    """Get the partition table name of a period (event_log_YYYYMM)"""
+    period_bounds(period)
+    return f"event_log_{period.replace('-', '')}"
+
+
+def _partition_table(table_name: str) -> Table:
+    """Rollover table with the event_log columns (primary key only, no secondary indexes)"""
+    return Table(
+        table_name,
+        MetaData(),
+        *[
+            Column(c.name, c.type, primary_key=c.primary_key, nullable=c.nullable, autoincrement=False)
+            for c in EventLog.__table__.columns
+        ]
+    )
+
+
+def _endpoints(connection, source, first_event_id: int, last_event_id: int) -> Dict[str, Any]:
+    """Count and hash-chain endpoints of an event_id range in an event_log table"""
+    id_column = source.c.event_id
+    in_range = (id_column >= first_event_id) & (id_column <= last_event_id)
+    first_id, last_id, count = connection.execute(
+        select(func.min(id_column), func.max(id_column), func.count()).select_from(source).where(in_range)
+    ).one()
+    return {
+        'first_event_id': first_id,
+        'last_event_id': last_id,
+        'event_count': count,
+        'first_prev_hash': connection.execute(
+            select(source.c.prev_hash).where(id_column == first_id)
+        ).scalar(),
+        'last_hash': connection.execute(select(source.c.hash).where(id_column == last_id)).scalar(),
+    }
+
+
+def _register(connection, period: str, table_name: str, status: str, endpoints: Dict[str, Any]) -> Dict[str, Any]:
+    connection.execute(insert(EventLogPartition).values(
+        period=period,
+        table_name=table_name,
+        status=status,
+        closed_at=datetime.now(timezone.utc),
+        **endpoints
+    ))
+    return {'period': period, 'table_name': table_name, 'status': status, **endpoints}
+
+
+def _roll_next_sqlite_partition(connection, current: str) -> Optional[Dict[str, Any]]:
+    """
+    Move the oldest closed month of event_log into its rollover table (one transaction).
+
+    A partition is a contiguous event_id range: from the first event in
+    event_log up to the last event stamped before the end of its month.
+    Events written out of timestamp order stay with their event_id
+    neighbours, so the hash chain never interleaves across tables.
+    """
+    # chain head lock: 동시 append 대기 (write lock)
+    lock_chain_head(connection)
+
+    first = connection.execute(
+        select(EventLog.event_id, EventLog.timestamp).order_by(EventLog.event_id).limit(1)
+    ).first()
+    if first is None:
+        return None
+
+    period = period_of(first.timestamp)
+    last_period = connection.execute(select(func.max(EventLogPartition.period))).scalar()
+    if last_period is not None and period <= last_period:
+        period = next_period(last_period)
+    if period >= current:
+        return None
+
+    _, end = period_bounds(period)
+    cut = connection.execute(
+        select(func.max(EventLog.event_id)).where(EventLog.timestamp < end)
+    ).scalar()
+
+    table_name = partition_table_name(period)
+    partition = _partition_table(table_name)
+    partition.create(connection)
+    columns = [EventLog.__table__.c[name] for name in EVENT_COLUMNS]
+    connection.execute(insert(partition).from_select(
+        list(EVENT_COLUMNS),
+        select(*columns).where(EventLog.event_id <= cut).order_by(EventLog.event_id)
+    ))
+    endpoints = _endpoints(connection, partition, first.event_id, cut)
+
+    for statement in append_only_trigger_statements(table_name):
+        connection.execute(text(statement))
+
+    # 같은 트랜잭션에서만 delete trigger 해제 (write lock 유지 중이므로 다른 connection은 볼 수 없음)
+    connection.execute(text("DROP TRIGGER IF EXISTS prevent_event_log_delete"))
+    deleted = connection.execute(delete(EventLog).where(EventLog.event_id <= cut)).rowcount
+    for statement in append_only_trigger_statements("event_log"):
+        connection.execute(text(statement))
+    if deleted != endpoints['event_count']:
+        raise RuntimeError(f"Rollover of {period} copied {endpoints['event_count']} events but removed {deleted}")
+
+    return _register(connection, period, table_name, PARTITION_CLOSED, endpoints)
+
+
+def postgres_partition_ddl(period: str) -> str:
+    """
+    Get the DDL creating a native monthly partition of event_log (Postgres).
+
+    Args:
+        period: Period string YYYY-MM
+
+    Returns:
+        CREATE TABLE ... PARTITION OF statement
+    """
+    start, end = period_bounds(period)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_table_name(period)} PARTITION OF event_log "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def postgres_convert_statements(first_period: str) -> List[str]:
+    """
+    Get the statements converting a plain event_log into a range-partitioned table (Postgres).
+
+    Existing rows stay in event_log_legacy, attached as the partition for
+    everything before first_period. The primary key becomes
+    (event_id, timestamp) because Postgres requires the partition key in it;
+    event_id stays unique through the chain head sequence.
+
+    Args:
+        first_period: First monthly partition (YYYY-MM), usually the current month
+
+    Returns:
+        List of SQL statements (run in one transaction)
+    """
+    start, _ = period_bounds(first_period)
+    return [
+        "ALTER TABLE event_log RENAME TO event_log_legacy",
+        "ALTER INDEX IF EXISTS ix_event_log_correlation_id RENAME TO ix_event_log_legacy_correlation_id",
+        "ALTER INDEX IF EXISTS ix_event_log_event_type_timestamp RENAME TO ix_event_log_legacy_event_type_timestamp",
+        "CREATE TABLE event_log (LIKE event_log_legacy INCLUDING DEFAULTS) PARTITION BY RANGE (timestamp)",
+        "ALTER TABLE event_log ADD PRIMARY KEY (event_id, timestamp)",
+        f"ALTER TABLE event_log ATTACH PARTITION event_log_legacy FOR VALUES FROM (MINVALUE) TO ('{start.isoformat()}')",
+        "CREATE INDEX ix_event_log_correlation_id ON event_log (correlation_id)",
+        "CREATE INDEX ix_event_log_event_type_timestamp ON event_log (event_type, timestamp)",
+        postgres_partition_ddl(first_period),
+        postgres_partition_ddl(next_period(first_period)),
+    ]
+
+
+def _is_postgres_partitioned(connection) -> bool:
+    return connection.execute(text(
+        "SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'event_log'::regclass"
+    )).first() is not None
+
+
+def _rollover_postgres(connection, current: str) -> List[Dict[str, Any]]:
+    """Create upcoming native partitions and register closed ones (rows stay attached)"""
+    if not _is_postgres_partitioned(connection):
+        raise RuntimeError("event_log is not partitioned; run 'convert-postgres --execute' first")
+
+    for period in (current, next_period(current)):
+        connection.execute(text(postgres_partition_ddl(period)))
+
+    registered = set(connection.execute(select(EventLogPartition.period)).scalars())
+    children = connection.execute(text(
+        "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = 'event_log'::regclass"
+    )).scalars().all()
+
+    results = []
+    for table_name in sorted(children):
+        match = PARTITION_NAME_PATTERN.match(table_name)
+        if match is None:
+            continue
+        period = f"{match.group(1)}-{match.group(2)}"
+        if period >= current or period in registered:
+            continue
+        source = event_log_table(table_name)
+        bounds = connection.execute(
+            select(func.min(source.c.event_id), func.max(source.c.event_id)).select_from(source)
+        ).one()
+        if bounds[0] is None:
+            continue
+        results.append(_register(
+            connection, period, table_name, PARTITION_ATTACHED, _endpoints(connection, source, *bounds)
+        ))
+    return results
+
+
+def rollover_partitions(engine, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """
+    Close every complete month of event_log into its own partition.
+
+    SQLite: events are moved into rollover tables (event_log_YYYYMM, append-only
+    triggers) one month per transaction, keeping event_log small.
+    Postgres: upcoming native partitions are created and closed ones are
+    registered with their hash-chain endpoints (rows stay attached).
+
+    Args:
+        engine: SQLAlchemy engine
+        now: Reference time (default: now, UTC); the month of now stays hot
+
+    Returns:
+        List of registered partition dicts (period, table_name, status, endpoints)
+    """
+    current = period_of(now or datetime.now(timezone.utc))
+
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            return _rollover_postgres(conn, current)
+
+    results = []
+    while True:
+        with engine.begin() as conn:
+            partition = _roll_next_sqlite_partition(conn, current)
+        if partition is None:
+            return results
+        results.append(partition)
+
+
+def _archive_paths(archive_dir: Path, period: str) -> Tuple[Path, Path]:
+    name = partition_table_name(period)
+    return archive_dir / f"{name}{ARCHIVE_SUFFIX}", archive_dir / f"{name}{MANIFEST_SUFFIX}"
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _write_archive(connection, source, partition: EventLogPartition, path: Path, batch_size: int) -> None:
+    """Write partition rows as gzip NDJSON in event_id order (tmp file + fsync + rename)"""
+    tmp_path = path.with_name(path.name + ".tmp")
+    id_column = source.c.event_id
+    after = partition.first_event_id - 1
+    with open(tmp_path, 'wb') as raw:
+        with gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as f:
+            while True:
+                rows = connection.execute(
+                    select(*[source.c[name] for name in EVENT_COLUMNS])
+                    .where((id_column > after) & (id_column <= partition.last_event_id))
+                    .order_by(id_column)
+                    .limit(batch_size)
+                ).all()
+                if not rows:
+                    break
+                for event_id, timestamp, event_type, correlation_id, actor, payload, prev_hash, event_hash in rows:
+                    record = {
+                        'event_id': event_id,
+                        'timestamp': normalize_timestamp(timestamp),
+                        'event_type': event_type,
+                        'correlation_id': correlation_id,
+                        'actor': actor,
+                        'payload': payload,
+                        'prev_hash': prev_hash,
+                        'hash': event_hash,
+                    }
+                    f.write((json.dumps(record, separators=(',', ':'), ensure_ascii=False) + "\n").encode('utf-8'))
+                after = rows[-1][0]
+        raw.flush()
+        os.fsync(raw.fileno())
+    os.replace(tmp_path, path)
+
+
+def verify_archive(archive_path: str) -> Dict[str, Any]:
+    """
+    Verify an archive file against its manifest (checksum, hash chain, endpoints).
+
+    Args:
+        archive_path: Path of the .ndjson.gz archive (manifest next to it)
+
+    Returns:
+        Result dict with ok, period, events and, when failed, reason
+    """
+    path = Path(archive_path)
+    manifest_path = path.with_name(path.name[:-len(ARCHIVE_SUFFIX)] + MANIFEST_SUFFIX)
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    result = {'ok': True, 'period': manifest['period'], 'events': 0}
+
+    def fail(reason: str) -> Dict[str, Any]:
+        result.update(ok=False, reason=reason)
+        return result
+
+    if _file_sha256(path) != manifest['sha256']:
+        return fail("archive checksum mismatch")
+
+    expected_prev = manifest['first_prev_hash']
+    first_id = last_id = last_hash = None
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            record = json.loads(line)
+            event_id = record['event_id']
+            if last_id is not None and event_id <= last_id:
+                return fail(f"event_id {event_id} out of order")
+            if first_id is None:
+                first_id = event_id
+            last_id = event_id
+            result['events'] += 1
+
+            if record['hash'] is None:
+                if expected_prev is not None:
+                    return fail(f"event {event_id}: missing hash")
+                continue
+            if expected_prev is None:
+                expected_prev = GENESIS_HASH
+            if record['prev_hash'] != expected_prev:
+                return fail(f"event {event_id}: prev_hash {record['prev_hash']} != previous hash {expected_prev}")
+            computed = compute_event_hash(
+                record['prev_hash'],
+                datetime.fromisoformat(record['timestamp']),
+                record['event_type'],
+                record['correlation_id'],
+                record['actor'],
+                record['payload']
+            )
+            if computed != record['hash']:
+                return fail(f"event {event_id}: hash mismatch (stored {record['hash']}, computed {computed})")
+            expected_prev = last_hash = record['hash']
+
+    if result['events'] != manifest['event_count']:
+        return fail(f"event count {result['events']} != manifest {manifest['event_count']}")
+    if (first_id, last_id) != (manifest['first_event_id'], manifest['last_event_id']):
+        return fail(f"event_id range {first_id}-{last_id} != manifest "
+                    f"{manifest['first_event_id']}-{manifest['last_event_id']}")
+    if last_hash != manifest['last_hash']:
+        return fail(f"last hash {last_hash} != manifest {manifest['last_hash']}")
+    return result
+
+
+def archive_partition(
+    engine,
+    period: str,
+    archive_dir: str,
+    batch_size: int = 10_000
+) -> Dict[str, Any]:
+    """
+    Export a closed partition to a compressed archive and drop it from the database.
+
+    The archive (gzip NDJSON, event_id order) and its manifest (endpoints,
+    SHA256) are written and verified before the partition table is dropped
+    (Postgres: detached, then dropped). The registry keeps the hash-chain
+    endpoints so verify_chain() can continue across the archived range.
+
+    Args:
+        engine: SQLAlchemy engine
+        period: Partition period (YYYY-MM)
+        archive_dir: Directory for archive and manifest files
+        batch_size: Events read per query
+
+    Returns:
+        Dict with period, archive_path, sha256 and event_count
+
+    Raises:
+        ValueError: If the partition is unknown or already archived
+        RuntimeError: If the partition range is not contiguous or the archive fails verification
+    """
+    directory = Path(archive_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    archive_path, manifest_path = _archive_paths(directory, period)
+
+    with engine.connect() as conn:
+        partition = conn.execute(
+            select(EventLogPartition.__table__).where(EventLogPartition.period == period)
+        ).first()
+        if partition is None:
+            raise ValueError(f"No closed event_log partition for {period}")
+        if partition.status == PARTITION_ARCHIVED:
+            raise ValueError(f"Partition {period} is already archived at {partition.archive_path}")
+
+        source = event_log_table(partition.table_name)
+        stored = _endpoints(conn, source, partition.first_event_id, partition.last_event_id)
+        if stored['event_count'] != partition.event_count or stored['last_hash'] != partition.last_hash:
+            raise RuntimeError(f"Partition {period} does not match its registered endpoints")
+        # archive 구간 안에 다른 테이블의 이벤트가 섞여 있으면 endpoint만으로 체인을 이을 수 없음
+        others = conn.execute(
+            select(func.count()).select_from(EventLog.__table__).where(
+                EventLog.event_id.between(partition.first_event_id, partition.last_event_id)
+            )
+        ).scalar()
+        expected_others = partition.event_count if partition.status == PARTITION_ATTACHED else 0
+        if others != expected_others:
+            raise RuntimeError(f"Partition {period} event_id range overlaps other events; cannot archive")
+
+        _write_archive(conn, source, partition, archive_path, batch_size)
+
+    sha256 = _file_sha256(archive_path)
+    manifest = {
+        'period': period,
+        'table_name': partition.table_name,
+        'format': ARCHIVE_FORMAT,
+        'first_event_id': partition.first_event_id,
+        'last_event_id': partition.last_event_id,
+        'event_count': partition.event_count,
+        'first_prev_hash': partition.first_prev_hash,
+        'last_hash': partition.last_hash,
+        'sha256': sha256,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+    }
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+
+    verification = verify_archive(str(archive_path))
+    if not verification['ok']:
+        raise RuntimeError(f"Archive of {period} failed verification: {verification['reason']}")
+
+    with engine.begin() as conn:
+        if engine.dialect.name == "postgresql":
+            conn.execute(text(f"ALTER TABLE event_log DETACH PARTITION {partition.table_name}"))
+        conn.execute(text(f"DROP TABLE {partition.table_name}"))
+        conn.execute(
+            EventLogPartition.__table__.update()
+            .where(EventLogPartition.period == period)
+            .values(
+                status=PARTITION_ARCHIVED,
+                archive_path=str(archive_path),
+                archive_sha256=sha256,
+                archived_at=datetime.now(timezone.utc)
+            )
+        )
+
+    return {
+        'period': period,
+        'archive_path': str(archive_path),
+        'sha256': sha256,
+        'event_count': partition.event_count,
+    }
+
+
+def archive_closed_partitions(
+    engine,
+    archive_dir: str,
+    keep_months: int = DEFAULT_KEEP_MONTHS,
+    now: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    Archive closed partitions older than keep_months before the current month.
+
+    Args:
+        engine: SQLAlchemy engine
+        archive_dir: Directory for archive and manifest files
+        keep_months: Number of most recent closed months kept in the database
+        now: Reference time (default: now, UTC)
+
+    Returns:
+        List of archive result dicts (oldest first)
+    """
+    cutoff = period_of(now or datetime.now(timezone.utc))
+    for _ in range(keep_months):
+        cutoff = previous_period(cutoff)
+
+    with engine.connect() as conn:
+        periods = conn.execute(
+            select(EventLogPartition.period)
+            .where(EventLogPartition.status != PARTITION_ARCHIVED)
+            .where(EventLogPartition.period < cutoff)
+            .order_by(EventLogPartition.period)
+        ).scalars().all()
+
+    return [archive_partition(engine, period, archive_dir) for period in periods]
+
+
+def list_partitions(session) -> List[EventLogPartition]:
+    """Get registered partitions in period order"""
+    return session.query(EventLogPartition).order_by(EventLogPartition.period).all()
+
+
+def format_partition(partition: EventLogPartition) -> str:
+    """Format a registry row as a summary line"""
+    line = (
+        f"{partition.period} {partition.status:<8} {partition.table_name} "
+        f"events {partition.first_event_id}-{partition.last_event_id} ({partition.event_count})"
+    )
+    if partition.archive_path:
+        line += f" -> {partition.archive_path}"
+    return line
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse CLI arguments"""
+    parser = argparse.ArgumentParser(
+        prog="python -m kis.storage.event_partitions",
+        description="Roll event_log over into monthly partitions and archive closed ones"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    rollover = subparsers.add_parser("rollover", help="Close every complete month into its own partition")
+    rollover.add_argument("--now", default=None, help="Reference time (ISO 8601, default: now)")
+
+    archive = subparsers.add_parser("archive", help="Export closed partitions to gzip NDJSON and drop them")
+    archive.add_argument("--archive-dir", required=True, help="Directory for archive and manifest files")
+    archive.add_argument("--period", default=None, help="Archive only this partition (YYYY-MM)")
+    archive.add_argument(
+        "--keep-months",
+        type=int,
+        default=DEFAULT_KEEP_MONTHS,
+        help=f"Closed months kept in the database (default: {DEFAULT_KEEP_MONTHS})"
+    )
+    archive.add_argument("--now", default=None, help="Reference time (ISO 8601, default: now)")
+
+    verify = subparsers.add_parser("verify-archive", help="Verify archive files against their manifests")
+    verify.add_argument("paths", nargs="+", help="Archive files (.ndjson.gz)")
+
+    subparsers.add_parser("list", help="List registered partitions")
+
+    convert = subparsers.add_parser("convert-postgres", help="Convert event_log to a partitioned table (Postgres)")
+    convert.add_argument("--first-period", default=None, help="First monthly partition (default: current month)")
+    convert.add_argument("--execute", action="store_true", help="Run the statements (default: print only)")
+    return parser.parse_args(argv)
+
+
+def _parse_now(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    now = datetime.fromisoformat(value)
+    return now if now.tzinfo else now.replace(tzinfo=timezone.utc)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point"""
+    args = parse_args(argv)
+
+    if args.command == "verify-archive":
+        failed = False
+        for path in args.paths:
+            result = verify_archive(path)
+            if result['ok']:
+                print(f"OK: {path} ({result['period']}, {result['events']} events)")
+            else:
+                failed = True
+                print(f"FAILED: {path}: {result['reason']}")
+        return 1 if failed else 0
+
+    database_url = os.getenv("DATABASE_URL", DATABASE_URL)
+    engine = create_storage_engine(database_url)
+    try:
+        if args.command == "convert-postgres":
+            statements = postgres_convert_statements(
+                args.first_period or period_of(datetime.now(timezone.utc))
+            )
+            if not args.execute:
+                print(";\n".join(statements) + ";")
+                return 0
+            if engine.dialect.name != "postgresql":
+                print("Error: convert-postgres requires a PostgreSQL DATABASE_URL")
+                return 1
+            with engine.begin() as conn:
+                for statement in statements:
+                    conn.execute(text(statement))
+            print("event_log converted to a partitioned table")
+            return 0
+
+        if args.command == "rollover":
+            for partition in rollover_partitions(engine, now=_parse_now(args.now)):
+                print(f"Closed {partition['period']}: {partition['event_count']} events "
+                      f"({partition['first_event_id']}-{partition['last_event_id']}) -> {partition['table_name']}")
+            return 0
+
+        if args.command == "archive":
+            if args.period:
+                results = [archive_partition(engine, args.period, args.archive_dir)]
+            else:
+                results = archive_closed_partitions(
+                    engine, args.archive_dir, keep_months=args.keep_months, now=_parse_now(args.now)
+                )
+            for result in results:
+                print(f"Archived {result['period']}: {result['event_count']} events -> {result['archive_path']}")
+            return 0
+
+        session = sessionmaker(bind=engine)()
+        try:
+            for partition in list_partitions(session):
+                print(format_partition(partition))
+        finally:
+            session.close()
+        return 0
+    except (RuntimeError, ValueError) as e:
+        print(f"Error: {e}")
+        return 1
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    exit(main())
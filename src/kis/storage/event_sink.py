@@ -0,0 +1,440 @@
+"""Buffered, batched event_log writer with optional durable local WAL"""
+
+import json
+import logging
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from kis.storage.models import EventLog
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 0.2  # seconds
+
+WAL_SEGMENT_PREFIX = "events-"
+WAL_SEGMENT_SUFFIX = ".jsonl"
+# wal_dir 아래 sink 인스턴스(프로세스)별 하위 디렉터리와 잠금 파일
+WAL_INSTANCE_PREFIX = "sink-"
+WAL_LOCK_NAME = ".lock"
+WAL_RECOVER_LOCK_NAME = ".recover.lock"
+
+
+def _fsync_dir(path: Path) -> None:
+    """fsync a directory so created/removed segment files survive a crash (no-op where unsupported)"""
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _lock_file(f, blocking: bool = True) -> bool:
+    """
+    Take an exclusive lock on an open file (released when the file is closed).
+
+    Returns:
+        False if blocking is False and another open file holds the lock
+    """
+    try:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        else:
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK if blocking else msvcrt.LK_NBLCK, 1)
+    except OSError:
+        if blocking:
+            raise
+        return False
+    return True
+
+
+@contextmanager
+def _locked(path: Path):
+    """Hold an exclusive lock on path for the duration of the block"""
+    with open(path, 'a') as f:
+        _lock_file(f)
+        yield
+
+
+def _build_event(record: Dict[str, Any]) -> EventLog:
+    return EventLog(
+        timestamp=datetime.fromisoformat(record['timestamp']),
+        event_type=record['event_type'],
+        correlation_id=record['correlation_id'],
+        actor=record['actor'],
+        payload_json=record['payload']
+    )
+
+
+class EventSink:
+    """
+    Buffers event_log appends in memory and writes them in batched inserts.
+
+    A batch is flushed when batch_size events are buffered or flush_interval
+    seconds have passed, by a background thread. Inserts go through an ORM
+    session, so events are hash-chained like any other append.
+
+    Durable mode (wal_dir set): every event is appended to a local JSONL
+    segment and fsync'd before emit() returns; concurrent emits share one
+    fsync (group commit). A segment is rotated at each flush and removed
+    once its batch is committed.
+
+    Each sink writes its segments to its own subdirectory of wal_dir and
+    holds an exclusive lock on it until close(), so several workers can
+    share wal_dir. recover() only replays subdirectories whose lock is free,
+    i.e. those left over by a crashed or stopped process. A segment whose
+    first event is already in event_log was committed before the crash and
+    is dropped instead of being inserted twice.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        wal_dir: Optional[str] = None,
+        autostart: bool = True
+    ):
+        """
+        Initialize sink.
+
+        Args:
+            session_factory: Callable returning a new SQLAlchemy session (e.g. sessionmaker)
+            batch_size: Buffered events that trigger a flush
+            flush_interval: Max seconds an event waits in the buffer
+            wal_dir: Directory for durable WAL segments, may be shared by workers (None = memory only)
+            autostart: Recover WAL segments and start the background flusher
+        """
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.wal_dir = Path(wal_dir) if wal_dir else None
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        # background flush 실패 횟수 (모니터링용)
+        self.flush_failures = 0
+        self.last_error: Optional[str] = None
+
+        self._segment_seq = 0
+        self._segment_path: Optional[Path] = None
+        self._segment_file = None
+        # rotate 되었지만 아직 commit되지 않은 segment (flush 실패 시 재시도 대상)
+        self._unflushed_segments: List[Path] = []
+        # group commit: 기록된 줄 수 / fsync 완료된 줄 수
+        self._sync_lock = threading.Lock()
+        self._written = 0
+        self._synced = 0
+
+        self.instance_dir: Optional[Path] = None
+        self._instance_lock = None
+        if self.wal_dir is not None:
+            self.wal_dir.mkdir(parents=True, exist_ok=True)
+            self._claim_instance_dir()
+
+        if autostart:
+            self.recover()
+            self.start()
+
+    # -- WAL segments ------------------------------------------------------
+
+    def _claim_instance_dir(self) -> None:
+        """Create this sink's WAL subdirectory and hold its lock until close()"""
+        # recover()가 잠금 전의 새 디렉터리를 버려진 것으로 보지 않도록 recover lock 안에서 생성
+        with _locked(self.wal_dir / WAL_RECOVER_LOCK_NAME):
+            self.instance_dir = self.wal_dir / f"{WAL_INSTANCE_PREFIX}{os.getpid()}-{uuid.uuid4().hex[:12]}"
+            self.instance_dir.mkdir()
+            self._instance_lock = open(self.instance_dir / WAL_LOCK_NAME, 'a')
+            _lock_file(self._instance_lock)
+        _fsync_dir(self.wal_dir)
+
+    def _release_instance_dir(self) -> None:
+        """Release the subdirectory lock; remove the directory if no segment is left"""
+        if self._instance_lock is None:
+            return
+        with _locked(self.wal_dir / WAL_RECOVER_LOCK_NAME):
+            self._instance_lock.close()
+            self._instance_lock = None
+            # 남은 segment가 있으면 (flush 실패) 다음 recover()가 재생하도록 디렉터리 유지
+            if not self._segment_paths(self.instance_dir):
+                (self.instance_dir / WAL_LOCK_NAME).unlink()
+                self.instance_dir.rmdir()
+        _fsync_dir(self.wal_dir)
+
+    @staticmethod
+    def _segment_paths(directory: Path) -> List[Path]:
+        return sorted(
+            directory.glob(f"{WAL_SEGMENT_PREFIX}*{WAL_SEGMENT_SUFFIX}"),
+            key=lambda path: int(path.name[len(WAL_SEGMENT_PREFIX):-len(WAL_SEGMENT_SUFFIX)])
+        )
+
+    def _open_segment(self) -> None:
+        existing = self._segment_paths(self.instance_dir)
+        if existing:
+            last = existing[-1].name
+            self._segment_seq = max(self._segment_seq, int(last[len(WAL_SEGMENT_PREFIX):-len(WAL_SEGMENT_SUFFIX)]))
+        self._segment_seq += 1
+        self._segment_path = self.instance_dir / f"{WAL_SEGMENT_PREFIX}{self._segment_seq:012d}{WAL_SEGMENT_SUFFIX}"
+        self._segment_file = open(self._segment_path, 'a', encoding='utf-8')
+        _fsync_dir(self.instance_dir)
+
+    def _rotate_segment(self) -> Optional[Path]:
+        """fsync and close the current segment (caller holds the condition lock) and return its path"""
+        if self._segment_file is None:
+            return None
+        # 아직 fsync되지 않은 emit이 있어도 rotate 이후에는 durable
+        self._segment_file.flush()
+        os.fsync(self._segment_file.fileno())
+        self._segment_file.close()
+        path = self._segment_path
+        self._segment_file = None
+        self._segment_path = None
+        return path
+
+    # -- public API --------------------------------------------------------
+
+    def emit(
+        self,
+        event_type: str,
+        correlation_id: str,
+        actor: str,
+        payload: Dict[str, Any],
+        timestamp: Optional[datetime] = None
+    ) -> None:
+        """
+        Buffer an event (durable before returning in WAL mode).
+
+        Args:
+            event_type: Event type
+            correlation_id: Correlation ID
+            actor: Actor
+            payload: Event payload dictionary
+            timestamp: Event timestamp (default: now, UTC)
+
+        Raises:
+            RuntimeError: If the sink is closed
+        """
+        record = {
+            'timestamp': (timestamp or datetime.now(timezone.utc)).isoformat(),
+            'event_type': event_type,
+            'correlation_id': correlation_id,
+            'actor': actor,
+            'payload': payload
+        }
+
+        seq = None
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("EventSink is closed")
+            if self.wal_dir is not None:
+                if self._segment_file is None:
+                    self._open_segment()
+                self._segment_file.write(json.dumps(record, separators=(',', ':')) + "\n")
+                self._segment_file.flush()
+                self._written += 1
+                seq = self._written
+            self._buffer.append(record)
+            if len(self._buffer) >= self.batch_size:
+                self._condition.notify()
+
+        if seq is not None:
+            self._sync(seq)
+
+    def _sync(self, seq: int) -> None:
+        """
+        Wait until the seq-th WAL line is fsync'd (group commit).
+
+        The fsync runs outside the condition lock, so other threads keep
+        appending; one fsync covers every line written before it started,
+        and emitters whose line is already covered return without syncing.
+        """
+        with self._sync_lock:
+            if self._synced >= seq:
+                return
+            with self._condition:
+                target = self._written
+                if self._segment_file is None:
+                    # flush가 segment를 rotate하면서 이미 fsync
+                    self._synced = max(self._synced, target)
+                    return
+                fd = os.dup(self._segment_file.fileno())
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._synced = max(self._synced, target)
+
+    def pending(self) -> int:
+        """Number of buffered (not yet flushed) events"""
+        with self._condition:
+            return len(self._buffer)
+
+    def flush(self) -> int:
+        """
+        Write buffered events in one transaction.
+
+        On failure the events are put back at the front of the buffer (and
+        stay in their WAL segment) so the next flush retries them in order.
+
+        Returns:
+            Number of events written
+        """
+        with self._flush_lock:
+            with self._condition:
+                records = self._buffer
+                self._buffer = []
+                segment = self._rotate_segment()
+            if segment is not None:
+                self._unflushed_segments.append(segment)
+            if not records:
+                return 0
+
+            try:
+                self._insert(records)
+            except Exception:
+                with self._condition:
+                    self._buffer[:0] = records
+                raise
+
+            if self._unflushed_segments:
+                for path in self._unflushed_segments:
+                    path.unlink()
+                self._unflushed_segments = []
+                _fsync_dir(self.instance_dir)
+            return len(records)
+
+    def _insert(self, records: List[Dict[str, Any]]) -> None:
+        session = self.session_factory()
+        try:
+            session.add_all([_build_event(record) for record in records])
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def recover(self) -> int:
+        """
+        Replay WAL segments left by crashed or stopped sinks.
+
+        Subdirectories whose lock is held by a live sink (in this or another
+        process) are skipped.
+
+        Returns:
+            Number of events inserted
+        """
+        if self.wal_dir is None:
+            return 0
+
+        inserted = 0
+        with self._flush_lock, _locked(self.wal_dir / WAL_RECOVER_LOCK_NAME):
+            # 하위 디렉터리 도입 전 wal_dir에 직접 기록된 segment
+            inserted += self._replay_segments(self.wal_dir)
+            for directory in sorted(self.wal_dir.glob(f"{WAL_INSTANCE_PREFIX}*")):
+                if directory == self.instance_dir or not directory.is_dir():
+                    continue
+                lock_path = directory / WAL_LOCK_NAME
+                with open(lock_path, 'a') as lock_file:
+                    if not _lock_file(lock_file, blocking=False):
+                        continue  # 다른 worker가 사용 중
+                    inserted += self._replay_segments(directory)
+                lock_path.unlink()
+                directory.rmdir()
+            _fsync_dir(self.wal_dir)
+        return inserted
+
+    def _replay_segments(self, directory: Path) -> int:
+        inserted = 0
+        for path in self._segment_paths(directory):
+            records = self._read_segment(path)
+            if records and not self._is_committed(records[0]):
+                self._insert(records)
+                inserted += len(records)
+            path.unlink()
+        _fsync_dir(directory)
+        return inserted
+
+    @staticmethod
+    def _read_segment(path: Path) -> List[Dict[str, Any]]:
+        records = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # crash 중 일부만 기록된 마지막 줄 (emit이 반환되지 않은 이벤트)
+                    break
+        return records
+
+    def _is_committed(self, record: Dict[str, Any]) -> bool:
+        session = self.session_factory()
+        try:
+            return session.query(EventLog.event_id).filter(
+                EventLog.event_type == record['event_type'],
+                EventLog.timestamp == datetime.fromisoformat(record['timestamp']),
+                EventLog.correlation_id == record['correlation_id'],
+                EventLog.actor == record['actor']
+            ).first() is not None
+        finally:
+            session.close()
+
+    # -- background flusher ------------------------------------------------
+
+    def start(self) -> None:
+        """Start the background flush thread (idempotent)"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="event-sink-flusher", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._closed and len(self._buffer) < self.batch_size:
+                    self._condition.wait(self.flush_interval)
+                closed = self._closed
+            try:
+                self.flush()
+            except Exception as e:
+                # DB 잠금 등 일시적 오류: 버퍼(및 WAL)에 남겨두고 다음 주기에 재시도
+                self.flush_failures += 1
+                self.last_error = f"{type(e).__name__}: {e}"
+                logger.warning("EventSink flush failed (%d pending): %s", self.pending(), e)
+            if closed:
+                return
+
+    def close(self) -> None:
+        """Stop the background thread, flush remaining events and release the WAL subdirectory"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        try:
+            self.flush()
+        finally:
+            with self._condition:
+                self._rotate_segment()
+            self._release_instance_dir()
@@ -0,0 +1,134 @@
+"""Storage engine factory (SQLite tuning pragmas, pooling per backend)"""
+
+import os
+from typing import Dict, Any, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import StaticPool
+
+
+# SQLite connect-time pragmas (환경변수로 조정 가능)
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("KIS_SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.getenv("KIS_SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE = int(os.getenv("KIS_SQLITE_CACHE_SIZE", "-65536"))  # 음수: KiB 단위 (64 MiB)
+
+# Postgres 등 서버형 DB connection pool
+SERVER_POOL_SIZE = int(os.getenv("KIS_DB_POOL_SIZE", "10"))
+SERVER_MAX_OVERFLOW = int(os.getenv("KIS_DB_MAX_OVERFLOW", "20"))
+SERVER_POOL_RECYCLE = 1800  # seconds
+
+
+def is_sqlite_url(database_url: str) -> bool:
+    """Check whether a database URL points to SQLite"""
+    return make_url(database_url).get_backend_name() == "sqlite"
+
+
+def is_sqlite_memory_url(database_url: str) -> bool:
+    """Check whether a database URL is an in-memory SQLite database"""
+    url = make_url(database_url)
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def get_engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    Get create_engine keyword arguments for a database URL.
+
+    - SQLite file: default QueuePool, connections usable from worker threads
+      (FastAPI threadpool, event sink flusher), driver busy timeout
+    - SQLite in-memory: single shared connection (StaticPool)
+    - Others (Postgres): sized QueuePool with pre-ping and recycling
+
+    Args:
+        database_url: Database URL
+
+    Returns:
+        Keyword arguments for sqlalchemy.create_engine
+    """
+    if is_sqlite_url(database_url):
+        options: Dict[str, Any] = {
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+            }
+        }
+        if is_sqlite_memory_url(database_url):
+            options["poolclass"] = StaticPool
+        return options
+
+    return {
+        "pool_size": SERVER_POOL_SIZE,
+        "max_overflow": SERVER_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": SERVER_POOL_RECYCLE,
+    }
+
+
+def get_sqlite_pragmas(database_url: str) -> Dict[str, Any]:
+    """
+    Get pragmas applied to every new SQLite connection.
+
+    Args:
+        database_url: SQLite database URL
+
+    Returns:
+        Ordered dict of pragma name -> value
+    """
+    pragmas: Dict[str, Any] = {}
+    if not is_sqlite_memory_url(database_url):
+        # WAL: reader가 writer를 막지 않음 (in-memory DB는 지원하지 않음)
+        pragmas["journal_mode"] = "WAL"
+    # WAL에서는 NORMAL도 commit 순서/무결성 보장 (전원 장애 시 마지막 트랜잭션만 유실 가능)
+    pragmas["synchronous"] = "NORMAL"
+    pragmas["busy_timeout"] = SQLITE_BUSY_TIMEOUT_MS
+    pragmas["mmap_size"] = SQLITE_MMAP_SIZE
+    pragmas["cache_size"] = SQLITE_CACHE_SIZE
+    return pragmas
+
+
+def create_storage_engine(database_url: Optional[str] = None, **kwargs) -> Engine:
+    """
+    Create a SQLAlchemy engine with the storage tuning profile.
+
+    Shared by engine CLI, GUI and Execution Server instead of plain create_engine.
+
+    Args:
+        database_url: Database URL (default: DATABASE_URL env var or SQLite default)
+        **kwargs: Extra create_engine arguments (override the profile)
+
+    Returns:
+        SQLAlchemy engine
+    """
+    if database_url is None:
+        # Local import: kis.storage.init_db uses this factory
+        from kis.storage.init_db import DATABASE_URL
+        database_url = os.getenv("DATABASE_URL", DATABASE_URL)
+
+    options = get_engine_options(database_url)
+    options.update(kwargs)
+    options.setdefault("echo", False)
+    engine = create_engine(database_url, **options)
+    install_sqlite_pragmas(engine, database_url)
+    return engine
+
+
+def install_sqlite_pragmas(engine: Engine, database_url: str) -> None:
+    """
+    Apply get_sqlite_pragmas() on every new connection of a SQLite engine (no-op otherwise).
+
+    Args:
+        engine: Sync engine (for an AsyncEngine pass engine.sync_engine)
+        database_url: Database URL the engine was created with
+    """
+    if not is_sqlite_url(database_url):
+        return
+    pragmas = get_sqlite_pragmas(database_url)
+
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
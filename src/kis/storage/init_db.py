@@ -1,51 +1,59 @@
 """Database initialization script with idempotency guarantee"""
 
 import os
-from datetime import datetime, timezone
-from typing import Optional
-from sqlalchemy import create_engine, text, inspect
-from sqlalchemy.orm import sessionmaker
+from typing import List, Optional
+from sqlalchemy import text
 
-from kis.storage.models import Base, SchemaVersion
+from kis.storage.factory import create_storage_engine
+from kis.storage.migrations import LATEST_SCHEMA_VERSION, print_progress, run_migrations
 
 # Default to SQLite, but allow DATABASE_URL override for Postgres
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///kis_trading.db")
 
 
-def create_event_log_triggers(engine):
-    """Create append-only triggers for event_log table (SQLite)"""
-    # SQLite-specific: Create triggers to prevent UPDATE/DELETE on event_log
-    # SQLite requires executing one statement at a time
+def append_only_trigger_statements(table_name: str = "event_log") -> List[str]:
+    """
+    Get statements (re)creating the append-only triggers of an event_log table (SQLite).
     
-    trigger_statements = [
-        "DROP TRIGGER IF EXISTS prevent_event_log_update",
-        "DROP TRIGGER IF EXISTS prevent_event_log_delete",
-        """CREATE TRIGGER prevent_event_log_update
-    BEFORE UPDATE ON event_log
+    Args:
+        table_name: event_log or one of its rollover partitions
+        
+    Returns:
+        List of SQL statements (SQLite requires executing one statement at a time)
+    """
+    return [
+        f"DROP TRIGGER IF EXISTS prevent_{table_name}_update",
+        f"DROP TRIGGER IF EXISTS prevent_{table_name}_delete",
+        f"""CREATE TRIGGER prevent_{table_name}_update
+    BEFORE UPDATE ON {table_name}
     BEGIN
-        SELECT RAISE(ABORT, 'event_log is append-only: UPDATE not allowed');
+        SELECT RAISE(ABORT, '{table_name} is append-only: UPDATE not allowed');
     END""",
-        """CREATE TRIGGER prevent_event_log_delete
-    BEFORE DELETE ON event_log
+        f"""CREATE TRIGGER prevent_{table_name}_delete
+    BEFORE DELETE ON {table_name}
     BEGIN
-        SELECT RAISE(ABORT, 'event_log is append-only: DELETE not allowed');
+        SELECT RAISE(ABORT, '{table_name} is append-only: DELETE not allowed');
     END""",
     ]
-    
+
+
+def create_event_log_triggers(engine):
+    """Create append-only triggers for event_log table (SQLite)"""
+    # SQLite-specific: Create triggers to prevent UPDATE/DELETE on event_log
     with engine.connect() as conn:
-        for statement in trigger_statements:
+        for statement in append_only_trigger_statements("event_log"):
             conn.execute(text(statement))
         conn.commit()
 
 
 def init_database(database_url: Optional[str] = None) -> None:
     """
-    Initialize database with idempotency guarantee.
+    Initialize or upgrade the database with idempotency guarantee.
     
     This function can be called multiple times safely:
-    - Creates tables if they don't exist
-    - Creates triggers if they don't exist
-    - Records schema version if not already recorded
+    - Applies pending schema migrations in order (kis.storage.migrations),
+      each recorded in schema_version
+    - Creates event_log append-only triggers if they don't exist (SQLite)
     
     Args:
         database_url: Optional database URL. If not provided, uses DATABASE_URL env var or SQLite default.
@@ -53,45 +61,24 @@ def init_database(database_url: Optional[str] = None) -> None:
     db_url = database_url or DATABASE_URL
     
     # Create engine
-    engine = create_engine(db_url, echo=False)
-    
-    # Create all tables (idempotent - won't recreate if they exist)
-    Base.metadata.create_all(engine)
-    
-    # Create event_log append-only triggers (SQLite)
-    if db_url.startswith("sqlite"):
-        create_event_log_triggers(engine)
-    
-    # Record schema version (idempotent)
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    engine = create_storage_engine(db_url)
     
     try:
-        # Check if schema version already exists
-        current_version = "0.1.0"
-        existing = session.query(SchemaVersion).filter_by(schema_version=current_version).first()
+        # Apply pending migrations (new database: all of them, in order)
+        applied = run_migrations(engine, progress=print_progress)
+        for plan in applied:
+            print(f"Schema version {plan['version']} applied: {plan['description']}")
+        if not applied:
+            print(f"Schema version {LATEST_SCHEMA_VERSION} already applied.")
         
-        if not existing:
-            schema_version = SchemaVersion(
-                schema_version=current_version,
-                applied_at=datetime.now(timezone.utc),
-                description="Phase 0 initial schema with append-only event_log"
-            )
-            session.add(schema_version)
-            session.commit()
-            print(f"Schema version {current_version} recorded.")
-        else:
-            print(f"Schema version {current_version} already exists.")
-    
-    except Exception as e:
-        session.rollback()
-        raise e
+        # Create event_log append-only triggers (SQLite)
+        if db_url.startswith("sqlite"):
+            create_event_log_triggers(engine)
     finally:
-        session.close()
+        engine.dispose()
     
     print(f"Database initialized successfully at: {db_url}")
 
 
 if __name__ == "__main__":
     init_database()
-
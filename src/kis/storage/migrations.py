@@ -0,0 +1,548 @@
+"""Ordered, idempotent schema migrations recorded in schema_version (python -m kis.storage.migrations)"""
+
+import argparse
+import os
+from datetime import datetime, timezone
+from typing import Dict, Any, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, insert, inspect, select, text, update
+
+from kis.storage.event_chain import CHAIN_ID, ensure_chain_head
+from kis.storage.factory import create_storage_engine
+from kis.storage.models import (
+    Base,
+    EventChainHead,
+    EventLog,
+    Order,
+    Proposal,
+    ProposalPosition,
+    SchemaVersion,
+    Snapshot,
+    SnapshotConstituent,
+)
+from kis.storage.proposal_positions import backfill_proposal_positions
+from kis.storage.snapshot_constituents import (
+    DEFAULT_BATCH_SIZE as SNAPSHOT_BATCH_SIZE,
+    backfill_snapshot_constituents,
+)
+from kis.storage.snapshot_content import backfill_snapshot_content_hashes
+
+
+DEFAULT_BATCH_SIZE = 500
+
+# progress(backfill name, rows done, estimated total)
+ProgressCallback = Callable[[str, int, int], None]
+
+
+class Backfill:
+    """Chunked data backfill of a migration (committed per batch, so the database stays online)"""
+
+    def __init__(
+        self,
+        name: str,
+        estimate: Callable[[Any], int],
+        run: Callable[[Any, int, Callable[[int], None]], int]
+    ):
+        """
+        Initialize backfill.
+
+        Args:
+            name: Display name (e.g. 'orders.proposal_id')
+            estimate: estimate(engine) -> rows to touch
+            run: run(engine, batch_size, progress) -> rows written; progress(rows done)
+        """
+        self.name = name
+        self.estimate = estimate
+        self.run = run
+
+
+class Migration:
+    """One schema version: tables, columns and indexes to add, then backfills (each step idempotent)"""
+
+    def __init__(
+        self,
+        version: str,
+        description: str,
+        tables: Sequence[str] = (),
+        columns: Sequence[str] = (),
+        indexes: Sequence[str] = (),
+        backfills: Sequence[Backfill] = ()
+    ):
+        """
+        Initialize migration.
+
+        Args:
+            version: Schema version (dotted integers, e.g. '0.4.0')
+            description: Description recorded in schema_version
+            tables: Model tables to create if missing
+            columns: Nullable model columns ('table.column') to add if missing
+            indexes: Model index names to create if missing
+            backfills: Data backfills run after the DDL
+        """
+        self.version = version
+        self.description = description
+        self.tables = tuple(tables)
+        self.columns = tuple(columns)
+        self.indexes = tuple(indexes)
+        self.backfills = tuple(backfills)
+
+
+def parse_version(version: str) -> Tuple[int, ...]:
+    """
+    Parse a dotted schema version for ordering.
+
+    Raises:
+        ValueError: If the version is not dotted integers
+    """
+    try:
+        return tuple(int(part) for part in version.split("."))
+    except ValueError:
+        raise ValueError(f"Invalid schema version: {version} (expected e.g. 0.4.0)")
+
+
+def _count(engine, statement) -> int:
+    with engine.connect() as conn:
+        return conn.execute(statement).scalar() or 0
+
+
+def _has_table(engine, table_name: str) -> bool:
+    return inspect(engine).has_table(table_name)
+
+
+def _has_column(engine, table_name: str, column_name: str) -> bool:
+    if not _has_table(engine, table_name):
+        return False
+    return column_name in {column["name"] for column in inspect(engine).get_columns(table_name)}
+
+
+def _find_index(index_name: str):
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            if index.name == index_name:
+                return index
+    raise ValueError(f"Unknown index in migration: {index_name}")
+
+
+def _has_index(engine, index) -> bool:
+    table_name = index.table.name
+    if not _has_table(engine, table_name):
+        return False
+    existing = {item["name"] for item in inspect(engine).get_indexes(table_name)}
+    # unique=True 컬럼 인덱스는 SQLite에서 unique constraint로 보고될 수 있음
+    existing |= {item["name"] for item in inspect(engine).get_unique_constraints(table_name)}
+    return index.name in existing
+
+
+# --- backfills ---
+
+def _estimate_order_proposal_ids(engine) -> int:
+    if not _has_table(engine, "orders"):
+        return 0
+    if not _has_column(engine, "orders", "proposal_id"):
+        return _count(engine, select(func.count()).select_from(Order.__table__))
+    return _count(engine, select(func.count()).where(Order.proposal_id.is_(None)))
+
+
+def backfill_order_proposal_ids(
+    engine,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    Fill orders.proposal_id from payload_json for orders created before the column existed.
+
+    Orders are updated in keyset batches (one transaction each).
+
+    Args:
+        engine: SQLAlchemy engine
+        batch_size: Orders per transaction
+        progress: Optional callback with the number of orders processed so far
+
+    Returns:
+        Number of updated rows
+    """
+    updated = 0
+    processed = 0
+    after = 0
+    while True:
+        with engine.begin() as conn:
+            order_ids = conn.execute(
+                select(Order.order_id)
+                .where(Order.proposal_id.is_(None), Order.order_id > after)
+                .order_by(Order.order_id)
+                .limit(batch_size)
+            ).scalars().all()
+            if not order_ids:
+                break
+            updated += conn.execute(
+                update(Order)
+                .where(Order.order_id.in_(order_ids))
+                .values(proposal_id=Order.payload_json["proposal_id"].as_integer())
+            ).rowcount
+        processed += len(order_ids)
+        after = order_ids[-1]
+        if progress:
+            progress(processed)
+    return updated
+
+
+def _estimate_chain_head(engine) -> int:
+    if not _has_table(engine, "event_chain_head"):
+        return 1
+    if _count(engine, select(func.count()).select_from(EventChainHead.__table__)) == 0:
+        return 1
+    if not _has_column(engine, "event_chain_head", "head_event_id"):
+        return 1
+    return _count(engine, select(func.count()).where(EventChainHead.head_event_id.is_(None)))
+
+
+def _backfill_chain_head(engine, batch_size: int, progress: Callable[[int], None]) -> int:
+    # head row 생성 (마지막 chained event 기준) 후, 이전 버전 head의 event_id sequence 채움
+    with engine.begin() as conn:
+        ensure_chain_head(conn)
+        updated = conn.execute(
+            update(EventChainHead)
+            .where(EventChainHead.chain_id == CHAIN_ID, EventChainHead.head_event_id.is_(None))
+            .values(head_event_id=select(func.coalesce(func.max(EventLog.event_id), 0)).scalar_subquery())
+        ).rowcount
+    progress(1)
+    return updated
+
+
+def _estimate_missing_children(parent, child, key: str):
+    def estimate(engine) -> int:
+        if not _has_table(engine, parent.__tablename__):
+            return 0
+        if not _has_table(engine, child.__tablename__):
+            return _count(engine, select(func.count()).select_from(parent.__table__))
+        has_child = select(getattr(child, key)).where(getattr(child, key) == getattr(parent, key)).exists()
+        return _count(engine, select(func.count()).select_from(parent.__table__).where(~has_child))
+    return estimate
+
+
+def _estimate_snapshot_content_hashes(engine) -> int:
+    if not _has_table(engine, "snapshots"):
+        return 0
+    if not _has_column(engine, "snapshots", "content_hash"):
+        return _count(engine, select(func.count()).select_from(Snapshot.__table__))
+    return _count(engine, select(func.count()).where(Snapshot.content_hash.is_(None)))
+
+
+def _backfill_snapshot_content_hashes(engine, batch_size: int, progress: Callable[[int], None]) -> int:
+    return backfill_snapshot_content_hashes(engine, batch_size=min(batch_size, SNAPSHOT_BATCH_SIZE), progress=progress)
+
+
+def _backfill_snapshot_constituents(engine, batch_size: int, progress: Callable[[int], None]) -> int:
+    # snapshot payload가 크므로 batch를 snapshot 단위 기본값 이하로 제한
+    return backfill_snapshot_constituents(engine, batch_size=min(batch_size, SNAPSHOT_BATCH_SIZE), progress=progress)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(
+        "0.1.0",
+        "Phase 0 initial schema with append-only event_log",
+        tables=("event_log", "snapshots", "proposals", "approvals", "orders", "fills",
+                "system_state", "schema_version"),
+    ),
+    Migration(
+        "0.2.0",
+        "Deduplicate snapshots by content hash",
+        columns=("snapshots.content_hash",),
+        indexes=("ix_snapshots_content_hash",),
+        backfills=(Backfill(
+            "snapshots.content_hash",
+            _estimate_snapshot_content_hashes,
+            _backfill_snapshot_content_hashes
+        ),),
+    ),
+    Migration(
+        "0.3.0",
+        "Store proposal config for replay",
+        columns=("proposals.config_json",),
+    ),
+    Migration(
+        "0.4.0",
+        "Index hot queries and link orders to proposals",
+        columns=("orders.proposal_id",),
+        indexes=("ix_proposals_status_created_at", "ix_system_state_timestamp", "ix_event_log_event_type_timestamp",
+                 "ix_approvals_proposal_id", "ix_orders_proposal_id", "ix_schema_version_applied_at"),
+        backfills=(Backfill("orders.proposal_id", _estimate_order_proposal_ids, backfill_order_proposal_ids),),
+    ),
+    Migration(
+        "0.5.0",
+        "Hash-chain event_log appends",
+        tables=("event_chain_head", "event_log_checkpoints"),
+    ),
+    Migration(
+        "0.6.0",
+        "Monthly event_log partitions and event_id sequence in the chain head",
+        tables=("event_log_partitions",),
+        columns=("event_chain_head.head_event_id",),
+        backfills=(Backfill("event_chain_head", _estimate_chain_head, _backfill_chain_head),),
+    ),
+    Migration(
+        "0.7.0",
+        "Normalized proposal positions",
+        tables=("proposal_positions",),
+        backfills=(Backfill(
+            "proposal_positions",
+            _estimate_missing_children(Proposal, ProposalPosition, "proposal_id"),
+            backfill_proposal_positions
+        ),),
+    ),
+    Migration(
+        "0.8.0",
+        "Normalized snapshot constituents",
+        tables=("snapshot_constituents",),
+        backfills=(Backfill(
+            "snapshot_constituents",
+            _estimate_missing_children(Snapshot, SnapshotConstituent, "snapshot_id"),
+            _backfill_snapshot_constituents
+        ),),
+    ),
+]
+
+LATEST_SCHEMA_VERSION = MIGRATIONS[-1].version
+
+
+def get_applied_versions(engine) -> List[str]:
+    """
+    Get schema versions recorded in schema_version.
+
+    Args:
+        engine: SQLAlchemy engine
+
+    Returns:
+        Recorded versions (empty for a new database)
+    """
+    if not _has_table(engine, SchemaVersion.__tablename__):
+        return []
+    with engine.connect() as conn:
+        return list(conn.execute(select(SchemaVersion.schema_version)).scalars())
+
+
+def get_pending_migrations(engine, target: Optional[str] = None) -> List[Migration]:
+    """
+    Get migrations not yet recorded, in order, up to an optional target version.
+
+    Args:
+        engine: SQLAlchemy engine
+        target: Last version to include (default: latest)
+
+    Returns:
+        Pending migrations
+
+    Raises:
+        ValueError: If the target version is unknown
+    """
+    if target is not None and target not in {migration.version for migration in MIGRATIONS}:
+        raise ValueError(f"Unknown target schema version: {target}")
+    applied = set(get_applied_versions(engine))
+    pending = []
+    for migration in sorted(MIGRATIONS, key=lambda m: parse_version(m.version)):
+        if target is not None and parse_version(migration.version) > parse_version(target):
+            break
+        if migration.version not in applied:
+            pending.append(migration)
+    return pending
+
+
+def plan_migration(engine, migration: Migration) -> Dict[str, Any]:
+    """
+    Describe what a migration would change, with estimated rows touched (dry run).
+
+    Args:
+        engine: SQLAlchemy engine
+        migration: Migration to plan
+
+    Returns:
+        Dict with version, description and steps [{action, target, rows}]
+    """
+    steps = []
+    for table_name in migration.tables:
+        if not _has_table(engine, table_name):
+            steps.append({'action': 'create table', 'target': table_name, 'rows': 0})
+    for qualified in migration.columns:
+        table_name, column_name = qualified.split(".")
+        if _has_table(engine, table_name) and not _has_column(engine, table_name, column_name):
+            # nullable 컬럼 추가는 메타데이터 변경만 (기존 row rewrite 없음)
+            steps.append({'action': 'add column', 'target': qualified, 'rows': 0})
+    for index_name in migration.indexes:
+        index = _find_index(index_name)
+        if _has_table(engine, index.table.name) and not _has_index(engine, index):
+            rows = _count(engine, select(func.count()).select_from(index.table))
+            steps.append({'action': 'create index', 'target': index_name, 'rows': rows})
+    for backfill in migration.backfills:
+        rows = backfill.estimate(engine)
+        if rows:
+            steps.append({'action': 'backfill', 'target': backfill.name, 'rows': rows})
+    return {'version': migration.version, 'description': migration.description, 'steps': steps}
+
+
+def apply_migration(
+    engine,
+    migration: Migration,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[ProgressCallback] = None
+) -> Dict[str, Any]:
+    """
+    Apply one migration and record its version.
+
+    DDL steps are skipped when already present and backfills only touch rows
+    that still need them, so an interrupted migration can simply be re-run.
+    The version is recorded only after every step succeeded.
+
+    Args:
+        engine: SQLAlchemy engine
+        migration: Migration to apply
+        batch_size: Rows per backfill transaction
+        progress: Optional callback progress(backfill name, rows done, estimated total)
+
+    Returns:
+        Plan dict of the applied steps (see plan_migration)
+
+    Raises:
+        RuntimeError: If a column to add is NOT NULL
+    """
+    plan = plan_migration(engine, migration)
+
+    tables = [Base.metadata.tables[name] for name in migration.tables]
+    Base.metadata.create_all(engine, tables=tables)
+
+    missing_columns = []
+    for qualified in migration.columns:
+        table_name, column_name = qualified.split(".")
+        if not _has_column(engine, table_name, column_name):
+            column = Base.metadata.tables[table_name].c[column_name]
+            if not column.nullable:
+                raise RuntimeError(f"Cannot add NOT NULL column {qualified} to existing table")
+            missing_columns.append(column)
+    with engine.begin() as conn:
+        for column in missing_columns:
+            column_type = column.type.compile(dialect=engine.dialect)
+            conn.execute(text(f"ALTER TABLE {column.table.name} ADD COLUMN {column.name} {column_type}"))
+
+    for index_name in migration.indexes:
+        _find_index(index_name).create(engine, checkfirst=True)
+
+    for backfill in migration.backfills:
+        total = backfill.estimate(engine)
+        if not total:
+            continue
+
+        def report(done: int, name: str = backfill.name, total: int = total) -> None:
+            if progress:
+                progress(name, done, total)
+
+        backfill.run(engine, batch_size, report)
+
+    with engine.begin() as conn:
+        conn.execute(insert(SchemaVersion).values(
+            schema_version=migration.version,
+            applied_at=datetime.now(timezone.utc),
+            description=migration.description
+        ))
+    return plan
+
+
+def run_migrations(
+    engine,
+    target: Optional[str] = None,
+    dry_run: bool = False,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[ProgressCallback] = None
+) -> List[Dict[str, Any]]:
+    """
+    Apply (or plan, with dry_run) all pending migrations in order.
+
+    Args:
+        engine: SQLAlchemy engine
+        target: Last version to apply (default: latest)
+        dry_run: Only report steps and estimated rows, change nothing
+        batch_size: Rows per backfill transaction
+        progress: Optional backfill progress callback
+
+    Returns:
+        List of plan dicts, one per pending migration
+    """
+    results = []
+    for migration in get_pending_migrations(engine, target):
+        if dry_run:
+            results.append(plan_migration(engine, migration))
+        else:
+            results.append(apply_migration(engine, migration, batch_size=batch_size, progress=progress))
+    return results
+
+
+def print_progress(name: str, done: int, total: int) -> None:
+    """Print backfill progress (default progress callback of the CLI and init_database)"""
+    print(f"  {name}: {min(done, total):,}/{total:,} rows")
+
+
+def format_plan(plan: Dict[str, Any]) -> str:
+    """Format a migration plan as summary lines"""
+    lines = [f"{plan['version']}: {plan['description']}"]
+    if not plan['steps']:
+        lines.append("  (no changes, version will be recorded)")
+    for step in plan['steps']:
+        rows = f" (~{step['rows']:,} rows)" if step['rows'] else ""
+        lines.append(f"  {step['action']} {step['target']}{rows}")
+    return "\n".join(lines)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse CLI arguments"""
+    parser = argparse.ArgumentParser(
+        prog="python -m kis.storage.migrations",
+        description="Apply ordered schema migrations recorded in schema_version"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Report pending steps and estimated rows only")
+    parser.add_argument("--target", default=None, help="Last version to apply (default: latest)")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Rows per backfill transaction (default: {DEFAULT_BATCH_SIZE})"
+    )
+    parser.add_argument("--list", action="store_true", help="List migrations and whether they are applied")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point"""
+    # Local import: kis.storage.init_db imports this module
+    from kis.storage.init_db import DATABASE_URL
+
+    args = parse_args(argv)
+    database_url = os.getenv("DATABASE_URL", DATABASE_URL)
+    engine = create_storage_engine(database_url)
+
+    try:
+        if args.list:
+            applied = set(get_applied_versions(engine))
+            for migration in MIGRATIONS:
+                status = "applied" if migration.version in applied else "pending"
+                print(f"{migration.version:<8} {status:<8} {migration.description}")
+            return 0
+
+        plans = run_migrations(
+            engine,
+            target=args.target,
+            dry_run=args.dry_run,
+            batch_size=max(1, args.batch_size),
+            progress=print_progress
+        )
+        if not plans:
+            print("No pending migrations.")
+        for plan in plans:
+            print(("[dry-run] " if args.dry_run else "Applied ") + format_plan(plan))
+        return 0
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -7,15 +7,19 @@ from sqlalchemy import (
     Column,
     String,
     Integer,
+    Float,
     DateTime,
     Text,
     JSON,
     ForeignKey,
+    Index,
     Enum as SQLEnum,
 )
-from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.orm import declarative_base, deferred, relationship
 import enum
 
+from kis.storage.encoding import EncodedJSON
+
 Base = declarative_base()
 
 
@@ -56,10 +60,53 @@ class EventLog(Base):
     event_type = Column(String(100), nullable=False)
     correlation_id = Column(String(100), nullable=False, index=True)
     actor = Column(String(50), nullable=False)
-    payload_json = Column(JSON, nullable=False)
+    payload_json = Column(EncodedJSON(setting="event_log"), nullable=False)
     prev_hash = Column(String(64), nullable=True)
     hash = Column(String(64), nullable=True)
 
+    __table_args__ = (
+        Index("ix_event_log_event_type_timestamp", "event_type", "timestamp"),
+    )
+
+
+class EventChainHead(Base):
+    """Current head of the event_log hash chain (single row, locked by appenders)"""
+    __tablename__ = "event_chain_head"
+
+    chain_id = Column(Integer, primary_key=True)
+    head_hash = Column(String(64), nullable=False)
+    head_event_id = Column(Integer, nullable=True)  # event_id sequence (event_log 파티션 이동 후에도 단조 증가)
+    updated_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+
+class EventLogCheckpoint(Base):
+    """Verified position in the event_log hash chain"""
+    __tablename__ = "event_log_checkpoints"
+
+    checkpoint_id = Column(Integer, primary_key=True, autoincrement=True)
+    event_id = Column(Integer, nullable=False, index=True)
+    hash = Column(String(64), nullable=False)
+    events_verified = Column(Integer, nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+
+
+class EventLogPartition(Base):
+    """Registry of closed monthly event_log partitions and their hash-chain endpoints"""
+    __tablename__ = "event_log_partitions"
+
+    period = Column(String(7), primary_key=True)  # YYYY-MM
+    table_name = Column(String(64), nullable=False)
+    status = Column(String(20), nullable=False)  # closed / attached / archived
+    first_event_id = Column(Integer, nullable=False)
+    last_event_id = Column(Integer, nullable=False, index=True)
+    event_count = Column(Integer, nullable=False)
+    first_prev_hash = Column(String(64), nullable=True)  # NULL: 해시 체인 도입 이전 이벤트로 시작
+    last_hash = Column(String(64), nullable=True)
+    closed_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    archive_path = Column(Text, nullable=True)
+    archive_sha256 = Column(String(64), nullable=True)
+    archived_at = Column(DateTime(timezone=True), nullable=True)
+
 
 class Snapshot(Base):
     """Market data snapshot table"""
@@ -68,7 +115,27 @@ class Snapshot(Base):
     snapshot_id = Column(Integer, primary_key=True, autoincrement=True)
     asof = Column(DateTime(timezone=True), nullable=False)
     source = Column(String(100), nullable=False)
-    payload_json = Column(JSON, nullable=False)
+    # 전체 universe blob은 접근할 때만 로드 (목록/Proposal.snapshot 조인 시 메타데이터만 조회)
+    payload_json = deferred(Column(EncodedJSON(setting="snapshots"), nullable=False))
+    content_hash = Column(String(64), nullable=True, unique=True, index=True)  # SHA256 of canonical payload JSON
+
+
+class SnapshotConstituent(Base):
+    """Snapshot universe normalized from payload_json (one row per symbol) for per-symbol history queries"""
+    __tablename__ = "snapshot_constituents"
+
+    snapshot_id = Column(Integer, ForeignKey("snapshots.snapshot_id"), primary_key=True)
+    market = Column(String(10), primary_key=True)
+    symbol = Column(String(50), primary_key=True)
+    asof = Column(DateTime(timezone=True), nullable=False)  # snapshots.asof 복사 (symbol별 시계열 조회용)
+    score = Column(Float, nullable=True)
+
+    # Relationships
+    snapshot = relationship("Snapshot", foreign_keys=[snapshot_id])
+
+    __table_args__ = (
+        Index("ix_snapshot_constituents_symbol_asof", "symbol", "asof"),
+    )
 
 
 class Proposal(Base):
@@ -79,13 +146,35 @@ class Proposal(Base):
     created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
     universe_snapshot_id = Column(Integer, ForeignKey("snapshots.snapshot_id"), nullable=True)
     config_hash = Column(String(64), nullable=False)
+    config_json = Column(JSON, nullable=True)  # Config used to create the proposal (for replay)
     git_commit_sha = Column(String(40), nullable=True)
     schema_version = Column(String(20), nullable=False)
-    payload_json = Column(JSON, nullable=False)
+    payload_json = Column(EncodedJSON(setting="proposals"), nullable=False)
     status = Column(SQLEnum(ProposalStatus), nullable=False, default=ProposalStatus.PENDING)
 
+    # Relationships (Snapshot.payload_json은 deferred이므로 메타데이터만 로드)
+    snapshot = relationship("Snapshot", foreign_keys=[universe_snapshot_id], lazy="select")
+
+    __table_args__ = (
+        Index("ix_proposals_status_created_at", "status", "created_at"),
+    )
+
+
+class ProposalPosition(Base):
+    """Proposal positions normalized from payload_json (one row per symbol) for SQL exposure queries"""
+    __tablename__ = "proposal_positions"
+
+    proposal_id = Column(Integer, ForeignKey("proposals.proposal_id"), primary_key=True)
+    market = Column(String(10), primary_key=True)
+    symbol = Column(String(50), primary_key=True)
+    weight = Column(Float, nullable=False)
+
     # Relationships
-    snapshot = relationship("Snapshot", foreign_keys=[universe_snapshot_id])
+    proposal = relationship("Proposal", foreign_keys=[proposal_id])
+
+    __table_args__ = (
+        Index("ix_proposal_positions_symbol_weight", "symbol", "weight"),
+    )
 
 
 class Approval(Base):
@@ -93,7 +182,7 @@ class Approval(Base):
     __tablename__ = "approvals"
 
     approval_id = Column(Integer, primary_key=True, autoincrement=True)
-    proposal_id = Column(Integer, ForeignKey("proposals.proposal_id"), nullable=False)
+    proposal_id = Column(Integer, ForeignKey("proposals.proposal_id"), nullable=False, index=True)
     token_hash = Column(String(64), nullable=True, index=True)  # Hash only, no raw token (null for rejected)
     token_expires_at = Column(DateTime(timezone=True), nullable=True)  # null for rejected
     token_used_at = Column(DateTime(timezone=True), nullable=True)
@@ -113,6 +202,7 @@ class Order(Base):
 
     order_id = Column(Integer, primary_key=True, autoincrement=True)
     correlation_id = Column(String(100), nullable=False, index=True)
+    proposal_id = Column(Integer, ForeignKey("proposals.proposal_id"), nullable=True, index=True)
     status = Column(SQLEnum(OrderStatus), nullable=False, default=OrderStatus.PENDING)
     broker_order_id = Column(String(100), nullable=True)
     payload_json = Column(JSON, nullable=False)
@@ -139,7 +229,7 @@ class SystemState(Base):
     __tablename__ = "system_state"
 
     state_id = Column(Integer, primary_key=True, autoincrement=True)
-    timestamp = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    timestamp = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc), index=True)
     kill_switch_status = Column(SQLEnum(KillSwitchStatus), nullable=False, default=KillSwitchStatus.ACTIVE)
     kill_switch_reason = Column(Text, nullable=True)
     portfolio_value = Column(String(50), nullable=True)
@@ -152,6 +242,6 @@ class SchemaVersion(Base):
     __tablename__ = "schema_version"
 
     schema_version = Column(String(20), primary_key=True)
-    applied_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
+    applied_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc), index=True)
     description = Column(Text, nullable=True)
 
@@ -0,0 +1,252 @@
+"""Normalized proposal positions: build, backfill and exposure queries (python -m kis.storage.proposal_positions)"""
+
+import argparse
+import os
+from typing import Dict, Any, Callable, List, Optional
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+
+from kis.storage.factory import create_storage_engine
+from kis.storage.models import Proposal, ProposalPosition, ProposalStatus
+
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def build_position_rows(proposal_id: int, proposal_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Build proposal_positions rows from proposal data.
+
+    Args:
+        proposal_id: Proposal ID
+        proposal_data: Proposal data dict with 'positions' ({symbol, market, weight})
+
+    Returns:
+        List of row dicts (proposal_id, market, symbol, weight)
+    """
+    # 같은 (market, symbol)이 두 번 나오면 weight 합산 (primary key 중복 방지)
+    weights: Dict[tuple, float] = {}
+    for position in proposal_data.get('positions') or []:
+        key = (position['market'], position['symbol'])
+        weights[key] = weights.get(key, 0.0) + float(position['weight'])
+    return [
+        {'proposal_id': proposal_id, 'market': market, 'symbol': symbol, 'weight': weight}
+        for (market, symbol), weight in weights.items()
+    ]
+
+
+def build_positions(proposal_id: int, proposal_data: Dict[str, Any]) -> List[ProposalPosition]:
+    """
+    Build (unsaved) ProposalPosition rows from proposal data.
+
+    Args:
+        proposal_id: Proposal ID
+        proposal_data: Proposal data dict with 'positions'
+
+    Returns:
+        List of ProposalPosition objects (not added to session)
+    """
+    return [ProposalPosition(**row) for row in build_position_rows(proposal_id, proposal_data)]
+
+
+def backfill_proposal_positions(
+    engine,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    Fill proposal_positions for proposals saved before the table existed (idempotent).
+
+    Proposals are read in keyset batches (one transaction each); proposals
+    that already have position rows are skipped.
+
+    Args:
+        engine: SQLAlchemy engine
+        batch_size: Proposals per transaction
+        progress: Optional callback with the number of proposals processed so far
+
+    Returns:
+        Number of inserted position rows
+    """
+    has_positions = select(ProposalPosition.proposal_id).where(
+        ProposalPosition.proposal_id == Proposal.proposal_id
+    ).exists()
+
+    inserted = 0
+    processed = 0
+    after = 0
+    while True:
+        with engine.begin() as conn:
+            proposals = conn.execute(
+                select(Proposal.proposal_id, Proposal.payload_json)
+                .where(Proposal.proposal_id > after, ~has_positions)
+                .order_by(Proposal.proposal_id)
+                .limit(batch_size)
+            ).all()
+            if not proposals:
+                break
+
+            rows = []
+            for proposal_id, payload in proposals:
+                rows.extend(build_position_rows(proposal_id, payload))
+            if rows:
+                conn.execute(insert(ProposalPosition), rows)
+            inserted += len(rows)
+            after = proposals[-1][0]
+        processed += len(proposals)
+        if progress:
+            progress(processed)
+
+    return inserted
+
+
+def get_proposals_holding(
+    session: Session,
+    symbol: str,
+    min_weight: float = 0.0,
+    market: Optional[str] = None,
+    statuses: Optional[List[ProposalStatus]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get proposals holding a symbol at or above a weight (e.g. AAPL over 7%).
+
+    Args:
+        session: Database session
+        symbol: Symbol
+        min_weight: Minimum weight (fraction, 0.07 = 7%)
+        market: Optional market filter (KR/US)
+        statuses: Optional proposal status filter
+
+    Returns:
+        List of dicts with proposal_id, created_at, status, market, symbol, weight (newest first)
+    """
+    query = (
+        select(
+            ProposalPosition.proposal_id,
+            Proposal.created_at,
+            Proposal.status,
+            ProposalPosition.market,
+            ProposalPosition.symbol,
+            ProposalPosition.weight,
+        )
+        .join(Proposal, Proposal.proposal_id == ProposalPosition.proposal_id)
+        .where(ProposalPosition.symbol == symbol, ProposalPosition.weight >= min_weight)
+        .order_by(Proposal.created_at.desc(), ProposalPosition.proposal_id.desc())
+    )
+    if market:
+        query = query.where(ProposalPosition.market == market)
+    if statuses:
+        query = query.where(Proposal.status.in_(statuses))
+    return [dict(row._mapping) for row in session.execute(query)]
+
+
+def get_symbol_exposure(
+    session: Session,
+    statuses: Optional[List[ProposalStatus]] = None,
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Aggregate exposure per symbol across proposals.
+
+    Args:
+        session: Database session
+        statuses: Optional proposal status filter
+        limit: Optional maximum number of symbols (highest total weight first)
+
+    Returns:
+        List of dicts with market, symbol, proposals, avg_weight, max_weight, total_weight
+    """
+    total_weight = func.sum(ProposalPosition.weight)
+    query = (
+        select(
+            ProposalPosition.market,
+            ProposalPosition.symbol,
+            func.count(ProposalPosition.proposal_id).label("proposals"),
+            func.avg(ProposalPosition.weight).label("avg_weight"),
+            func.max(ProposalPosition.weight).label("max_weight"),
+            total_weight.label("total_weight"),
+        )
+        .group_by(ProposalPosition.market, ProposalPosition.symbol)
+        .order_by(total_weight.desc(), ProposalPosition.symbol)
+    )
+    if statuses:
+        query = query.join(Proposal, Proposal.proposal_id == ProposalPosition.proposal_id).where(
+            Proposal.status.in_(statuses)
+        )
+    if limit:
+        query = query.limit(limit)
+    return [dict(row._mapping) for row in session.execute(query)]
+
+
+def _parse_statuses(values: List[str]) -> List[ProposalStatus]:
+    try:
+        return [ProposalStatus(value) for value in values]
+    except ValueError:
+        expected = ", ".join(status.value for status in ProposalStatus)
+        raise ValueError(f"Unknown proposal status in {values} (expected {expected})")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse CLI arguments"""
+    parser = argparse.ArgumentParser(
+        prog="python -m kis.storage.proposal_positions",
+        description="Backfill and query normalized proposal positions"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backfill = subparsers.add_parser("backfill", help="Fill proposal_positions for existing proposals")
+    backfill.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Proposals per transaction (default: {DEFAULT_BATCH_SIZE})"
+    )
+
+    holding = subparsers.add_parser("holding", help="List proposals holding a symbol")
+    holding.add_argument("symbol", help="Symbol (e.g. AAPL)")
+    holding.add_argument("--min-weight", type=float, default=0.0, help="Minimum weight (0.07 = 7%%)")
+    holding.add_argument("--market", default=None, help="Market filter (KR/US)")
+    holding.add_argument("--status", action="append", default=[], help="Proposal status filter (repeatable)")
+
+    exposure = subparsers.add_parser("exposure", help="Aggregate exposure per symbol")
+    exposure.add_argument("--status", action="append", default=[], help="Proposal status filter (repeatable)")
+    exposure.add_argument("--limit", type=int, default=20, help="Number of symbols (default: 20)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point"""
+    # Local import: kis.storage.init_db imports this module
+    from kis.storage.init_db import DATABASE_URL
+
+    args = parse_args(argv)
+    database_url = os.getenv("DATABASE_URL", DATABASE_URL)
+    engine = create_storage_engine(database_url)
+
+    try:
+        if args.command == "backfill":
+            inserted = backfill_proposal_positions(engine, batch_size=max(1, args.batch_size))
+            print(f"Backfilled proposal_positions: {inserted} rows")
+            return 0
+
+        statuses = _parse_statuses(args.status)
+        with Session(engine) as session:
+            if args.command == "holding":
+                for row in get_proposals_holding(session, args.symbol, args.min_weight, args.market, statuses):
+                    print(f"proposal {row['proposal_id']:>6}  {row['created_at']}  {row['status'].value:<8}  "
+                          f"{row['market']} {row['symbol']}  {row['weight']:.2%}")
+            else:
+                for row in get_symbol_exposure(session, statuses, args.limit):
+                    print(f"{row['market']} {row['symbol']:<12} proposals={row['proposals']:<5} "
+                          f"avg={row['avg_weight']:.2%} max={row['max_weight']:.2%}")
+        return 0
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,232 @@
+"""Re-encode stored payload_json columns (python -m kis.storage.reencode)"""
+
+import argparse
+import os
+from typing import Dict, Any, List, Optional
+
+from sqlalchemy import LargeBinary, bindparam, inspect, select, text, type_coerce, update
+from sqlalchemy.types import TypeDecorator
+
+from kis.storage.encoding import (
+    ENCODING_JSON,
+    ENCODINGS,
+    check_encoding,
+    decode_payload,
+    detect_encoding,
+    encode_payload,
+)
+from kis.storage.factory import create_storage_engine
+from kis.storage.init_db import DATABASE_URL
+from kis.storage.models import Proposal, Snapshot
+
+
+DEFAULT_BATCH_SIZE = 500
+
+# table -> (Table, primary key column)
+REENCODABLE_TABLES = {
+    'snapshots': (Snapshot.__table__, 'snapshot_id'),
+    'proposals': (Proposal.__table__, 'proposal_id'),
+}
+
+# append-only 테이블은 기존 row를 다시 쓰지 않음 (새 이벤트만 설정된 encoding으로 기록)
+APPEND_ONLY_TABLES = ('event_log',)
+
+
+class _RawPayload(TypeDecorator):
+    """Pass stored payload values through unchanged (no JSON/encoding processing)"""
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def bind_processor(self, dialect):
+        return None
+
+    def result_processor(self, dialect, coltype):
+        return None
+
+
+def _stored_size(raw: Any) -> int:
+    if isinstance(raw, str):
+        return len(raw.encode('utf-8'))
+    if isinstance(raw, (bytes, memoryview)):
+        return len(raw)
+    return len(encode_payload(raw, ENCODING_JSON).encode('utf-8'))
+
+
+def _postgres_column_type(connection, table_name: str) -> str:
+    return connection.execute(
+        text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = :table_name AND column_name = 'payload_json'"
+        ),
+        {'table_name': table_name}
+    ).scalar()
+
+
+def reencode_table(
+    engine,
+    table_name: str,
+    encoding: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    dry_run: bool = False
+) -> Dict[str, Any]:
+    """
+    Re-encode payload_json of every row in a table (keyset batches, one transaction each).
+
+    Rows already in the target encoding are skipped, so the tool can be
+    re-run after an interruption. On Postgres a json/jsonb column is first
+    converted to bytea for binary encodings.
+
+    Args:
+        engine: SQLAlchemy engine
+        table_name: Table to re-encode (snapshots or proposals)
+        encoding: Target encoding
+        batch_size: Rows per transaction
+        dry_run: Only count rows and sizes, write nothing
+
+    Returns:
+        Dict with table, encoding, rows, converted, skipped, bytes_before, bytes_after
+
+    Raises:
+        ValueError: If the table cannot be re-encoded or the encoding is unavailable
+    """
+    check_encoding(encoding)
+    if table_name in APPEND_ONLY_TABLES:
+        raise ValueError(f"{table_name} is append-only; existing rows are never rewritten")
+    if table_name not in REENCODABLE_TABLES:
+        raise ValueError(f"Unknown table: {table_name} (expected one of {', '.join(REENCODABLE_TABLES)})")
+    table, pk_name = REENCODABLE_TABLES[table_name]
+    pk = table.c[pk_name]
+
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            column_type = _postgres_column_type(conn, table_name)
+            if encoding != ENCODING_JSON and column_type in ("json", "jsonb") and not dry_run:
+                conn.execute(text(
+                    f"ALTER TABLE {table_name} ALTER COLUMN payload_json TYPE bytea "
+                    f"USING convert_to(payload_json::text, 'UTF8')"
+                ))
+            elif encoding == ENCODING_JSON and column_type == "bytea":
+                raise ValueError(f"{table_name}.payload_json is bytea; json text needs a json column")
+
+    stats = {
+        'table': table_name,
+        'encoding': encoding,
+        'rows': 0,
+        'converted': 0,
+        'skipped': 0,
+        'bytes_before': 0,
+        'bytes_after': 0,
+    }
+    raw_column = type_coerce(table.c.payload_json, _RawPayload())
+    statement = (
+        update(table)
+        .where(pk == bindparam('b_pk'))
+        .values(payload_json=bindparam('b_payload', type_=_RawPayload()))
+    )
+
+    after = None
+    while True:
+        with engine.begin() as conn:
+            query = select(pk, raw_column).order_by(pk).limit(batch_size)
+            if after is not None:
+                query = query.where(pk > after)
+            rows = conn.execute(query).all()
+            if not rows:
+                break
+
+            updates = []
+            for row_id, raw in rows:
+                size = _stored_size(raw)
+                stats['rows'] += 1
+                stats['bytes_before'] += size
+                if detect_encoding(raw) == encoding:
+                    stats['skipped'] += 1
+                    stats['bytes_after'] += size
+                    continue
+                encoded = encode_payload(decode_payload(raw), encoding)
+                stats['converted'] += 1
+                stats['bytes_after'] += _stored_size(encoded)
+                updates.append({'b_pk': row_id, 'b_payload': encoded})
+
+            if updates and not dry_run:
+                conn.execute(statement, updates)
+            after = rows[-1][0]
+
+    return stats
+
+
+def vacuum(engine) -> None:
+    """Reclaim space after re-encoding (SQLite VACUUM; no-op on other databases)"""
+    if engine.dialect.name != "sqlite":
+        return
+    with engine.connect() as conn:
+        conn.exec_driver_sql("VACUUM")
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    """Format re-encode stats as a summary line"""
+    ratio = stats['bytes_after'] / stats['bytes_before'] if stats['bytes_before'] else 1.0
+    return (
+        f"{stats['table']}: {stats['converted']} of {stats['rows']} rows -> {stats['encoding']} "
+        f"({stats['skipped']} already encoded), {stats['bytes_before']:,} -> {stats['bytes_after']:,} bytes "
+        f"({ratio:.1%})"
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse CLI arguments"""
+    parser = argparse.ArgumentParser(
+        prog="python -m kis.storage.reencode",
+        description="Re-encode stored payload_json columns (json, zlib, msgpack, zstd)"
+    )
+    parser.add_argument(
+        "--table",
+        action="append",
+        dest="tables",
+        choices=sorted(REENCODABLE_TABLES),
+        default=[],
+        help="Table to re-encode (repeatable, default: all)"
+    )
+    parser.add_argument("--encoding", required=True, choices=ENCODINGS, help="Target encoding")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Rows per transaction (default: {DEFAULT_BATCH_SIZE})"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Report sizes without writing")
+    parser.add_argument("--vacuum", action="store_true", help="Run VACUUM afterwards (SQLite)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point"""
+    args = parse_args(argv)
+    database_url = os.getenv("DATABASE_URL", DATABASE_URL)
+    engine = create_storage_engine(database_url)
+
+    try:
+        existing = set(inspect(engine).get_table_names())
+        for table_name in args.tables or sorted(REENCODABLE_TABLES):
+            if table_name not in existing:
+                print(f"{table_name}: table not found, skipped")
+                continue
+            stats = reencode_table(
+                engine, table_name, args.encoding, batch_size=max(1, args.batch_size), dry_run=args.dry_run
+            )
+            print(("[dry-run] " if args.dry_run else "") + format_stats(stats))
+        if args.vacuum and not args.dry_run:
+            vacuum(engine)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    finally:
+        engine.dispose()
+
+    print(f"Set KIS_PAYLOAD_ENCODING (or KIS_PAYLOAD_ENCODING_<TABLE>) to '{args.encoding}' for new rows.")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -2,9 +2,9 @@
 
 import os
 from typing import Generator
-from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 
+from kis.storage.factory import create_storage_engine
 from kis.storage.init_db import DATABASE_URL
 
 
@@ -18,7 +18,7 @@ def get_engine():
     global _engine
     if _engine is None:
         database_url = os.getenv("DATABASE_URL", DATABASE_URL)
-        _engine = create_engine(database_url, echo=False)
+        _engine = create_storage_engine(database_url)
     return _engine
 
 
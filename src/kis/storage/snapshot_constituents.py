@@ -0,0 +1,218 @@
+"""Normalized snapshot constituents: build, backfill and score history (python -m kis.storage.snapshot_constituents)"""
+
+import argparse
+import os
+from datetime import datetime, timezone
+from typing import Dict, Any, Callable, List, Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from kis.storage.factory import create_storage_engine
+from kis.storage.models import Snapshot, SnapshotConstituent
+
+
+# snapshot payload가 크므로 batch당 snapshot 수를 작게 유지
+DEFAULT_BATCH_SIZE = 20
+
+
+def build_constituent_rows(
+    snapshot_id: int,
+    asof: datetime,
+    payload: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    Build snapshot_constituents rows from a snapshot payload.
+
+    Args:
+        snapshot_id: Snapshot ID
+        asof: Snapshot asof (UTC)
+        payload: Snapshot payload dict with 'universe' ({symbol, market, score})
+
+    Returns:
+        List of row dicts (snapshot_id, market, symbol, asof, score)
+    """
+    rows = {}
+    for entry in payload.get('universe') or []:
+        key = (entry.get('market'), entry.get('symbol'))
+        # symbol/market이 없는 항목과 중복 항목(첫 항목 유지)은 제외
+        if None in key or key in rows:
+            continue
+        score = entry.get('score')
+        rows[key] = {
+            'snapshot_id': snapshot_id,
+            'market': key[0],
+            'symbol': key[1],
+            'asof': asof,
+            'score': float(score) if isinstance(score, (int, float)) else None,
+        }
+    return list(rows.values())
+
+
+def build_constituents(snapshot: Snapshot) -> List[SnapshotConstituent]:
+    """
+    Build (unsaved) SnapshotConstituent rows for a flushed Snapshot.
+
+    Args:
+        snapshot: Snapshot with snapshot_id, asof and payload_json set
+
+    Returns:
+        List of SnapshotConstituent objects (not added to session)
+    """
+    return [
+        SnapshotConstituent(**row)
+        for row in build_constituent_rows(snapshot.snapshot_id, snapshot.asof, snapshot.payload_json)
+    ]
+
+
+def backfill_snapshot_constituents(
+    engine,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    Fill snapshot_constituents for snapshots saved before the table existed (idempotent).
+
+    Snapshots are read in keyset batches (one transaction each); snapshots
+    that already have constituent rows are skipped.
+
+    Args:
+        engine: SQLAlchemy engine
+        batch_size: Snapshots per transaction
+        progress: Optional callback with the number of snapshots processed so far
+
+    Returns:
+        Number of inserted constituent rows
+    """
+    has_constituents = select(SnapshotConstituent.snapshot_id).where(
+        SnapshotConstituent.snapshot_id == Snapshot.snapshot_id
+    ).exists()
+
+    inserted = 0
+    processed = 0
+    after = 0
+    while True:
+        with engine.begin() as conn:
+            snapshots = conn.execute(
+                select(Snapshot.snapshot_id, Snapshot.asof, Snapshot.payload_json)
+                .where(Snapshot.snapshot_id > after, ~has_constituents)
+                .order_by(Snapshot.snapshot_id)
+                .limit(batch_size)
+            ).all()
+            if not snapshots:
+                break
+
+            rows = []
+            for snapshot_id, asof, payload in snapshots:
+                rows.extend(build_constituent_rows(snapshot_id, asof, payload))
+            if rows:
+                conn.execute(insert(SnapshotConstituent), rows)
+            inserted += len(rows)
+            after = snapshots[-1][0]
+        processed += len(snapshots)
+        if progress:
+            progress(processed)
+
+    return inserted
+
+
+def get_score_history(
+    session: Session,
+    symbol: str,
+    market: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get a symbol's score over time (index range scan on symbol, asof).
+
+    Args:
+        session: Database session
+        symbol: Symbol
+        market: Optional market filter (KR/US)
+        since: Optional inclusive lower asof bound
+        until: Optional exclusive upper asof bound
+
+    Returns:
+        List of dicts with snapshot_id, asof, market, score (oldest first)
+    """
+    query = (
+        select(
+            SnapshotConstituent.snapshot_id,
+            SnapshotConstituent.asof,
+            SnapshotConstituent.market,
+            SnapshotConstituent.score,
+        )
+        .where(SnapshotConstituent.symbol == symbol)
+        .order_by(SnapshotConstituent.asof, SnapshotConstituent.snapshot_id)
+    )
+    if market:
+        query = query.where(SnapshotConstituent.market == market)
+    if since is not None:
+        query = query.where(SnapshotConstituent.asof >= since)
+    if until is not None:
+        query = query.where(SnapshotConstituent.asof < until)
+    return [dict(row._mapping) for row in session.execute(query)]
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    if value is None:
+        return None
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed.astimezone(timezone.utc) if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse CLI arguments"""
+    parser = argparse.ArgumentParser(
+        prog="python -m kis.storage.snapshot_constituents",
+        description="Backfill normalized snapshot constituents and query per-symbol score history"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    backfill = subparsers.add_parser("backfill", help="Fill snapshot_constituents for existing snapshots")
+    backfill.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Snapshots per transaction (default: {DEFAULT_BATCH_SIZE})"
+    )
+
+    history = subparsers.add_parser("history", help="Print a symbol's score over time")
+    history.add_argument("symbol", help="Symbol (e.g. 005930.KS)")
+    history.add_argument("--market", default=None, help="Market filter (KR/US)")
+    history.add_argument("--since", default=None, help="Inclusive start (ISO 8601)")
+    history.add_argument("--until", default=None, help="Exclusive end (ISO 8601)")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main CLI entry point"""
+    # Local import: kis.storage.init_db imports this module
+    from kis.storage.init_db import DATABASE_URL
+
+    args = parse_args(argv)
+    database_url = os.getenv("DATABASE_URL", DATABASE_URL)
+    engine = create_storage_engine(database_url)
+
+    try:
+        if args.command == "backfill":
+            inserted = backfill_snapshot_constituents(engine, batch_size=max(1, args.batch_size))
+            print(f"Backfilled snapshot_constituents: {inserted} rows")
+            return 0
+
+        since, until = _parse_time(args.since), _parse_time(args.until)
+        with Session(engine) as session:
+            for row in get_score_history(session, args.symbol, args.market, since, until):
+                score = "-" if row['score'] is None else f"{row['score']:g}"
+                print(f"{row['asof']}  snapshot {row['snapshot_id']:>6}  {row['market']}  {score}")
+        return 0
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    finally:
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,92 @@
+"""Snapshot content hashing and content_hash backfill for snapshot deduplication"""
+
+import hashlib
+import json
+from typing import Dict, Any, Callable, Optional
+
+from sqlalchemy import bindparam, select, update
+
+from kis.storage.models import Snapshot
+
+
+# snapshot payload가 크므로 batch당 snapshot 수를 작게 유지
+DEFAULT_BATCH_SIZE = 20
+
+
+def get_snapshot_content_hash(payload_data: Dict[str, Any]) -> str:
+    """
+    Calculate SHA256 hash of canonical snapshot payload JSON.
+
+    Uses the same canonicalization as get_config_hash (sorted keys).
+
+    Args:
+        payload_data: Snapshot payload dict (asof as ISO string)
+
+    Returns:
+        SHA256 hash as hex string (64 characters)
+    """
+    canonical = json.dumps(payload_data, sort_keys=True)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def backfill_snapshot_content_hashes(
+    engine,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    progress: Optional[Callable[[int], None]] = None
+) -> int:
+    """
+    Fill snapshots.content_hash for snapshots saved before the column existed (idempotent).
+
+    Snapshots without a hash are read in keyset batches (one transaction
+    each). content_hash is unique, so a snapshot whose content was already
+    stored under an earlier snapshot_id keeps a NULL hash; save_snapshot
+    then deduplicates new copies against the earliest one.
+
+    Args:
+        engine: SQLAlchemy engine
+        batch_size: Snapshots per transaction
+        progress: Optional callback with the number of snapshots processed so far
+
+    Returns:
+        Number of updated rows
+    """
+    statement = (
+        update(Snapshot)
+        .where(Snapshot.snapshot_id == bindparam('b_snapshot_id'))
+        .values(content_hash=bindparam('b_content_hash'))
+    )
+
+    updated = 0
+    processed = 0
+    after = 0
+    while True:
+        with engine.begin() as conn:
+            snapshots = conn.execute(
+                select(Snapshot.snapshot_id, Snapshot.payload_json)
+                .where(Snapshot.content_hash.is_(None), Snapshot.snapshot_id > after)
+                .order_by(Snapshot.snapshot_id)
+                .limit(batch_size)
+            ).all()
+            if not snapshots:
+                break
+
+            hashes = {snapshot_id: get_snapshot_content_hash(payload) for snapshot_id, payload in snapshots}
+            taken = set(conn.execute(
+                select(Snapshot.content_hash).where(Snapshot.content_hash.in_(set(hashes.values())))
+            ).scalars())
+            rows = []
+            for snapshot_id, content_hash in hashes.items():
+                # 이전 snapshot과 content가 같은 중복 row는 NULL로 유지
+                if content_hash in taken:
+                    continue
+                taken.add(content_hash)
+                rows.append({'b_snapshot_id': snapshot_id, 'b_content_hash': content_hash})
+            if rows:
+                conn.execute(statement, rows)
+            updated += len(rows)
+            after = snapshots[-1][0]
+        processed += len(snapshots)
+        if progress:
+            progress(processed)
+
+    return updated
@@ -0,0 +1,79 @@
+"""Tests for Bench module - synthetic universes, engine and storage benchmark CLIs"""
+
+import json
+import pytest
+
+from kis.bench.synthetic import generate_snapshot, generate_universe, parse_size
+from kis.bench.engine import compare_results, main
+from kis.bench import storage as storage_bench
+from kis.engine.proposal import create_proposal
+from kis.engine.run import PHASE0_CONFIG
+
+
+def test_synthetic_universe_generator():
+    """Test 1: 규모/market 비율/재현성 및 create_proposal 입력 호환"""
+    assert [parse_size(s) for s in ("1k", "10k", "100k", "2500")] == [1000, 10000, 100000, 2500]
+    with pytest.raises(ValueError):
+        parse_size("ten")
+
+    universe = generate_universe(1000, kr_ratio=0.25, seed=7, missing_score_ratio=0.1)
+    assert len(universe) == 1000
+    assert sum(1 for s in universe if s['market'] == 'KR') == 250
+    assert len({s['symbol'] for s in universe}) == 1000
+    assert any(s['score'] is None for s in universe)
+    assert universe == generate_universe(1000, kr_ratio=0.25, seed=7, missing_score_ratio=0.1)
+
+    proposal = create_proposal(generate_snapshot(1000, seed=1), PHASE0_CONFIG)
+    assert proposal['constraints_check']['passed'] is True
+
+    with pytest.raises(ValueError, match="kr_ratio"):
+        generate_universe(10, kr_ratio=1.5)
+
+
+def test_engine_benchmark_cli_writes_results(tmp_path, capsys):
+    """Test 2: 벤치마크 결과 JSON 기록 및 baseline 대비 regression 비교"""
+    output = tmp_path / "bench.json"
+    exit_code = main([
+        "--sizes", "1k", "--kr-ratio", "0.4", "--kr-ratio", "0.6",
+        "--repeat", "2", "--output", str(output)
+    ])
+    assert exit_code == 0
+
+    results = json.loads(output.read_text(encoding='utf-8'))
+    assert results['meta']['repeat'] == 2
+    assert [(c['size'], c['kr_ratio']) for c in results['cases']] == [(1000, 0.4), (1000, 0.6)]
+    for case in results['cases']:
+        assert set(case['latency']) == {'create_proposal', 'columnar', 'persist'}
+        assert case['latency']['persist']['runs'] == 2
+        assert case['memory_peak_bytes']['create_proposal'] > 0
+
+    # baseline보다 2배 느린 결과는 regression
+    slower = json.loads(json.dumps(results))
+    for case in slower['cases']:
+        case['latency']['columnar']['median_ms'] *= 2
+    regressions = compare_results(results, slower, threshold=0.2)
+    assert len(regressions) == 2
+    assert all(r.startswith("columnar size=1000") for r in regressions)
+    assert compare_results(results, results) == []
+
+
+def test_storage_benchmark_cli_reports_encodings(tmp_path):
+    """Test 3: payload encoding별 크기/로드 시간 기록 (json 대비 비율, 미설치 encoding은 skip)"""
+    output = tmp_path / "bench_storage.json"
+    exit_code = storage_bench.main([
+        "--sizes", "1k", "--encoding", "zlib", "--encoding", "zstd",
+        "--rows", "3", "--repeat", "2", "--output", str(output)
+    ])
+    assert exit_code == 0
+
+    results = json.loads(output.read_text(encoding='utf-8'))
+    case = results['cases'][0]
+    assert case['size'] == 1000
+    # json은 비교 기준으로 항상 포함
+    assert 'json' in case['results'] and 'zlib' in case['results']
+    assert case['results']['zlib']['latency']['load']['runs'] == 2
+    assert case['vs_json']['zlib']['size_ratio'] < 0.5
+    if results['meta']['available_encodings']['zstd']:
+        assert 'zstd' in case['results']
+    else:
+        assert case['skipped'] == ['zstd']
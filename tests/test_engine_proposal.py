@@ -9,6 +9,7 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
 from kis.storage.init_db import init_database
+from kis.storage.migrations import LATEST_SCHEMA_VERSION
 from kis.storage.models import Snapshot, Proposal, EventLog, SchemaVersion, ProposalStatus
 from kis.engine.sample_data import load_sample_snapshot
 from kis.engine.proposal import create_proposal
@@ -156,7 +157,7 @@ def test_proposal_save_fields(sample_snapshot_data, temp_db):
         assert len(saved_proposal.config_hash) == 64  # SHA256 hex length
         assert saved_proposal.git_commit_sha is not None
         assert saved_proposal.schema_version is not None
-        assert saved_proposal.schema_version == "0.1.0"  # From init_db
+        assert saved_proposal.schema_version == LATEST_SCHEMA_VERSION  # From init_db migrations
         assert saved_proposal.status == ProposalStatus.PENDING
         
         # Verify payload_json
@@ -266,3 +267,611 @@ def test_proposal_insufficient_stocks():
     with pytest.raises(ValueError, match="Insufficient US stocks"):
         create_proposal(insufficient_us_snapshot, PHASE0_CONFIG)
 
+
+
+def _assert_same_proposal(expected, actual):
+    """Compare two proposal payloads (correlation_id excluded)"""
+    assert [(p['symbol'], p['market']) for p in actual['positions']] == \
+        [(p['symbol'], p['market']) for p in expected['positions']]
+    for exp_pos, act_pos in zip(expected['positions'], actual['positions']):
+        assert act_pos['weight'] == pytest.approx(exp_pos['weight'], abs=1e-12)
+
+    assert actual['constraints_check'].keys() == expected['constraints_check'].keys()
+    for key, value in expected['constraints_check'].items():
+        assert actual['constraints_check'][key] == pytest.approx(value, abs=1e-12), key
+
+
+def test_columnar_proposal_parity_sample(sample_snapshot_data):
+    """Test 6: columnar 엔진이 샘플 데이터에서 create_proposal과 동일한 결과를 생성"""
+    from kis.engine.columnar import create_proposal_columnar
+
+    expected = create_proposal(sample_snapshot_data, PHASE0_CONFIG)
+    actual = create_proposal_columnar(sample_snapshot_data, PHASE0_CONFIG)
+
+    _assert_same_proposal(expected, actual)
+    assert actual['constraints_check']['passed'] is True
+    assert isinstance(actual['positions'][0]['weight'], float)
+
+
+def test_columnar_proposal_parity_large_universe():
+    """Test 7: 동점/score 누락이 섞인 대규모 universe에서 columnar 엔진 parity"""
+    import random
+    from kis.engine.columnar import create_proposal_columnar, UniverseColumns
+
+    rng = random.Random(42)
+    universe = []
+    for i in range(5000):
+        market = 'KR' if i % 3 == 0 else 'US'
+        roll = rng.random()
+        if roll < 0.05:
+            score = None
+        elif roll < 0.5:
+            score = rng.randint(90, 100)  # 동점 다수
+        else:
+            score = rng.uniform(-10, 100)
+        universe.append({"symbol": f"SYM{rng.randint(0, 10**6):07d}", "market": market, "score": score})
+    snapshot = {'asof': datetime.now(timezone.utc), 'source': 'test', 'universe': universe}
+
+    expected = create_proposal(snapshot, PHASE0_CONFIG)
+    _assert_same_proposal(expected, create_proposal_columnar(snapshot, PHASE0_CONFIG))
+
+    # 미리 만든 columns 재사용
+    columns = UniverseColumns.from_snapshot(snapshot)
+    _assert_same_proposal(expected, create_proposal_columnar(columns, PHASE0_CONFIG))
+
+
+def test_columnar_proposal_insufficient_stocks():
+    """Test 8: columnar 엔진도 부족 데이터 시 동일한 에러"""
+    from kis.engine.columnar import create_proposal_columnar
+
+    snapshot = {
+        'asof': datetime.now(timezone.utc),
+        'source': 'test',
+        'universe': [{"symbol": f"{i:06d}.KS", "market": "KR", "score": i} for i in range(5)]
+    }
+
+    with pytest.raises(ValueError, match="Insufficient US stocks"):
+        create_proposal_columnar(snapshot, PHASE0_CONFIG)
+
+
+def test_create_proposals_batch_persists_all(sample_snapshot_data, temp_db):
+    """Test 9: 여러 snapshot x config 배치 생성 및 단일 트랜잭션 저장"""
+    from kis.engine.run import create_proposals_batch, get_config_hash
+
+    second_snapshot = dict(sample_snapshot_data, source='sample-2')
+    alt_config = dict(PHASE0_CONFIG, variant="alt")
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    try:
+        results = create_proposals_batch(
+            [sample_snapshot_data, second_snapshot],
+            [PHASE0_CONFIG, alt_config],
+            session=session
+        )
+
+        assert len(results) == 4
+        assert [(r['snapshot_index'], r['config_index']) for r in results] == [(0, 0), (0, 1), (1, 0), (1, 1)]
+
+        assert session.query(Snapshot).count() == 2
+        assert session.query(Proposal).count() == 4
+        assert session.query(EventLog).filter_by(event_type="proposal_created").count() == 4
+
+        for result in results:
+            proposal = session.query(Proposal).filter_by(proposal_id=result['proposal_id']).one()
+            assert proposal.universe_snapshot_id == result['snapshot_id']
+            assert proposal.payload_json['correlation_id'] == result['proposal']['correlation_id']
+            expected_config = [PHASE0_CONFIG, alt_config][result['config_index']]
+            assert proposal.config_hash == get_config_hash(expected_config)
+    finally:
+        session.close()
+
+
+def test_engine_cli_batch_reports_throughput(sample_snapshot_path, temp_db, tmp_path, monkeypatch, capsys):
+    """Test 10: CLI 배치 모드 실행 시 proposals/sec 출력 (JSON/NDJSON snapshot 파일)"""
+    import json
+    from kis.engine.run import main
+
+    # 같은 snapshot의 NDJSON 버전
+    sample = json.loads(sample_snapshot_path.read_text(encoding="utf-8"))
+    ndjson_path = tmp_path / "sample_snapshot.ndjson"
+    with open(ndjson_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"asof": sample["asof"], "source": sample["source"]}) + "\n")
+        for stock in sample["universe"]:
+            f.write(json.dumps(stock) + "\n")
+
+    monkeypatch.setenv("DATABASE_URL", temp_db)
+    for extra_args in ([], ["--workers", "2"]):
+        exit_code = main([str(sample_snapshot_path), str(ndjson_path)] + extra_args)
+        assert exit_code == 0
+        assert "proposals/sec" in capsys.readouterr().out
+
+    engine = create_engine(temp_db)
+    session = sessionmaker(bind=engine)()
+    try:
+        proposals = session.query(Proposal).all()
+        assert len(proposals) == 4
+        assert len({p.payload_json['correlation_id'] for p in proposals}) == 4
+        assert len({tuple(pos['symbol'] for pos in p.payload_json['positions']) for p in proposals}) == 1
+    finally:
+        session.close()
+
+
+def test_parallel_runner_from_files_and_snapshot_ids(sample_snapshot_path, temp_db, monkeypatch):
+    """Test 11: process pool 병렬 실행 - 파일당 1회 파싱/저장, config별 오류는 결과로 수집, 단일 writer로 저장"""
+    from kis.engine import parallel
+    from kis.engine.parallel import run_parallel, parse_snapshot_ids
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    saved = []
+    save_snapshot = parallel.save_snapshot
+
+    def counting_save_snapshot(session, snapshot_data):
+        saved.append(snapshot_data['source'])
+        return save_snapshot(session, snapshot_data)
+
+    monkeypatch.setattr(parallel, "save_snapshot", counting_save_snapshot)
+    alt_config = dict(PHASE0_CONFIG, kr_target_weight=0.5, us_target_weight=0.5)
+    infeasible_config = dict(PHASE0_CONFIG, max_weight_per_position=0.01)
+
+    try:
+        results = run_parallel(
+            session,
+            [PHASE0_CONFIG, alt_config, infeasible_config],
+            workers=2,
+            snapshot_files=[str(sample_snapshot_path)] * 3 + [str(sample_snapshot_path.parent / "missing.json")]
+        )
+        created = [r for r in results if "error" not in r]
+        failed = [r for r in results if "error" in r]
+        assert len(created) == 6
+        assert sorted(r['config_index'] for r in failed) == [0, 1, 2, 2, 2, 2]
+        assert len(saved) == 3  # config 수와 무관하게 파일당 1회
+        assert session.query(Proposal).count() == 6
+        assert session.query(EventLog).filter_by(event_type="proposal_created").count() == 6
+
+        snapshot_ids = sorted({r['snapshot_id'] for r in created})
+        rerun = run_parallel(
+            session,
+            [PHASE0_CONFIG],
+            workers=2,
+            snapshot_ids=snapshot_ids + [9999],
+            database_url=temp_db
+        )
+        assert sorted(r['snapshot_id'] for r in rerun if "error" not in r) == snapshot_ids
+        assert [r['source'] for r in rerun if "error" in r] == ["snapshot:9999"]
+        assert session.query(Proposal).count() == 6 + len(snapshot_ids)
+        for result in rerun:
+            if "error" not in result:
+                assert result['proposal']['constraints_check']['passed'] is True
+    finally:
+        session.close()
+
+    assert parse_snapshot_ids("3,5,8-10") == [3, 5, 8, 9, 10]
+    with pytest.raises(ValueError):
+        parse_snapshot_ids(",")
+
+
+def test_streaming_loader_and_proposal(tmp_path, sample_snapshot_path):
+    """Test 12: 스트리밍 로더(JSON/NDJSON) + bounded top-k Proposal이 create_proposal과 동일"""
+    import json
+    import random
+    from kis.engine.sample_data import open_snapshot_stream
+    from kis.engine.streaming import create_proposal_streaming
+
+    rng = random.Random(7)
+    universe = [
+        {
+            "symbol": f"S{i:05d}",
+            "market": "KR" if i % 4 == 0 else "US",
+            "score": None if i % 17 == 0 else rng.randint(0, 50) + rng.random() * 1e-3
+        }
+        for i in range(3000)
+    ]
+
+    # universe가 asof/source보다 먼저 나오는 JSON (헤더 검증을 위해 universe 건너뛰기)
+    json_path = tmp_path / "snapshot.json"
+    json_path.write_text(json.dumps({"universe": universe, "asof": "2025-12-18T00:00:00Z", "source": "vendor"}))
+
+    ndjson_path = tmp_path / "snapshot.ndjson"
+    with open(ndjson_path, "w", encoding="utf-8") as f:
+        f.write(json.dumps({"asof": "2025-12-18T00:00:00Z", "source": "vendor"}) + "\n")
+        for stock in universe:
+            f.write(json.dumps(stock) + "\n")
+
+    expected = create_proposal({"universe": universe}, PHASE0_CONFIG)
+
+    for path in (json_path, ndjson_path):
+        # 작은 chunk로 경계 처리를 검증
+        stream = open_snapshot_stream(str(path), chunk_size=97)
+        assert stream.source == "vendor"
+        assert stream.asof == datetime(2025, 12, 18, tzinfo=timezone.utc)
+        assert list(stream.iter_universe()) == universe
+
+        actual = create_proposal_streaming(stream, PHASE0_CONFIG)
+        assert actual['positions'] == expected['positions']
+        assert actual['constraints_check'] == expected['constraints_check']
+
+    # 기존 샘플 파일도 스트리밍 로더로 동일하게 읽힘
+    stream = open_snapshot_stream(str(sample_snapshot_path))
+    assert list(stream.iter_universe()) == load_sample_snapshot(str(sample_snapshot_path))['universe']
+
+
+def test_streaming_loader_validates_header(tmp_path):
+    """Test 13: 스트리밍 로더가 asof/source 누락을 먼저 검증"""
+    import json
+    from kis.engine.sample_data import open_snapshot_stream
+
+    missing_source = tmp_path / "missing_source.json"
+    missing_source.write_text(json.dumps({"asof": "2025-12-18T00:00:00Z", "universe": []}))
+    with pytest.raises(ValueError, match="source"):
+        open_snapshot_stream(str(missing_source))
+
+    bad_asof = tmp_path / "bad_asof.ndjson"
+    bad_asof.write_text(json.dumps({"asof": "not-a-date", "source": "x"}) + "\n")
+    with pytest.raises(ValueError, match="Invalid asof format"):
+        open_snapshot_stream(str(bad_asof))
+
+
+def test_save_snapshot_deduplicates_identical_content(sample_snapshot_data, temp_db):
+    """Test 14: 동일 content snapshot은 기존 snapshot_id 재사용 (content_hash)"""
+    from kis.engine.run import get_snapshot_content_hash, create_proposals_batch
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    try:
+        first_id = save_snapshot(session, sample_snapshot_data)
+        second_id = save_snapshot(session, dict(sample_snapshot_data))
+        assert second_id == first_id
+        assert session.query(Snapshot).count() == 1
+
+        saved = session.query(Snapshot).filter_by(snapshot_id=first_id).one()
+        assert saved.content_hash == get_snapshot_content_hash(saved.payload_json)
+
+        # 내용이 다르면 새 snapshot
+        changed = dict(sample_snapshot_data, source='sample-2')
+        assert save_snapshot(session, changed) != first_id
+
+        # 배치 저장도 기존/배치 내 중복을 재사용
+        results = create_proposals_batch(
+            [sample_snapshot_data, changed, sample_snapshot_data],
+            [PHASE0_CONFIG],
+            session=session
+        )
+        assert session.query(Snapshot).count() == 2
+        assert results[0]['snapshot_id'] == first_id
+        assert results[2]['snapshot_id'] == first_id
+    finally:
+        session.close()
+
+
+def test_provenance_resolved_once_per_process(sample_snapshot_data, temp_db, monkeypatch):
+    """Test 15: build SHA/config hash/schema version은 프로세스당 1회만 계산"""
+    import subprocess
+    import kis.engine.provenance as provenance_module
+    from kis.engine.provenance import ProvenanceContext, get_config_hash
+
+    calls = []
+    real_run = subprocess.run
+
+    def counting_run(*args, **kwargs):
+        calls.append(args)
+        return real_run(*args, **kwargs)
+
+    monkeypatch.delenv("BUILD_VERSION", raising=False)
+    monkeypatch.setattr(provenance_module, "BUILD_VERSION_FILE", Path(temp_db.replace("sqlite:///", "") + ".missing"))
+    monkeypatch.setattr(provenance_module.subprocess, "run", counting_run)
+    monkeypatch.setattr(provenance_module, "_provenance", ProvenanceContext())
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    try:
+        snapshot_id = save_snapshot(session, sample_snapshot_data)
+        proposal_ids = [
+            save_proposal(session, create_proposal(sample_snapshot_data, PHASE0_CONFIG), snapshot_id, PHASE0_CONFIG)
+            for _ in range(3)
+        ]
+        assert len(calls) == 1
+
+        proposals = session.query(Proposal).filter(Proposal.proposal_id.in_(proposal_ids)).all()
+        assert {p.config_hash for p in proposals} == {get_config_hash(PHASE0_CONFIG)}
+        assert {p.schema_version for p in proposals} == {LATEST_SCHEMA_VERSION}
+    finally:
+        session.close()
+
+    # BUILD_VERSION 환경변수가 있으면 git을 호출하지 않음
+    monkeypatch.setenv("BUILD_VERSION", "build-1234")
+    context = ProvenanceContext()
+    assert context.git_commit_sha == "build-1234"
+    assert len(calls) == 1
+
+    # 변경된 config는 다시 해시
+    config = dict(PHASE0_CONFIG)
+    first_hash = context.config_hash(config)
+    config["phase"] = 1
+    assert context.config_hash(config) != first_hash
+
+
+def test_incremental_engine_matches_full_recompute():
+    """Test 16: 증분 엔진 결과가 매 delta마다 전체 재계산과 동일 + position diff"""
+    import random
+    from kis.engine.incremental import IncrementalProposalEngine
+
+    rng = random.Random(11)
+    universe = {
+        f"S{i:04d}": {"symbol": f"S{i:04d}", "market": "KR" if i % 2 else "US", "score": rng.randint(0, 30)}
+        for i in range(400)
+    }
+
+    engine = IncrementalProposalEngine(PHASE0_CONFIG)
+    baseline = engine.load_snapshot({'universe': list(universe.values())})
+    assert baseline['proposal']['positions'] == create_proposal({'universe': list(universe.values())})['positions']
+    assert len(baseline['diff']['added']) == 13
+
+    next_id = 400
+    for _ in range(200):
+        symbols = list(universe)
+        removed = rng.sample(symbols, rng.randint(0, 2))
+        rescored = {s: rng.choice([None, rng.randint(0, 40)]) for s in rng.sample(symbols, 5) if s not in removed}
+        added = []
+        for _ in range(rng.randint(0, 2)):
+            stock = {"symbol": f"S{next_id:04d}", "market": rng.choice(["KR", "US"]), "score": rng.randint(0, 40)}
+            next_id += 1
+            added.append(stock)
+
+        previous_positions = engine.last_proposal['positions']
+        result = engine.apply_delta(added=added, removed=removed, rescored=rescored)
+
+        for symbol in removed:
+            del universe[symbol]
+        for symbol, score in rescored.items():
+            universe[symbol] = dict(universe[symbol], score=score)
+        for stock in added:
+            universe[stock['symbol']] = stock
+
+        expected = create_proposal({'universe': list(universe.values())}, PHASE0_CONFIG)
+        assert result['proposal']['positions'] == expected['positions']
+
+        previous_symbols = {p['symbol'] for p in previous_positions}
+        current_symbols = {p['symbol'] for p in expected['positions']}
+        assert {p['symbol'] for p in result['diff']['added']} == current_symbols - previous_symbols
+        assert {p['symbol'] for p in result['diff']['removed']} == previous_symbols - current_symbols
+
+    with pytest.raises(ValueError, match="Unknown symbol"):
+        engine.apply_delta(removed=["NOPE"])
+
+    # 거부된 delta는 books에 일부도 반영되지 않음 (다음 Proposal 불변)
+    last_positions = engine.last_proposal['positions']
+    top_symbol = last_positions[0]['symbol']
+    kr_symbols = [symbol for symbol, stock in universe.items() if stock['market'] == "KR"]
+    with pytest.raises(ValueError, match="Unknown symbol"):
+        engine.apply_delta(
+            added=[{"symbol": "NEW1", "market": "KR", "score": 1000}],
+            removed=[top_symbol],
+            rescored={"NOPE": 1}
+        )
+    with pytest.raises(ValueError, match="Insufficient KR"):
+        engine.apply_delta(removed=kr_symbols)
+    result = engine.apply_delta()
+    assert result['proposal']['positions'] == last_positions
+    assert result['diff'] == {'added': [], 'removed': [], 'changed': []}
+
+
+def test_allocator_water_fill_and_config():
+    """Test 17: score 비례 water-filling 배분, config 제약 반영, 불가능한 config 거부"""
+    import time
+    import numpy as np
+    from kis.engine.allocator import AllocationSpec, water_fill
+    from kis.engine.columnar import create_proposal_columnar
+
+    # 상한 초과분이 나머지에 비례 재분배됨
+    weights = water_fill(np.array([100.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]), 0.6, 0.08)
+    assert weights.sum() == pytest.approx(0.6, abs=1e-12)
+    assert weights.max() <= 0.08 + 1e-12
+    assert weights[0] == pytest.approx(0.08)
+
+    weights = water_fill(np.array([5.0, 4.0, 3.0, 2.0, 1.0, 1.0, 1.0, 1.0, 1.0, 1.0]), 0.6, 0.08)
+    assert weights.sum() == pytest.approx(0.6, abs=1e-12)
+    assert np.all(np.diff(weights) <= 1e-12)
+
+    universe = (
+        [{"symbol": f"K{i:02d}", "market": "KR", "score": 100 - i} for i in range(10)] +
+        [{"symbol": f"U{i:02d}", "market": "US", "score": 1 + i % 4} for i in range(15)]
+    )
+    config = dict(PHASE0_CONFIG, kr_positions=6, us_positions=10, max_weight_per_position=0.1)
+    proposal = create_proposal({'universe': universe}, config)
+    us_weights = [p['weight'] for p in proposal['positions'] if p['market'] == 'US']
+    assert sum(p['market'] == 'KR' for p in proposal['positions']) == 6
+    assert len(us_weights) == 10
+    assert len(set(us_weights)) > 1
+    assert proposal['constraints_check']['passed'] is True
+    assert proposal['constraints_check']['max_weight'] == 0.1
+    _assert_same_proposal(proposal, create_proposal_columnar({'universe': universe}, config))
+
+    # 동일 가중 옵션
+    equal = create_proposal({'universe': universe}, dict(PHASE0_CONFIG, weighting="equal"))
+    assert {round(p['weight'], 12) for p in equal['positions'] if p['market'] == 'KR'} == {0.08}
+
+    with pytest.raises(ValueError, match="Infeasible KR allocation"):
+        AllocationSpec.from_config(dict(PHASE0_CONFIG, kr_positions=4))
+    with pytest.raises(ValueError, match="Too many positions"):
+        AllocationSpec.from_config(dict(PHASE0_CONFIG, us_positions=16))
+
+    # 수천 개 후보 배분
+    raw = np.random.default_rng(3).uniform(1, 100, 5000)
+    water_fill(raw, 0.6, 0.0005)
+    start = time.perf_counter()
+    for _ in range(100):
+        weights = water_fill(raw, 0.6, 0.0005)
+    elapsed = (time.perf_counter() - start) / 100
+    assert weights.sum() == pytest.approx(0.6, abs=1e-9)
+    assert weights.max() <= 0.0005 + 1e-12
+    assert elapsed < 0.01
+
+
+def test_replay_verifies_stored_proposals(sample_snapshot_data, temp_db, monkeypatch, capsys):
+    """Test 18: 저장된 snapshot/config로 Proposal 재생성 후 position 단위 검증"""
+    from kis.engine.replay import run_replay, main
+    from kis.engine.provenance import get_config_hash
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    equal_config = dict(PHASE0_CONFIG, weighting="equal")
+
+    try:
+        proposal_ids = []
+        for i in range(3):
+            snapshot_data = dict(sample_snapshot_data, source=f"replay-{i}")
+            snapshot_id = save_snapshot(session, snapshot_data)
+            for config in (PHASE0_CONFIG, equal_config):
+                proposal_ids.append(
+                    save_proposal(session, create_proposal(snapshot_data, config), snapshot_id, config)
+                )
+        assert session.get(Proposal, proposal_ids[1]).config_json == equal_config
+
+        # config_json이 없는 기존 row: PHASE0_CONFIG는 config_hash로 해석, 그 외는 unresolved
+        session.get(Proposal, proposal_ids[2]).config_json = None
+        session.get(Proposal, proposal_ids[3]).config_json = None
+        # 저장된 결과 변조
+        tampered = session.get(Proposal, proposal_ids[4])
+        payload = dict(tampered.payload_json)
+        payload['positions'] = [dict(p) for p in payload['positions']]
+        payload['positions'][0]['weight'] += 0.001
+        tampered.payload_json = payload
+
+        # weighting이 config에 들어가기 전 row: 예전 PHASE0 hash + 균등 가중 결과
+        legacy_config = {k: v for k, v in PHASE0_CONFIG.items() if k != "weighting"}
+        assert get_config_hash(legacy_config) != get_config_hash(PHASE0_CONFIG)
+        legacy_id = save_proposal(
+            session, create_proposal(snapshot_data, equal_config), snapshot_id, PHASE0_CONFIG
+        )
+        legacy = session.get(Proposal, legacy_id)
+        legacy.config_hash = get_config_hash(legacy_config)
+        legacy.config_json = None
+        session.commit()
+    finally:
+        session.close()
+
+    summary = run_replay(temp_db, workers=2, chunk_size=1)
+    assert summary['total'] == 7
+    assert summary['snapshots'] == 3
+    assert summary['counts'] == {'match': 5, 'mismatch': 1, 'error': 0, 'unresolved_config': 1}
+    by_id = {r['proposal_id']: r for r in summary['results']}
+    assert by_id[proposal_ids[3]]['status'] == 'unresolved_config'
+    assert by_id[proposal_ids[4]]['status'] == 'mismatch'
+    assert 'weight' in by_id[proposal_ids[4]]['mismatches'][0]
+
+    # snapshot 범위 지정 + columnar 엔진으로 검증
+    first_snapshot = by_id[proposal_ids[0]]['snapshot_id']
+    summary = run_replay(temp_db, snapshot_ids=[first_snapshot], engine_name='columnar')
+    assert summary['counts']['match'] == 2
+
+    monkeypatch.setenv("DATABASE_URL", temp_db)
+    assert main(["--snapshot-ids", str(first_snapshot)]) == 0
+    assert main([]) == 1
+    assert "mismatched: 1" in capsys.readouterr().out
+    assert by_id[legacy_id]['status'] == 'match'
+
+
+def test_proposal_positions_saved_backfilled_and_queried(sample_snapshot_data, temp_db):
+    """Test 19: 저장 시 proposal_positions 기록, 기존 proposal backfill, SQL exposure 조회"""
+    from kis.storage.models import ProposalPosition
+    from kis.storage.proposal_positions import (
+        backfill_proposal_positions,
+        get_proposals_holding,
+        get_symbol_exposure,
+    )
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    try:
+        snapshot_id = save_snapshot(session, sample_snapshot_data)
+        proposal_data = create_proposal(sample_snapshot_data, PHASE0_CONFIG)
+        proposal_id = save_proposal(session, proposal_data, snapshot_id, PHASE0_CONFIG)
+
+        stored = {
+            (p.market, p.symbol): p.weight
+            for p in session.query(ProposalPosition).filter_by(proposal_id=proposal_id)
+        }
+        assert stored == {(p['market'], p['symbol']): p['weight'] for p in proposal_data['positions']}
+
+        # 테이블 도입 이전에 저장된 proposal: positions 삭제 후 backfill
+        session.query(ProposalPosition).delete()
+        session.commit()
+        assert backfill_proposal_positions(engine, batch_size=1) == len(proposal_data['positions'])
+        assert backfill_proposal_positions(engine) == 0
+        assert session.query(ProposalPosition).count() == len(proposal_data['positions'])
+
+        top = max(proposal_data['positions'], key=lambda p: p['weight'])
+        holding = get_proposals_holding(session, top['symbol'], min_weight=top['weight'])
+        assert [(row['proposal_id'], row['weight']) for row in holding] == [(proposal_id, top['weight'])]
+        assert get_proposals_holding(session, top['symbol'], min_weight=top['weight'] + 0.01) == []
+        assert get_proposals_holding(session, top['symbol'], statuses=[ProposalStatus.APPROVED]) == []
+
+        exposure = get_symbol_exposure(session)
+        assert len(exposure) == len(proposal_data['positions'])
+        assert exposure[0]['total_weight'] == pytest.approx(top['weight'])
+        assert exposure[0]['proposals'] == 1
+    finally:
+        session.close()
+
+
+def test_snapshot_constituents_history_and_deferred_payload(sample_snapshot_data, temp_db):
+    """Test 20: snapshot_constituents 기록/backfill, symbol별 score 이력, payload_json 지연 로드"""
+    from sqlalchemy import inspect as sa_inspect
+    from kis.storage.models import SnapshotConstituent
+    from kis.storage.snapshot_constituents import backfill_snapshot_constituents, get_score_history
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    try:
+        symbol = sample_snapshot_data['universe'][0]['symbol']
+        later = dict(
+            sample_snapshot_data,
+            asof='2025-12-19T00:00:00Z',
+            universe=[dict(entry, score=entry['score'] - 1) for entry in sample_snapshot_data['universe']]
+        )
+        first_id = save_snapshot(session, sample_snapshot_data)
+        second_id = save_snapshot(session, later)
+        universe_size = len(sample_snapshot_data['universe'])
+        assert session.query(SnapshotConstituent).count() == 2 * universe_size
+
+        history = get_score_history(session, symbol)
+        first_score = float(sample_snapshot_data['universe'][0]['score'])
+        assert [(row['snapshot_id'], row['score']) for row in history] == [
+            (first_id, first_score), (second_id, first_score - 1)
+        ]
+        since = datetime(2025, 12, 19, tzinfo=timezone.utc)
+        assert [row['snapshot_id'] for row in get_score_history(session, symbol, since=since)] == [second_id]
+
+        # 테이블 도입 이전 snapshot backfill
+        session.query(SnapshotConstituent).filter_by(snapshot_id=second_id).delete()
+        session.commit()
+        assert backfill_snapshot_constituents(engine, batch_size=1) == universe_size
+        assert backfill_snapshot_constituents(engine) == 0
+
+        # 목록 조회/Proposal.snapshot 접근 시 payload_json은 로드되지 않음
+        proposal_data = create_proposal(sample_snapshot_data, PHASE0_CONFIG)
+        proposal_id = save_proposal(session, proposal_data, first_id, PHASE0_CONFIG)
+        session.expunge_all()
+        proposal = session.get(Proposal, proposal_id)
+        assert proposal.snapshot.source == sample_snapshot_data['source']
+        assert 'payload_json' in sa_inspect(proposal.snapshot).unloaded
+        listed = session.query(Snapshot).order_by(Snapshot.snapshot_id).all()
+        assert all('payload_json' in sa_inspect(snapshot).unloaded for snapshot in listed)
+        assert listed[1].payload_json['universe'][0]['score'] == first_score - 1
+    finally:
+        session.close()
@@ -24,7 +24,11 @@ from kis.execution.app import app, broker_client as app_broker_client
 from kis.execution.broker import SpyBrokerClient
 from kis.execution.auth import create_token, calculate_token_hash
 from kis.execution.config import get_jwt_secret
-from kis.storage.session import get_db_session
+from kis.storage.async_session import (
+    get_async_db_session,
+    create_async_storage_engine,
+    create_async_session_factory
+)
 
 
 @pytest.fixture
@@ -123,16 +127,15 @@ def test_approval(temp_db, test_proposal):
 def client(temp_db):
     """Create FastAPI test client with database dependency override"""
     # Override database dependency
-    def override_get_db():
-        engine = create_engine(temp_db)
-        Session = sessionmaker(bind=engine)
-        session = Session()
+    async def override_get_db():
+        engine = create_async_storage_engine(temp_db)
         try:
-            yield session
+            async with create_async_session_factory(engine)() as session:
+                yield session
         finally:
-            session.close()
+            await engine.dispose()
     
-    app.dependency_overrides[get_db_session] = override_get_db
+    app.dependency_overrides[get_async_db_session] = override_get_db
     
     # Replace broker client with spy
     import kis.execution.app as execution_app
@@ -518,3 +521,733 @@ def test_success_case(client, test_proposal, test_approval, temp_db):
         if "EXECUTION_JWT_SECRET" in os.environ:
             del os.environ["EXECUTION_JWT_SECRET"]
 
+
+
+def test_rejection_events_batched_through_event_sink(client, test_proposal, temp_db, tmp_path):
+    """Test 7: event_sink 설정 시 거부 이벤트는 버퍼링 후 일괄 기록"""
+    import kis.execution.app as execution_app
+    from kis.storage.event_sink import EventSink
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    sink = EventSink(Session, batch_size=1000, flush_interval=60, wal_dir=str(tmp_path / "wal"))
+    execution_app.event_sink = sink
+    try:
+        for _ in range(20):
+            response = client.post("/place_order", json={"order_intent": {"symbol": "AAPL", "quantity": 10}})
+            assert response.status_code == 401
+        assert sink.pending() == 20
+    finally:
+        execution_app.event_sink = None
+        sink.close()
+
+    session = Session()
+    try:
+        assert session.query(EventLog).filter_by(event_type="order_rejected").count() == 20
+    finally:
+        session.close()
+
+
+def test_async_repository_concurrent_writes(test_proposal, temp_db):
+    """Test 8: AsyncSession 기반 repository - 동시 요청이 이벤트 루프를 막지 않고 체인 무결성 유지"""
+    import asyncio
+    from kis.execution import async_repository
+    from kis.gui.repository import AsyncProposalRepository
+    from kis.storage.event_chain import verify_chain
+
+    async def run():
+        engine = create_async_storage_engine(temp_db)
+        AsyncSessionLocal = create_async_session_factory(engine)
+
+        async def reject_once(i):
+            async with AsyncSessionLocal() as session:
+                assert await async_repository.get_kill_switch_status(session) == KillSwitchStatus.ACTIVE
+                await async_repository.log_event(session, "order_rejected", f"async-{i}", {"i": i})
+                await session.commit()
+
+        try:
+            await asyncio.gather(*(reject_once(i) for i in range(20)))
+
+            async with AsyncSessionLocal() as session:
+                repo = AsyncProposalRepository(session)
+                assert [p.proposal_id for p in await repo.get_proposals()] == [test_proposal.proposal_id]
+                approval = await repo.reject_proposal(test_proposal.proposal_id, "tester", "async test")
+                assert approval.status == ApprovalStatus.REJECTED
+                assert await repo.get_proposals() == []
+                with pytest.raises(ValueError):
+                    await repo.reject_proposal(test_proposal.proposal_id, "tester", "again")
+        finally:
+            await engine.dispose()
+
+    asyncio.run(run())
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    try:
+        assert session.query(EventLog).filter(EventLog.correlation_id.like("async-%")).count() == 20
+        assert verify_chain(session)['ok'] is True
+    finally:
+        session.close()
+
+
+def test_kill_switch_service_cache(client, test_proposal, test_approval, temp_db):
+    """Test 9: kill switch 캐시 - data_version 변경 감지, 메모리 조회로 주문 처리, stale/중단 시 ACTIVE (fail closed)"""
+    import time
+    import kis.execution.app as execution_app
+    from kis.execution.kill_switch import KillSwitchService
+    from kis.storage.factory import create_storage_engine
+
+    def wait_for(predicate, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return False
+
+    engine = create_storage_engine(temp_db)
+    service = KillSwitchService(engine, poll_interval=0.01, max_staleness=1.0)
+    try:
+        # system_state 레코드 없음 -> 기본 ACTIVE
+        assert service.get_status() == KillSwitchStatus.ACTIVE
+        assert service.metrics()['watcher'] == "sqlite_data_version"
+
+        # 다른 연결의 INACTIVE 기록을 watcher가 감지
+        writer = create_engine(temp_db)
+        Session = sessionmaker(bind=writer)
+        session = Session()
+        try:
+            session.add(SystemState(
+                timestamp=datetime.now(timezone.utc),
+                kill_switch_status=KillSwitchStatus.INACTIVE,
+                kill_switch_reason="test"
+            ))
+            session.commit()
+        finally:
+            session.close()
+        assert wait_for(lambda: service.get_status() == KillSwitchStatus.INACTIVE)
+
+        execution_app.kill_switch_service = service
+        os.environ["EXECUTION_JWT_SECRET"] = test_approval["secret"]
+        try:
+            metrics = client.get("/metrics/kill_switch").json()
+            assert metrics['enabled'] is True
+            assert metrics['status'] == "inactive"
+            assert metrics['fail_closed'] is False
+            assert metrics['staleness_seconds'] <= metrics['max_staleness_seconds']
+
+            response = client.post(
+                "/place_order",
+                json={"order_intent": {"symbol": "AAPL", "quantity": 10}},
+                headers={"Authorization": f"Bearer {test_approval['token']}"}
+            )
+            assert response.status_code == 200
+        finally:
+            execution_app.kill_switch_service = None
+            del os.environ["EXECUTION_JWT_SECRET"]
+
+        # 재활성화도 감지
+        session = Session()
+        try:
+            session.add(SystemState(
+                timestamp=datetime.now(timezone.utc) + timedelta(seconds=1),
+                kill_switch_status=KillSwitchStatus.ACTIVE,
+                kill_switch_reason="re-activate"
+            ))
+            session.commit()
+        finally:
+            session.close()
+        assert wait_for(lambda: service.get_status() == KillSwitchStatus.ACTIVE)
+        writer.dispose()
+    finally:
+        service.close()
+
+    # watcher 중단 -> 캐시 값과 무관하게 ACTIVE
+    assert service.get_status() == KillSwitchStatus.ACTIVE
+    assert service.metrics()['fail_closed'] is True
+
+    # watcher 없이 staleness 예산 초과 -> ACTIVE
+    stale = KillSwitchService(engine, max_staleness=0.05, autostart=False)
+    stale._status = KillSwitchStatus.INACTIVE
+    stale._synced = True
+    stale._last_sync = time.monotonic()
+    assert stale.get_status() == KillSwitchStatus.INACTIVE
+    time.sleep(0.1)
+    assert stale.get_status() == KillSwitchStatus.ACTIVE
+    assert stale.metrics()['staleness_seconds'] > 0.05
+    engine.dispose()
+    assert client.get("/metrics/kill_switch").json() == {"enabled": False}
+
+
+def test_concurrent_token_reuse_single_claim(client, test_proposal, test_approval, temp_db):
+    """Test 10: 같은 토큰으로 동시 요청 -> 조건부 UPDATE claim으로 정확히 1건만 성공 + broker calls == 1 + orders 1건"""
+    from concurrent.futures import ThreadPoolExecutor
+    import kis.execution.app as execution_app
+    spy = execution_app.broker_client
+    spy.reset()
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    try:
+        session.add(SystemState(
+            timestamp=datetime.now(timezone.utc),
+            kill_switch_status=KillSwitchStatus.INACTIVE,
+            kill_switch_reason="test"
+        ))
+        session.commit()
+    finally:
+        session.close()
+
+    os.environ["EXECUTION_JWT_SECRET"] = test_approval["secret"]
+    try:
+        def fire(_):
+            return client.post(
+                "/place_order",
+                json={"order_intent": {"symbol": "AAPL", "quantity": 10}},
+                headers={"Authorization": f"Bearer {test_approval['token']}"}
+            )
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            responses = list(pool.map(fire, range(16)))
+    finally:
+        del os.environ["EXECUTION_JWT_SECRET"]
+
+    codes = sorted(response.status_code for response in responses)
+    assert codes == [200] + [403] * 15
+    assert all(
+        "already used" in response.json()['detail'].lower()
+        for response in responses if response.status_code == 403
+    )
+    assert spy.call_count == 1
+
+    session = Session()
+    try:
+        assert session.query(Order).count() == 1
+        assert session.query(EventLog).filter_by(event_type="order_requested").count() == 1
+        approval = session.query(Approval).filter_by(token_jti=test_approval["token_jti"]).one()
+        assert approval.token_used_at is not None
+    finally:
+        session.close()
+
+
+def test_unclaimed_token_rejection_reason(client, test_proposal, test_approval, temp_db, monkeypatch):
+    """Test 11: claim 실패 사유 - DB 만료 시각이 claim 시각 이전일 때만 expired, 그 외는 일반 claim 실패"""
+    import kis.execution.app as execution_app
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+
+    def set_expires_at(expires_at):
+        session = Session()
+        try:
+            if session.query(SystemState).count() == 0:
+                session.add(SystemState(
+                    timestamp=datetime.now(timezone.utc),
+                    kill_switch_status=KillSwitchStatus.INACTIVE,
+                    kill_switch_reason="test"
+                ))
+            approval = session.query(Approval).filter_by(token_jti=test_approval["token_jti"]).one()
+            approval.token_expires_at = expires_at
+            session.commit()
+        finally:
+            session.close()
+
+    def last_reason():
+        session = Session()
+        try:
+            event = session.query(EventLog).filter_by(event_type="order_rejected").order_by(EventLog.event_id.desc()).first()
+            return event.payload_json["reason"]
+        finally:
+            session.close()
+
+    os.environ["EXECUTION_JWT_SECRET"] = test_approval["secret"]
+    try:
+        headers = {"Authorization": f"Bearer {test_approval['token']}"}
+        order = {"order_intent": {"symbol": "AAPL", "quantity": 10}}
+
+        # JWT는 유효하지만 DB의 만료 시각이 지남
+        set_expires_at(datetime.now(timezone.utc) - timedelta(seconds=1))
+        response = client.post("/place_order", json=order, headers=headers)
+        assert response.status_code == 403
+        assert response.json()["detail"] == "Token expired"
+        assert last_reason() == "Token expired (from DB)"
+
+        # 만료 전인데 claim이 실패 (예: 경합) -> expired로 오분류하지 않음
+        set_expires_at(datetime.now(timezone.utc) + timedelta(seconds=3600))
+
+        async def claim_nothing(*args, **kwargs):
+            return None
+
+        monkeypatch.setattr(execution_app, "claim_approval_token", claim_nothing)
+        response = client.post("/place_order", json=order, headers=headers)
+        assert response.status_code == 403
+        assert response.json()["detail"] == "Approval token could not be claimed"
+        assert last_reason() == "Approval claim failed"
+        assert execution_app.broker_client.call_count == 0
+    finally:
+        del os.environ["EXECUTION_JWT_SECRET"]
+
+
+def test_verified_token_cache(monkeypatch):
+    """Test 12: 검증된 토큰 LRU 캐시 - 재시도 시 재검증 없음, secret별 분리, 실패 시 미검증 claims 제공, exp 만료/LRU 제거"""
+    import time
+    from kis.execution import auth
+    from kis.execution.auth import TokenCache, TokenExpiredError, InvalidTokenSignatureError, verify_token
+
+    cache = TokenCache(max_entries=2)
+    monkeypatch.setattr(auth, "token_cache", cache)
+    secret = "test-secret-key-12345"
+
+    def make(jti, expires_in_seconds=3600):
+        return create_token(secret, jti, 1, f"corr-{jti}", "hash", expires_in_seconds=expires_in_seconds)
+
+    token = make("a")
+    claims = verify_token(token, secret)
+    assert verify_token(token, secret) == claims
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # 반환값 변경이 캐시에 영향 없음
+    claims["proposal_id"] = 999
+    assert verify_token(token, secret)["proposal_id"] == 1
+
+    # 다른 secret -> 캐시 미사용, 서명 오류에 미검증 claims 포함 (실패 결과도 캐시)
+    for _ in range(2):
+        with pytest.raises(InvalidTokenSignatureError) as exc_info:
+            verify_token(token, "other-secret")
+        assert exc_info.value.claims["correlation_id"] == "corr-a"
+    assert cache.hits == 3
+
+    # 만료 토큰: TokenExpiredError + claims
+    with pytest.raises(TokenExpiredError) as exc_info:
+        verify_token(make("b", expires_in_seconds=-10), secret)
+    assert exc_info.value.claims["jti"] == "b"
+
+    # 실패 경로도 decode는 1회, 다른 알고리즘/형식 오류 토큰은 서명 오류
+    import jwt as pyjwt
+    decode_calls = []
+    original_decode = pyjwt.decode_complete
+    monkeypatch.setattr(pyjwt, "decode_complete", lambda *a, **kw: decode_calls.append(1) or original_decode(*a, **kw))
+    with pytest.raises(TokenExpiredError):
+        verify_token(make("b2", expires_in_seconds=-10), secret, use_cache=False)
+    assert len(decode_calls) == 1
+    hs512 = pyjwt.encode({"jti": "d", "exp": int(time.time()) + 60}, secret, algorithm="HS512")
+    with pytest.raises(InvalidTokenSignatureError) as exc_info:
+        verify_token(hs512, secret, use_cache=False)
+    assert exc_info.value.claims["jti"] == "d"
+    with pytest.raises(InvalidTokenSignatureError) as exc_info:
+        verify_token("not-a-token", secret, use_cache=False)
+    assert exc_info.value.claims == {}
+
+    # LRU: max_entries=2 -> 가장 오래 사용되지 않은 항목 제거
+    assert len(cache) == 2
+    hits = cache.hits
+    verify_token(token, secret)
+    assert cache.hits == hits  # 제거되어 다시 검증
+
+    # 캐시 항목은 토큰 exp 시점에 만료
+    key = TokenCache.make_key("expiring", secret)
+    cache.put(key, {"jti": "c"}, expires_at=time.time() - 1)
+    assert cache.get(key) is None
+    assert len(TokenCache(max_entries=0)) == 0
+
+
+def test_place_orders_basket(client, temp_db):
+    """Test 13: /place_orders - 토큰 1회로 proposal 전체 주문, 시장별 동시성 제한, bulk insert, leg별 결과, 토큰 재사용 차단"""
+    import asyncio
+    import kis.execution.app as execution_app
+
+    class ConcurrencyBroker(SpyBrokerClient):
+        """Tracks max concurrent calls per market and fails one symbol"""
+
+        def __init__(self):
+            super().__init__()
+            self.active = {}
+            self.max_active = {}
+
+        async def place_order(self, order_data):
+            market = order_data["market"]
+            self.active[market] = self.active.get(market, 0) + 1
+            self.max_active[market] = max(self.max_active.get(market, 0), self.active[market])
+            try:
+                await asyncio.sleep(0.01)
+                if order_data["symbol"] == "FAIL":
+                    raise RuntimeError("broker down")
+                return await super().place_order(order_data)
+            finally:
+                self.active[market] -= 1
+
+    positions = [{"symbol": f"KR{i:02d}", "market": "KR", "weight": 0.05} for i in range(6)]
+    positions += [{"symbol": f"US{i:02d}", "market": "US", "weight": 0.05} for i in range(5)]
+    positions.append({"symbol": "FAIL", "market": "US", "weight": 0.05})
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    secret = "test-secret-key-12345"
+    try:
+        proposal = Proposal(
+            created_at=datetime.now(timezone.utc),
+            universe_snapshot_id=1,
+            config_hash="test_hash",
+            git_commit_sha="test_sha",
+            schema_version="0.1.0",
+            payload_json={"positions": positions, "correlation_id": "basket-corr"},
+            status=ProposalStatus.PENDING
+        )
+        session.add(proposal)
+        session.flush()
+        token = create_token(secret, "basket-jti", proposal.proposal_id, "basket-corr", "hash")
+        session.add(Approval(
+            proposal_id=proposal.proposal_id,
+            status=ApprovalStatus.APPROVED,
+            approved_by="test_user",
+            approved_at=datetime.now(timezone.utc),
+            token_hash=calculate_token_hash(token),
+            token_jti="basket-jti",
+            token_expires_at=datetime.now(timezone.utc) + timedelta(seconds=3600)
+        ))
+        session.add(SystemState(
+            timestamp=datetime.now(timezone.utc),
+            kill_switch_status=KillSwitchStatus.INACTIVE,
+            kill_switch_reason="test"
+        ))
+        session.commit()
+        proposal_id = proposal.proposal_id
+    finally:
+        session.close()
+
+    broker = ConcurrencyBroker()
+    original_broker = execution_app.broker_client
+    execution_app.broker_client = broker
+    os.environ["EXECUTION_JWT_SECRET"] = secret
+    os.environ["EXECUTION_MARKET_CONCURRENCY"] = "KR=2,US=3"
+    try:
+        headers = {"Authorization": f"Bearer {token}"}
+
+        # 제안에 없는 종목 -> 400, 토큰은 소모되지 않음
+        response = client.post("/place_orders", json={"order_intents": [{"symbol": "MSFT"}]}, headers=headers)
+        assert response.status_code == 400
+        assert broker.call_count == 0
+
+        # order_intents 없음/일부 position 누락/중복 종목/market 불일치 -> 400, 토큰은 소모되지 않음
+        basket = {"order_intents": [{"symbol": p["symbol"], "quantity": 1} for p in positions]}
+        invalid_baskets = [
+            ({}, "order_intents is required"),
+            ({"order_intents": basket["order_intents"][:1]}, "Missing order intents"),
+            ({"order_intents": basket["order_intents"] + basket["order_intents"][:1]}, "duplicate symbol"),
+            ({"order_intents": [{**basket["order_intents"][0], "market": "US"}] + basket["order_intents"][1:]}, "does not match"),
+        ]
+        for body, detail in invalid_baskets:
+            response = client.post("/place_orders", json=body, headers=headers)
+            assert response.status_code == 400
+            assert detail in response.json()["detail"]
+        assert broker.call_count == 0
+
+        response = client.post("/place_orders", json=basket, headers=headers)
+        assert response.status_code == 200
+        legs = response.json()["legs"]
+        assert response.json()["proposal_id"] == proposal_id
+        assert [leg["symbol"] for leg in legs] == [p["symbol"] for p in positions]
+        assert {leg["status"] for leg in legs if leg["symbol"] != "FAIL"} == {"pending"}
+        failed = [leg for leg in legs if leg["symbol"] == "FAIL"]
+        assert failed[0]["status"] == "rejected" and "broker down" in failed[0]["error"]
+        assert broker.call_count == 11
+        assert broker.max_active["KR"] <= 2 and broker.max_active["US"] <= 3
+
+        # 같은 토큰으로 재요청 -> basket 전체가 1회용
+        response = client.post("/place_orders", json=basket, headers=headers)
+        assert response.status_code == 403
+        assert "already used" in response.json()["detail"].lower()
+        assert broker.call_count == 11
+    finally:
+        execution_app.broker_client = original_broker
+        del os.environ["EXECUTION_JWT_SECRET"]
+        del os.environ["EXECUTION_MARKET_CONCURRENCY"]
+
+    session = Session()
+    try:
+        orders = session.query(Order).filter_by(proposal_id=proposal_id).order_by(Order.order_id).all()
+        assert [order.order_id for order in orders] == [leg["order_id"] for leg in legs]
+        assert sum(order.status.value == "rejected" for order in orders) == 1
+        assert session.query(EventLog).filter_by(event_type="orders_requested").count() == 1
+    finally:
+        session.close()
+
+
+def test_place_orders_requires_intents_for_engine_proposal(client, temp_db):
+    """Test 14: engine이 만든 proposal에 빈 body로 /place_orders -> claim 전 400 (토큰 미사용), proposal 없음 -> 404 + order_rejected 기록"""
+    from pathlib import Path
+    from kis.engine.sample_data import load_sample_snapshot
+    from kis.engine.proposal import create_proposal
+    import kis.execution.app as execution_app
+
+    snapshot = load_sample_snapshot(str(Path(__file__).parent.parent / "data" / "sample_snapshot.json"))
+    payload = create_proposal(snapshot)
+    assert payload["positions"] and all("quantity" not in p for p in payload["positions"])
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    secret = "test-secret-key-12345"
+    try:
+        proposal = Proposal(
+            created_at=datetime.now(timezone.utc),
+            universe_snapshot_id=1,
+            config_hash="test_hash",
+            git_commit_sha="test_sha",
+            schema_version="0.1.0",
+            payload_json=payload,
+            status=ProposalStatus.PENDING
+        )
+        session.add(proposal)
+        session.flush()
+        tokens = {
+            "engine-jti": create_token(secret, "engine-jti", proposal.proposal_id, payload["correlation_id"], "hash"),
+            "missing-jti": create_token(secret, "missing-jti", proposal.proposal_id + 1, "missing-corr", "hash"),
+        }
+        for jti, token in tokens.items():
+            session.add(Approval(
+                proposal_id=proposal.proposal_id,
+                status=ApprovalStatus.APPROVED,
+                approved_by="test_user",
+                approved_at=datetime.now(timezone.utc),
+                token_hash=calculate_token_hash(token),
+                token_jti=jti,
+                token_expires_at=datetime.now(timezone.utc) + timedelta(seconds=3600)
+            ))
+        session.add(SystemState(
+            timestamp=datetime.now(timezone.utc),
+            kill_switch_status=KillSwitchStatus.INACTIVE,
+            kill_switch_reason="test"
+        ))
+        session.commit()
+    finally:
+        session.close()
+
+    spy = execution_app.broker_client
+    spy.reset()
+    os.environ["EXECUTION_JWT_SECRET"] = secret
+    try:
+        response = client.post("/place_orders", json={}, headers={"Authorization": f"Bearer {tokens['engine-jti']}"})
+        assert response.status_code == 400
+        assert "order_intents is required" in response.json()["detail"]
+
+        response = client.post("/place_orders", json={}, headers={"Authorization": f"Bearer {tokens['missing-jti']}"})
+        assert response.status_code == 404
+        assert spy.call_count == 0
+    finally:
+        del os.environ["EXECUTION_JWT_SECRET"]
+
+    session = Session()
+    try:
+        assert all(approval.token_used_at is None for approval in session.query(Approval).all())
+        reasons = [e.payload_json["reason"] for e in session.query(EventLog).filter_by(event_type="order_rejected").all()]
+        assert reasons == ["Invalid order basket", "Proposal not found"]
+    finally:
+        session.close()
+
+
+def test_place_orders_through_kis_client(client, temp_db):
+    """Test 15: /place_orders + KISBrokerClient - order_intents 없는 요청은 claim 전 400, 수량 지정 basket은 KIS 주문 성공"""
+    import httpx
+    import kis.execution.app as execution_app
+    from kis.execution.kis_client import KISBrokerClient, TOKEN_PATH
+
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == TOKEN_PATH:
+            return httpx.Response(200, json={"access_token": "tok", "expires_in": 86400})
+        requests.append(request.url.path)
+        return httpx.Response(200, json={
+            "rt_cd": "0", "msg_cd": "40600000", "msg1": "ok",
+            "output": {"ODNO": f"{len(requests):010d}", "ORD_TMD": "091500"},
+        })
+
+    positions = [
+        {"symbol": "005930", "market": "KR", "weight": 0.5},
+        {"symbol": "AAPL", "market": "US", "weight": 0.5},
+    ]
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    secret = "test-secret-key-12345"
+    try:
+        proposal = Proposal(
+            created_at=datetime.now(timezone.utc),
+            universe_snapshot_id=1,
+            config_hash="test_hash",
+            git_commit_sha="test_sha",
+            schema_version="0.1.0",
+            payload_json={"positions": positions, "correlation_id": "kis-corr"},
+            status=ProposalStatus.PENDING
+        )
+        session.add(proposal)
+        session.flush()
+        token = create_token(secret, "kis-jti", proposal.proposal_id, "kis-corr", "hash")
+        session.add(Approval(
+            proposal_id=proposal.proposal_id,
+            status=ApprovalStatus.APPROVED,
+            approved_by="test_user",
+            approved_at=datetime.now(timezone.utc),
+            token_hash=calculate_token_hash(token),
+            token_jti="kis-jti",
+            token_expires_at=datetime.now(timezone.utc) + timedelta(seconds=3600)
+        ))
+        session.add(SystemState(
+            timestamp=datetime.now(timezone.utc),
+            kill_switch_status=KillSwitchStatus.INACTIVE,
+            kill_switch_reason="test"
+        ))
+        session.commit()
+        proposal_id = proposal.proposal_id
+    finally:
+        session.close()
+
+    def token_used_at():
+        session = Session()
+        try:
+            return session.query(Approval).filter_by(token_jti="kis-jti").one().token_used_at
+        finally:
+            session.close()
+
+    kis = KISBrokerClient(
+        "app-key", "app-secret", "12345678-01",
+        base_url="http://localhost:8010",
+        rate_limit=1000.0,
+        transport=httpx.MockTransport(handler)
+    )
+    original_broker = execution_app.broker_client
+    execution_app.broker_client = kis
+    os.environ["EXECUTION_JWT_SECRET"] = secret
+    try:
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = client.post("/place_orders", json={}, headers=headers)
+        assert response.status_code == 400
+        assert "order_intents is required" in response.json()["detail"]
+        assert requests == []
+        assert token_used_at() is None
+
+        basket = {"order_intents": [
+            {"symbol": "005930", "quantity": 3},
+            {"symbol": "AAPL", "quantity": 1, "price": 190.5},
+        ]}
+        response = client.post("/place_orders", json=basket, headers=headers)
+        assert response.status_code == 200
+        legs = response.json()["legs"]
+        assert [leg["status"] for leg in legs] == ["pending", "pending"]
+        assert all(leg["broker_order_id"] for leg in legs)
+        assert len(requests) == 2
+        assert token_used_at() is not None
+    finally:
+        execution_app.broker_client = original_broker
+        del os.environ["EXECUTION_JWT_SECRET"]
+
+    session = Session()
+    try:
+        assert session.query(Order).filter_by(proposal_id=proposal_id).count() == 2
+    finally:
+        session.close()
+
+
+def test_place_order_broker_failures(client, test_proposal, temp_db):
+    """Test 16: /place_order broker 오류 - 잘못된 주문은 claim 전 400, 거부 422/장애 502 + rejected order + event 기록"""
+    import httpx
+    import kis.execution.app as execution_app
+    from kis.execution.kis_client import KISBrokerClient, TOKEN_PATH
+
+    failures = ["reject", 503]
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == TOKEN_PATH:
+            return httpx.Response(200, json={"access_token": "tok", "expires_in": 86400})
+        requests.append(request.url.path)
+        failure = failures.pop(0)
+        if failure == "reject":
+            return httpx.Response(200, json={"rt_cd": "1", "msg_cd": "APBK0919", "msg1": "주문가능금액을 초과 했습니다"})
+        return httpx.Response(failure)
+
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    secret = "test-secret-key-12345"
+    session = Session()
+    try:
+        tokens = {}
+        for jti in ("reject-jti", "down-jti"):
+            tokens[jti] = create_token(secret, jti, test_proposal.proposal_id, "test-correlation-123", "hash")
+            session.add(Approval(
+                proposal_id=test_proposal.proposal_id,
+                status=ApprovalStatus.APPROVED,
+                approved_by="test_user",
+                approved_at=datetime.now(timezone.utc),
+                token_hash=calculate_token_hash(tokens[jti]),
+                token_jti=jti,
+                token_expires_at=datetime.now(timezone.utc) + timedelta(seconds=3600)
+            ))
+        session.add(SystemState(
+            timestamp=datetime.now(timezone.utc),
+            kill_switch_status=KillSwitchStatus.INACTIVE,
+            kill_switch_reason="test"
+        ))
+        session.commit()
+    finally:
+        session.close()
+
+    def token_used_at(jti):
+        session = Session()
+        try:
+            return session.query(Approval).filter_by(token_jti=jti).one().token_used_at
+        finally:
+            session.close()
+
+    kis = KISBrokerClient(
+        "app-key", "app-secret", "12345678-01",
+        base_url="http://localhost:8010",
+        rate_limit=1000.0,
+        max_retries=0,
+        transport=httpx.MockTransport(handler)
+    )
+    original_broker = execution_app.broker_client
+    execution_app.broker_client = kis
+    os.environ["EXECUTION_JWT_SECRET"] = secret
+    try:
+        headers = {"Authorization": f"Bearer {tokens['reject-jti']}"}
+
+        # 가격 없는 US 주문 -> broker 호출/claim 전에 400
+        response = client.post("/place_order", json={"order_intent": {"symbol": "AAPL", "market": "US", "quantity": 1}}, headers=headers)
+        assert response.status_code == 400
+        assert requests == []
+        assert token_used_at("reject-jti") is None
+
+        # broker 거부 -> 422, 토큰 소모, rejected order 기록
+        response = client.post("/place_order", json={"order_intent": {"symbol": "005930", "quantity": 1}}, headers=headers)
+        assert response.status_code == 422
+        assert "APBK0919" in response.json()["detail"]
+        assert token_used_at("reject-jti") is not None
+
+        # broker 장애 -> 502
+        headers = {"Authorization": f"Bearer {tokens['down-jti']}"}
+        response = client.post("/place_order", json={"order_intent": {"symbol": "005930", "quantity": 1}}, headers=headers)
+        assert response.status_code == 502
+        assert "BrokerUnavailableError" in response.json()["detail"]
+        assert token_used_at("down-jti") is not None
+        assert len(requests) == 2
+    finally:
+        execution_app.broker_client = original_broker
+        del os.environ["EXECUTION_JWT_SECRET"]
+
+    session = Session()
+    try:
+        orders = session.query(Order).order_by(Order.order_id).all()
+        assert [order.status.value for order in orders] == ["rejected", "rejected"]
+        assert "APBK0919" in orders[0].payload_json["error"]
+        events = session.query(EventLog).filter_by(event_type="order_rejected").all()
+        broker_events = [e for e in events if e.payload_json["reason"] == "Broker error"]
+        assert len(broker_events) == 2
+        assert session.query(EventLog).filter_by(event_type="order_requested").count() == 2
+    finally:
+        session.close()
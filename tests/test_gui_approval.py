@@ -13,7 +13,11 @@ from fastapi.testclient import TestClient
 from kis.storage.init_db import init_database
 from kis.storage.models import Proposal, Approval, EventLog, ProposalStatus, ApprovalStatus
 from kis.gui.app import app
-from kis.storage.session import get_db_session
+from kis.storage.async_session import (
+    get_async_db_session,
+    create_async_storage_engine,
+    create_async_session_factory
+)
 
 
 @pytest.fixture
@@ -66,16 +70,15 @@ def test_proposal(temp_db):
 def client(temp_db):
     """Create FastAPI test client with database dependency override"""
     # Override database dependency
-    def override_get_db():
-        engine = create_engine(temp_db)
-        Session = sessionmaker(bind=engine)
-        session = Session()
+    async def override_get_db():
+        engine = create_async_storage_engine(temp_db)
         try:
-            yield session
+            async with create_async_session_factory(engine)() as session:
+                yield session
         finally:
-            session.close()
+            await engine.dispose()
     
-    app.dependency_overrides[get_db_session] = override_get_db
+    app.dependency_overrides[get_async_db_session] = override_get_db
     
     yield TestClient(app)
     
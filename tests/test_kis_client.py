@@ -0,0 +1,249 @@
+"""Tests for KIS mock-trading broker client (httpx.MockTransport stand-in server)"""
+
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from kis.execution import kis_client
+from kis.execution.kis_client import (
+    KISBrokerClient,
+    TokenBucket,
+    CircuitBreaker,
+    BrokerRejectedError,
+    BrokerUnavailableError,
+    KIS_MOCK_BASE_URL,
+)
+
+
+BASE_URL = "http://localhost:8010"
+
+
+class StandInServer:
+    """Minimal KIS API stand-in: token endpoint + order endpoints with scripted failures"""
+
+    def __init__(self, failures=None):
+        self.failures = list(failures or [])
+        self.token_calls = 0
+        self.orders = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == kis_client.TOKEN_PATH:
+            self.token_calls += 1
+            return httpx.Response(200, json={"access_token": "tok", "token_type": "Bearer", "expires_in": 86400})
+        if self.failures:
+            failure = self.failures.pop(0)
+            if failure == "connect":
+                raise httpx.ConnectError("connection refused", request=request)
+            if failure == "rate_limit":
+                return httpx.Response(500, json={"rt_cd": "1", "msg_cd": "EGW00201", "msg1": "초당 거래건수를 초과하였습니다."})
+            if failure == "reject":
+                return httpx.Response(200, json={"rt_cd": "1", "msg_cd": "APBK0919", "msg1": "주문가능금액을 초과 했습니다"})
+            return httpx.Response(failure)
+        self.orders.append({
+            "path": request.url.path,
+            "tr_id": request.headers["tr_id"],
+            "authorization": request.headers["authorization"],
+            "body": json.loads(request.content),
+        })
+        return httpx.Response(200, json={
+            "rt_cd": "0",
+            "msg_cd": "40600000",
+            "msg1": "모의투자 매수주문이 완료 되었습니다.",
+            "output": {"KRX_FWDG_ORD_ORGNO": "00950", "ODNO": f"{len(self.orders):010d}", "ORD_TMD": "091500"},
+        })
+
+
+def make_client(server, **kwargs):
+    options = {"rate_limit": 1000.0, "max_retries": 3}
+    options.update(kwargs)
+    return KISBrokerClient(
+        "app-key",
+        "app-secret",
+        "12345678-01",
+        base_url=BASE_URL,
+        transport=httpx.MockTransport(server.handler),
+        **options
+    )
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(kis_client, "RETRY_BASE_DELAY", 0.0)
+
+
+def test_mock_domain_enforced():
+    """Test 1: 실전 도메인 base URL 거부, 모의투자 도메인/local stand-in만 허용"""
+    with pytest.raises(ValueError):
+        KISBrokerClient("k", "s", "12345678-01", base_url="https://openapi.koreainvestment.com:9443")
+    with pytest.raises(ValueError):
+        KISBrokerClient("k", "s", "1234")
+
+    async def run():
+        client = KISBrokerClient("k", "s", "12345678-01")
+        assert client.base_url == KIS_MOCK_BASE_URL
+        await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_place_orders_share_token_and_pool():
+    """Test 2: 동시 주문 - access token 1회 발급, KR/US 요청 매핑, 응답 형식"""
+    server = StandInServer()
+
+    async def run():
+        client = make_client(server)
+        try:
+            results = await asyncio.gather(
+                *(client.place_order({"symbol": "005930.KS", "market": "KR", "quantity": 1}) for _ in range(5)),
+                client.place_order({"symbol": "AAPL", "market": "US", "quantity": 2, "price": 190.5, "side": "sell"}),
+            )
+        finally:
+            await client.aclose()
+        return results
+
+    results = asyncio.run(run())
+    assert server.token_calls == 1
+    assert len({result["broker_order_id"] for result in results}) == 6
+    assert all(result["status"] == "pending" for result in results)
+
+    kr = [order for order in server.orders if order["path"] == kis_client.DOMESTIC_ORDER_PATH]
+    assert len(kr) == 5
+    assert kr[0]["tr_id"] == "VTTC0802U" and kr[0]["authorization"] == "Bearer tok"
+    assert kr[0]["body"] == {
+        "CANO": "12345678", "ACNT_PRDT_CD": "01", "PDNO": "005930",
+        "ORD_DVSN": "01", "ORD_QTY": "1", "ORD_UNPR": "0",
+    }
+    us = [order for order in server.orders if order["path"] == kis_client.OVERSEAS_ORDER_PATH]
+    assert us[0]["tr_id"] == "VTTT1001U"
+    assert us[0]["body"]["OVRS_ORD_UNPR"] == "190.50"
+
+
+def test_retry_only_when_order_not_processed():
+    """Test 3: 재시도 - 연결 실패/게이트웨이 rate limit은 재시도, 5xx 주문은 중복 방지를 위해 재시도 없음, 거부는 즉시 오류"""
+    order = {"symbol": "005930", "market": "KR", "quantity": 1}
+
+    async def run(server, **kwargs):
+        client = make_client(server, **kwargs)
+        try:
+            return await client.place_order(order), client
+        finally:
+            await client.aclose()
+
+    server = StandInServer(["connect", "rate_limit"])
+    result, client = asyncio.run(run(server))
+    assert result["broker_order_id"] and client.stats["retries"] == 2
+    assert len(server.orders) == 1
+
+    server = StandInServer([503])
+    with pytest.raises(BrokerUnavailableError):
+        asyncio.run(run(server))
+    assert server.failures == [] and server.orders == []  # 1회만 시도
+
+    server = StandInServer(["connect"] * 5)
+    with pytest.raises(BrokerUnavailableError):
+        asyncio.run(run(server, max_retries=2))
+    assert len(server.failures) == 2  # 최초 1회 + 재시도 2회
+
+    server = StandInServer(["reject"])
+    with pytest.raises(BrokerRejectedError) as exc_info:
+        asyncio.run(run(server))
+    assert exc_info.value.msg_cd == "APBK0919"
+
+
+def test_circuit_breaker_fails_fast_and_recovers():
+    """Test 4: circuit breaker - 연속 실패 시 open (요청 없이 즉시 실패), reset_timeout 후 시험 호출 성공 시 closed"""
+    server = StandInServer([503, 503, 503])
+    order = {"symbol": "005930", "market": "KR", "quantity": 1}
+
+    async def run():
+        client = make_client(server, failure_threshold=2, reset_timeout=0.05)
+        try:
+            await client.get_access_token()
+            for _ in range(2):
+                with pytest.raises(BrokerUnavailableError):
+                    await client.place_order(order)
+            assert client.circuit_breaker.state == CircuitBreaker.OPEN
+
+            with pytest.raises(BrokerUnavailableError, match="circuit breaker"):
+                await client.place_order(order)
+            assert len(server.failures) == 1  # open 상태에서는 요청이 나가지 않음
+
+            await asyncio.sleep(0.06)
+            with pytest.raises(BrokerUnavailableError):
+                await client.place_order(order)  # half-open 시험 호출 실패 -> 다시 open
+            assert client.circuit_breaker.state == CircuitBreaker.OPEN
+
+            await asyncio.sleep(0.06)
+            assert (await client.place_order(order))["status"] == "pending"
+            assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+        finally:
+            await client.aclose()
+
+    asyncio.run(run())
+
+
+def test_token_bucket_limits_rate():
+    """Test 5: token bucket - burst(capacity) 이후 초당 rate 건으로 제한"""
+    async def run():
+        bucket = TokenBucket(rate=50.0)
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(60)))
+        return time.monotonic() - start
+
+    elapsed = asyncio.run(run())
+    # 50건은 즉시, 나머지 10건은 50/s -> 약 0.2초
+    assert 0.15 <= elapsed < 1.0
+
+
+def test_circuit_breaker_trial_release_and_rate_limit():
+    """Test 6: circuit breaker - gateway rate limit은 실패로 세지 않음, 취소/예상 밖 오류 시 half-open 시험 호출 예약 해제, bool 수량 거부"""
+    order = {"symbol": "005930", "market": "KR", "quantity": 1}
+
+    async def rate_limited():
+        server = StandInServer(["rate_limit"] * 3)
+        client = make_client(server, failure_threshold=2)
+        try:
+            assert (await client.place_order(order))["status"] == "pending"
+            return client.circuit_breaker
+        finally:
+            await client.aclose()
+
+    breaker = asyncio.run(rate_limited())
+    assert breaker.state == CircuitBreaker.CLOSED and breaker.failures == 0
+
+    async def interrupted_trials():
+        client = make_client(StandInServer(), failure_threshold=1, reset_timeout=0.0)
+        breaker = client.circuit_breaker
+        try:
+            breaker.record_failure()
+            assert breaker.state == CircuitBreaker.OPEN
+
+            async def hang(*args):
+                await asyncio.sleep(10)
+
+            client._send_once = hang
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(client._request("POST", "/x", {}, {}, idempotent=False), 0.01)
+            assert breaker.state == CircuitBreaker.HALF_OPEN
+
+            async def status_error(*args):
+                request = httpx.Request("POST", BASE_URL)
+                raise httpx.HTTPStatusError("unexpected", request=request, response=httpx.Response(418, request=request))
+
+            client._send_once = status_error
+            with pytest.raises(httpx.HTTPStatusError):
+                await client._request("POST", "/x", {}, {}, idempotent=False)
+            # 예약이 해제되어 다음 시험 호출이 허용됨
+            assert breaker.allow()
+        finally:
+            await client.aclose()
+
+    asyncio.run(interrupted_trials())
+
+    client = make_client(StandInServer())
+    with pytest.raises(ValueError, match="positive integer quantity"):
+        client.validate_order({**order, "quantity": True})
+    asyncio.run(client.aclose())
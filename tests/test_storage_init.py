@@ -1,5 +1,6 @@
 """Tests for database initialization and append-only event_log"""
 
+import json
 import os
 import tempfile
 import pytest
@@ -75,7 +76,10 @@ def test_required_tables_exist(temp_db):
 
 
 def test_schema_version_recorded(temp_db):
-    """Test that schema_version is recorded after initialization"""
+    """Test that every migration version is recorded after initialization"""
+    from kis.storage.migrations import MIGRATIONS, LATEST_SCHEMA_VERSION
+    from kis.engine.provenance import get_schema_version
+
     init_database(temp_db)
     
     engine = create_engine(temp_db)
@@ -83,10 +87,10 @@ def test_schema_version_recorded(temp_db):
     session = Session()
     
     try:
-        schema_version = session.query(SchemaVersion).filter_by(schema_version="0.1.0").first()
-        assert schema_version is not None, "Schema version 0.1.0 should be recorded"
-        assert schema_version.schema_version == "0.1.0"
-        assert schema_version.applied_at is not None
+        recorded = {row.schema_version: row for row in session.query(SchemaVersion)}
+        assert set(recorded) == {migration.version for migration in MIGRATIONS}
+        assert recorded["0.1.0"].applied_at is not None
+        assert get_schema_version(session) == LATEST_SCHEMA_VERSION
     finally:
         session.close()
 
@@ -139,3 +143,535 @@ def test_event_log_append_only(temp_db):
     finally:
         session.close()
 
+
+
+def test_init_db_adds_missing_columns(temp_db):
+    """Test that init_database migrates tables created before a column was added"""
+    engine = create_engine(temp_db)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE snapshots ("
+            "snapshot_id INTEGER PRIMARY KEY, asof DATETIME NOT NULL, "
+            "source VARCHAR(100) NOT NULL, payload_json JSON NOT NULL)"
+        ))
+
+        # 0.2.0 이전 snapshot: 1, 2는 같은 content (dedup 도입 전 중복 저장)
+        for snapshot_id, source in ((1, "a"), (2, "a"), (3, "b")):
+            payload = json.dumps({"asof": "2025-12-18T00:00:00+00:00", "source": source, "universe": []})
+            conn.execute(
+                text("INSERT INTO snapshots VALUES (:id, '2025-12-18 00:00:00', :source, :payload)"),
+                {"id": snapshot_id, "source": source, "payload": payload}
+            )
+
+    init_database(temp_db)
+    init_database(temp_db)
+
+    inspector = inspect(engine)
+    columns = {column["name"] for column in inspector.get_columns("snapshots")}
+    assert "content_hash" in columns
+    index_names = {index["name"] for index in inspector.get_indexes("snapshots")}
+    assert "ix_snapshots_content_hash" in index_names
+
+    # 기존 row의 content_hash backfill (중복 row는 NULL 유지) -> 재수집 시 기존 snapshot 재사용
+    from kis.engine.run import save_snapshot
+    from kis.storage.snapshot_content import get_snapshot_content_hash
+
+    session = sessionmaker(bind=engine)()
+    try:
+        hashes = dict(session.query(Snapshot.snapshot_id, Snapshot.content_hash).all())
+        assert hashes[1] == get_snapshot_content_hash(
+            {"asof": "2025-12-18T00:00:00+00:00", "source": "a", "universe": []}
+        )
+        assert hashes[2] is None
+        assert hashes[3] is not None and hashes[3] != hashes[1]
+
+        for source, expected_id in (("a", 1), ("b", 3)):
+            snapshot_data = {"asof": datetime(2025, 12, 18, tzinfo=timezone.utc), "source": source, "universe": []}
+            assert save_snapshot(session, snapshot_data) == expected_id
+        assert session.query(Snapshot).count() == 3
+    finally:
+        session.close()
+
+
+def _query_plans(engine, run_queries):
+    """Capture SQL executed by run_queries and return EXPLAIN QUERY PLAN details per statement"""
+    from sqlalchemy import event
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        run_queries()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    plans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            plans.append(" | ".join(row[-1] for row in rows))
+    return plans
+
+
+def test_hot_queries_use_indexes(temp_db):
+    """Test that status/time-ordered hot queries are served by indexes (EXPLAIN QUERY PLAN)"""
+    from kis.gui.repository import ProposalRepository
+    from kis.execution.repository import get_kill_switch_status
+    from kis.engine.provenance import get_schema_version
+
+    init_database(temp_db)
+    engine = create_engine(temp_db)
+    session = sessionmaker(bind=engine)()
+
+    try:
+        plans = _query_plans(engine, lambda: (
+            ProposalRepository(session).get_proposals("pending"),
+            get_kill_switch_status(session),
+            get_schema_version(session),
+            session.query(EventLog).filter(EventLog.event_type == "order_placed")
+                .order_by(EventLog.timestamp.desc()).first(),
+            session.query(Approval).filter_by(proposal_id=1).all(),
+            session.query(Order).filter_by(proposal_id=1).all(),
+        ))
+    finally:
+        session.close()
+
+    expected_indexes = [
+        "ix_proposals_status_created_at",
+        "ix_system_state_timestamp",
+        "ix_schema_version_applied_at",
+        "ix_event_log_event_type_timestamp",
+        "ix_approvals_proposal_id",
+        "ix_orders_proposal_id",
+    ]
+    assert len(plans) == len(expected_indexes)
+    for plan, index_name in zip(plans, expected_indexes):
+        assert f"INDEX {index_name}" in plan, plan
+        assert "USE TEMP B-TREE" not in plan, plan
+
+
+def test_init_db_adds_order_proposal_id(temp_db):
+    """Test that orders created before orders.proposal_id existed are backfilled and indexed"""
+    engine = create_engine(temp_db)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE orders ("
+            "order_id INTEGER PRIMARY KEY, correlation_id VARCHAR(100) NOT NULL, "
+            "status VARCHAR(9) NOT NULL, broker_order_id VARCHAR(100), "
+            "payload_json JSON NOT NULL, created_at DATETIME NOT NULL)"
+        ))
+        conn.execute(text(
+            "INSERT INTO orders (correlation_id, status, payload_json, created_at) "
+            "VALUES ('c-1', 'PENDING', '{\"proposal_id\": 7, \"approval_id\": 3}', '2025-01-01 00:00:00')"
+        ))
+
+    init_database(temp_db)
+    init_database(temp_db)
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT proposal_id FROM orders")).scalar() == 7
+    index_names = {index["name"] for index in inspect(engine).get_indexes("orders")}
+    assert "ix_orders_proposal_id" in index_names
+
+
+def test_event_log_hash_chain_incremental_verification(temp_db):
+    """Test that appended events are hash-chained and verified incrementally from checkpoints"""
+    from kis.storage.event_chain import GENESIS_HASH, verify_chain
+    from kis.execution.repository import log_event
+    from kis.gui.repository import ProposalRepository
+
+    init_database(temp_db)
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    try:
+        # 해시 체인 도입 이전 이벤트 (hash NULL)
+        session.execute(text(
+            "INSERT INTO event_log (timestamp, event_type, correlation_id, actor, payload_json) "
+            "VALUES ('2025-01-01 00:00:00', 'legacy', 'legacy-1', 'test', '{}')"
+        ))
+        session.commit()
+
+        # 여러 append 경로 + 한 flush에 여러 이벤트
+        log_event(session, "order_rejected", "c-1", {"reason": "kill switch"})
+        session.commit()
+        ProposalRepository(session).log_approval_event("approval_granted", "c-2", 1, 1, approved_by="admin")
+        session.add_all([
+            EventLog(event_type="batch", correlation_id=f"b-{i}", actor="test", payload_json={"i": i})
+            for i in range(5)
+        ])
+        session.commit()
+
+        events = session.query(EventLog).order_by(EventLog.event_id).all()
+        assert events[0].hash is None
+        assert events[1].prev_hash == GENESIS_HASH
+        for previous, current in zip(events[1:], events[2:]):
+            assert current.prev_hash == previous.hash
+        assert [e.correlation_id for e in events[3:]] == [f"b-{i}" for i in range(5)]
+
+        result = verify_chain(session)
+        assert result['ok'] is True
+        assert (result['verified'], result['unchained']) == (7, 1)
+        assert result['head_hash'] == events[-1].hash
+
+        # checkpoint 이후 이벤트만 검증
+        log_event(session, "order_placed", "c-3", {"order_id": 1})
+        session.commit()
+        result = verify_chain(session, batch_size=2)
+        assert (result['ok'], result['verified'], result['start_event_id']) == (True, 1, events[-1].event_id)
+
+        # 트리거를 우회한 변조는 전체 검증에서 탐지
+        tampered_id = events[4].event_id
+        session.execute(text("DROP TRIGGER prevent_event_log_update"))
+        session.execute(text(
+            f"UPDATE event_log SET payload_json = '{{\"i\": 99}}' WHERE event_id = {tampered_id}"
+        ))
+        session.commit()
+        assert verify_chain(session)['verified'] == 0
+        result = verify_chain(session, full=True)
+        assert result['ok'] is False
+        assert result['broken_event_id'] == tampered_id
+        assert "hash mismatch" in result['reason']
+    finally:
+        session.close()
+
+
+def test_event_sink_batches_and_recovers_wal(temp_db, tmp_path):
+    """Test that EventSink flushes in batches and replays its durable WAL after a crash"""
+    import time
+    from kis.storage.event_sink import EventSink
+    from kis.storage.event_chain import verify_chain
+
+    init_database(temp_db)
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+
+    def count_events():
+        session = Session()
+        try:
+            return session.query(EventLog).count()
+        finally:
+            session.close()
+
+    # size threshold로 background flush
+    sink = EventSink(Session, batch_size=5, flush_interval=60)
+    for i in range(4):
+        sink.emit("order_rejected", f"c-{i}", "test", {"i": i})
+    assert count_events() == 0
+    sink.emit("order_rejected", "c-4", "test", {"i": 4})
+    deadline = time.monotonic() + 5
+    while count_events() < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert count_events() == 5
+    sink.close()
+
+    def segments(path):
+        return sorted(path.glob("sink-*/events-*.jsonl"))
+
+    # durable mode: flush 전에 프로세스가 죽은 경우 (close/flush 호출 없음)
+    wal_dir = tmp_path / "wal"
+    crashed = EventSink(Session, batch_size=100, wal_dir=str(wal_dir), autostart=False)
+    for i in range(3):
+        crashed.emit("order_rejected", f"w-{i}", "test", {"i": i})
+    assert len(segments(wal_dir)) == 1
+    assert count_events() == 5
+
+    # 같은 wal_dir을 공유하는 살아있는 worker의 segment는 건드리지 않음
+    live = EventSink(Session, batch_size=100, flush_interval=60, wal_dir=str(wal_dir))
+    live.emit("order_rejected", "l-0", "test", {"i": 0})
+    assert live.recover() == 0
+    assert len(segments(wal_dir)) == 2
+    assert count_events() == 5
+
+    # 이미 commit된 segment가 남은 경우 중복 기록하지 않음
+    committed = EventSink(Session, wal_dir=str(tmp_path / "wal-committed"), autostart=False)
+    committed.emit("order_rejected", "d-0", "test", {"i": 0})
+    segment = segments(tmp_path / "wal-committed")[0]
+    segment_copy = segment.read_bytes()
+    committed.flush()
+    segment.write_bytes(segment_copy)
+    committed._instance_lock.close()  # 프로세스 종료로 잠금 해제
+    assert count_events() == 6
+
+    crashed._instance_lock.close()
+    restarted = EventSink(Session, wal_dir=str(wal_dir))
+    assert count_events() == 9
+    assert segments(wal_dir) == [live._segment_path]
+    restarted.close()
+    live.close()
+    assert count_events() == 10
+    assert [path.name for path in wal_dir.iterdir()] == [".recover.lock"]
+    assert EventSink(Session, wal_dir=str(tmp_path / "wal-committed"), autostart=False).recover() == 0
+    assert count_events() == 10
+
+    session = Session()
+    try:
+        events = session.query(EventLog).filter(EventLog.correlation_id.like("w-%")).order_by(EventLog.event_id).all()
+        assert [e.payload_json["i"] for e in events] == [0, 1, 2]
+        assert verify_chain(session)['ok'] is True
+    finally:
+        session.close()
+
+
+def test_storage_engine_sqlite_profile(temp_db):
+    """Test that storage engines apply the SQLite WAL/pragma profile and readers don't block on writers"""
+    from kis.storage.factory import (
+        create_storage_engine, get_engine_options,
+        SQLITE_BUSY_TIMEOUT_MS, SQLITE_CACHE_SIZE, SQLITE_MMAP_SIZE
+    )
+
+    engine = create_storage_engine(temp_db)
+    try:
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == SQLITE_BUSY_TIMEOUT_MS
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == SQLITE_CACHE_SIZE
+            assert conn.execute(text("PRAGMA mmap_size")).scalar() == SQLITE_MMAP_SIZE
+            # 기존 데이터 호환을 위해 foreign key 강제는 켜지 않음
+            assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 0
+
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE wal_probe (value INTEGER)"))
+
+        # WAL: 쓰기 트랜잭션 진행 중에도 다른 connection에서 읽기 가능
+        with engine.connect() as writer, engine.connect() as reader:
+            writer.execute(text("BEGIN IMMEDIATE"))
+            writer.execute(text("INSERT INTO wal_probe (value) VALUES (1)"))
+            assert reader.execute(text("SELECT COUNT(*) FROM wal_probe")).scalar() == 0
+            writer.execute(text("ROLLBACK"))
+    finally:
+        engine.dispose()
+
+    memory_engine = create_storage_engine("sqlite://")
+    try:
+        with memory_engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "memory"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1
+    finally:
+        memory_engine.dispose()
+
+    options = get_engine_options("postgresql://user:pw@localhost/kis")
+    assert options["pool_pre_ping"] is True
+    assert options["pool_size"] > 0 and options["max_overflow"] >= 0
+    assert "connect_args" not in options
+
+
+def test_event_log_monthly_rollover_and_archive(temp_db, tmp_path):
+    """Test that closed months roll over into partitions, archive with their chain endpoints and stay verifiable"""
+    import gzip
+    from kis.storage.event_chain import verify_chain
+    from kis.storage.event_partitions import (
+        rollover_partitions, archive_closed_partitions, verify_archive, list_partitions
+    )
+
+    init_database(temp_db)
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    try:
+        # 해시 체인 도입 이전 이벤트 + 7~9월 이벤트 (9월 이벤트 하나는 8월 timestamp로 늦게 기록)
+        session.execute(text(
+            "INSERT INTO event_log (timestamp, event_type, correlation_id, actor, payload_json) "
+            "VALUES ('2026-07-01 00:00:00', 'legacy', 'legacy-1', 'test', '{}')"
+        ))
+        session.commit()
+        stamps = [datetime(2026, 7, 10), datetime(2026, 7, 31, 23, 59), datetime(2026, 8, 2),
+                  datetime(2026, 9, 1), datetime(2026, 8, 31), datetime(2026, 9, 5), datetime(2026, 10, 1)]
+        for i, stamp in enumerate(stamps):
+            session.add(EventLog(timestamp=stamp.replace(tzinfo=timezone.utc), event_type="test",
+                                 correlation_id=f"m-{i}", actor="test", payload_json={"i": i}))
+            session.commit()
+        assert verify_chain(session, save_checkpoint=False)['verified'] == 7
+        session.close()
+
+        closed = rollover_partitions(engine, now=datetime(2026, 10, 15, tzinfo=timezone.utc))
+        assert [(p['period'], p['first_event_id'], p['last_event_id']) for p in closed] == [
+            ("2026-07", 1, 3), ("2026-08", 4, 6), ("2026-09", 7, 7)
+        ]
+        assert rollover_partitions(engine, now=datetime(2026, 10, 15, tzinfo=timezone.utc)) == []
+
+        session = Session()
+        # hot table에는 현재 월만 남고, 파티션은 append-only
+        assert session.query(EventLog).count() == 1
+        with pytest.raises((OperationalError, DatabaseError)):
+            session.execute(text("DELETE FROM event_log_202607"))
+        session.rollback()
+
+        # 새 이벤트는 event_id가 이어지고 체인도 파티션을 넘어 연결됨
+        session.add(EventLog(event_type="after", correlation_id="after-1", actor="test", payload_json={}))
+        session.commit()
+        assert session.query(EventLog).filter_by(correlation_id="after-1").one().event_id == 9
+        result = verify_chain(session, full=True)
+        assert (result['ok'], result['verified'], result['unchained']) == (True, 8, 1)
+
+        archived = archive_closed_partitions(
+            engine, str(tmp_path / "archive"), keep_months=1, now=datetime(2026, 10, 15, tzinfo=timezone.utc)
+        )
+        assert [a['period'] for a in archived] == ["2026-07", "2026-08"]
+        assert [p.status for p in list_partitions(session)] == ["archived", "archived", "closed"]
+        assert "event_log_202607" not in inspect(engine).get_table_names()
+        for entry in archived:
+            assert verify_archive(entry['archive_path'])['ok'] is True
+
+        session.expire_all()
+        result = verify_chain(session, full=True)
+        assert (result['ok'], result['verified'], result['archived']) == (True, 3, 6)
+        session.add(EventLog(event_type="after", correlation_id="after-2", actor="test", payload_json={}))
+        session.commit()
+        assert verify_chain(session)['verified'] == 1
+
+        # archive 파일 변조 탐지
+        path = archived[1]['archive_path']
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            lines = f.readlines()
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            f.writelines([lines[0].replace('"i":2', '"i":99')] + lines[1:])
+        assert verify_archive(path)['ok'] is False
+    finally:
+        session.close()
+
+
+def test_payload_encoding_reencode_roundtrip(temp_db):
+    """Test that payloads re-encode to a compact encoding in place and still load transparently"""
+    from kis.storage.encoding import EncodedJSON, decode_payload, detect_encoding
+    from kis.storage.reencode import reencode_table
+
+    init_database(temp_db)
+    engine = create_engine(temp_db)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+
+    try:
+        payloads = [{"universe": [{"symbol": f"S{i}-{j}", "price": j * 1.5} for j in range(50)]} for i in range(5)]
+        # 기존 (encoding 도입 이전) row는 JSON text로 저장되어 있음
+        for i, payload in enumerate(payloads):
+            session.execute(
+                text("INSERT INTO snapshots (asof, source, payload_json) VALUES ('2026-01-01 00:00:00', :source, :payload)"),
+                {'source': f"enc-{i}", 'payload': json.dumps(payload)}
+            )
+        session.commit()
+
+        # dry-run은 크기만 보고하고 아무것도 쓰지 않음
+        stats = reencode_table(engine, "snapshots", "zlib", batch_size=2, dry_run=True)
+        assert (stats['rows'], stats['converted']) == (5, 5)
+        assert stats['bytes_after'] < stats['bytes_before']
+        raw = session.execute(text("SELECT payload_json FROM snapshots")).scalars().all()
+        assert {detect_encoding(value) for value in raw} == {"json"}
+
+        stats = reencode_table(engine, "snapshots", "zlib", batch_size=2)
+        assert stats['converted'] == 5
+        raw = session.execute(text("SELECT payload_json FROM snapshots ORDER BY snapshot_id")).scalars().all()
+        assert {detect_encoding(value) for value in raw} == {"zlib"}
+        assert [decode_payload(value) for value in raw] == payloads
+
+        # 재실행 시 이미 변환된 row는 건너뜀
+        assert reencode_table(engine, "snapshots", "zlib")['skipped'] == 5
+
+        # 컬럼 설정과 무관하게 zlib row와 새 row를 함께 읽음
+        session.add(Snapshot(asof=datetime(2026, 1, 2, tzinfo=timezone.utc), source="enc-json",
+                             payload_json={"universe": []}))
+        session.commit()
+        session.expire_all()
+        loaded = [s.payload_json for s in session.query(Snapshot).order_by(Snapshot.snapshot_id)]
+        assert loaded == payloads + [{"universe": []}]
+
+        # 명시적 encoding 컬럼 타입
+        assert decode_payload(EncodedJSON(encoding="zlib").bind_processor(None)({"a": 1})) == {"a": 1}
+
+        with pytest.raises(ValueError, match="append-only"):
+            reencode_table(engine, "event_log", "zlib")
+        with pytest.raises(ValueError, match="Unknown payload encoding"):
+            reencode_table(engine, "snapshots", "bson")
+    finally:
+        session.close()
+
+
+def test_migrations_cover_models(temp_db):
+    """Test that applying every migration to an empty database yields the full model schema"""
+    from kis.storage.migrations import run_migrations
+
+    engine = create_engine(temp_db)
+    run_migrations(engine)
+
+    inspector = inspect(engine)
+    for table in Base.metadata.sorted_tables:
+        assert inspector.has_table(table.name), f"No migration creates {table.name}"
+        columns = {column["name"] for column in inspector.get_columns(table.name)}
+        assert {column.name for column in table.columns} <= columns, f"Missing columns in {table.name}"
+        index_names = {index["name"] for index in inspector.get_indexes(table.name)}
+        assert {index.name for index in table.indexes} <= index_names, f"Missing indexes on {table.name}"
+
+
+def test_migrations_upgrade_legacy_database(temp_db, monkeypatch, capsys):
+    """Test dry-run estimates, chunked backfills with progress and re-run idempotency on a 0.1.0 database"""
+    from kis.storage.migrations import (
+        LATEST_SCHEMA_VERSION, get_applied_versions, main, run_migrations
+    )
+    from kis.storage.models import ProposalPosition
+
+    engine = create_engine(temp_db)
+    # 0.1.0 시점 orders 테이블 (proposal_id 컬럼 없음)
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE orders ("
+            "order_id INTEGER PRIMARY KEY, correlation_id VARCHAR(100) NOT NULL, "
+            "status VARCHAR(9) NOT NULL, broker_order_id VARCHAR(100), "
+            "payload_json JSON NOT NULL, created_at DATETIME NOT NULL)"
+        ))
+    run_migrations(engine, target="0.1.0")
+    assert get_applied_versions(engine) == ["0.1.0"]
+
+    session = sessionmaker(bind=engine)()
+    try:
+        for i in range(3):
+            session.add(Proposal(config_hash="h", schema_version="0.1.0", payload_json={
+                "positions": [{"symbol": f"S{i}", "market": "KR", "weight": 0.1}]
+            }))
+        session.commit()
+    finally:
+        session.close()
+    with engine.begin() as conn:
+        for i in range(5):
+            conn.execute(text(
+                "INSERT INTO orders (correlation_id, status, payload_json, created_at) "
+                f"VALUES ('c-{i}', 'PENDING', '{{\"proposal_id\": {i + 1}}}', '2025-01-01 00:00:00')"
+            ))
+
+    # dry-run: 변경 없이 단계별 예상 row 수만 보고
+    plans = run_migrations(engine, dry_run=True)
+    assert [plan['version'] for plan in plans][0] == "0.2.0"
+    steps = {(step['action'], step['target']): step['rows'] for plan in plans for step in plan['steps']}
+    assert steps[('add column', 'orders.proposal_id')] == 0
+    assert steps[('create index', 'ix_orders_proposal_id')] == 5
+    assert steps[('backfill', 'orders.proposal_id')] == 5
+    assert steps[('backfill', 'proposal_positions')] == 3
+    assert get_applied_versions(engine) == ["0.1.0"]
+    assert "proposal_positions" not in inspect(engine).get_table_names()
+
+    progress = []
+    applied = run_migrations(engine, batch_size=2, progress=lambda *args: progress.append(args))
+    assert applied[-1]['version'] == LATEST_SCHEMA_VERSION
+    assert ("orders.proposal_id", 2, 5) in progress and ("orders.proposal_id", 5, 5) in progress
+    assert ("proposal_positions", 3, 3) in progress
+
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT proposal_id FROM orders ORDER BY order_id")).scalars().all() == [1, 2, 3, 4, 5]
+    session = sessionmaker(bind=engine)()
+    try:
+        assert session.query(ProposalPosition).count() == 3
+    finally:
+        session.close()
+
+    # 재실행 시 적용할 migration 없음
+    assert run_migrations(engine) == []
+    monkeypatch.setenv("DATABASE_URL", temp_db)
+    assert main(["--dry-run"]) == 0
+    assert "No pending migrations." in capsys.readouterr().out
+    assert main(["--target", "9.9.9"]) == 1